@@ -1,7 +1,26 @@
 from abc import ABC, abstractmethod
 from playwright.async_api import async_playwright
 from src.models.post import Post
-from typing import List, Dict, Optional
+from src.utils.fixtures import FixtureStore, FixtureRecorder, FixtureReplayer, get_fixture_mode
+from src.utils.parse_pool import ParsePool, get_parse_workers, run_fetch_parse_pipeline
+from src.utils.selector_stats import SelectorStats
+from src.utils.checkpoint import CrawlCheckpoint
+from src.utils.memory import MemoryMonitor
+from src.utils.prefetch_filters import PrefetchFilter
+from src.utils.browser_profiles import get_browser_profile, launch_browser
+from src.utils.rate_limiter import get_rate_limiter
+from src.utils.page_boundary import find_boundary_page
+from src.utils.proxy_pool import (
+    OUTCOME_BLOCKED, OUTCOME_ERROR, OUTCOME_OK, PER_CONTEXT_PROXY, NoHealthyProxyError, Proxy, classify_response,
+    get_proxy_pool,
+)
+from src.utils.circuit_breaker import (
+    BLOCKED_STATUSES, CircuitOpenError, describe_error, get_circuit_breakers, html_is_bot_check, looks_like_bot_check,
+)
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import asyncio
+import contextlib
 import os
 import re
 import httpx
@@ -9,6 +28,55 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# 봇 탐지 우회를 위한 JavaScript (최소한, 목록 수집용 추가 탭에도 주입)
+STEALTH_SCRIPT = """
+    // navigator.webdriver 속성 제거
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Chrome 객체 추가
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+"""
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+PAGE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+def parse_boards(spec: str, default_url: str, board_url: Callable[[str], str]) -> List[Dict[str, str]]:
+    """게시판 목록 설정 → [{'name', 'url'}] (비어 있으면 기본 URL 하나)
+    
+    쉼표로 구분한 항목: "이름" (board_url(이름)으로 주소 생성) 또는 "이름=URL"
+    """
+    boards = []
+    for entry in (spec or '').split(','):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, _, url = entry.partition('=')
+        boards.append({'name': name.strip(), 'url': url.strip() or board_url(name.strip())})
+    return boards or [{'name': '', 'url': default_url}]
+
+
+def with_query(url: str, **params: str) -> str:
+    """URL의 쿼리 파라미터 일부만 교체"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in params]
+    query.extend(params.items())
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), parts.fragment))
+
+
 class BaseCrawler(ABC):
     def __init__(self):
         self.browser = None
@@ -17,66 +85,111 @@ class BaseCrawler(ABC):
         self.headless = os.getenv('BROWSER_HEADLESS', 'true').lower() == 'true'
         self.timeout = int(os.getenv('BROWSER_TIMEOUT', '30000'))
         self.delay = int(os.getenv('BROWSER_DELAY', '1000'))
+        self.browser_profile = get_browser_profile('standard')
         self.naver_cookies: Optional[Dict[str, str]] = None
+        # 픽스처 기록/재생 (FIXTURE_MODE=record|replay, FIXTURE_DIR=저장 경로)
+        self.fixture_mode = get_fixture_mode()
+        self.fixture_dir = os.getenv('FIXTURE_DIR', 'fixtures')
+        self.fixture_store: Optional[FixtureStore] = None
+        self.fixture_replayer: Optional[FixtureReplayer] = None
+        # 상세 페이지 수집 방식 (browser: Playwright 페이지, http: httpx + 프로세스 풀 파싱)
+        self.detail_fetch = os.getenv('DETAIL_FETCH', 'browser').strip().lower()
+        self.fetch_concurrency = int(os.getenv('DETAIL_FETCH_CONCURRENCY', '4'))
+        self.parse_workers = get_parse_workers()
+        # 대체 선택자 적중 통계 (과거 성공 선택자부터 시도)
+        self.selector_stats = SelectorStats()
+        # 중간 상태 체크포인트 (run_* 스크립트가 설정, --resume으로 재개)
+        self.checkpoint: Optional[CrawlCheckpoint] = None
+        # 메모리 제한 모드: 상세 페이지 N회 이동 또는 브라우저 RSS(MB) 초과 시 페이지/컨텍스트 재생성 (0: 사용 안 함)
+        self.recycle_every = int(os.getenv('PAGE_RECYCLE_EVERY', '0'))
+        self.recycle_rss_mb = int(os.getenv('PAGE_RECYCLE_RSS_MB', '0'))
+        self.memory = MemoryMonitor()
+        self.navigations_since_recycle = 0
+        self.recycle_count = 0
+        # 목록 단계 사전 필터 (PREFETCH_RULES_PATH 규칙, 채널/날짜 파서가 정해진 뒤 처음 사용할 때 생성)
+        self._prefetch_filter: Optional[PrefetchFilter] = None
+        # 호스트별 요청 속도 제한 (상세 HTTP 수집/댓글 수집이 공유)
+        self.rate_limiter = get_rate_limiter()
+        # 목록 수집: 날짜 경계 페이지를 지수/이진 탐색으로 찾고 기간 안 페이지를 탭 여러 개로 동시에 수집
+        self.boundary_search = os.getenv('LIST_BOUNDARY_SEARCH', 'true').lower() == 'true'
+        self.list_concurrency = int(os.getenv('LIST_FETCH_CONCURRENCY', '3'))
+        # 여러 게시판 수집 (하위 클래스가 <채널>_BOARDS 설정으로 채움, 게시판마다 같은 브라우저의 별도 컨텍스트 사용)
+        self.boards: List[Dict[str, str]] = []
+        self.board_concurrency = int(os.getenv('BOARD_CONCURRENCY', '3'))
+        # 호스트별 서킷 브레이커 (연속 실패/봇 확인 페이지면 요청 중단) 및 수집 시작 전 빠른 접속 확인
+        self.circuit_breakers = get_circuit_breakers()
+        self.health_check = os.getenv('HEALTH_CHECK', 'true').lower() == 'true'
+        self.health_timeout = float(os.getenv('HEALTH_CHECK_TIMEOUT_SEC', '5'))
+        # 프록시 풀 (PROXY_POOL 설정 시): 컨텍스트마다 프록시 하나, 프록시·호스트별 속도 제한과 상태 점수
+        self.proxy_pool = get_proxy_pool()
+        self.proxy: Optional[Proxy] = None
+        # 같은 프록시를 계속 써야 하는 세션 키 (로그인한 네이버 세션 등, 하위 클래스가 설정)
+        self.proxy_key: Optional[str] = None
     
     async def __aenter__(self):
         self.playwright = await async_playwright().start()
         
         # 브라우저 컨텍스트 옵션 설정 (최소한의 봇 탐지 우회)
         context_options = {
-            'user_agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+            'user_agent': USER_AGENT,
             'viewport': {'width': 1920, 'height': 1080},
             'locale': 'ko-KR',
             'timezone_id': 'Asia/Seoul',
         }
         
-        # 브라우저 옵션
-        browser_options = {
-            'headless': self.headless,
-        }
-        
-        if not self.headless:
-            browser_options['args'] = ['--disable-blink-features=AutomationControlled']
-        else:
-            browser_options['args'] = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox'
-            ]
-        
-        self.browser = await self.playwright.chromium.launch(**browser_options)
-        self.context = await self.browser.new_context(**context_options)
+        # 브라우저 실행 프로필 (BROWSER_PROFILE, 기본: standard)
+        self.browser = await launch_browser(self.playwright, self.headless, self.browser_profile,
+                                            proxy=PER_CONTEXT_PROXY if self.proxy_pool else None)
+        self._context_options = context_options
+        await self._open_page()
+        return self
+    
+    async def _open_page(self, storage_state: Optional[Dict] = None):
+        """새 컨텍스트/페이지 생성 및 초기 설정 (재생성 시 쿠키/스토리지 상태 유지)"""
+        options = dict(self._context_options, **self._proxy_options())
+        if storage_state:
+            options['storage_state'] = storage_state
+        self.context = await self.browser.new_context(**options)
         self.page = await self.context.new_page()
         
         # 봇 탐지 우회를 위한 JavaScript 주입 (최소한)
-        await self.page.add_init_script("""
-            // navigator.webdriver 속성 제거
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-            
-            // Chrome 객체 추가
-            window.chrome = {
-                runtime: {},
-                loadTimes: function() {},
-                csi: function() {},
-                app: {}
-            };
-        """)
+        await self.page.add_init_script(STEALTH_SCRIPT)
         
         # 기본 헤더 설정
-        await self.page.set_extra_http_headers({
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        await self.page.set_extra_http_headers(PAGE_HEADERS)
         
         self.page.set_default_timeout(self.timeout)
-        return self
+        await self._install_fixture_hooks()
+    
+    def _proxy_options(self) -> Dict:
+        """새 컨텍스트의 프록시 옵션 (프록시가 없거나 풀에서 제외됐으면 새로 배정)"""
+        if not self.proxy_pool:
+            return {}
+        if self.proxy is None or self.proxy.evicted:
+            self.proxy = self.proxy_pool.choose(self.popular_url, sticky=self.proxy_key)
+            print(f"🫛 컨텍스트 프록시: {self.proxy.name}")
+        return {'proxy': self.proxy.playwright_proxy()}
+    
+    def _new_http_client(self, proxy: Optional[Proxy] = None, **kwargs) -> httpx.AsyncClient:
+        """httpx 클라이언트 (proxy를 지정하면 그 프록시 경유, 재생 모드면 픽스처 transport)"""
+        kwargs.setdefault('timeout', self.timeout / 1000)
+        kwargs.setdefault('follow_redirects', True)
+        return httpx.AsyncClient(transport=self._httpx_transport(), proxy=proxy.url if proxy else None, **kwargs)
+    
+    async def _throttle(self, url: str):
+        """요청 전 속도 제한 (프록시를 쓰면 현재 프록시의 호스트 버킷, 아니면 공유 호스트 버킷)"""
+        if self.proxy_pool and self.proxy:
+            await self.proxy_pool.acquire(url, proxy=self.proxy)
+        else:
+            await self.rate_limiter.acquire(url)
+    
+    def _record_proxy(self, outcome: str, proxy: Optional[Proxy] = None):
+        """요청 결과를 프록시 상태 점수에 반영 (프록시를 쓰지 않으면 무시)"""
+        if self.proxy_pool:
+            self.proxy_pool.record(proxy or self.proxy, outcome)
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self._on_close()
         if hasattr(self, 'context') and self.context:
             await self.context.close()
         if self.browser:
@@ -88,6 +201,539 @@ class BaseCrawler(ABC):
     async def crawl(self, max_posts: int = 20) -> List[Post]:
         pass
     
+    @abstractmethod
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        """목록 페이지에서 상세 수집 대상 항목(url, title 등) 수집"""
+        pass
+    
+    def _for_board(self, board: Dict[str, str]) -> 'BaseCrawler':
+        """게시판 하나를 맡을 같은 종류의 크롤러 (브라우저는 _attach로 공유)"""
+        return type(self)(popular_url=board['url'])
+    
+    async def _attach(self, parent: 'BaseCrawler', storage_state: Optional[Dict] = None):
+        """부모 크롤러의 브라우저/로그인/통계를 공유하고 자기 페이지(컨텍스트)만 새로 생성"""
+        self.playwright = parent.playwright
+        self.browser = parent.browser
+        self._context_options = getattr(parent, '_context_options', None)
+        self.naver_cookies = parent.naver_cookies
+        self.fixture_store = parent.fixture_store
+        self.fixture_replayer = parent.fixture_replayer
+        self.selector_stats = parent.selector_stats
+        self.memory = parent.memory
+        self.rate_limiter = parent.rate_limiter
+        self.circuit_breakers = parent.circuit_breakers
+        self.proxy_pool = parent.proxy_pool
+        self._prefetch_filter = parent.prefetch_filter
+        # 게시판마다 자기 컨텍스트 = 자기 프록시 (sticky 키가 있으면 부모와 같은 프록시)
+        await self._open_page(storage_state=storage_state)
+    
+    async def _detach(self):
+        """게시판 크롤러의 컨텍스트만 닫음 (브라우저는 부모가 닫음)"""
+        context = getattr(self, 'context', None) or (self.page.context if self.page else None)
+        if context:
+            await context.close()
+    
+    async def crawl_boards(self, max_posts: int = None) -> List[Post]:
+        """설정된 게시판을 같은 브라우저에서 동시에 수집 (게시판이 하나면 crawl과 동일)
+        
+        게시판마다 별도 컨텍스트/페이지를 열고 브라우저, 로그인 상태, 호스트별 속도 제한기는 공유한다.
+        분류가 비어 있는 게시글은 category에 게시판 이름을 넣는다. 체크포인트는 단일 게시판 실행에만 적용된다.
+        max_posts는 게시판별 제한이다. 시작 전 헬스 체크에 실패하면 바로 빈 결과를 반환한다.
+        """
+        if not await self.check_health():
+            return []
+        if len(self.boards) <= 1:
+            return await self.crawl(max_posts=max_posts)
+        
+        # 로그인이 필요한 채널은 부모에서 한 번만 로그인하고 쿠키/스토리지를 게시판 컨텍스트에 복사
+        await self.prepare_details()
+        storage_state = await self.page.context.storage_state() if self.page else None
+        semaphore = asyncio.Semaphore(max(1, self.board_concurrency))
+        print(f"🫛 게시판 {len(self.boards)}개 동시 수집 (동시 {self.board_concurrency}개): "
+              f"{', '.join(board['name'] for board in self.boards)}")
+        
+        async def crawl_board(board: Dict[str, str]) -> List[Post]:
+            async with semaphore:
+                crawler = self._for_board(board)
+                try:
+                    await crawler._attach(self, storage_state)
+                    posts = await crawler.crawl(max_posts=max_posts)
+                except Exception as e:
+                    print(f"🫛❌ 게시판 {board['name']} 수집 실패: {e}")
+                    return []
+                finally:
+                    await crawler._detach()
+            for post in posts:
+                if not post.category:
+                    post.category = board['name']
+            print(f"🫛 게시판 {board['name']}: {len(posts)}개")
+            return posts
+        
+        results = await asyncio.gather(*(crawl_board(board) for board in self.boards))
+        posts: List[Post] = []
+        seen = set()
+        for board_posts in results:
+            for post in board_posts:
+                if post.url not in seen:
+                    seen.add(post.url)
+                    posts.append(post)
+        print(f"🫛 게시판 {len(self.boards)}개에서 총 {len(posts)}개 게시글 수집 완료")
+        # 게시판 크롤러는 체크포인트를 쓰지 않으므로 부모 상태는 완료로 표시 (run_* 스크립트가 삭제)
+        self._checkpoint_complete()
+        return posts
+    
+    async def check_health(self) -> bool:
+        """수집 시작 전 목록 주소 빠른 확인 (연결 실패/타임아웃/5xx면 서킷을 열고 False)
+        
+        브라우저가 아닌 요청이라 4xx나 봇 확인 페이지는 판단 근거로 쓰지 않는다 (브라우저로는 통과할 수 있음).
+        """
+        if not self.health_check or self.fixture_mode == 'replay':
+            return True
+        breaker = self.circuit_breakers.get(self.popular_url)
+        proxy = self.proxy or (self.proxy_pool.choose(self.popular_url, sticky=self.proxy_key) if self.proxy_pool else None)
+        try:
+            async with self._new_http_client(proxy, headers={'User-Agent': USER_AGENT},
+                                             timeout=self.health_timeout) as client:
+                response = await client.get(self.popular_url)
+        except httpx.HTTPError as e:
+            reason = f"헬스 체크 실패: {describe_error(e)}"
+        else:
+            if response.status_code < 500:
+                return True
+            reason = f"헬스 체크 실패: HTTP {response.status_code}"
+        breaker.trip(reason)
+        print(f"⚠️ {breaker.host} 접속 불가, {self.channel} 수집 생략 ({reason})")
+        return False
+    
+    async def _guarded_fetch_post(self, item: Dict, **kwargs) -> Optional[Post]:
+        """서킷 브레이커를 거친 _fetch_post
+        
+        예외나 봇 확인 페이지는 호스트 실패로 기록한다. 서킷이 열려 있으면 시험 요청 시점까지 기다렸다가
+        같은 항목으로 다시 시도하고, 최대 횟수만큼 열린 뒤에는 CircuitOpenError로 수집 종료를 알린다.
+        """
+        breaker = self.circuit_breakers.get(item.get('url') or self.popular_url)
+        while True:
+            try:
+                breaker.before_request()
+                break
+            except CircuitOpenError as e:
+                if not await self._on_circuit_open(e):
+                    raise
+        try:
+            post = await self._fetch_post(item, **kwargs)
+        except Exception as e:
+            breaker.record_failure(describe_error(e))
+            self._record_proxy(OUTCOME_ERROR)
+            raise
+        if post is None and await self._looks_blocked():
+            breaker.record_failure('봇 확인 페이지')
+            self._record_proxy(OUTCOME_BLOCKED)
+        else:
+            breaker.record_success()
+            self._record_proxy(OUTCOME_OK)
+        return post
+    
+    async def _on_circuit_open(self, error: CircuitOpenError) -> bool:
+        """서킷이 열렸을 때: 최대 횟수 전이면 시험 요청 시점까지 대기 후 True, 아니면 수집 종료(False)"""
+        if self.circuit_breakers.exhausted(error.host):
+            print(f"⚠️ {error.host} 수집 중단: 서킷이 {self.circuit_breakers.max_trips}회 열림 ({error.reason})")
+            return False
+        print(f"🫛 {error}")
+        # 반열림 상태에서 다른 시험 요청이 진행 중이면 잠깐 뒤 다시 확인
+        await asyncio.sleep(max(error.retry_in, 1.0))
+        return True
+    
+    async def _looks_blocked(self) -> bool:
+        """현재 페이지가 봇 확인/차단 페이지인지 (제목 + 보이는 본문 앞부분)"""
+        if self.page is None:
+            return False
+        try:
+            text = await self.page.evaluate(
+                "() => document.title + '\\n' + (document.body ? document.body.innerText.slice(0, 2000) : '')"
+            )
+        except Exception:
+            return False
+        return looks_like_bot_check(text)
+    
+    async def prepare_details(self):
+        """상세 페이지 수집 전 준비 (로그인 등, 분산 워커가 호출)"""
+        pass
+    
+    def _accept_post(self, post: Post) -> bool:
+        """상세 추출 결과 중 저장 대상인지 (목록에서 제목을 얻지 못한 항목도 제목/카테고리 규칙 적용)"""
+        rule = self.prefetch_filter.check_post(post.title, post.category or '')
+        if rule:
+            print(f"🫛 제외 ({rule.name}, 상세): {(post.title or '')[:50]}")
+            return False
+        return True
+    
+    @property
+    def prefetch_filter(self) -> PrefetchFilter:
+        if self._prefetch_filter is None:
+            self._prefetch_filter = PrefetchFilter(self.channel, date_parser=self._parse_date)
+        return self._prefetch_filter
+    
+    def _prefetch_rejected(self, item: Dict, since=None) -> Optional[str]:
+        """목록 항목을 사전 필터로 평가해서 제외 사유 반환 (통과면 None, 상세 페이지로 이동하지 않음)"""
+        rejected = self.prefetch_filter.check(item, since=since)
+        if rejected is None:
+            return None
+        rule, reason = rejected
+        print(f"🫛 제외 ({rule.name}, {reason}): {(item.get('title') or '')[:50]} {item.get('dateText', '')}".rstrip())
+        return reason
+    
+    @abstractmethod
+    async def _fetch_post(self, item: Dict, settle_ms: int = 1000) -> Optional[Post]:
+        """목록 항목 하나의 상세 페이지 접속 + 데이터 추출"""
+        pass
+    
+    async def _install_fixture_hooks(self):
+        """FIXTURE_MODE에 따라 응답 기록 또는 재생 훅 설치 (페이지 재생성 시 다시 호출)"""
+        if not self.fixture_mode:
+            return
+        if self.fixture_store is None:
+            self.fixture_store = FixtureStore(self.fixture_dir, self.channel)
+            if self.fixture_mode == 'record':
+                print(f"🫛📼 픽스처 기록 모드: {self.fixture_store.dir}")
+            else:
+                self.fixture_replayer = FixtureReplayer(self.fixture_store)
+                print(f"🫛📼 픽스처 재생 모드: {self.fixture_store.dir} ({len(self.fixture_store.index)}개 응답)")
+        if self.fixture_mode == 'record':
+            FixtureRecorder(self.fixture_store).attach(self.page)
+        else:
+            await self.page.context.route("**/*", self.fixture_replayer.handle_route)
+    
+    async def _before_navigation(self):
+        """상세 페이지 이동 전 호출: 호스트별 속도 제한 대기, 메모리 측정 후 필요하면 페이지/컨텍스트 재생성"""
+        # 현재 컨텍스트의 프록시가 풀에서 제외됐으면 다른 프록시로 컨텍스트 재생성
+        if self.proxy is not None and self.proxy.evicted:
+            await self._recycle_page(f"프록시 {self.proxy.name} 제외")
+        await self._throttle(self.popular_url)
+        browser_mb = self.memory.sample()
+        reason = None
+        if self.recycle_every and self.navigations_since_recycle >= self.recycle_every:
+            reason = f"{self.navigations_since_recycle}회 이동"
+        elif self.recycle_rss_mb and browser_mb is not None and browser_mb > self.recycle_rss_mb:
+            reason = f"브라우저 RSS {browser_mb:.0f}MB > {self.recycle_rss_mb}MB"
+        if reason:
+            await self._recycle_page(reason)
+        self.navigations_since_recycle += 1
+    
+    async def _recycle_page(self, reason: str):
+        """쿠키/스토리지 상태를 유지한 채 페이지와 컨텍스트를 새로 생성 (렌더러 메모리 반환)"""
+        storage_state = await self.page.context.storage_state()
+        old_context = self.page.context
+        await self.page.close()
+        await old_context.close()
+        await self._open_page(storage_state=storage_state)
+        self.navigations_since_recycle = 0
+        self.recycle_count += 1
+        print(f"🫛 페이지/컨텍스트 재생성 ({reason})")
+    
+    def _record_items(self, items: List[Dict]):
+        """기록 모드일 때 목록 항목 저장"""
+        if self.fixture_mode == 'record' and self.fixture_store:
+            self.fixture_store.save_items(items)
+    
+    def _on_close(self):
+        """브라우저 종료 전 실행 결과 정리 (픽스처, 선택자 통계 저장)"""
+        self._flush_fixtures()
+        self.selector_stats.report()
+        self.selector_stats.save()
+        if self._prefetch_filter:
+            self._prefetch_filter.report()
+        self.memory.report(self.recycle_count)
+        self.circuit_breakers.report()
+        if self.proxy_pool:
+            self.proxy_pool.report()
+        # 마지막 저장 이후 완료된 게시글까지 기록 (정상 완료 시에는 이미 저장됨, 여러 게시판 수집은 재개 대상 아님)
+        if self.checkpoint and not self.checkpoint.state['completed'] and len(self.boards) <= 1:
+            self.checkpoint.save()
+            print(f"🫛 체크포인트 저장: {self.checkpoint.path} (--resume으로 재개 가능)")
+    
+    def _list_page_url(self, page: int) -> str:
+        """목록 URL의 page 파라미터만 바꾼 주소 (체크포인트 재개 시 바로 이동)"""
+        return with_query(self.popular_url, page=str(page))
+    
+    async def _open_list_tab(self):
+        """목록 병렬 수집용 탭 (같은 컨텍스트라 쿠키/재생 훅 공유)"""
+        tab = await self.page.context.new_page()
+        await tab.add_init_script(STEALTH_SCRIPT)
+        await tab.set_extra_http_headers(PAGE_HEADERS)
+        tab.set_default_timeout(self.timeout)
+        if self.fixture_mode == 'record' and self.fixture_store:
+            FixtureRecorder(self.fixture_store).attach(tab)
+        return tab
+    
+    def _edge_dates(self, items: List[Dict]) -> List:
+        """목록 항목 중 날짜를 해석할 수 있는 첫 행과 마지막 행의 날짜"""
+        dates = []
+        for ordered in (items, reversed(items)):
+            for item in ordered:
+                parsed = self._parse_date(item.get('dateText', '')) if item.get('dateText') else None
+                if parsed:
+                    dates.append(parsed)
+                    break
+        return dates
+    
+    async def _load_list_page(self, tab, page_no: int, list_script: str, settle_ms: int = 2000) -> List[Dict]:
+        """목록 페이지 하나를 탭에서 열고 항목 추출"""
+        url = self._list_page_url(page_no)
+        breaker = self.circuit_breakers.get(url)
+        breaker.before_request()
+        await self._throttle(url)
+        try:
+            await tab.goto(url, wait_until="load")
+            if settle_ms:
+                await tab.wait_for_timeout(settle_ms)
+            items = await tab.evaluate(list_script)
+        except Exception as e:
+            breaker.record_failure(describe_error(e))
+            self._record_proxy(OUTCOME_ERROR)
+            raise
+        breaker.record_success()
+        self._record_proxy(OUTCOME_OK)
+        return items
+    
+    async def _collect_by_boundary(self, list_script: str, max_pages: int, since=None,
+                                   settle_ms: int = 2000, page_one_loaded: bool = False) -> Optional[Tuple[List[Dict], int]]:
+        """날짜 경계 페이지를 찾은 뒤 기간 안 페이지를 동시에 수집 → (목록 항목, 경계 페이지), 불가능하면 None
+        
+        경계 판정은 각 페이지의 첫/마지막 행 날짜만 사용하고 (둘 다 기간 시작보다 이전이면 기간 밖),
+        경계 페이지는 기간 안 행이 섞여 있을 수 있으므로 함께 포함한다 (탐색 중 이미 읽은 페이지는 다시 열지 않음).
+        page_one_loaded: self.page에 1페이지가 이미 열려 있음 (첫 탐색은 이동 없이 현재 화면에서 추출)
+        """
+        window_start = self.prefetch_filter.window_start(since)
+        if window_start is None:
+            return None
+        pages: Dict[int, List[Dict]] = {}
+        reused = 0
+        if page_one_loaded:
+            try:
+                pages[1] = await self.page.evaluate(list_script)
+                reused = 1
+            except Exception as e:
+                print(f"🫛 열린 1페이지 추출 실패, 다시 로드: {e}")
+        
+        async def load(tab, page_no: int) -> List[Dict]:
+            pages[page_no] = await self._load_list_page(tab, page_no, list_script, settle_ms)
+            return pages[page_no]
+        
+        async def is_past(page_no: int) -> bool:
+            items = pages[page_no] if page_no in pages else await load(self.page, page_no)
+            if not items:
+                return True  # 빈 페이지 = 목록 끝
+            dates = self._edge_dates(items)
+            # 날짜를 알 수 없는 페이지는 놓치지 않도록 기간 안으로 간주
+            return bool(dates) and max(dates) < window_start
+        
+        try:
+            boundary, probes = await find_boundary_page(is_past, max_pages)
+        except Exception as e:
+            print(f"🫛 경계 탐색 실패, 순차 수집으로 전환: {e}")
+            return None
+        if not pages.get(1):
+            return None
+        
+        last_page = min(boundary, max_pages)
+        remaining = [n for n in range(1, last_page + 1) if n not in pages]
+        print(f"🫛 경계 탐색: 기간 밖 첫 페이지 {boundary} (탐색 {probes}회), "
+              f"남은 {len(remaining)}페이지를 탭 {min(self.list_concurrency, len(remaining))}개로 동시 수집")
+        
+        if remaining:
+            queue: asyncio.Queue = asyncio.Queue()
+            for n in remaining:
+                queue.put_nowait(n)
+            
+            async def worker():
+                tab = await self._open_list_tab()
+                try:
+                    while True:
+                        try:
+                            n = queue.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        try:
+                            await load(tab, n)
+                        except Exception as e:
+                            print(f"🫛 목록 {n}페이지 수집 실패: {e}")
+                finally:
+                    if tab is not None:
+                        await tab.close()
+            
+            await asyncio.gather(*(worker() for _ in range(max(1, min(self.list_concurrency, len(remaining))))))
+        
+        collected: List[Dict] = []
+        seen = set()
+        for n in range(1, last_page + 1):
+            for item in pages.get(n, []):
+                url = item.get('url', '')
+                # 사전 필터 (날짜 범위/제목/카테고리 규칙, 상세 페이지 이동 전)
+                if self._prefetch_rejected(item, since=since):
+                    continue
+                if url and url not in seen:
+                    seen.add(url)
+                    collected.append(item)
+        print(f"🫛 {last_page}페이지에서 {len(collected)}개 수집 (목록 페이지 {len(pages) - reused}회 로드)")
+        return collected, last_page
+    
+    def _resume_listing(self) -> Tuple[List[Dict], int]:
+        """체크포인트의 누적 목록 항목과 다음 목록 페이지 (없으면 빈 목록, 1페이지)"""
+        if self.checkpoint and self.checkpoint.listing_page > 1:
+            return list(self.checkpoint.listing_items), self.checkpoint.listing_page
+        return [], 1
+    
+    def _checkpoint_listing(self, next_page: int, items: List[Dict], done: bool = False):
+        if self.checkpoint:
+            self.checkpoint.save_listing(next_page, items, done=done)
+    
+    def _resumed_items(self) -> Optional[List[Dict]]:
+        """목록 수집이 끝난 체크포인트면 저장된 목록 항목 (목록 페이지 재탐색 생략)"""
+        if self.checkpoint and self.checkpoint.listing_done:
+            items = self.checkpoint.listing_items
+            print(f"🫛 체크포인트의 목록 항목 사용: {len(items)}개")
+            return items
+        return None
+    
+    def _pending_detail_items(self, post_items: List[Dict]) -> Tuple[List[Post], List[Dict]]:
+        """(이미 수집한 게시글, 아직 상세 수집하지 않은 항목)"""
+        if not self.checkpoint:
+            return [], post_items
+        done = self.checkpoint.completed_urls
+        pending = [item for item in post_items if item.get('url') not in done]
+        if len(pending) < len(post_items):
+            print(f"🫛 체크포인트 재개: 상세 수집 {len(post_items) - len(pending)}개 완료, {len(pending)}개 남음")
+        return self.checkpoint.restored_posts(), pending
+    
+    def _checkpoint_post(self, item: Dict, post: Optional[Post]):
+        if self.checkpoint:
+            self.checkpoint.add_post(item, post)
+    
+    def _checkpoint_complete(self):
+        # 서킷이 열려 중단된 실행은 완료 처리하지 않음 (--resume으로 남은 항목 재개)
+        if self.checkpoint and not self.circuit_breakers.exhausted(self.popular_url):
+            self.checkpoint.complete()
+    
+    def _flush_fixtures(self):
+        if self.fixture_mode == 'record' and self.fixture_store:
+            self.fixture_store.flush()
+        if self.fixture_replayer and self.fixture_replayer.misses:
+            print(f"🫛📼 재생 누락 요청: {len(self.fixture_replayer.misses)}개")
+    
+    async def _crawl_details_http(self, post_items: List[Dict], parse_fn: Callable[[str, Dict], Optional[Dict]]) -> List[Post]:
+        """상세 페이지를 httpx로 동시에 가져오고 프로세스 풀에서 파싱 (DETAIL_FETCH=http)
+        
+        프록시 풀이 있으면 프록시마다 클라이언트를 만들고 요청마다 대기 시간이 가장 짧은 프록시로 보낸다
+        (proxy_key가 있으면 그 세션의 프록시만 사용).
+        """
+        print(f"🫛 HTTP 상세 수집: fetch 동시성 {self.fetch_concurrency}, 파싱 워커 {self.parse_workers}개")
+        # 목록 페이지 접속 중 받은 쿠키를 그대로 사용 (봇 확인 통과 상태 유지)
+        cookies = {c['name']: c['value'] for c in await self.page.context.cookies()} if self.page else {}
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        }
+        
+        async with contextlib.AsyncExitStack() as stack:
+            proxies = self.proxy_pool.healthy() if self.proxy_pool else [None]
+            clients = {}
+            for proxy in proxies:
+                clients[proxy.url if proxy else None] = await stack.enter_async_context(
+                    self._new_http_client(proxy, headers=headers, cookies=cookies)
+                )
+            
+            async def fetch(item: Dict) -> str:
+                breaker = self.circuit_breakers.get(item['url'])
+                while True:
+                    try:
+                        breaker.before_request()
+                        break
+                    except CircuitOpenError as e:
+                        # 수집 종료면 예외 그대로 (fetch 워커가 멈춤)
+                        if not await self._on_circuit_open(e):
+                            raise
+                # 모든 프록시가 제외되면 fetch 워커 종료 (직접 연결로 바꾸지 않음: 출구 IP가 드러남)
+                if self.proxy_pool and not self.proxy_pool.healthy():
+                    raise NoHealthyProxyError(f"사용 가능한 프록시 없음 (전체 {len(self.proxy_pool.proxies)}개 제외됨)")
+                # 프록시 차단 응답이면 다른 프록시로 다시 요청 (프록시 수만큼, 최소 1회)
+                for _ in range(max(1, len(proxies))):
+                    if self.proxy_pool:
+                        proxy = await self.proxy_pool.acquire(item['url'], sticky=self.proxy_key)
+                        client = clients[proxy.url]
+                    else:
+                        proxy = None
+                        await self.rate_limiter.acquire(item['url'])
+                        client = clients[None]
+                    try:
+                        response = await client.get(item['url'])
+                    except httpx.HTTPError as e:
+                        breaker.record_failure(describe_error(e))
+                        self._record_proxy(OUTCOME_ERROR, proxy)
+                        raise
+                    outcome = classify_response(response.status_code, response.text)
+                    self._record_proxy(outcome, proxy)
+                    if outcome != OUTCOME_BLOCKED or not self.proxy_pool or not self.proxy_pool.healthy():
+                        break
+                if response.status_code in BLOCKED_STATUSES or response.status_code >= 500:
+                    breaker.record_failure(f"HTTP {response.status_code}")
+                elif html_is_bot_check(response.text):
+                    breaker.record_failure('봇 확인 페이지')
+                    raise Exception("봇 확인 페이지")
+                else:
+                    breaker.record_success()
+                response.raise_for_status()
+                # 요청 간격 조절 (fetch 워커 단위)
+                await asyncio.sleep(self.delay / 1000)
+                return response.text
+            
+            with ParsePool(self.parse_workers) as pool:
+                results = await run_fetch_parse_pipeline(
+                    post_items, fetch, parse_fn, pool, fetch_concurrency=self.fetch_concurrency
+                )
+        
+        posts = []
+        for item, data in zip(post_items, results):
+            if data:
+                post = Post(channel=self.channel, **data)
+                # fetch/파싱 실패 항목은 재개 시 다시 시도하도록 기록하지 않음
+                self._checkpoint_post(item, post)
+                posts.append(post)
+        return posts
+    
+    def _comment_source(self):
+        """댓글 수집 대상 (채널별 CommentSource, 지원하지 않으면 None)"""
+        return None
+    
+    async def collect_comments(self, posts: List[Post]) -> Dict[str, int]:
+        """수집한 게시글의 댓글을 별도 JSONL 파일에 기록 (COMMENTS_DIR/<채널>_comments.jsonl)"""
+        from src.crawlers.comment_collector import CommentCollector, CommentSink
+        source = self._comment_source()
+        if source is None:
+            print(f"🫛 {self.channel}: 댓글 수집 미지원")
+            return {}
+        # 네이버 로그인 쿠키가 있으면 사용, 아니면 현재 브라우저 컨텍스트 쿠키
+        cookies = self.naver_cookies or {c['name']: c['value'] for c in await self.page.context.cookies()}
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+        }
+        items = [{'id': p.id, 'url': p.url, 'comment_cnt': p.comment_cnt} for p in posts]
+        # 프록시를 쓰면 현재 세션의 프록시와 그 프록시의 호스트 버킷으로 요청
+        proxy = self.proxy or (self.proxy_pool.choose(self.popular_url, sticky=self.proxy_key) if self.proxy_pool else None)
+        limiter = proxy.limiter if proxy else self.rate_limiter
+        async with self._new_http_client(proxy, headers=headers, cookies=cookies) as client:
+            with CommentSink(self.channel) as sink:
+                stats = await CommentCollector(source, client, limiter, sink).collect(items)
+        print(f"🫛 댓글 수집 완료: 게시글 {stats['posts']}개, 페이지 {stats['pages']}개, 댓글 {stats['comments']}개 "
+              f"(실패 페이지 {stats['failed_pages']}개, 댓글 없음 {stats['skipped']}개) → {sink.path}")
+        limiter.report()
+        return stats
+    
+    def _httpx_transport(self):
+        """재생 모드면 픽스처 transport, 아니면 None (기본 네트워크)"""
+        return self.fixture_replayer.httpx_transport() if self.fixture_replayer else None
+    
     async def login_naver(self) -> Dict[str, str]:
         """네이버 로그인 후 쿠키 반환"""
         # NAVER_COOKIE가 제공되면 로그인 과정을 우회한다.
@@ -177,7 +823,8 @@ class BaseCrawler(ABC):
             return club_id
 
         # 2차: 응답 HTML에서 g_sClubId 변수 파싱
-        async with httpx.AsyncClient(cookies=self.naver_cookies) as client:
+        async with self._new_http_client(self.proxy, cookies=self.naver_cookies, follow_redirects=False,
+                                          timeout=5.0) as client:
             response = await client.get(cafe_url)
             response.raise_for_status()
             
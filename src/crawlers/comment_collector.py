@@ -0,0 +1,252 @@
+"""
+게시글 댓글 수집 (선택 단계)
+
+수집이 끝난 게시글의 댓글 페이지를 httpx로 가져와 게시글 id 기준 JSONL 파일에 바로 기록한다.
+    - 첫 페이지에서 마지막 댓글 페이지를 확인한 뒤 나머지 페이지를 동시에 요청
+    - 게시글 단위(COMMENT_POST_CONCURRENCY)와 페이지 단위(COMMENT_PAGE_CONCURRENCY) 동시성을 모두 제한하고,
+      모든 요청은 공유 속도 제한기(rate_limiter)를 거침
+    - 페이지를 받는 즉시 파싱/기록하고 버리므로 댓글이 수천 개인 게시글도 메모리에 한꺼번에 올리지 않음
+    - 댓글 수가 0인 게시글은 요청하지 않음
+
+저장 위치: COMMENTS_DIR(기본값: ./comments)/<채널>_comments.jsonl (실행마다 이어 쓰기)
+"""
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from src.crawlers.html_parsers import parse_fmkorea_comments, parse_ppomppu_comments
+from src.utils.canonical_url import extract_post_id
+from src.utils.rate_limiter import HostRateLimiter
+
+# 마지막 페이지를 알 수 없는 경우(카페 API 응답에 총 개수 없음) 순서대로 넘길 최대 페이지 수
+MAX_SEQUENTIAL_PAGES = 200
+
+# 네이버 카페 댓글 JSON API (COMMENT_CAFE_API_URL로 변경 가능)
+CAFE_COMMENT_API = (
+    "https://apis.naver.com/cafe-web/cafe-articleapi/v2.1/cafes/{club_id}/articles/{article_id}"
+    "/comments/pages/{page}?requestFrom=A&orderBy=asc"
+)
+
+
+class CommentSource:
+    """채널별 댓글 페이지 주소/파서"""
+    channel = ''
+    headers: Dict[str, str] = {}
+    # 응답에 마지막 페이지 정보가 없을 수 있음 (True면 짧은 페이지가 나올 때까지 다음 페이지 요청)
+    open_ended = False
+
+    def page_url(self, post_url: str, post_id: int, page: int) -> str:
+        raise NotImplementedError
+
+    def parse(self, text: str) -> Tuple[List[Dict], Optional[int]]:
+        """응답 본문 → (댓글 목록, 마지막 페이지 번호 또는 None)"""
+        raise NotImplementedError
+
+
+class FmkoreaComments(CommentSource):
+    channel = 'fmkorea'
+
+    def __init__(self, base_url: str = "https://www.fmkorea.com"):
+        self.base_url = base_url.rstrip('/')
+
+    def page_url(self, post_url: str, post_id: int, page: int) -> str:
+        return f"{self.base_url}/index.php?document_srl={post_id}&cpage={page}"
+
+    def parse(self, text: str) -> Tuple[List[Dict], Optional[int]]:
+        return parse_fmkorea_comments(text)
+
+
+class PpomppuComments(CommentSource):
+    channel = 'ppomppu'
+
+    def page_url(self, post_url: str, post_id: int, page: int) -> str:
+        separator = '&' if '?' in post_url else '?'
+        return f"{post_url}{separator}c_page={page}"
+
+    def parse(self, text: str) -> Tuple[List[Dict], Optional[int]]:
+        return parse_ppomppu_comments(text)
+
+
+def _dig(data, *path):
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def parse_cafe_comments(text: str) -> Tuple[List[Dict], Optional[int]]:
+    """카페 댓글 API JSON → 댓글 목록 (총 개수가 있으면 마지막 페이지 계산)"""
+    data = json.loads(text)
+    result = data.get('result', data)
+    block = result.get('comments') or {}
+    items = block.get('items', []) if isinstance(block, dict) else block
+
+    comments = []
+    for item in items or []:
+        if item.get('isDeleted'):
+            continue
+        comment_id = item.get('id') or item.get('commentId')
+        ref_id = item.get('refId') or item.get('refCommentId')
+        written = item.get('updateDate') or item.get('writeDate')
+        if isinstance(written, (int, float)):
+            written = datetime.fromtimestamp(written / 1000).strftime('%Y-%m-%d %H:%M')
+        comments.append({
+            'comment_id': comment_id,
+            'parent_id': ref_id if ref_id and ref_id != comment_id else None,
+            'author': _dig(item, 'writer', 'nick') or item.get('nickname') or '',
+            'content': item.get('content') or '',
+            'created_at': written or '',
+            'like_cnt': item.get('likeItCount') or 0,
+        })
+
+    last_page = _dig(block, 'pageInfo', 'lastNavigationPageNumber') if isinstance(block, dict) else None
+    if not last_page:
+        total = _dig(result, 'article', 'commentCount') or _dig(block, 'totalCount')
+        per_page = _dig(block, 'pageInfo', 'perPage') or (len(items) if items else 0)
+        if total and per_page:
+            last_page = -(-int(total) // int(per_page))
+    return comments, int(last_page) if last_page else None
+
+
+class CafeComments(CommentSource):
+    channel = 'mam2bebe'
+    headers = {'Referer': 'https://cafe.naver.com/', 'Accept': 'application/json'}
+    open_ended = True
+
+    def __init__(self, club_id: int, clubs: Optional[Dict[str, int]] = None):
+        self.club_id = club_id
+        # 여러 카페 수집 시 게시글 URL의 카페 슬러그 → club_id
+        self.clubs = clubs or {}
+        self.url_template = os.getenv('COMMENT_CAFE_API_URL', CAFE_COMMENT_API)
+
+    def page_url(self, post_url: str, post_id: int, page: int) -> str:
+        slug = urlsplit(post_url).path.strip('/').split('/', 1)[0]
+        club_id = self.clubs.get(slug, self.club_id)
+        return self.url_template.format(club_id=club_id, article_id=post_id, page=page)
+
+    def parse(self, text: str) -> Tuple[List[Dict], Optional[int]]:
+        return parse_cafe_comments(text)
+
+
+class CommentSink:
+    """댓글 JSONL 파일 (페이지 단위로 바로 기록)"""
+
+    def __init__(self, channel: str, path: Optional[str] = None):
+        directory = os.getenv('COMMENTS_DIR', 'comments')
+        self.path = path or os.path.join(directory, f"{channel}_comments.jsonl")
+        self.file = None
+        self.rows = 0
+
+    def __enter__(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.file = open(self.path, 'a', encoding='utf-8')
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def write(self, records: List[Dict]):
+        if not records:
+            return
+        self.file.write(''.join(json.dumps(r, ensure_ascii=False) + '\n' for r in records))
+        self.file.flush()
+        self.rows += len(records)
+
+
+class CommentCollector:
+    """게시글 목록의 댓글을 동시에 수집해 CommentSink에 기록"""
+
+    def __init__(
+        self,
+        source: CommentSource,
+        client: httpx.AsyncClient,
+        limiter: HostRateLimiter,
+        sink: CommentSink,
+        post_concurrency: Optional[int] = None,
+        page_concurrency: Optional[int] = None,
+    ):
+        self.source = source
+        self.client = client
+        self.limiter = limiter
+        self.sink = sink
+        self.post_concurrency = post_concurrency or int(os.getenv('COMMENT_POST_CONCURRENCY', '2'))
+        self.page_semaphore = asyncio.Semaphore(page_concurrency or int(os.getenv('COMMENT_PAGE_CONCURRENCY', '4')))
+        self.stats = {'posts': 0, 'pages': 0, 'comments': 0, 'failed_pages': 0, 'skipped': 0}
+
+    async def _fetch_page(self, post: Dict, page: int) -> Optional[Tuple[int, Optional[int]]]:
+        """댓글 한 페이지 요청 → 파싱 → 기록, (기록한 댓글 수, 마지막 페이지) 반환 (실패 시 None)"""
+        url = self.source.page_url(post['url'], post['id'], page)
+        # 파싱/기록까지 세마포어 안에서 (메모리에 남는 페이지 수를 페이지 동시성 이하로 유지)
+        async with self.page_semaphore:
+            await self.limiter.acquire(url)
+            try:
+                response = await self.client.get(url, headers=self.source.headers)
+                response.raise_for_status()
+                # 파싱은 스레드에서 (다른 페이지 요청이 계속 진행되도록)
+                comments, last_page = await asyncio.to_thread(self.source.parse, response.text)
+            except Exception as e:
+                print(f"🫛 댓글 페이지 수집 실패 ({post['id']} p{page}): {e}")
+                self.stats['failed_pages'] += 1
+                return None
+            self.sink.write([
+                {'channel': self.source.channel, 'post_id': post['id'], 'post_url': post['url'], 'page': page, **c}
+                for c in comments
+            ])
+        self.stats['pages'] += 1
+        self.stats['comments'] += len(comments)
+        return len(comments), last_page
+
+    async def collect_post(self, post: Dict) -> int:
+        """게시글 하나의 모든 댓글 페이지 수집, 기록한 댓글 수 반환"""
+        first = await self._fetch_page(post, 1)
+        if first is None:
+            return 0
+        count, last_page = first
+        if last_page and last_page > 1:
+            results = await asyncio.gather(*(self._fetch_page(post, page) for page in range(2, last_page + 1)))
+            count += sum(r[0] for r in results if r)
+        elif last_page is None and count and self.source.open_ended:
+            # 마지막 페이지를 모르면 첫 페이지보다 적게 올 때까지 순서대로
+            page_size = count
+            for page in range(2, MAX_SEQUENTIAL_PAGES + 1):
+                result = await self._fetch_page(post, page)
+                if not result or not result[0]:
+                    break
+                count += result[0]
+                if result[0] < page_size:
+                    break
+        self.stats['posts'] += 1
+        return count
+
+    async def collect(self, posts: List[Dict]) -> Dict[str, int]:
+        """posts: url/id/comment_cnt를 가진 dict 목록"""
+        targets = []
+        for post in posts:
+            post_id = post.get('id') or extract_post_id(self.source.channel, post.get('url', ''))
+            if post_id is None or not post.get('comment_cnt'):
+                self.stats['skipped'] += 1
+                continue
+            targets.append({'id': post_id, 'url': post.get('url', '')})
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for post in targets:
+            queue.put_nowait(post)
+
+        async def worker():
+            while True:
+                try:
+                    post = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await self.collect_post(post)
+
+        await asyncio.gather(*(worker() for _ in range(max(1, min(self.post_concurrency, len(targets))))))
+        return self.stats
@@ -1,88 +1,131 @@
-from src.crawlers.base_crawler import BaseCrawler
+from src.crawlers.base_crawler import BaseCrawler, parse_boards, with_query
+from src.utils.circuit_breaker import CircuitOpenError
 from src.models.post import Post
+from src.utils.brand_tagger import get_brand_tagger
+from src.utils.canonical_url import canonical_post_url
+from src.utils.prefetch_filters import REASON_TOO_OLD
+from src.crawlers.html_parsers import parse_fmkorea_detail, clean_fmkorea_content, parse_fmkorea_date
+from src.crawlers.comment_collector import FmkoreaComments
 from typing import List, Dict, Optional
+import os
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
+from urllib.parse import urlsplit
+
+
+# 목록 페이지의 게시글 항목 추출 (순차 수집/경계 탐색 공용)
+LIST_ITEMS_SCRIPT = """
+(() => {
+    const items = [];
+    // 게시글 목록 찾기 (일반적으로 ul, li 또는 div 구조)
+    const articleSelectors = [
+        'ul.bd_lst li',
+        'li.li',
+        '.hotdeal_list li',
+        '[class*="list"] li',
+        'div[class*="article"]',
+        'tr[class*="list"]'
+    ];
+
+    let rows = [];
+    for (const sel of articleSelectors) {
+        rows = Array.from(document.querySelectorAll(sel));
+        if (rows.length > 0) {
+            console.log('게시글 목록 발견:', sel, '개수:', rows.length);
+            break;
+        }
+    }
+
+    for (const row of rows) {
+        // 제목 링크 찾기
+        const titleLink = row.querySelector('a[href*="/"], a[href*="index.php"]');
+        if (!titleLink) continue;
+
+        const href = titleLink.getAttribute('href');
+        if (!href) continue;
+
+        // URL 생성 (현재 문서 기준 절대 경로)
+        let fullUrl = href;
+        if (href.startsWith('/')) {
+            fullUrl = location.origin + href;
+        } else if (!href.startsWith('http')) {
+            fullUrl = location.origin + '/' + href;
+        }
+
+        // 제목 추출
+        const titleText = titleLink.innerText.trim() || titleLink.textContent.trim();
+        if (!titleText) continue;
+
+        // 날짜 추출 (span.date.m_no 또는 유사한 구조)
+        let dateText = '';
+        const dateElem = row.querySelector('span.date, .date, [class*="date"]');
+        if (dateElem) {
+            dateText = dateElem.innerText.trim();
+        }
+
+        items.push({
+            url: fullUrl,
+            title: titleText,
+            dateText: dateText
+        });
+    }
+
+    return items;
+})()
+"""
 
 
 class FmkoreaCrawler(BaseCrawler):
-    def __init__(self):
+    def __init__(self, popular_url: Optional[str] = None):
         super().__init__()
-        self.popular_url = "https://www.fmkorea.com/index.php?mid=hotdeal&sort_index=pop&order_type=desc"
+        # 목 서버 등으로 대상 변경 가능 (인자 > FMKOREA_POPULAR_URL > 기본값)
+        self.popular_url = popular_url or os.getenv(
+            'FMKOREA_POPULAR_URL',
+            "https://www.fmkorea.com/index.php?mid=hotdeal&sort_index=pop&order_type=desc"
+        )
         self.channel = "fmkorea"
+        # 여러 게시판 (FMKOREA_BOARDS="hotdeal,best" 또는 "이름=URL", 게시판 이름은 목록 URL의 mid)
+        self.boards = parse_boards(os.getenv('FMKOREA_BOARDS', ''), self.popular_url,
+                                   lambda mid: with_query(self.popular_url, mid=mid))
     
     async def crawl(self, max_posts: int = None) -> List[Post]:
         """에펨코리아 인기글 크롤링 (오늘 기준 일주일 전까지)"""
         posts = []
         
         try:
-            # 1. 인기글 페이지 접속
-            print(f"🫛 인기글 페이지 접속: {self.popular_url}")
+            # 1~2. 인기글 페이지 접속 및 게시글 목록 수집 (일주일 전까지 필터링)
+            post_items = await self.discover(max_posts)
             
-            # 재시도 로직
-            max_retries = 3
-            for retry in range(max_retries):
-                try:
-                    response = await self.page.goto(
-                        self.popular_url,
-                        wait_until="load",
-                        timeout=30000
-                    )
-                    if response:
-                        print(f"🫛 페이지 응답 상태: {response.status}")
-                        if response.status != 200:
-                            raise Exception(f"HTTP 상태 코드 오류: {response.status}")
-                    
-                    await self.page.wait_for_timeout(3000)
+            # 3. 각 게시글 상세 정보 수집 (체크포인트 재개 시 남은 항목만)
+            posts, pending_items = self._pending_detail_items(post_items)
+            if self.detail_fetch == 'http':
+                # HTTP fetch + 프로세스 풀 파싱
+                posts += await self._crawl_details_http(pending_items, parse_fmkorea_detail)
+            else:
+                for i, item in enumerate(pending_items):
+                    try:
+                        post_url = item.get('url', '')
                     
-                    # 페이지 내용 확인
-                    page_title = await self.page.title()
-                    print(f"🫛 페이지 제목: {page_title[:50]}...")
+                        print(f"🫛 게시글 데이터 수집 시작: {post_url} [{i+1}/{len(pending_items)}]")
                     
-                    break
-                except Exception as e:
-                    if retry < max_retries - 1:
-                        print(f"🫛 페이지 로드 실패, 재시도 중... ({retry + 1}/{max_retries}): {e}")
-                        await self.page.wait_for_timeout(5000)
-                    else:
-                        print(f"🫛 페이지 로드 최종 실패: {e}")
+                        post = await self._guarded_fetch_post(item)
+                        self._checkpoint_post(item, post)
+                        if post:
+                            posts.append(post)
+                        
+                            # 요청 간격 조절
+                            await self.page.wait_for_timeout(1000)
+                        
+                    except CircuitOpenError:
+                        # 서킷이 최대 횟수만큼 열림: 남은 상세 수집 중단 (체크포인트로 재개 가능)
+                        break
+                    except Exception as e:
+                        print(f"🫛 게시글 {post_url} 처리 중 오류: {e}")
                         import traceback
                         traceback.print_exc()
-                        raise
-            
-            # 2. 게시글 목록 수집 (일주일 전까지 필터링)
-            post_items = await self._get_posts_from_popular_page(max_posts)
-            print(f"🫛 수집된 게시글 목록: {len(post_items)}개")
+                        continue
             
-            # 3. 각 게시글 상세 정보 수집
-            for i, item in enumerate(post_items):
-                try:
-                    post_url = item.get('url', '')
-                    title = item.get('title', '')
-                    
-                    print(f"🫛 게시글 데이터 수집 시작: {post_url} [{i+1}/{len(post_items)}]")
-                    
-                    # 게시글 상세 페이지 접속
-                    await self.page.goto(
-                        post_url,
-                        wait_until="load",
-                        timeout=30000
-                    )
-                    await self.page.wait_for_timeout(1000)
-                    
-                    # 게시글 데이터 추출
-                    post = await self._extract_post_data(post_url, title)
-                    if post:
-                        posts.append(post)
-                        
-                        # 요청 간격 조절
-                        await self.page.wait_for_timeout(1000)
-                        
-                except Exception as e:
-                    print(f"🫛 게시글 {post_url} 처리 중 오류: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            self._checkpoint_complete()
                     
         except Exception as e:
             print(f"🫛 에펨코리아 크롤링 오류: {e}")
@@ -92,82 +135,98 @@ class FmkoreaCrawler(BaseCrawler):
         print(f"🫛 총 {len(posts)}개 게시글 수집 완료")
         return posts
     
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        """인기글 목록에서 상세 수집 대상 항목 수집"""
+        resumed = self._resumed_items()
+        if resumed is not None:
+            return resumed
+        await self._open_popular_page()
+        post_items = await self._get_posts_from_popular_page(max_posts)
+        print(f"🫛 수집된 게시글 목록: {len(post_items)}개")
+        self._record_items(post_items)
+        return post_items
+    
+    async def _open_popular_page(self):
+        """인기글 목록 페이지 접속 (재시도 포함)"""
+        print(f"🫛 인기글 페이지 접속: {self.popular_url}")
+        
+        # 재시도 로직
+        max_retries = 3
+        for retry in range(max_retries):
+            try:
+                response = await self.page.goto(
+                    self.popular_url,
+                    wait_until="load",
+                    timeout=30000
+                )
+                if response:
+                    print(f"🫛 페이지 응답 상태: {response.status}")
+                    if response.status != 200:
+                        raise Exception(f"HTTP 상태 코드 오류: {response.status}")
+                
+                await self.page.wait_for_timeout(3000)
+                
+                # 페이지 내용 확인
+                page_title = await self.page.title()
+                print(f"🫛 페이지 제목: {page_title[:50]}...")
+                
+                break
+            except Exception as e:
+                if retry < max_retries - 1:
+                    print(f"🫛 페이지 로드 실패, 재시도 중... ({retry + 1}/{max_retries}): {e}")
+                    await self.page.wait_for_timeout(5000)
+                else:
+                    print(f"🫛 페이지 로드 최종 실패: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    raise
+
+    async def _fetch_post(self, item: Dict, settle_ms: int = 1000) -> Optional[Post]:
+        """게시글 상세 페이지 접속 후 데이터 추출"""
+        post_url = item.get('url', '')
+        await self._before_navigation()
+        await self.page.goto(
+            post_url,
+            wait_until="load",
+            timeout=30000
+        )
+        if settle_ms:
+            await self.page.wait_for_timeout(settle_ms)
+        return await self._extract_post_data(post_url, item.get('title', ''))
+    
     async def _get_posts_from_popular_page(self, max_posts: int = None) -> List[Dict]:
         """인기글 페이지에서 게시글 정보를 수집 (오늘 기준 일주일 전까지)"""
         print(f"🫛 인기글 목록 수집 중...")
         
-        # 날짜 필터: 오늘 기준 일주일 전
+        # 날짜 필터: 사전 필터의 날짜 규칙 (기본: 오늘 기준 일주일 전)
         today = datetime.now()
-        week_ago = today - timedelta(days=7)
-        print(f"🫛 날짜 필터: {week_ago.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
+        window_start = self.prefetch_filter.window_start()
+        if window_start:
+            print(f"🫛 날짜 필터: {window_start.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
         
-        collected_items: List[Dict] = []
-        current_page = 1
         max_pages = 200  # 충분히 큰 값
+        # 체크포인트가 있으면 저장된 목록 페이지부터 이어서 수집
+        collected_items, current_page = self._resume_listing()
+        
+        # 경계 탐색: 기간이 끝나는 페이지를 O(log N)번 만에 찾고 그 앞 페이지는 동시에 수집
+        # (체크포인트 재개 중이거나 max_posts 제한이 있으면 기존 순차 수집, 1페이지는 _open_popular_page에서 연 화면 사용)
+        if self.boundary_search and current_page == 1 and not max_posts:
+            found = await self._collect_by_boundary(LIST_ITEMS_SCRIPT, max_pages, page_one_loaded=True)
+            if found is not None:
+                post_items, last_page = found
+                self._checkpoint_listing(last_page + 1, post_items, done=True)
+                print(f"🫛 총 {len(post_items)}개 인기글 수집 완료 (경계 {last_page}페이지)")
+                return post_items
+            await self.page.goto(self._list_page_url(1), wait_until="load")
+        if current_page > 1:
+            print(f"🫛 체크포인트 재개: {current_page}페이지부터 목록 수집 (누적 {len(collected_items)}개)")
+            await self.page.goto(self._list_page_url(current_page), wait_until="load")
         
         while current_page <= max_pages:
             await self.page.wait_for_timeout(2000)
             
             # 현재 페이지에서 게시글 정보 추출
-            items = await self.page.evaluate("""
-                (() => {
-                    const items = [];
-                    // 게시글 목록 찾기 (일반적으로 ul, li 또는 div 구조)
-                    const articleSelectors = [
-                        'ul.bd_lst li',
-                        'li.li',
-                        '.hotdeal_list li',
-                        '[class*="list"] li',
-                        'div[class*="article"]',
-                        'tr[class*="list"]'
-                    ];
-                    
-                    let rows = [];
-                    for (const sel of articleSelectors) {
-                        rows = Array.from(document.querySelectorAll(sel));
-                        if (rows.length > 0) {
-                            console.log('게시글 목록 발견:', sel, '개수:', rows.length);
-                            break;
-                        }
-                    }
-                    
-                    for (const row of rows) {
-                        // 제목 링크 찾기
-                        const titleLink = row.querySelector('a[href*="/"], a[href*="index.php"]');
-                        if (!titleLink) continue;
-                        
-                        const href = titleLink.getAttribute('href');
-                        if (!href) continue;
-                        
-                        // URL 생성
-                        let fullUrl = href;
-                        if (href.startsWith('/')) {
-                            fullUrl = 'https://www.fmkorea.com' + href;
-                        } else if (!href.startsWith('http')) {
-                            fullUrl = 'https://www.fmkorea.com/' + href;
-                        }
-                        
-                        // 제목 추출
-                        const titleText = titleLink.innerText.trim() || titleLink.textContent.trim();
-                        if (!titleText) continue;
-                        
-                        // 날짜 추출 (span.date.m_no 또는 유사한 구조)
-                        let dateText = '';
-                        const dateElem = row.querySelector('span.date, .date, [class*="date"]');
-                        if (dateElem) {
-                            dateText = dateElem.innerText.trim();
-                        }
-                        
-                        items.push({
-                            url: fullUrl,
-                            title: titleText,
-                            dateText: dateText
-                        });
-                    }
-                    
-                    return items;
-                })()
-            """)
+            items = await self.page.evaluate(LIST_ITEMS_SCRIPT)
             
             print(f"🫛 [페이지 {current_page}] 화면에서 발견된 게시글 수: {len(items)}")
             
@@ -176,24 +235,12 @@ class FmkoreaCrawler(BaseCrawler):
             
             for item in items:
                 url = item.get('url', '')
-                title = item.get('title', '')
-                date_text = item.get('dateText', '')
                 
-                # 날짜 필터링 (일주일 전까지)
-                if date_text:
-                    post_date = self._parse_date(date_text)
-                    if post_date:
-                        if post_date < week_ago:
-                            print(f"🫛 제외: 일주일 이전 게시글 - {date_text}")
-                            found_old_posts = True
-                            continue
-                    else:
-                        # 날짜 파싱 실패 시 제외
-                        print(f"🫛 날짜 파싱 실패, 제외: {date_text}")
-                        continue
-                else:
-                    # 날짜 정보가 없으면 제외
-                    print(f"🫛 날짜 정보 없음, 제외")
+                # 사전 필터 (날짜 범위/제목/카테고리 규칙, 상세 페이지 이동 전)
+                reason = self._prefetch_rejected(item)
+                if reason:
+                    if reason == REASON_TOO_OLD:
+                        found_old_posts = True
                     continue
                 
                 # 중복 체크 (URL 기반)
@@ -214,6 +261,9 @@ class FmkoreaCrawler(BaseCrawler):
                 print(f"🫛 max_posts({max_posts})에 도달하여 수집 종료")
                 break
             
+            # 목록 커서 저장 (다음 실행은 다음 페이지부터)
+            self._checkpoint_listing(current_page + 1, collected_items)
+            
             # 다음 페이지로 이동
             if current_page < max_pages:
                 next_page_clicked = False
@@ -291,68 +341,22 @@ class FmkoreaCrawler(BaseCrawler):
         else:
             post_items = collected_items
         
+        self._checkpoint_listing(current_page, post_items, done=True)
         print(f"🫛 총 {len(post_items)}개 인기글 수집 완료 (총 {current_page}페이지 순회)")
         return post_items
     
+    def _comment_source(self):
+        """에펨코리아 댓글 페이지 (?cpage=N)"""
+        parts = urlsplit(self.popular_url)
+        return FmkoreaComments(f"{parts.scheme}://{parts.netloc}")
+    
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         """날짜 텍스트를 datetime으로 변환"""
-        if not date_text:
-            return None
-        
         try:
-            date_text = date_text.strip()
-            
-            # 형식 1: "2025.11.04 18:25" (YYYY.MM.DD HH:MM)
-            match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                hour = int(match.group(4))
-                minute = int(match.group(5))
-                return datetime(year, month, day, hour, minute)
-            
-            # 형식 2: "2025-11-04 18:25" (YYYY-MM-DD HH:MM)
-            match = re.search(r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                hour = int(match.group(4))
-                minute = int(match.group(5))
-                return datetime(year, month, day, hour, minute)
-            
-            # 형식 3: "2025.11.03" (YYYY.MM.DD) - 날짜만, 시간 없음 (00:00으로 설정)
-            match = re.match(r'^(\d{4})\.(\d{1,2})\.(\d{1,2})$', date_text)
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                return datetime(year, month, day, 0, 0)
-            
-            # 형식 4: "20:43", "20:12" (HH:MM) - 오늘 날짜로 가정
-            match = re.match(r'^(\d{1,2}):(\d{1,2})$', date_text)
-            if match:
-                today = datetime.now()
-                hour = int(match.group(1))
-                minute = int(match.group(2))
-                return today.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            # 형식 5: "11.04 18:25" (MM.DD HH:MM) - 올해로 가정
-            match = re.search(r'(\d{1,2})\.(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
-            if match:
-                today = datetime.now()
-                month = int(match.group(1))
-                day = int(match.group(2))
-                hour = int(match.group(3))
-                minute = int(match.group(4))
-                return today.replace(month=month, day=day, hour=hour, minute=minute, second=0, microsecond=0)
-            
+            return parse_fmkorea_date(date_text)
         except Exception as e:
             print(f"🫛 날짜 파싱 오류: {date_text} - {e}")
             return None
-        
-        return None
     
     async def _extract_post_data(self, post_url: str, title_from_list: str) -> Optional[Post]:
         """게시글 상세 페이지에서 데이터 추출"""
@@ -370,9 +374,6 @@ class FmkoreaCrawler(BaseCrawler):
                     # 여러 줄일 경우 첫 번째 줄만
                     title = title.split('\n')[0].strip()
             
-            # own_company: 제목에 "롯데온"이 있으면 1, 없으면 0
-            own_company = 1 if title and '롯데온' in title else 0
-            
             # 본문 내용 추출 (텍스트만, 이미지 제외, URL 및 탭 문자 제거)
             content = ""
             # 더 정확한 선택자 우선 사용
@@ -385,7 +386,8 @@ class FmkoreaCrawler(BaseCrawler):
                 'div[class*="article"]'
             ]
             
-            for sel in content_selectors:
+            trial = self.selector_stats.trial(self.channel, 'content', content_selectors)
+            for sel in trial:
                 try:
                     content_elem = await self.page.query_selector(sel)
                     if content_elem:
@@ -491,39 +493,10 @@ class FmkoreaCrawler(BaseCrawler):
                             }
                         """)
                         if content:
-                            # URL 제거 (모든 http:// 또는 https:// 패턴)
-                            content = re.sub(r'https?://[^\s]+', '', content)
-                            # "복사" 텍스트 제거
-                            content = re.sub(r'복사\s*', '', content)
-                            # "== $0" 같은 개발자 도구 표시 제거
-                            content = re.sub(r'==\s*\$\d+', '', content)
-                            # UI 관련 텍스트 제거
-                            content = re.sub(r'[^\n]*불러오는 중입니다[^\n]*', '', content)
-                            content = re.sub(r'[^\n]*검색어[^\n]*', '', content)
-                            content = re.sub(r'[^\n]*추천[^\n]*', '', content)
-                            content = re.sub(r'[^\n]*OFF[^\n]*', '', content)
-                            content = re.sub(r'[^\n]*저장[^\n]*', '', content)
-                            # 탭 문자(\t)를 공백으로 변환
-                            content = content.replace('\t', ' ')
-                            # 줄바꿈을 유지하면서 각 줄 내의 연속된 공백만 정리
-                            lines = content.split('\n')
-                            cleaned_lines = []
-                            for line in lines:
-                                # 각 줄 내의 연속된 공백만 정리 (줄바꿈은 유지)
-                                # URL 패턴이 남아있으면 제거
-                                cleaned_line = re.sub(r'https?://[^\s]+', '', line.strip())
-                                cleaned_line = re.sub(r' +', ' ', cleaned_line)
-                                # UI 관련 텍스트 제거
-                                if (cleaned_line and 
-                                    not cleaned_line.startswith('http') and
-                                    '불러오는 중입니다' not in cleaned_line and
-                                    '검색어' not in cleaned_line and
-                                    '추천' not in cleaned_line and
-                                    len(cleaned_line) > 5):  # 너무 짧은 텍스트 제외
-                                    cleaned_lines.append(cleaned_line)
-                            content = '\n'.join(cleaned_lines)
+                            content = clean_fmkorea_content(content)
                             if len(content) > 10:
                                 print(f"🫛 본문 추출 성공 (선택자: {sel}): {len(content)}자")
+                                trial.hit(sel)
                                 break
                 except Exception as e:
                     continue
@@ -595,29 +568,8 @@ class FmkoreaCrawler(BaseCrawler):
             except Exception as e:
                 print(f"🫛 날짜 추출 오류: {e}")
             
-            # URL 추출 (div.document_address a 또는 data-clipboard-text)
-            actual_url = post_url
-            try:
-                # 방법 1: div.document_address a 태그
-                doc_address = await self.page.query_selector('div.document_address')
-                if doc_address:
-                    a_tag = await doc_address.query_selector('a')
-                    if a_tag:
-                        url_text = await a_tag.inner_text()
-                        if url_text and 'fmkorea.com' in url_text:
-                            actual_url = url_text.strip()
-                            print(f"🫛 URL 추출 성공 (document_address): {actual_url}")
-                
-                # 방법 2: data-clipboard-text 속성
-                if actual_url == post_url:
-                    copy_button = await self.page.query_selector('button[data-clipboard-text]')
-                    if copy_button:
-                        clipboard_url = await copy_button.get_attribute('data-clipboard-text')
-                        if clipboard_url and 'fmkorea.com' in clipboard_url:
-                            actual_url = clipboard_url
-                            print(f"🫛 URL 추출 성공 (clipboard): {actual_url}")
-            except Exception as e:
-                print(f"🫛 URL 추출 오류: {e}")
+            # URL: 목록 URL의 document_srl로 정식 주소 생성 (주소 영역/복사 버튼 탐색 불필요)
+            actual_url = canonical_post_url(self.channel, post_url)
             
             # content가 없거나 의미있는 내용이 없으면 None 반환 (pass)
             content_cleaned = content.strip() if content else ""
@@ -625,6 +577,9 @@ class FmkoreaCrawler(BaseCrawler):
                 print(f"🫛 content가 없어서 게시물 제외: {post_url}")
                 return None
             
+            # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+            own_company = get_brand_tagger().own_company(title, content)
+            
             print(f"🫛 추출 완료: title={title[:30]}..., view_cnt={view_cnt}, comment_cnt={comment_cnt}, like_cnt={like_cnt}, own_company={own_company}")
             
             return Post(
@@ -0,0 +1,603 @@
+"""
+상세 페이지 HTML 파서 (BeautifulSoup 기반)
+
+HTTP로 받아온 원본 HTML을 프로세스 풀에서 파싱할 수 있도록 모듈 수준 함수로 구성한다.
+반환값은 Post 필드(channel 제외)를 담은 dict이며, 본문이 없으면 None을 반환한다.
+"""
+import re
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, Comment, NavigableString, Tag
+
+from src.utils.brand_tagger import get_brand_tagger
+from src.utils.canonical_url import canonical_post_url, extract_post_id
+
+# innerText 근사 시 앞뒤로 줄바꿈을 넣는 블록 요소
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'dd', 'div', 'dl', 'dt', 'fieldset',
+    'figcaption', 'figure', 'footer', 'form', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'header', 'hr', 'li', 'main', 'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul',
+}
+SKIP_TAGS = {'script', 'style', 'noscript', 'template'}
+
+
+def inner_text(node: Tag) -> str:
+    """브라우저 innerText 근사 (블록 요소/br 기준 줄바꿈, 셀은 탭으로 구분)"""
+    parts: List[str] = []
+
+    def walk(parent: Tag):
+        for child in parent.children:
+            if isinstance(child, Comment):
+                continue
+            if isinstance(child, NavigableString):
+                parts.append(re.sub(r'\s+', ' ', str(child)))
+            elif child.name in SKIP_TAGS:
+                continue
+            elif child.name == 'br':
+                parts.append('\n')
+            elif child.name in BLOCK_TAGS:
+                parts.append('\n')
+                walk(child)
+                parts.append('\n')
+            elif child.name in ('td', 'th'):
+                walk(child)
+                parts.append('\t')
+            else:
+                walk(child)
+
+    walk(node)
+    lines = [line.strip(' ') for line in ''.join(parts).split('\n')]
+    # 연속된 빈 줄은 하나로
+    text = re.sub(r'\n{2,}', '\n', '\n'.join(lines))
+    return text.strip()
+
+
+def _parse_count(text: str) -> int:
+    match = re.search(r'([\d,]+)', text or '')
+    return int(match.group(1).replace(',', '')) if match else 0
+
+
+def _remove(root: Tag, selector: str):
+    for el in root.select(selector):
+        el.decompose()
+
+
+# ---------------------------------------------------------------------------
+# 에펨코리아
+# ---------------------------------------------------------------------------
+
+FMKOREA_CONTENT_SELECTORS = [
+    'div[class*="document_"][class*="_content"]',  # document_*_content 패턴
+    '.rd_body',
+    '.xe_content',
+    'div[class*="content"]:not([class*="search"]):not([class*="keyword"])',  # 검색어 관련 제외
+    '.document_content',
+    'div[class*="article"]'
+]
+
+FMKOREA_UI_WORDS = ('불러오는 중입니다', '검색어', '추천', 'OFF', '저장')
+
+
+def parse_fmkorea_date(date_text: str) -> Optional[datetime]:
+    """에펨코리아 날짜 텍스트를 datetime으로 변환"""
+    if not date_text:
+        return None
+
+    date_text = date_text.strip()
+
+    # 형식 1: "2025.11.04 18:25" (YYYY.MM.DD HH:MM)
+    match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
+    if match:
+        year, month, day, hour, minute = (int(g) for g in match.groups())
+        return datetime(year, month, day, hour, minute)
+
+    # 형식 2: "2025-11-04 18:25" (YYYY-MM-DD HH:MM)
+    match = re.search(r'(\d{4})-(\d{1,2})-(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
+    if match:
+        year, month, day, hour, minute = (int(g) for g in match.groups())
+        return datetime(year, month, day, hour, minute)
+
+    # 형식 3: "2025.11.03" (YYYY.MM.DD) - 날짜만, 시간 없음 (00:00으로 설정)
+    match = re.match(r'^(\d{4})\.(\d{1,2})\.(\d{1,2})$', date_text)
+    if match:
+        year, month, day = (int(g) for g in match.groups())
+        return datetime(year, month, day, 0, 0)
+
+    # 형식 4: "20:43", "20:12" (HH:MM) - 오늘 날짜로 가정
+    match = re.match(r'^(\d{1,2}):(\d{1,2})$', date_text)
+    if match:
+        today = datetime.now()
+        return today.replace(hour=int(match.group(1)), minute=int(match.group(2)), second=0, microsecond=0)
+
+    # 형식 5: "11.04 18:25" (MM.DD HH:MM) - 올해로 가정
+    match = re.search(r'(\d{1,2})\.(\d{1,2})\s+(\d{1,2}):(\d{1,2})', date_text)
+    if match:
+        today = datetime.now()
+        month, day, hour, minute = (int(g) for g in match.groups())
+        return today.replace(month=month, day=day, hour=hour, minute=minute, second=0, microsecond=0)
+
+    return None
+
+
+def clean_fmkorea_content(content: str) -> str:
+    """에펨코리아 본문 텍스트 정리 (URL, UI 텍스트, 탭 제거 및 짧은 줄 제외)"""
+    # URL 제거 (모든 http:// 또는 https:// 패턴)
+    content = re.sub(r'https?://[^\s]+', '', content)
+    # "복사" 텍스트 제거
+    content = re.sub(r'복사\s*', '', content)
+    # "== $0" 같은 개발자 도구 표시 제거
+    content = re.sub(r'==\s*\$\d+', '', content)
+    # UI 관련 텍스트 제거
+    content = re.sub(r'[^\n]*불러오는 중입니다[^\n]*', '', content)
+    content = re.sub(r'[^\n]*검색어[^\n]*', '', content)
+    content = re.sub(r'[^\n]*추천[^\n]*', '', content)
+    content = re.sub(r'[^\n]*OFF[^\n]*', '', content)
+    content = re.sub(r'[^\n]*저장[^\n]*', '', content)
+    # 탭 문자(\t)를 공백으로 변환
+    content = content.replace('\t', ' ')
+    # 줄바꿈을 유지하면서 각 줄 내의 연속된 공백만 정리
+    cleaned_lines = []
+    for line in content.split('\n'):
+        # URL 패턴이 남아있으면 제거
+        cleaned_line = re.sub(r'https?://[^\s]+', '', line.strip())
+        cleaned_line = re.sub(r' +', ' ', cleaned_line)
+        # UI 관련 텍스트 제거
+        if (cleaned_line and
+            not cleaned_line.startswith('http') and
+            '불러오는 중입니다' not in cleaned_line and
+            '검색어' not in cleaned_line and
+            '추천' not in cleaned_line and
+            len(cleaned_line) > 5):  # 너무 짧은 텍스트 제외
+            cleaned_lines.append(cleaned_line)
+    return '\n'.join(cleaned_lines)
+
+
+def _fmkorea_line_ok(text: str) -> bool:
+    return (bool(text) and
+            not re.match(r'^==\s*\$\d+$', text) and
+            not any(word in text for word in FMKOREA_UI_WORDS) and
+            len(text) > 5)
+
+
+def _fmkorea_element_text(elem: Tag) -> str:
+    """본문 요소에서 UI/이미지/링크 URL을 제외한 텍스트 추출 (크롤러의 JS 추출 로직과 동일한 규칙)"""
+    clone = BeautifulSoup(str(elem), 'html.parser')
+    _remove(clone, '[class*="search"], [class*="keyword"], [class*="recommend"], [id*="search"], [id*="keyword"]')
+    _remove(clone, 'img')
+    for link in clone.select('a'):
+        # 절대 URL 링크는 태그만 벗기고, 상대 링크는 텍스트로 대체
+        href = link.get('href') or ''
+        if href.startswith('http') or href.startswith('//'):
+            link.unwrap()
+        else:
+            link.replace_with(link.get_text())
+    root = clone.find(True)
+
+    lines: List[str] = []
+    direct_child_divs = [child for child in root.find_all(recursive=False) if child.name == 'div']
+    for div in direct_child_divs:
+        text = inner_text(div)
+        if _fmkorea_line_ok(text):
+            clean_text = re.sub(r'https?://[^\s]+', '', text).strip()
+            if clean_text and not clean_text.startswith('http'):
+                lines.append(clean_text)
+
+    # 직접 자식 div가 없으면 리프 div만 중복 없이 사용
+    if not lines:
+        seen = set()
+        for div in root.find_all('div'):
+            if div.find('div'):
+                continue
+            text = inner_text(div)
+            if _fmkorea_line_ok(text) and text not in seen:
+                clean_text = re.sub(r'https?://[^\s]+', '', text).strip()
+                if clean_text and not clean_text.startswith('http'):
+                    seen.add(clean_text)
+                    lines.append(clean_text)
+
+    if lines:
+        return '\n'.join(lines)
+
+    # fallback: 전체 텍스트 (URL, UI 텍스트 제거)
+    text = re.sub(r'https?://[^\s]+', '', inner_text(root)).strip()
+    text = re.sub(r'[^\n]*불러오는 중입니다[^\n]*', '', text)
+    text = re.sub(r'[^\n]*검색어[^\n]*', '', text)
+    text = re.sub(r'[^\n]*추천[^\n]*', '', text)
+    return text.strip()
+
+
+def parse_fmkorea_detail(html: str, item: Dict) -> Optional[Dict]:
+    """에펨코리아 상세 페이지 HTML → Post 필드 dict"""
+    soup = BeautifulSoup(html, 'html.parser')
+    post_url = item.get('url', '')
+
+    # 제목 (h1.np_18px > span.np_18px_span)
+    title = item.get('title', '')
+    title_elem = soup.select_one('h1.np_18px span.np_18px_span') or soup.select_one('h1.np_18px, span.np_18px_span')
+    if title_elem:
+        title_text = inner_text(title_elem).strip()
+        if title_text:
+            title = title_text.split('\n')[0].strip()
+
+    # 본문
+    content = ""
+    for sel in FMKOREA_CONTENT_SELECTORS:
+        content_elem = soup.select_one(sel)
+        if not content_elem:
+            continue
+        content = clean_fmkorea_content(_fmkorea_element_text(content_elem))
+        if len(content) > 10:
+            break
+
+    # 조회수, 추천수, 댓글수 (div.side.fr span b)
+    view_cnt = like_cnt = comment_cnt = 0
+    side_div = soup.select_one('div.side.fr')
+    if side_div:
+        for span in side_div.select('span'):
+            span_text = span.get_text()
+            b_tag = span.find('b')
+            if not b_tag:
+                continue
+            if '조회' in span_text:
+                view_cnt = _parse_count(b_tag.get_text())
+            elif '추천' in span_text:
+                like_cnt = _parse_count(b_tag.get_text())
+            elif '댓글' in span_text:
+                comment_cnt = _parse_count(b_tag.get_text())
+
+    # 작성일시 (span.date.m_no, 대체: div.top_area 내부)
+    created_at = None
+    date_elem = soup.select_one('span.date.m_no, .date.m_no')
+    if date_elem:
+        created_at = parse_fmkorea_date(date_elem.get_text())
+    if not created_at:
+        date_elem = soup.select_one('div.top_area span.date, div.top_area .date')
+        if date_elem:
+            created_at = parse_fmkorea_date(date_elem.get_text())
+
+    # URL: 목록 URL의 document_srl로 정식 주소 생성
+    actual_url = canonical_post_url('fmkorea', post_url)
+
+    content_cleaned = content.strip()
+    if len(content_cleaned) < 10:
+        return None
+
+    return {
+        'id': None,
+        'category': "",
+        'title': title.strip() if title else "",
+        'content': content_cleaned,
+        'view_cnt': view_cnt,
+        'like_cnt': like_cnt,
+        'comment_cnt': comment_cnt,
+        'created_at': created_at,
+        # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+        'own_company': get_brand_tagger().own_company(title, content_cleaned),
+        'url': actual_url,
+    }
+
+
+# ---------------------------------------------------------------------------
+# 뽐뿌
+# ---------------------------------------------------------------------------
+
+PPOMPPU_CONTENT_SELECTORS = [
+    'table.board-contents',  # 더 정확한 선택자
+    '.board-contents table',
+    '.board-contents',
+    '[class*="contents"]:not([class*="menu"]):not([class*="nav"])',
+    '.view_content',
+    '#article'
+]
+
+# UI 관련 텍스트 목록 (본문이 아닌 것으로 판단)
+# 주의: 실제 본문에도 포함될 수 있는 일반적인 단어는 제외
+PPOMPPU_UI_KEYWORDS = [
+    '뽐뿌', '이벤트', '정보', '커뮤니티', '갤러리', '장터', '포럼', '뉴스', '상담실',
+    '로그인', '회원가입', '아이디비번찾기', '뽐뿌게시판', '사용기', '구매후기',
+    '쿠폰게시판', '쇼핑포럼', '뽐뿌핫딜', '목록보기', '최신순', '작성순',
+    '알림', '광고성 게시글', '에디터', 'HTML편집', '미리보기', '짤방',
+    '업자신고', '다른의견', '이전글', '다음글', '등록일', '조회수', '추천하기',
+    '질렀어요 신고', '첨부파일', '같이 보면 좋은 상품',  # '상품' 단독 제거, '같이 보면 좋은 상품'만
+    '구매하셨다면', '후기를 남겨주세요', '구매후기 쓰기'
+]
+
+
+def parse_ppomppu_date(date_text: str) -> Optional[datetime]:
+    """뽐뿌 날짜 텍스트를 datetime으로 변환 (목록/상세 페이지 형식)"""
+    if not date_text:
+        return None
+
+    # 형식 1: "23:08:03" (오늘 날짜 - 시간만 표시)
+    if re.match(r'^\d{2}:\d{2}:\d{2}$', date_text.strip()):
+        today = datetime.now()
+        time_parts = date_text.strip().split(':')
+        return today.replace(hour=int(time_parts[0]), minute=int(time_parts[1]), second=int(time_parts[2]), microsecond=0)
+
+    # 형식 2: "25/11/02" (YY/MM/DD)
+    if re.match(r'^\d{2}/\d{2}/\d{2}$', date_text.strip()):
+        parts = date_text.strip().split('/')
+        return datetime(2000 + int(parts[0]), int(parts[1]), int(parts[2]))
+
+    # 형식 3: "2025-11-02 09:33" (YYYY-MM-DD HH:MM) - 상세 페이지 형식도 지원
+    match = re.search(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})', date_text)
+    if match:
+        year, month, day, hour, minute = (int(g) for g in match.groups())
+        return datetime(year, month, day, hour, minute)
+
+    # 형식 4: "2025.11.02. 12:39" (YYYY.MM.DD. HH:MM)
+    match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s*(\d{1,2}):(\d{1,2})', date_text)
+    if match:
+        year, month, day, hour, minute = (int(g) for g in match.groups())
+        return datetime(year, month, day, hour, minute)
+
+    return None
+
+
+def clean_ppomppu_content(content_text: str) -> str:
+    """뽐뿌 본문 텍스트 정리 (메타 정보 라인 제거), UI 요소 위주면 빈 문자열 반환"""
+    # 줄바꿈 정리 (빈 줄 제거)
+    lines = [line.strip() for line in content_text.split('\n') if line.strip()]
+
+    # 메타 정보 라인 제거 (등록일, 조회수, 추천 등)
+    filtered_lines = []
+    for line in lines:
+        if (re.match(r'^(등록일|조회수|추천)\s*\d+', line) or
+            re.match(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', line) or  # 날짜 패턴
+            re.match(r'^https?://', line) or  # URL
+            re.match(r'^\d+원$', line) or  # 가격만 있는 라인
+            line in ['등록일', '조회수', '추천', '추천하기', '다른의견', '질렀어요 신고']):
+            continue
+        filtered_lines.append(line)
+
+    # 각 라인에서 UI 키워드가 포함되어 있는지 확인 (한 라인에서 하나의 키워드만 카운트)
+    ui_keyword_lines = sum(
+        1 for line in filtered_lines if any(keyword in line for keyword in PPOMPPU_UI_KEYWORDS)
+    )
+    total_lines = len(filtered_lines)
+    ui_ratio = ui_keyword_lines / max(total_lines, 1) if total_lines > 0 else 0
+
+    # 실제 본문이 있는지 확인 (UI 키워드가 없는 20자 이상의 라인)
+    has_meaningful_content = any(
+        not any(keyword in line for keyword in PPOMPPU_UI_KEYWORDS) and len(line) > 20
+        for line in filtered_lines
+    )
+
+    # UI 키워드 비율이 높고(50% 이상) 의미있는 본문이 없거나, UI 키워드 라인이 10개 이상이면 본문 없음
+    if (ui_ratio >= 0.5 and not has_meaningful_content) or ui_keyword_lines >= 10:
+        print(f"🫛 UI 요소가 많이 포함되어 본문 없는 것으로 판단 (UI 키워드 라인: {ui_keyword_lines}개, 비율: {ui_ratio:.2f}, 의미있는 본문: {has_meaningful_content})")
+        return ""
+
+    return '\n'.join(filtered_lines)
+
+
+def _ppomppu_element_text(elem: Tag) -> str:
+    """본문 요소에서 메뉴/댓글/추천/관련상품/이미지/URL 링크를 제외한 텍스트 추출"""
+    clone = BeautifulSoup(str(elem), 'html.parser')
+    _remove(clone, '[class*="menu"], [class*="nav"], [class*="sidebar"], [id*="menu"], [id*="nav"], [id*="sidebar"]')
+    _remove(clone, '[class*="comment"], [class*="reply"], [id*="comment"], [id*="reply"], [class*="reply_box"], [class*="comment_box"]')
+    _remove(clone, '[class*="recommend"], [class*="like"], [class*="attach"], [class*="prev"], [class*="next"], [class*="list"]')
+    root = clone.find(True)
+    if not root:
+        return ''
+    for el in root.find_all(True):
+        if el.decomposed:
+            continue
+        text = el.get_text()
+        if (('같이 보면 좋은' in text and ('상품' in text or '추천' in text)) or
+            '구매하셨다면' in text or '후기를 남겨주세요' in text or '구매후기 쓰기' in text):
+            el.decompose()
+    _remove(clone, 'img')
+    for link in clone.select('a'):
+        href = link.get('href') or ''
+        if href.startswith('http') or href.startswith('//'):
+            link.decompose()
+        else:
+            link.replace_with(link.get_text())
+    return inner_text(root)
+
+
+def parse_ppomppu_detail(html: str, item: Dict) -> Optional[Dict]:
+    """뽐뿌 상세 페이지 HTML → Post 필드 dict"""
+    soup = BeautifulSoup(html, 'html.parser')
+    post_url = item.get('url', '')
+
+    # 제목 (h1에서 이미지, 카테고리 span, 댓글 수 span 제외)
+    title = item.get('title', '')
+    title_elem = soup.select_one('h1')
+    if title_elem:
+        clone = BeautifulSoup(str(title_elem), 'html.parser')
+        _remove(clone, 'img, span#comment, span[id*="comment"], span.subject_preface, span[class*="preface"], span[class*="subject"]')
+        title_text = inner_text(clone.find(True))
+    else:
+        title_elem = soup.select_one('span.topTitle, .topTitle, [class*="title"]')
+        title_text = inner_text(title_elem) if title_elem else ''
+    if title_text and title_text.strip():
+        title = title_text.strip()
+
+    # 본문
+    content = ""
+    for sel in PPOMPPU_CONTENT_SELECTORS:
+        content_elem = soup.select_one(sel)
+        if not content_elem:
+            continue
+        content_text = _ppomppu_element_text(content_elem)
+        if not content_text:
+            continue
+        content = clean_ppomppu_content(content_text)
+        if len(content) > 10:
+            break
+
+    body_elem = soup.body or soup
+    page_text = inner_text(body_elem)
+
+    # 조회수 ("조회수" 텍스트 이후 값)
+    view_cnt = 0
+    view_match = re.search(r'조회수\s*[:：]?\s*([\d,]+)', page_text)
+    if view_match:
+        view_cnt = int(view_match.group(1).replace(',', ''))
+
+    # 좋아요 수 (span.topTitle-rec em)
+    like_cnt = 0
+    like_elem = soup.select_one('span.topTitle-rec em')
+    if like_elem:
+        like_match = re.search(r'(\d+)', like_elem.get_text())
+        if like_match:
+            like_cnt = int(like_match.group(1))
+
+    # 작성일시 ("등록일 YYYY-MM-DD HH:MM")
+    created_at = None
+    for li in soup.select('ul.topTitle-mainbox li'):
+        date_match = re.search(r'등록일\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', li.get_text())
+        if date_match:
+            created_at = datetime.strptime(date_match.group(1).strip(), '%Y-%m-%d %H:%M')
+            break
+    if not created_at:
+        date_match = re.search(r'등록일\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', page_text)
+        if date_match:
+            created_at = datetime.strptime(date_match.group(1).strip(), '%Y-%m-%d %H:%M')
+    if not created_at:
+        date_match = re.search(r'등록일[^\n]*[:：]?\s*(\d{2}/\d{2}/\d{2}|\d{2}:\d{2}:\d{2})', page_text)
+        if date_match:
+            created_at = parse_ppomppu_date(date_match.group(1).strip())
+
+    # 게시글 ID (URL의 no=)
+    article_id = extract_post_id('ppomppu', post_url)
+
+    content_cleaned = content.strip()
+    if len(content_cleaned) < 10:
+        return None
+
+    return {
+        'id': article_id,
+        'category': "",  # category는 빈 문자열로 고정
+        'title': title.strip() if title else "",
+        'content': content_cleaned,
+        'view_cnt': view_cnt,
+        'like_cnt': like_cnt,
+        'comment_cnt': item.get('comment_cnt', 0),
+        'created_at': created_at,
+        # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+        'own_company': get_brand_tagger().own_company(title, content_cleaned),
+        'url': canonical_post_url('ppomppu', post_url),
+    }
+
+
+# ---------------------------------------------------------------------------
+# 댓글 목록 (페이지 단위)
+#
+# 반환값: (댓글 dict 목록, 마지막 댓글 페이지 번호 또는 None)
+# 댓글 dict: comment_id, parent_id(대댓글이면 원댓글 id), author, content, created_at, like_cnt
+# ---------------------------------------------------------------------------
+
+COMMENT_DATE_PATTERN = re.compile(r'\d{4}[.\-]\d{2}[.\-]\d{2}\s+\d{2}:\d{2}(?::\d{2})?|\d{2}[.\-/]\d{2}[.\-/]\d{2}\s+\d{2}:\d{2}(?::\d{2})?')
+
+
+def _comment_id(elem: Tag) -> Optional[int]:
+    match = re.search(r'(\d+)', elem.get('id', '') or '')
+    return int(match.group(1)) if match else None
+
+
+def _max_page(html: str, param: str) -> Optional[int]:
+    """페이지 이동 링크의 param=N 중 가장 큰 값 (링크가 없으면 None)"""
+    pages = [int(n) for n in re.findall(rf'[?&;]{param}=(\d+)', html)]
+    return max(pages) if pages else None
+
+
+def _is_reply(elem: Tag) -> bool:
+    classes = ' '.join(elem.get('class', []))
+    return bool(re.search(r'(^|\s)(re|reply|sub_comment|comment_reply)(\s|$)', classes)) or 'margin-left' in (elem.get('style') or '')
+
+
+FMKOREA_COMMENT_ITEM_SELECTORS = ['li.fdb_itm', 'li[id^="comment_"]']
+
+
+def parse_fmkorea_comments(html: str) -> Tuple[List[Dict], Optional[int]]:
+    """에펨코리아 댓글 페이지(?cpage=N) HTML → 댓글 목록"""
+    soup = BeautifulSoup(html, 'html.parser')
+    items: List[Tag] = []
+    for sel in FMKOREA_COMMENT_ITEM_SELECTORS:
+        items = soup.select(sel)
+        if items:
+            break
+
+    comments = []
+    last_top_id = None
+    for li in items:
+        comment_id = _comment_id(li)
+        content_elem = li.select_one('.comment-content .xe_content') or li.select_one('.xe_content') or li.select_one('.comment-content')
+        if not content_elem:
+            continue
+        # 대댓글: "원댓글 찾기" 링크의 findComment(번호), 없으면 들여쓰기된 항목을 직전 원댓글에 연결
+        parent_id = None
+        parent_link = li.select_one('a.findParent')
+        if parent_link:
+            match = re.search(r'(\d+)', parent_link.get('onclick', '') or parent_link.get('href', ''))
+            parent_id = int(match.group(1)) if match else last_top_id
+            parent_link.decompose()
+        elif _is_reply(li):
+            parent_id = last_top_id
+        else:
+            last_top_id = comment_id
+
+        author_elem = li.select_one('.meta .member_plate') or li.select_one('.member_plate') or li.select_one('.meta a')
+        date_elem = li.select_one('.meta .date') or li.select_one('.date')
+        vote_elem = li.select_one('.voted_count') or li.select_one('.vote')
+        date_match = COMMENT_DATE_PATTERN.search(date_elem.get_text() if date_elem else '')
+        comments.append({
+            'comment_id': comment_id,
+            'parent_id': parent_id,
+            'author': author_elem.get_text(strip=True) if author_elem else '',
+            'content': inner_text(content_elem),
+            'created_at': date_match.group(0) if date_match else (date_elem.get_text(strip=True) if date_elem else ''),
+            'like_cnt': _parse_count(vote_elem.get_text()) if vote_elem else 0,
+        })
+
+    nav = soup.select_one('.fdb_nav, .bd_pg, [class*="comment_page"], [class*="cmt_page"]')
+    return comments, _max_page(str(nav) if nav else html, 'cpage')
+
+
+PPOMPPU_COMMENT_ITEM_SELECTORS = ['div.comment_line', 'div[id^="comment_"]:not([id*="Content"])', 'tr[id^="comment_"]']
+PPOMPPU_COMMENT_CONTENT_SELECTORS = ['[id^="commentContent_"]', '.comment_template', '.over_hide', '.han']
+
+
+def parse_ppomppu_comments(html: str) -> Tuple[List[Dict], Optional[int]]:
+    """뽐뿌 댓글 페이지(view.php?...&c_page=N) HTML → 댓글 목록"""
+    soup = BeautifulSoup(html, 'html.parser')
+    items: List[Tag] = []
+    for sel in PPOMPPU_COMMENT_ITEM_SELECTORS:
+        items = soup.select(sel)
+        if items:
+            break
+
+    comments = []
+    last_top_id = None
+    for elem in items:
+        content_elem = None
+        for sel in PPOMPPU_COMMENT_CONTENT_SELECTORS:
+            content_elem = elem.select_one(sel)
+            if content_elem:
+                break
+        if not content_elem:
+            continue
+        comment_id = _comment_id(content_elem) or _comment_id(elem)
+        if _is_reply(elem):
+            parent_id = last_top_id
+        else:
+            parent_id = None
+            last_top_id = comment_id
+
+        author_elem = elem.select_one('.com_name_writer') or elem.select_one('.com_name') or elem.select_one('[class*="name"]')
+        vote_elem = elem.select_one('[id^="vote_cnt_"]') or elem.select_one('[class*="recom"]')
+        date_match = COMMENT_DATE_PATTERN.search(elem.get_text(' '))
+        comments.append({
+            'comment_id': comment_id,
+            'parent_id': parent_id,
+            'author': author_elem.get_text(strip=True) if author_elem else '',
+            'content': inner_text(content_elem),
+            'created_at': date_match.group(0) if date_match else '',
+            'like_cnt': _parse_count(vote_elem.get_text()) if vote_elem else 0,
+        })
+
+    return comments, _max_page(html, 'c_page')
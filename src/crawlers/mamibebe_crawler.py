@@ -1,33 +1,92 @@
 from src.crawlers.base_crawler import BaseCrawler
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.proxy_pool import PER_CONTEXT_PROXY
 from src.models.post import Post
-from typing import List, Set
+from src.utils.brand_tagger import get_brand_tagger
+from src.utils.canonical_url import canonical_post_url, extract_post_id
+from src.utils.browser_profiles import get_browser_profile, launch_browser
+from src.crawlers.comment_collector import CafeComments
+from typing import List, Set, Dict, Optional
 import httpx
 import os
 import re
 from datetime import datetime, timedelta
+from urllib.parse import urljoin, urlsplit, urlunsplit
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright
 
 load_dotenv()
 
 class MamibebeCrawler(BaseCrawler):
-    def __init__(self):
+    def __init__(self, cafe_main_url: Optional[str] = None, popular_url: Optional[str] = None):
         super().__init__()
-        self.cafe_main_url = "https://cafe.naver.com/skybluezw4rh"
-        self.popular_url = "https://cafe.naver.com/f-e/cafes/29434212/popular"
-        self.club_id = 29434212
+        # 목 서버 등으로 대상 변경 가능 (인자 > MAMIBEBE_CAFE_MAIN_URL / MAMIBEBE_POPULAR_URL > 기본값)
+        self.cafe_main_url = cafe_main_url or os.getenv('MAMIBEBE_CAFE_MAIN_URL', "https://cafe.naver.com/skybluezw4rh")
+        self.popular_url = popular_url or os.getenv('MAMIBEBE_POPULAR_URL', "https://cafe.naver.com/f-e/cafes/29434212/popular")
+        self.cafe_slug = self.cafe_main_url.rstrip('/').rsplit('/', 1)[-1]
+        club_match = re.search(r'/cafes/(\d+)', self.popular_url)
+        self.club_id = int(club_match.group(1)) if club_match else 29434212
         self.channel = "mam2bebe"
+        # 게시글 iframe 문서 URL 템플릿 (첫 게시글에서 한 번 확인 후 외곽 카페 셸 없이 직접 접속)
+        self.article_url_template: Optional[str] = None
+        self.direct_article = os.getenv('MAMIBEBE_DIRECT_ARTICLE', 'true').lower() == 'true'
+        # 현재 페이지가 iframe 없이 본문 문서를 직접 연 상태인지
+        self._frame_document = False
+        # 이미지/미디어/폰트 요청 차단 (추출에 사용하지 않는 리소스)
+        self.block_heavy_resources = os.getenv('MAMIBEBE_BLOCK_RESOURCES', 'true').lower() == 'true'
+        self.browser_profile = get_browser_profile('plain')
+        # 여러 카페 (MAMIBEBE_CAFES="카페슬러그:club_id,…", 같은 로그인 상태로 동시에 수집)
+        self.boards = self._parse_cafes(os.getenv('MAMIBEBE_CAFES', ''))
+        # 로그인한 네이버 세션은 IP가 바뀌면 끊길 수 있으므로 프록시 풀에서도 항상 같은 프록시 사용
+        self.proxy_key = 'naver'
+    
+    def _parse_cafes(self, spec: str) -> List[Dict[str, str]]:
+        """카페 목록 설정 → 게시판 목록 (현재 카페 주소의 호스트/경로 형식을 따라 주소 생성)"""
+        cafe_base = self.cafe_main_url.rstrip('/').rsplit('/', 1)[0]
+        cafes = []
+        for entry in spec.split(','):
+            slug, _, club_id = entry.strip().partition(':')
+            if not slug or not club_id.strip().isdigit():
+                continue
+            cafes.append({
+                'name': slug,
+                'url': re.sub(r'/cafes/\d+', f'/cafes/{club_id.strip()}', self.popular_url),
+                'cafe_main_url': f"{cafe_base}/{slug}",
+            })
+        return cafes or [{'name': self.cafe_slug, 'url': self.popular_url, 'cafe_main_url': self.cafe_main_url}]
+    
+    def _for_board(self, board: Dict[str, str]) -> 'MamibebeCrawler':
+        return MamibebeCrawler(cafe_main_url=board['cafe_main_url'], popular_url=board['url'])
     
     async def __aenter__(self):
-        """맘이베베용 단순 브라우저 초기화 (기존 방식)"""
+        """맘이베베용 단순 브라우저 초기화 (BROWSER_PROFILE이 없으면 추가 옵션 없는 plain 프로필)"""
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=self.headless)
-        self.page = await self.browser.new_page()
-        self.page.set_default_timeout(self.timeout)
+        self.browser = await launch_browser(self.playwright, self.headless, self.browser_profile,
+                                            proxy=PER_CONTEXT_PROXY if self.proxy_pool else None)
+        await self._open_page()
         return self
     
+    async def _open_page(self, storage_state: Optional[Dict] = None):
+        """페이지 생성 및 초기 설정 (재생성 시 네이버 로그인 쿠키 유지)"""
+        self.page = await self.browser.new_page(storage_state=storage_state, **self._proxy_options())
+        self.context = self.page.context
+        self.page.set_default_timeout(self.timeout)
+        await self._install_fixture_hooks()
+        if self.block_heavy_resources:
+            await self.page.route("**/*", self._block_heavy_resources)
+        # 새 페이지는 항상 외곽 셸/목록 문서에서 시작
+        self._frame_document = False
+    
+    async def _block_heavy_resources(self, route):
+        """이미지/미디어/폰트는 중단하고 나머지는 다음 핸들러(픽스처 재생 등)로 넘김"""
+        if route.request.resource_type in ('image', 'media', 'font'):
+            await route.abort()
+        else:
+            await route.fallback()
+    
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """맘이베베용 단순 브라우저 종료 (기존 방식)"""
+        self._on_close()
         if self.browser:
             await self.browser.close()
         if self.playwright:
@@ -38,49 +97,34 @@ class MamibebeCrawler(BaseCrawler):
         posts = []
         
         try:
-            # 1. 네이버 로그인
-            self.naver_cookies = await self.login_naver()
-            
-            # 2. 카페 입장
-            print(f"🫛 카페 입장: {self.cafe_main_url}")
-            await self.page.goto(self.cafe_main_url, wait_until="load")
-            await self.page.wait_for_timeout(2000)
-            
-            # 3. 인기글 페이지 접속
-            print(f"🫛 인기글 페이지 접속: {self.popular_url}")
-            await self.page.goto(self.popular_url, wait_until="load")
-            await self.page.wait_for_timeout(2000)
+            # 1~3. 네이버 로그인, 인기글 페이지 접속 및 게시글 URL 목록 수집 (일주일 전까지 필터링)
+            post_items = await self.discover(max_posts)
             
-            # 4. 게시글 URL 목록 수집 (일주일 전까지 필터링)
-            post_urls = await self._get_posts_from_popular_page(max_posts)
-            print(f"🫛 수집된 게시글 URL: {len(post_urls)}개")
-            
-            # 5. 각 게시글 상세 정보 수집
+            # 4. 각 게시글 상세 정보 수집 (체크포인트 재개 시 남은 항목만)
+            posts, pending_items = self._pending_detail_items(post_items)
+            post_urls = [item['url'] for item in pending_items]
             for i, post_url in enumerate(post_urls):
                 try:
                     print(f"🫛 게시글 데이터 수집 시작: {post_url} [{i+1}/{len(post_urls)}]")
                     
-                    # 게시글 상세 페이지 접속
-                    await self.page.goto(post_url, wait_until="load")
-                    await self.page.wait_for_timeout(2000)
-                    
-                    # 게시글 데이터 추출
-                    post = await self._extract_post_data(post_url)
+                    post = await self._guarded_fetch_post({'url': post_url})
+                    if post and not self._accept_post(post):
+                        post = None
+                    self._checkpoint_post({'url': post_url}, post)
                     if post:
-                        # 게시글 상세 페이지에서도 카카오페이 추천인 게시물 제외
-                        title_normalized = post.title.strip() if post.title else ""
-                        if '카카오페이' in title_normalized:
-                            if '증권 추천인' in title_normalized or '피자만들기 추천인' in title_normalized:
-                                print(f"🫛 제외: 카카오페이 추천인 게시물 (상세) - {title_normalized[:50]}")
-                                continue
                         posts.append(post)
                     
                     # 요청 간격 조절
                     await self.page.wait_for_timeout(1000)
                     
+                except CircuitOpenError:
+                    # 서킷이 최대 횟수만큼 열림: 남은 상세 수집 중단 (체크포인트로 재개 가능)
+                    break
                 except Exception as e:
                     print(f"게시글 {post_url} 처리 중 오류: {e}")
                     continue
+            
+            self._checkpoint_complete()
                     
         except Exception as e:
             print(f"맘이베베 크롤링 오류: {e}")
@@ -90,19 +134,107 @@ class MamibebeCrawler(BaseCrawler):
         print(f"🫛 총 {len(posts)}개 게시글 수집 완료")
         return posts
     
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        """네이버 로그인 후 인기글 목록에서 상세 수집 대상 항목 수집"""
+        # 1. 네이버 로그인
+        await self.prepare_details()
+        resumed = self._resumed_items()
+        if resumed is not None:
+            return resumed
+        
+        # 2. 인기글 페이지 접속 (카페 메인 셸은 읽는 내용이 없어 생략)
+        print(f"🫛 인기글 페이지 접속: {self.popular_url}")
+        await self.page.goto(self.popular_url, wait_until="load")
+        self._frame_document = False
+        await self.page.wait_for_timeout(2000)
+        
+        # 3. 게시글 URL 목록 수집 (일주일 전까지 필터링)
+        post_urls = await self._get_posts_from_popular_page(max_posts)
+        print(f"🫛 수집된 게시글 URL: {len(post_urls)}개")
+        post_items = [{'url': url} for url in post_urls]
+        self._record_items(post_items)
+        # iframe 내부 클릭으로 페이지를 넘기므로 목록은 수집이 끝난 뒤에만 저장
+        self._checkpoint_listing(1, post_items, done=True)
+        return post_items
+    
+    async def prepare_details(self):
+        """카페 게시글 열람을 위한 네이버 로그인 (한 번만)"""
+        if self.naver_cookies is None:
+            self.naver_cookies = await self.login_naver()
+    
+    async def _fetch_post(self, item: Dict, settle_ms: int = 2000) -> Optional[Post]:
+        """게시글 상세 페이지 접속 후 데이터 추출 (가능하면 iframe 문서에 직접 접속)"""
+        post_url = item.get('url', '')
+        article_id = extract_post_id(self.channel, post_url)
+        await self._before_navigation()
+        
+        if self.article_url_template and article_id is not None:
+            await self.page.goto(self.article_url_template.format(article_id=article_id), wait_until="load")
+            self._frame_document = True
+            if settle_ms:
+                await self.page.wait_for_timeout(settle_ms)
+            post = await self._extract_post_data(post_url)
+            if post and (post.title or post.content):
+                return post
+            # 직접 접속으로 본문을 얻지 못하면 템플릿을 버리고 외곽 셸 방식으로 재시도
+            print("🫛 iframe 문서 직접 접속 실패, 카페 셸 방식으로 전환")
+            self.article_url_template = None
+            self.direct_article = False
+        
+        await self.page.goto(post_url, wait_until="load")
+        self._frame_document = False
+        if settle_ms:
+            await self.page.wait_for_timeout(settle_ms)
+        if self.direct_article and article_id is not None:
+            await self._learn_article_template(article_id)
+        return await self._extract_post_data(post_url)
+    
+    async def _learn_article_template(self, article_id: int):
+        """외곽 셸의 iframe#cafe_main 문서 URL에서 게시글 URL 템플릿 추출 (1회)"""
+        try:
+            iframe_elem = await self.page.wait_for_selector("iframe#cafe_main", timeout=5000)
+            frame = await iframe_elem.content_frame()
+            frame_url = frame.url if frame and frame.url not in ('', 'about:blank') else urljoin(
+                self.page.url, await iframe_elem.get_attribute('src') or ''
+            )
+        except Exception as e:
+            print(f"🫛 iframe URL 확인 실패: {e}")
+            return
+        
+        parts = urlsplit(frame_url)
+        # /articles/<ID> 구간만 자리표시자로 교체 (클럽 ID 등 다른 숫자에 게시글 ID가 포함돼도 영향 없음)
+        article_segment = re.compile(rf'(/articles/){article_id}(?=/|$)')
+        if not article_segment.search(parts.path):
+            print(f"🫛 iframe URL에 게시글 ID가 없어 직접 접속 불가: {frame_url}")
+            self.direct_article = False
+            return
+        escape = lambda text: text.replace('{', '{{').replace('}', '}}')
+        template_path = article_segment.sub(r'\1{article_id}', escape(parts.path), count=1)
+        self.article_url_template = urlunsplit(parts._replace(
+            netloc=escape(parts.netloc), path=template_path, query=escape(parts.query), fragment=escape(parts.fragment)
+        ))
+        print(f"🫛 게시글 iframe 문서 직접 접속 사용: {self.article_url_template}")
+    
+    async def _content_frame(self, timeout: int = 5000):
+        """본문이 있는 frame 반환 (직접 접속한 문서면 메인 frame, 아니면 iframe#cafe_main)"""
+        if self._frame_document:
+            return self.page.main_frame
+        iframe_elem = await self.page.wait_for_selector("iframe#cafe_main", timeout=timeout)
+        return await iframe_elem.content_frame()
+    
     async def _get_posts_from_popular_page(self, max_posts: int = None) -> List[str]:
         """인기글 페이지에서 게시글 URL을 수집 (오늘 기준 일주일 전까지)"""
         print(f"🫛 인기글 URL 목록 수집 중...")
         
-        # 날짜 필터: 오늘 기준 일주일 전
+        # 날짜 필터: 사전 필터의 날짜 규칙 (기본: 오늘 기준 일주일 전)
         today = datetime.now()
-        week_ago = today - timedelta(days=7)
-        print(f"🫛 날짜 필터: {week_ago.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
+        window_start = self.prefetch_filter.window_start()
+        if window_start:
+            print(f"🫛 날짜 필터: {window_start.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
 
         # 본문은 iframe#cafe_main 안에 로드됨
         try:
-            iframe_elem = await self.page.wait_for_selector("iframe#cafe_main", timeout=10000)
-            frame = await iframe_elem.content_frame()
+            frame = await self._content_frame(timeout=10000)
         except Exception as e:
             print(f"🫛❌ 인기글 iframe 탐색 실패: {e}")
             frame = None
@@ -152,10 +284,10 @@ class MamibebeCrawler(BaseCrawler):
                     // 전체 URL 생성
                     let fullUrl = href;
                     if (href.startsWith('/')) {
-                      fullUrl = 'https://cafe.naver.com' + href;
+                      fullUrl = location.origin + href;
                     } else if (href.includes('skybluezw4rh')) {
                       if (!href.startsWith('http')) {
-                        fullUrl = 'https://cafe.naver.com/' + href;
+                        fullUrl = location.origin + '/' + href;
                       }
                     }
                     
@@ -175,24 +307,10 @@ class MamibebeCrawler(BaseCrawler):
             before_len = len(collected_urls)
             for item in items:
                 url = item.get('url', '')
-                title = item.get('title', '')
-                date_text = item.get('dateText', '')
-                
-                # 카카오페이 추천인 게시물 제외
-                # 제목에서 공백 제거 후 정확히 매칭
-                if title:
-                    title_normalized = title.strip()
-                    # "카카오페이 증권 추천인" 또는 "카카오페이 피자만들기 추천인" 포함 여부 확인
-                    if '카카오페이' in title_normalized:
-                        if '증권 추천인' in title_normalized or '피자만들기 추천인' in title_normalized:
-                            print(f"🫛 제외: 카카오페이 추천인 게시물 - {title_normalized[:50]}")
-                            continue
                 
-                # 날짜 필터링 (일주일 전까지)
-                if date_text:
-                    post_date = self._parse_date(date_text)
-                    if post_date and post_date < week_ago:
-                        continue  # 일주일 이전 게시글은 제외
+                # 사전 필터 (카카오페이 추천인 등 제목 규칙, 날짜 범위, 상세 페이지 이동 전)
+                if self._prefetch_rejected(item):
+                    continue
                 
                 # 중복 체크 (URL 기반)
                 if url and url not in collected_urls:
@@ -357,8 +475,7 @@ class MamibebeCrawler(BaseCrawler):
                         await self.page.wait_for_timeout(3000)
                         # iframe 재참조 (페이지 전환 후)
                         try:
-                            iframe_elem = await self.page.wait_for_selector("iframe#cafe_main", timeout=5000)
-                            frame = await iframe_elem.content_frame()
+                            frame = await self._content_frame()
                             
                             # '>' 버튼을 클릭한 경우, 다음에 나타나는 페이지 번호를 확인
                             if used_right_arrow:
@@ -414,6 +531,15 @@ class MamibebeCrawler(BaseCrawler):
         print(f"🫛 총 {len(post_urls)}개 인기글 URL 수집 완료 (총 {current_page}페이지 순회)")
         return post_urls
     
+    def _comment_source(self):
+        """카페 댓글 JSON API (네이버 로그인 쿠키 사용)"""
+        clubs = {}
+        for board in self.boards:
+            club_match = re.search(r'/cafes/(\d+)', board['url'])
+            if club_match:
+                clubs[board['name']] = int(club_match.group(1))
+        return CafeComments(self.club_id, clubs)
+    
     def _parse_date(self, date_text: str) -> datetime:
         """날짜 텍스트를 datetime으로 파싱"""
         if not date_text:
@@ -466,16 +592,14 @@ class MamibebeCrawler(BaseCrawler):
     async def _extract_post_data(self, post_url: str) -> Post:
         """게시글 상세 페이지에서 데이터 추출"""
         try:
-            # iframe 내부 접근
+            # iframe 내부 접근 (직접 접속한 문서면 메인 frame)
             try:
-                iframe_elem = await self.page.wait_for_selector("iframe#cafe_main", timeout=5000)
-                frame = await iframe_elem.content_frame()
+                frame = await self._content_frame()
             except:
                 frame = self.page
             
             # 게시글 ID 추출
-            article_id_match = re.search(r'skybluezw4rh/(\d+)', post_url)
-            article_id = int(article_id_match.group(1)) if article_id_match else None
+            article_id = extract_post_id(self.channel, post_url)
             
             # 제목 추출
             title = ""
@@ -486,12 +610,14 @@ class MamibebeCrawler(BaseCrawler):
                 '.ArticleTitle',
                 'h3'
             ]
-            for sel in title_selectors:
+            trial = self.selector_stats.trial(self.channel, 'title', title_selectors)
+            for sel in trial:
                 try:
                     title_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if title_elem:
                         title = await title_elem.inner_text()
                         if title:
+                            trial.hit(sel)
                             break
                 except:
                     continue
@@ -504,12 +630,14 @@ class MamibebeCrawler(BaseCrawler):
                 '.board_name',
                 '.menu_name'
             ]
-            for sel in category_selectors:
+            trial = self.selector_stats.trial(self.channel, 'category', category_selectors)
+            for sel in trial:
                 try:
                     cat_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if cat_elem:
                         category = await cat_elem.inner_text()
                         if category:
+                            trial.hit(sel)
                             break
                 except:
                     continue
@@ -528,7 +656,8 @@ class MamibebeCrawler(BaseCrawler):
             ]
             
             # 방법 1: 가장 간단한 방법 - innerText 직접 사용
-            for sel in content_selectors:
+            trial = self.selector_stats.trial(self.channel, 'content', content_selectors)
+            for sel in trial:
                 try:
                     content_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if content_elem:
@@ -540,6 +669,7 @@ class MamibebeCrawler(BaseCrawler):
                             content = '\n'.join(lines)
                             if len(content) > 10:  # 의미있는 길이인지 확인
                                 print(f"🫛 본문 추출 성공 (선택자: {sel}): {len(content)}자")
+                                trial.hit(sel)
                                 break
                 except Exception as e:
                     continue
@@ -573,7 +703,8 @@ class MamibebeCrawler(BaseCrawler):
                 '[class*="view"]',
                 '[class*="read"]'
             ]
-            for sel in view_selectors:
+            trial = self.selector_stats.trial(self.channel, 'view_cnt', view_selectors)
+            for sel in trial:
                 try:
                     view_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if view_elem:
@@ -585,6 +716,7 @@ class MamibebeCrawler(BaseCrawler):
                             view_num_str = view_match.group(1).replace(',', '')
                             view_cnt = int(view_num_str)
                             print(f"🫛 조회수 추출 성공: {view_text} -> {view_cnt}")
+                            trial.hit(sel)
                             break
                 except Exception as e:
                     continue
@@ -609,7 +741,8 @@ class MamibebeCrawler(BaseCrawler):
                 '.LikeButton',
                 'text=/좋아요\\s*\\d+/'
             ]
-            for sel in like_selectors:
+            trial = self.selector_stats.trial(self.channel, 'like_cnt', like_selectors)
+            for sel in trial:
                 try:
                     like_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if like_elem:
@@ -617,6 +750,7 @@ class MamibebeCrawler(BaseCrawler):
                         like_match = re.search(r'(\d+)', like_text)
                         if like_match:
                             like_cnt = int(like_match.group(1))
+                            trial.hit(sel)
                             break
                 except:
                     continue
@@ -629,7 +763,8 @@ class MamibebeCrawler(BaseCrawler):
                 '.CommentButton',
                 'text=/댓글\\s*\\d+/'
             ]
-            for sel in comment_selectors:
+            trial = self.selector_stats.trial(self.channel, 'comment_cnt', comment_selectors)
+            for sel in trial:
                 try:
                     comment_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if comment_elem:
@@ -637,6 +772,7 @@ class MamibebeCrawler(BaseCrawler):
                         comment_match = re.search(r'(\d+)', comment_text)
                         if comment_match:
                             comment_cnt = int(comment_match.group(1))
+                            trial.hit(sel)
                             break
                 except:
                     continue
@@ -651,7 +787,8 @@ class MamibebeCrawler(BaseCrawler):
                 '.article_info .date',
                 '.article_info .time'
             ]
-            for sel in date_selectors:
+            trial = self.selector_stats.trial(self.channel, 'created_at', date_selectors)
+            for sel in trial:
                 try:
                     date_elem = await frame.query_selector(sel) if frame else await self.page.query_selector(sel)
                     if date_elem:
@@ -660,6 +797,7 @@ class MamibebeCrawler(BaseCrawler):
                             created_at = self._parse_date(date_text)
                             if created_at:
                                 print(f"🫛 날짜 파싱 성공: {date_text} -> {created_at}")
+                                trial.hit(sel)
                                 break
                 except Exception as e:
                     continue
@@ -676,27 +814,16 @@ class MamibebeCrawler(BaseCrawler):
                 except:
                     pass
             
-            # URL 복사 버튼 클릭하여 실제 URL 가져오기
-            actual_url = post_url
-            try:
-                copy_btn = await frame.query_selector('button[class*="copy"], button[aria-label*="복사"], .copy_url') if frame else await self.page.query_selector('button[class*="copy"], button[aria-label*="복사"], .copy_url')
-                if copy_btn:
-                    await copy_btn.click()
-                    await self.page.wait_for_timeout(500)
-                    # 클립보드에서 URL 가져오기
-                    clipboard_text = await self.page.evaluate("navigator.clipboard.readText()")
-                    if clipboard_text and 'skybluezw4rh' in clipboard_text:
-                        actual_url = clipboard_text
-            except:
-                pass
-            
-            # own_company: 제목에 "롯데온"이 있으면 1, 없으면 0
-            own_company = 1 if title and '롯데온' in title else 0
+            # URL: 게시글 ID로 정식 주소 생성 (복사 버튼 클릭 + 클립보드 읽기 불필요)
+            actual_url = canonical_post_url(self.channel, post_url, self.cafe_slug)
             
             # content가 없어도 게시물은 수집 (기존 코드와 동일하게)
             
             print(f"🫛 추출 완료: title={title[:30]}..., view_cnt={view_cnt}, comment_cnt={comment_cnt}, like_cnt={like_cnt}")
             
+            # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+            own_company = get_brand_tagger().own_company(title, content)
+            
             return Post(
                 id=article_id,
                 channel=self.channel,  # "mam2bebe" 고정
@@ -707,7 +834,7 @@ class MamibebeCrawler(BaseCrawler):
                 like_cnt=like_cnt,
                 comment_cnt=comment_cnt,
                 created_at=created_at,
-                own_company=own_company,  # 제목에 "롯데온" 포함 여부
+                own_company=own_company,
                 url=actual_url
             )
                 
@@ -1,128 +1,195 @@
-from src.crawlers.base_crawler import BaseCrawler
+from src.crawlers.base_crawler import BaseCrawler, parse_boards, with_query
+from src.utils.circuit_breaker import CircuitOpenError
 from src.models.post import Post
+from src.utils.brand_tagger import get_brand_tagger
+from src.utils.canonical_url import canonical_post_url, extract_post_id
+from src.utils.prefetch_filters import REASON_TOO_OLD
+from src.utils.engagement_store import EngagementStore, default_track_since
+from src.crawlers.html_parsers import parse_ppomppu_detail, clean_ppomppu_content, parse_ppomppu_date
+from src.crawlers.comment_collector import PpomppuComments
 from typing import List, Dict, Optional
+import os
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
+
+
+# 목록 페이지의 게시글 항목 추출 (순차 수집/경계 탐색 공용)
+LIST_ITEMS_SCRIPT = """
+(() => {
+    const items = [];
+    // 다양한 테이블 선택자 시도
+    let rows = [];
+    const selectors = [
+        '.list_table tr',
+        'table.list_table tr',
+        '.board_table tr',
+        'table.board_table tr',
+        'table tr',
+        '[class*="list"] tr',
+        '[class*="table"] tr'
+    ];
+
+    for (const sel of selectors) {
+        rows = Array.from(document.querySelectorAll(sel));
+        if (rows.length > 0) {
+            console.log('테이블 발견:', sel, '행 수:', rows.length);
+            break;
+        }
+    }
+
+    for (const row of rows) {
+        // 번호 컬럼 찾기 (첫 번째 td)
+        const noTd = row.querySelector('td:first-child');
+        if (!noTd) continue;
+
+        // 번호 (공지/'-' 행 제외는 사전 필터 규칙 ppomppu-notice에서 처리)
+        const noText = noTd.innerText.trim();
+
+        // 제목 링크 찾기
+        const titleLink = row.querySelector('td.title a, a[href*="view.php"]');
+        if (!titleLink) continue;
+
+        const href = titleLink.getAttribute('href');
+        if (!href) continue;
+
+        // URL 생성 (현재 문서 기준 절대 경로)
+        let fullUrl = href;
+        if (href.startsWith('/')) {
+            fullUrl = location.origin + href;
+        } else if (href.startsWith('view.php')) {
+            fullUrl = location.origin + '/zboard/' + href;
+        } else if (!href.startsWith('http')) {
+            fullUrl = location.origin + '/zboard/' + href;
+        }
+
+        // 제목 추출
+        const titleText = titleLink.innerText.trim() || titleLink.textContent.trim();
+
+        // 댓글수 추출 (제목 마지막 부분 또는 span.baseList-c)
+        let commentCount = 0;
+        const commentSpan = row.querySelector('span.baseList-c');
+        if (commentSpan) {
+            const commentText = commentSpan.innerText.trim();
+            const match = commentText.match(/(\\d+)/);
+            if (match) {
+                commentCount = parseInt(match[1]);
+            }
+        }
+
+        // 제목에서도 댓글수 찾기 (제목 뒤 숫자 패턴)
+        if (commentCount === 0) {
+            // 제목 마지막 숫자 찾기 (예: "...7 [가전/전자]")
+            const titleMatch = titleText.match(/(\\d+)\\s*\\[[^\\]]+\\]$/);
+            if (titleMatch) {
+                commentCount = parseInt(titleMatch[1]);
+            }
+        }
+
+        // 추천수/조회수 추출 (목록 행에 표시되는 경우, 예: "12 - 0")
+        let likeCount = null;
+        const recTd = row.querySelector('td.baseList-rec');
+        if (recTd) {
+            const match = recTd.innerText.trim().match(/^(\\d+)/);
+            if (match) {
+                likeCount = parseInt(match[1]);
+            }
+        }
+        let viewCount = null;
+        const viewsTd = row.querySelector('td.baseList-views');
+        if (viewsTd) {
+            const match = viewsTd.innerText.replace(/,/g, '').trim().match(/^(\\d+)/);
+            if (match) {
+                viewCount = parseInt(match[1]);
+            }
+        }
+
+        // 날짜 추출 (일반적으로 날짜 컬럼)
+        let dateText = '';
+        const dateCells = row.querySelectorAll('td');
+        for (const cell of dateCells) {
+            const text = cell.innerText.trim();
+            // 날짜 패턴 찾기 (YY/MM/DD 또는 HH:MM:SS)
+            if (text.match(/\\d{2}\\/\\d{2}\\/\\d{2}/) || text.match(/\\d{2}:\\d{2}:\\d{2}/)) {
+                dateText = text;
+                break;
+            }
+        }
+
+        // 카테고리 추출 (제목에서 [카테고리] 패턴)
+        let category = '';
+        const categoryMatch = titleText.match(/^\\[([^\\]]+)\\]/);
+        if (categoryMatch) {
+            category = categoryMatch[1];
+        }
+
+        items.push({
+            url: fullUrl,
+            title: titleText,
+            dateText: dateText,
+            comment_cnt: commentCount,
+            like_cnt: likeCount,
+            view_cnt: viewCount,
+            category: category,
+            no: noText
+        });
+    }
+
+    return items;
+})()
+"""
 
 
 class PpomppuCrawler(BaseCrawler):
-    def __init__(self):
+    def __init__(self, popular_url: Optional[str] = None):
         super().__init__()
-        self.popular_url = "https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu&hotlist_flag=999"
+        # 목 서버 등으로 대상 변경 가능 (인자 > PPOMPPU_POPULAR_URL > 기본값)
+        self.popular_url = popular_url or os.getenv(
+            'PPOMPPU_POPULAR_URL',
+            "https://www.ppomppu.co.kr/zboard/zboard.php?id=ppomppu&hotlist_flag=999"
+        )
         self.channel = "ppomppu"
+        # 여러 게시판 (PPOMPPU_BOARDS="ppomppu,freeboard" 또는 "이름=URL", 게시판 이름은 목록 URL의 id)
+        self.boards = parse_boards(os.getenv('PPOMPPU_BOARDS', ''), self.popular_url,
+                                   lambda board_id: with_query(self.popular_url, id=board_id))
     
     async def crawl(self, max_posts: int = None) -> List[Post]:
         """뽐뿌 인기글 크롤링 (오늘 기준 일주일 전까지)"""
         posts = []
         
         try:
-            # 1. 인기글 페이지 접속 (로그인 불필요)
-            print(f"🫛 인기글 페이지 접속: {self.popular_url}")
-            
-            # 재시도 로직
-            max_retries = 3
-            for retry in range(max_retries):
-                try:
-                    # 페이지 접속
-                    response = await self.page.goto(
-                        self.popular_url, 
-                        wait_until="load",
-                        timeout=30000
-                    )
-                    if response:
-                        print(f"🫛 페이지 응답 상태: {response.status}")
-                        if response.status != 200:
-                            raise Exception(f"HTTP 상태 코드 오류: {response.status}")
-            
-                    # 페이지 로딩 대기 (동적 콘텐츠 고려)
-                    await self.page.wait_for_timeout(3000)
-            
-                    # 페이지 내용 확인
-                    page_title = await self.page.title()
-                    print(f"🫛 페이지 제목: {page_title[:50]}...")
-                    
-                    # 실제 HTML 구조 확인
-                    page_content = await self.page.content()
-                    print(f"🫛 페이지 길이: {len(page_content)} bytes")
-                    
-                    # 다양한 선택자로 테이블 찾기 시도
-                    selectors_to_try = [
-                        '.list_table',
-                        'table.list_table',
-                        '.board_table',
-                        'table.board_table',
-                        'table',
-                        '[class*="list"]',
-                        '[class*="table"]',
-                        '[id*="list"]'
-                    ]
-                    
-                    table_found = False
-                    for selector in selectors_to_try:
-                        try:
-                            element = await self.page.query_selector(selector)
-                            if element:
-                                print(f"🫛 테이블 발견: {selector}")
-                                # 게시글 행 확인
-                                row_count = await self.page.evaluate(f"document.querySelectorAll('{selector} tr').length")
-                                print(f"🫛 발견된 게시글 행 수: {row_count}")
-                                if row_count > 0:
-                                    table_found = True
-                                    break
-                        except:
-                            continue
+            # 1~2. 인기글 페이지 접속 (로그인 불필요) 및 게시글 목록 수집 (일주일 전까지 필터링, 번호 존재 여부 확인)
+            post_items = await self.discover(max_posts)
+            
+            # 3. 각 게시글 상세 정보 수집 (체크포인트 재개 시 남은 항목만)
+            posts, pending_items = self._pending_detail_items(post_items)
+            if self.detail_fetch == 'http':
+                # HTTP fetch + 프로세스 풀 파싱
+                posts += await self._crawl_details_http(pending_items, parse_ppomppu_detail)
+            else:
+                for i, item in enumerate(pending_items):
+                    try:
+                        post_url = item.get('url', '')
                     
-                    if not table_found:
-                        # 페이지 HTML 일부 출력 (디버깅)
-                        body_text = await self.page.evaluate("document.body.innerText")
-                        print(f"🫛 페이지 본문 일부: {body_text[:200]}...")
-                        raise Exception(f"게시글 테이블을 찾을 수 없습니다. 페이지 구조 확인 필요.")
+                        print(f"🫛 게시글 데이터 수집 시작: {post_url} [{i+1}/{len(pending_items)}]")
                     
-                    break
-                except Exception as e:
-                    if retry < max_retries - 1:
-                        print(f"🫛 페이지 로드 실패, 재시도 중... ({retry + 1}/{max_retries}): {e}")
-                        await self.page.wait_for_timeout(5000)  # 재시도 전 대기 시간 증가
-                    else:
-                        print(f"🫛 페이지 로드 최종 실패: {e}")
+                        post = await self._guarded_fetch_post(item)
+                        self._checkpoint_post(item, post)
+                        if post:
+                            posts.append(post)
+                        
+                            # 요청 간격 조절
+                            await self.page.wait_for_timeout(1000)
+                        
+                    except CircuitOpenError:
+                        # 서킷이 최대 횟수만큼 열림: 남은 상세 수집 중단 (체크포인트로 재개 가능)
+                        break
+                    except Exception as e:
+                        print(f"🫛 게시글 {post_url} 처리 중 오류: {e}")
                         import traceback
                         traceback.print_exc()
-                        raise
-            
-            # 2. 게시글 목록 수집 (일주일 전까지 필터링, 번호 존재 여부 확인)
-            post_items = await self._get_posts_from_popular_page(max_posts)
-            print(f"🫛 수집된 게시글 목록: {len(post_items)}개")
+                        continue
             
-            # 3. 각 게시글 상세 정보 수집
-            for i, item in enumerate(post_items):
-                try:
-                    post_url = item.get('url', '')
-                    comment_cnt = item.get('comment_cnt', 0)
-                    title = item.get('title', '')
-                    
-                    print(f"🫛 게시글 데이터 수집 시작: {post_url} [{i+1}/{len(post_items)}]")
-                    
-                    # 게시글 상세 페이지 접속 (정적 페이지)
-                    await self.page.goto(
-                        post_url, 
-                        wait_until="load",
-                        timeout=30000
-                    )
-                    await self.page.wait_for_timeout(1000)
-                        
-                    # 게시글 데이터 추출
-                    post = await self._extract_post_data(post_url, comment_cnt, title)
-                    if post:
-                        posts.append(post)
-                        
-                        # 요청 간격 조절
-                        await self.page.wait_for_timeout(1000)
-                        
-                except Exception as e:
-                    print(f"🫛 게시글 {post_url} 처리 중 오류: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            self._checkpoint_complete()
                     
         except Exception as e:
             print(f"🫛 뽐뿌 크롤링 오류: {e}")
@@ -132,129 +199,196 @@ class PpomppuCrawler(BaseCrawler):
         print(f"🫛 총 {len(posts)}개 게시글 수집 완료")
         return posts
     
-    async def _get_posts_from_popular_page(self, max_posts: int = None) -> List[Dict]:
-        """인기글 페이지에서 게시글 정보를 수집 (오늘 기준 일주일 전까지, 번호 존재 여부 확인)"""
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        """인기글 목록에서 상세 수집 대상 항목 수집"""
+        resumed = self._resumed_items()
+        if resumed is not None:
+            return resumed
+        await self._open_popular_page()
+        post_items = await self._get_posts_from_popular_page(max_posts)
+        print(f"🫛 수집된 게시글 목록: {len(post_items)}개")
+        self._record_items(post_items)
+        return post_items
+    
+    async def refresh_counters(self, store: EngagementStore, since: Optional[datetime] = None,
+                               fetch_missing: Optional[bool] = None) -> Dict[str, int]:
+        """
+        추적 중인 게시글의 지표를 목록 행에서 읽어 스냅샷 저장 (상세 페이지는 필요할 때만)
+        
+        목록 행에 댓글/추천/조회수가 모두 표시되므로 목록 페이지 몇 장으로 수천 건을 갱신한다.
+        목록에서 사라진(인기글 해제 등) 추적 게시글만 상세 페이지로 확인한다.
+        """
+        since = since or default_track_since()
+        if fetch_missing is None:
+            fetch_missing = os.getenv('ENGAGEMENT_FETCH_MISSING', 'true').lower() == 'true'
+        max_detail = int(os.getenv('ENGAGEMENT_MAX_DETAIL_REFRESH', '50'))
+        
+        tracked = store.tracked(self.channel, since)
+        print(f"🫛 지표 갱신 시작: 추적 게시글 {len(tracked)}개 (since {since.strftime('%Y-%m-%d %H:%M')})")
+        stats = {'list_rows': 0, 'list_snapshots': 0, 'detail_snapshots': 0, 'missing': 0}
+        
+        await self._open_popular_page()
+        items = await self._get_posts_from_popular_page(since=since)
+        stats['list_rows'] = len(items)
+        
+        seen = set()
+        needs_detail = []
+        for item in items:
+            post_id = extract_post_id(self.channel, item.get('url', ''))
+            if post_id is None:
+                continue
+            seen.add(post_id)
+            # 목록 행에 지표가 없으면 상세 페이지로 확인
+            if item.get('view_cnt') is None and item.get('like_cnt') is None:
+                needs_detail.append(item)
+                continue
+            store.record(self.channel, post_id, canonical_post_url(self.channel, item['url']), item, 'list',
+                         title=item.get('title'), created_at=self._parse_date(item.get('dateText', '')))
+            stats['list_snapshots'] += 1
+        
+        missing = [info for post_id, info in tracked.items() if post_id not in seen]
+        stats['missing'] = len(missing)
+        if fetch_missing:
+            needs_detail.extend({'url': info['url'], 'title': info.get('title') or ''} for info in missing)
+        
+        for item in needs_detail[:max_detail]:
+            try:
+                post = await self._guarded_fetch_post(item, settle_ms=0)
+            except CircuitOpenError:
+                break
+            except Exception as e:
+                print(f"🫛 게시글 {item.get('url', '')} 지표 확인 오류: {e}")
+                continue
+            if post:
+                store.record_posts([post.model_dump()], source='detail')
+                stats['detail_snapshots'] += 1
+            await self.page.wait_for_timeout(self.delay)
+        store.conn.commit()
+        
+        print(f"🫛 지표 갱신 완료: 목록 {stats['list_snapshots']}건, 상세 {stats['detail_snapshots']}건 "
+              f"(목록에 없는 추적 게시글 {stats['missing']}개)")
+        return stats
+    
+    async def _open_popular_page(self):
+        """인기글 목록 페이지 접속 (재시도 포함, 게시글 테이블 확인)"""
+        print(f"🫛 인기글 페이지 접속: {self.popular_url}")
+        
+        # 재시도 로직
+        max_retries = 3
+        for retry in range(max_retries):
+            try:
+                # 페이지 접속
+                response = await self.page.goto(
+                    self.popular_url, 
+                    wait_until="load",
+                    timeout=30000
+                )
+                if response:
+                    print(f"🫛 페이지 응답 상태: {response.status}")
+                    if response.status != 200:
+                        raise Exception(f"HTTP 상태 코드 오류: {response.status}")
+        
+                # 페이지 로딩 대기 (동적 콘텐츠 고려)
+                await self.page.wait_for_timeout(3000)
+        
+                # 페이지 내용 확인
+                page_title = await self.page.title()
+                print(f"🫛 페이지 제목: {page_title[:50]}...")
+                
+                # 실제 HTML 구조 확인 (문서 전체를 Python으로 가져오지 않고 길이만 확인)
+                page_length = await self.page.evaluate("document.documentElement.outerHTML.length")
+                print(f"🫛 페이지 길이: {page_length} bytes")
+                
+                # 다양한 선택자로 테이블 찾기 시도
+                selectors_to_try = [
+                    '.list_table',
+                    'table.list_table',
+                    '.board_table',
+                    'table.board_table',
+                    'table',
+                    '[class*="list"]',
+                    '[class*="table"]',
+                    '[id*="list"]'
+                ]
+                
+                table_found = False
+                for selector in selectors_to_try:
+                    try:
+                        element = await self.page.query_selector(selector)
+                        if element:
+                            print(f"🫛 테이블 발견: {selector}")
+                            # 게시글 행 확인
+                            row_count = await self.page.evaluate(f"document.querySelectorAll('{selector} tr').length")
+                            print(f"🫛 발견된 게시글 행 수: {row_count}")
+                            if row_count > 0:
+                                table_found = True
+                                break
+                    except:
+                        continue
+                
+                if not table_found:
+                    # 페이지 HTML 일부 출력 (디버깅)
+                    body_text = await self.page.evaluate("document.body.innerText.slice(0, 200)")
+                    print(f"🫛 페이지 본문 일부: {body_text}...")
+                    raise Exception(f"게시글 테이블을 찾을 수 없습니다. 페이지 구조 확인 필요.")
+                
+                break
+            except Exception as e:
+                if retry < max_retries - 1:
+                    print(f"🫛 페이지 로드 실패, 재시도 중... ({retry + 1}/{max_retries}): {e}")
+                    await self.page.wait_for_timeout(5000)  # 재시도 전 대기 시간 증가
+                else:
+                    print(f"🫛 페이지 로드 최종 실패: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    raise
+
+    async def _fetch_post(self, item: Dict, settle_ms: int = 1000) -> Optional[Post]:
+        """게시글 상세 페이지(정적 페이지) 접속 후 데이터 추출"""
+        post_url = item.get('url', '')
+        await self._before_navigation()
+        await self.page.goto(
+            post_url, 
+            wait_until="load",
+            timeout=30000
+        )
+        if settle_ms:
+            await self.page.wait_for_timeout(settle_ms)
+        return await self._extract_post_data(post_url, item.get('comment_cnt', 0), item.get('title', ''))
+    
+    async def _get_posts_from_popular_page(self, max_posts: int = None, since: Optional[datetime] = None) -> List[Dict]:
+        """인기글 페이지에서 게시글 정보를 수집 (기본: 오늘 기준 일주일 전까지, 번호 존재 여부 확인)"""
         print(f"🫛 인기글 목록 수집 중...")
         
-        # 날짜 필터: 오늘 기준 일주일 전
+        # 날짜 필터: 사전 필터의 날짜 규칙 (기본: 오늘 기준 일주일 전, 지표 갱신 시에는 추적 시작 시각)
         today = datetime.now()
-        week_ago = today - timedelta(days=7)
-        print(f"🫛 날짜 필터: {week_ago.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
+        window_start = self.prefetch_filter.window_start(since)
+        if window_start:
+            print(f"🫛 날짜 필터: {window_start.strftime('%Y-%m-%d')} ~ {today.strftime('%Y-%m-%d')}")
         
-        collected_items: List[Dict] = []
-        current_page = 1
         max_pages = 200  # 충분히 큰 값 (일주일 전까지 모든 페이지를 탐색)
+        # 체크포인트가 있으면 저장된 목록 페이지부터 이어서 수집
+        collected_items, current_page = self._resume_listing()
+        
+        # 경계 탐색: 기간이 끝나는 페이지를 O(log N)번 만에 찾고 그 앞 페이지는 동시에 수집
+        # (체크포인트 재개 중이거나 max_posts 제한이 있으면 기존 순차 수집, 1페이지는 _open_popular_page에서 연 화면 사용)
+        if self.boundary_search and current_page == 1 and not max_posts:
+            found = await self._collect_by_boundary(LIST_ITEMS_SCRIPT, max_pages, since=since, page_one_loaded=True)
+            if found is not None:
+                post_items, last_page = found
+                self._checkpoint_listing(last_page + 1, post_items, done=True)
+                print(f"🫛 총 {len(post_items)}개 인기글 수집 완료 (경계 {last_page}페이지)")
+                return post_items
+            await self.page.goto(self._list_page_url(1), wait_until="load")
+        if current_page > 1:
+            print(f"🫛 체크포인트 재개: {current_page}페이지부터 목록 수집 (누적 {len(collected_items)}개)")
+            await self.page.goto(self._list_page_url(current_page), wait_until="load")
         
         while current_page <= max_pages:
             # 현재 페이지에서 게시글 정보 추출
             await self.page.wait_for_timeout(2000)
             
-            items = await self.page.evaluate("""
-                (() => {
-                    const items = [];
-                    // 다양한 테이블 선택자 시도
-                    let rows = [];
-                    const selectors = [
-                        '.list_table tr',
-                        'table.list_table tr',
-                        '.board_table tr',
-                        'table.board_table tr',
-                        'table tr',
-                        '[class*="list"] tr',
-                        '[class*="table"] tr'
-                    ];
-                    
-                    for (const sel of selectors) {
-                        rows = Array.from(document.querySelectorAll(sel));
-                        if (rows.length > 0) {
-                            console.log('테이블 발견:', sel, '행 수:', rows.length);
-                            break;
-                        }
-                    }
-                    
-                    for (const row of rows) {
-                        // 번호 컬럼 찾기 (첫 번째 td)
-                        const noTd = row.querySelector('td:first-child');
-                        if (!noTd) continue;
-                        
-                        const noText = noTd.innerText.trim();
-                        // 번호가 존재하는지 확인 (공백, "-", "공지" 등 제외)
-                        if (!noText || noText === '-' || noText === '공지' || isNaN(parseInt(noText))) {
-                            continue;
-                        }
-                        
-                        // 제목 링크 찾기
-                        const titleLink = row.querySelector('td.title a, a[href*="view.php"]');
-                        if (!titleLink) continue;
-                        
-                        const href = titleLink.getAttribute('href');
-                        if (!href) continue;
-                        
-                        // URL 생성
-                        let fullUrl = href;
-                        if (href.startsWith('/')) {
-                            fullUrl = 'https://www.ppomppu.co.kr' + href;
-                        } else if (href.startsWith('view.php')) {
-                            fullUrl = 'https://www.ppomppu.co.kr/zboard/' + href;
-                        } else if (!href.startsWith('http')) {
-                            fullUrl = 'https://www.ppomppu.co.kr/zboard/' + href;
-                        }
-                        
-                        // 제목 추출
-                        const titleText = titleLink.innerText.trim() || titleLink.textContent.trim();
-                        
-                        // 댓글수 추출 (제목 마지막 부분 또는 span.baseList-c)
-                        let commentCount = 0;
-                        const commentSpan = row.querySelector('span.baseList-c');
-                        if (commentSpan) {
-                            const commentText = commentSpan.innerText.trim();
-                            const match = commentText.match(/(\\d+)/);
-                            if (match) {
-                                commentCount = parseInt(match[1]);
-                            }
-                        }
-                        
-                        // 제목에서도 댓글수 찾기 (제목 뒤 숫자 패턴)
-                        if (commentCount === 0) {
-                            // 제목 마지막 숫자 찾기 (예: "...7 [가전/전자]")
-                            const titleMatch = titleText.match(/(\\d+)\\s*\\[[^\\]]+\\]$/);
-                            if (titleMatch) {
-                                commentCount = parseInt(titleMatch[1]);
-                            }
-                        }
-                        
-                        // 날짜 추출 (일반적으로 날짜 컬럼)
-                        let dateText = '';
-                        const dateCells = row.querySelectorAll('td');
-                        for (const cell of dateCells) {
-                            const text = cell.innerText.trim();
-                            // 날짜 패턴 찾기 (YY/MM/DD 또는 HH:MM:SS)
-                            if (text.match(/\\d{2}\\/\\d{2}\\/\\d{2}/) || text.match(/\\d{2}:\\d{2}:\\d{2}/)) {
-                                dateText = text;
-                                break;
-                            }
-                        }
-                        
-                        // 카테고리 추출 (제목에서 [카테고리] 패턴)
-                        let category = '';
-                        const categoryMatch = titleText.match(/^\\[([^\\]]+)\\]/);
-                        if (categoryMatch) {
-                            category = categoryMatch[1];
-                        }
-                        
-                        items.push({
-                            url: fullUrl,
-                            title: titleText,
-                            dateText: dateText,
-                            comment_cnt: commentCount,
-                            category: category,
-                            no: noText
-                        });
-                    }
-                    
-                    return items;
-                })()
-            """)
+            items = await self.page.evaluate(LIST_ITEMS_SCRIPT)
             
             print(f"🫛 [페이지 {current_page}] 화면에서 발견된 게시글 수: {len(items)}")
             
@@ -263,24 +397,12 @@ class PpomppuCrawler(BaseCrawler):
             
             for item in items:
                 url = item.get('url', '')
-                title = item.get('title', '')
-                date_text = item.get('dateText', '')
                 
-                # 날짜 필터링 (일주일 전까지)
-                if date_text:
-                    post_date = self._parse_date(date_text)
-                    if post_date:
-                        if post_date < week_ago:
-                            print(f"🫛 제외: 일주일 이전 게시글 - {date_text}")
-                            found_old_posts = True  # 일주일 이전 게시글이 발견됨
-                            continue
-                    else:
-                        # 날짜 파싱 실패 시 제외 (명확한 날짜가 필요)
-                        print(f"🫛 날짜 파싱 실패, 제외: {date_text}")
-                        continue
-                else:
-                    # 날짜 정보가 없으면 제외
-                    print(f"🫛 날짜 정보 없음, 제외")
+                # 사전 필터 (공지 행, 날짜 범위, 제목/카테고리 규칙, 상세 페이지 이동 전)
+                reason = self._prefetch_rejected(item, since=since)
+                if reason:
+                    if reason == REASON_TOO_OLD:
+                        found_old_posts = True  # 일주일 이전 게시글이 발견됨
                     continue
                 
                 # 중복 체크 (URL 기반)
@@ -301,6 +423,9 @@ class PpomppuCrawler(BaseCrawler):
                 print(f"🫛 max_posts({max_posts})에 도달하여 수집 종료")
                 break
             
+            # 목록 커서 저장 (다음 실행은 다음 페이지부터)
+            self._checkpoint_listing(current_page + 1, collected_items)
+            
             # 다음 페이지로 이동
             if current_page < max_pages:
                 next_page_clicked = False
@@ -395,54 +520,31 @@ class PpomppuCrawler(BaseCrawler):
         else:
             post_items = collected_items
         
+        self._checkpoint_listing(current_page, post_items, done=True)
         print(f"🫛 총 {len(post_items)}개 인기글 수집 완료 (총 {current_page}페이지 순회)")
         return post_items
     
+    async def _match_body_text(self, pattern: str) -> Optional[str]:
+        """본문 전체 텍스트를 Python으로 가져오지 않고 브라우저에서 정규식 첫 그룹만 추출"""
+        return await self.page.evaluate(
+            """(pattern) => {
+                const match = document.body.innerText.match(new RegExp(pattern));
+                return match ? match[1] : null;
+            }""",
+            pattern,
+        )
+    
+    def _comment_source(self):
+        """뽐뿌 댓글 페이지 (&c_page=N)"""
+        return PpomppuComments()
+    
     def _parse_date(self, date_text: str) -> Optional[datetime]:
         """날짜 텍스트를 datetime으로 변환 (목록 페이지용)"""
-        if not date_text:
-            return None
-        
         try:
-            # 형식 1: "23:08:03" (오늘 날짜 - 시간만 표시)
-            if re.match(r'^\d{2}:\d{2}:\d{2}$', date_text.strip()):
-                today = datetime.now()
-                time_parts = date_text.strip().split(':')
-                return today.replace(hour=int(time_parts[0]), minute=int(time_parts[1]), second=int(time_parts[2]), microsecond=0)
-            
-            # 형식 2: "25/11/02" (YY/MM/DD)
-            if re.match(r'^\d{2}/\d{2}/\d{2}$', date_text.strip()):
-                parts = date_text.strip().split('/')
-                year = 2000 + int(parts[0])
-                month = int(parts[1])
-                day = int(parts[2])
-                return datetime(year, month, day)
-            
-            # 형식 3: "2025-11-02 09:33" (YYYY-MM-DD HH:MM) - 상세 페이지 형식도 지원
-            match = re.search(r'(\d{4})-(\d{2})-(\d{2})\s+(\d{2}):(\d{2})', date_text)
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                hour = int(match.group(4))
-                minute = int(match.group(5))
-                return datetime(year, month, day, hour, minute)
-            
-            # 형식 4: "2025.11.02. 12:39" (YYYY.MM.DD. HH:MM)
-            match = re.search(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?\s*(\d{1,2}):(\d{1,2})', date_text)
-            if match:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                hour = int(match.group(4))
-                minute = int(match.group(5))
-                return datetime(year, month, day, hour, minute)
-            
+            return parse_ppomppu_date(date_text)
         except Exception as e:
             print(f"🫛 날짜 파싱 오류: {date_text} - {e}")
             return None
-        
-        return None
     
     async def _extract_post_data(self, post_url: str, comment_cnt: int, title_from_list: str) -> Optional[Post]:
         """게시글 상세 페이지에서 데이터 추출"""
@@ -511,19 +613,8 @@ class PpomppuCrawler(BaseCrawler):
                 '#article'
             ]
             
-            # UI 관련 텍스트 목록 (본문이 아닌 것으로 판단)
-            # 주의: 실제 본문에도 포함될 수 있는 일반적인 단어는 제외
-            ui_keywords = [
-                '뽐뿌', '이벤트', '정보', '커뮤니티', '갤러리', '장터', '포럼', '뉴스', '상담실',
-                '로그인', '회원가입', '아이디비번찾기', '뽐뿌게시판', '사용기', '구매후기',
-                '쿠폰게시판', '쇼핑포럼', '뽐뿌핫딜', '목록보기', '최신순', '작성순',
-                '알림', '광고성 게시글', '에디터', 'HTML편집', '미리보기', '짤방',
-                '업자신고', '다른의견', '이전글', '다음글', '등록일', '조회수', '추천하기',
-                '질렀어요 신고', '첨부파일', '같이 보면 좋은 상품',  # '상품' 단독 제거, '같이 보면 좋은 상품'만
-                '구매하셨다면', '후기를 남겨주세요', '구매후기 쓰기'
-            ]
-            
-            for sel in content_selectors:
+            trial = self.selector_stats.trial(self.channel, 'content', content_selectors)
+            for sel in trial:
                 try:
                     content_elem = await self.page.query_selector(sel)
                     if content_elem:
@@ -577,53 +668,11 @@ class PpomppuCrawler(BaseCrawler):
                         """)
                         
                         if content_text:
-                            # 줄바꿈 정리 (빈 줄 제거)
-                            lines = [line.strip() for line in content_text.split('\n') if line.strip()]
-                            
-                            # 메타 정보 라인 제거 (등록일, 조회수, 추천 등)
-                            filtered_lines = []
-                            for line in lines:
-                                # 메타 정보 패턴 제외
-                                if (re.match(r'^(등록일|조회수|추천)\s*\d+', line) or
-                                    re.match(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}', line) or  # 날짜 패턴
-                                    re.match(r'^https?://', line) or  # URL
-                                    re.match(r'^\d+원$', line) or  # 가격만 있는 라인
-                                    line in ['등록일', '조회수', '추천', '추천하기', '다른의견', '질렀어요 신고']):
-                                    continue
-                                filtered_lines.append(line)
-                            
-                            content = '\n'.join(filtered_lines)
-                            
-                            # UI 키워드가 많이 포함되어 있는지 확인 (정확한 매칭)
-                            # 각 라인에서 UI 키워드가 포함되어 있는지 확인
-                            ui_keyword_lines = 0
-                            for line in filtered_lines:
-                                for keyword in ui_keywords:
-                                    if keyword in line:
-                                        ui_keyword_lines += 1
-                                        break  # 한 라인에서 하나의 키워드만 카운트
-                            
-                            total_lines = len(filtered_lines)
-                            ui_ratio = ui_keyword_lines / max(total_lines, 1) if total_lines > 0 else 0
-                            
-                            # 실제 본문이 있는지 확인 (일정 길이 이상의 연속된 텍스트가 있는지)
-                            has_meaningful_content = False
-                            for line in filtered_lines:
-                                # UI 키워드가 포함되지 않은 라인 중 길이가 충분한 라인이 있는지
-                                is_ui_line = any(keyword in line for keyword in ui_keywords)
-                                if not is_ui_line and len(line) > 20:  # 20자 이상의 의미있는 본문 라인
-                                    has_meaningful_content = True
-                                    break
-                            
-                            # UI 키워드 비율이 높고(50% 이상) 의미있는 본문이 없으면 본문 없는 것으로 판단
-                            # 또는 UI 키워드 라인이 10개 이상이면 본문 없는 것으로 판단
-                            if (ui_ratio >= 0.5 and not has_meaningful_content) or ui_keyword_lines >= 10:
-                                print(f"🫛 UI 요소가 많이 포함되어 본문 없는 것으로 판단 (UI 키워드 라인: {ui_keyword_lines}개, 비율: {ui_ratio:.2f}, 의미있는 본문: {has_meaningful_content})")
-                                content = ""  # 본문이 없는 것으로 처리
-                                continue  # 다음 선택자 시도
-                            
+                            # 메타 정보 라인 제거, UI 요소 위주면 빈 문자열 (다음 선택자 시도)
+                            content = clean_ppomppu_content(content_text)
                             if len(content) > 10:
                                 print(f"🫛 본문 추출 성공 (선택자: {sel}): {len(content)}자")
+                                trial.hit(sel)
                                 break
                 except Exception as e:
                     continue
@@ -631,12 +680,10 @@ class PpomppuCrawler(BaseCrawler):
             # 조회수 추출 ("조회수" 텍스트 이후 값)
             view_cnt = 0
             try:
-                page_text = await self.page.evaluate("document.body.innerText")
-                view_match = re.search(r'조회수\s*[:：]?\s*([\d,]+)', page_text)
-                if view_match:
-                    view_num_str = view_match.group(1).replace(',', '')
-                    view_cnt = int(view_num_str)
-                    print(f"🫛 조회수 추출 성공: {view_match.group(1)} -> {view_cnt}")
+                view_text = await self._match_body_text(r'조회수\s*[:：]?\s*([\d,]+)')
+                if view_text:
+                    view_cnt = int(view_text.replace(',', ''))
+                    print(f"🫛 조회수 추출 성공: {view_text} -> {view_cnt}")
             except Exception as e:
                 pass
             
@@ -677,10 +724,9 @@ class PpomppuCrawler(BaseCrawler):
                 
                 # 방법 2: 페이지 텍스트에서 "등록일 YYYY-MM-DD HH:MM" 형식 찾기
                 if not created_at:
-                    page_text = await self.page.evaluate("document.body.innerText")
-                    date_match = re.search(r'등록일\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})', page_text)
-                    if date_match:
-                        date_str = date_match.group(1).strip()
+                    date_str = await self._match_body_text(r'등록일\s+(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2})')
+                    if date_str:
+                        date_str = date_str.strip()
                         try:
                             created_at = datetime.strptime(date_str, '%Y-%m-%d %H:%M')
                             print(f"🫛 날짜 파싱 성공 (전체 텍스트): {date_str} -> {created_at}")
@@ -689,40 +735,18 @@ class PpomppuCrawler(BaseCrawler):
                 
                 # 방법 3: 기존 패턴 (YY/MM/DD 또는 HH:MM:SS) - 하위 호환성
                 if not created_at:
-                    page_text = await self.page.evaluate("document.body.innerText")
-                    date_match = re.search(r'등록일[^\n]*[:：]?\s*(\d{2}/\d{2}/\d{2}|\d{2}:\d{2}:\d{2})', page_text)
-                    if date_match:
-                        date_text = date_match.group(1).strip()
+                    date_text = await self._match_body_text(r'등록일[^\n]*[:：]?\s*(\d{2}/\d{2}/\d{2}|\d{2}:\d{2}:\d{2})')
+                    if date_text:
+                        date_text = date_text.strip()
                         created_at = self._parse_date(date_text)
                         if created_at:
                             print(f"🫛 날짜 파싱 성공 (기존 패턴): {date_text} -> {created_at}")
             except Exception as e:
                 print(f"🫛 날짜 추출 오류: {e}")
             
-            # URL 추출 (span.topTitle-copy 클릭하여 클립보드에서 가져오기)
-            actual_url = post_url
-            try:
-                copy_span = await self.page.query_selector('span.topTitle-copy')
-                if copy_span:
-                    await copy_span.click()
-                    await self.page.wait_for_timeout(500)
-                    # 클립보드에서 URL 가져오기
-                    clipboard_text = await self.page.evaluate("navigator.clipboard.readText()")
-                    if clipboard_text and ('ppomppu.co.kr' in clipboard_text or 'view.php' in clipboard_text):
-                        actual_url = clipboard_text
-                        print(f"🫛 URL 클립보드 복사 성공: {actual_url}")
-            except Exception as e:
-                # 클립보드 접근 실패 시 원본 URL 사용
-                pass
-            
-            # 게시글 ID 추출 (URL에서)
-            article_id = None
-            id_match = re.search(r'no=(\d+)', post_url)
-            if id_match:
-                article_id = int(id_match.group(1))
-            
-            # own_company: 제목에 "롯데온"이 있으면 1, 없으면 0
-            own_company = 1 if title and '롯데온' in title else 0
+            # URL/게시글 ID: 목록 URL의 no=로 정식 주소 생성 (복사 버튼 클릭 + 클립보드 읽기 불필요)
+            actual_url = canonical_post_url(self.channel, post_url)
+            article_id = extract_post_id(self.channel, post_url)
             
             # content가 없거나 의미있는 내용이 없으면 None 반환 (pass)
             content_cleaned = content.strip() if content else ""
@@ -732,6 +756,9 @@ class PpomppuCrawler(BaseCrawler):
             
             print(f"🫛 추출 완료: title={title[:30]}..., view_cnt={view_cnt}, comment_cnt={comment_cnt}, like_cnt={like_cnt}")
             
+            # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+            own_company = get_brand_tagger().own_company(title, content)
+            
             return Post(
                 id=article_id,
                 channel=self.channel,
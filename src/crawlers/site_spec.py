@@ -0,0 +1,350 @@
+"""
+선언형 사이트 명세(site spec) 로드/컴파일
+
+새 커뮤니티를 크롤러 클래스 없이 명세 파일(TOML, 또는 같은 구조의 JSON)만으로 추가한다.
+명세는 처음 사용할 때 한 번 컴파일되어 (CSS 선택자 → soupsieve 컴파일 객체, 정규식, 날짜 형식 분류)
+목록/상세 HTML을 한 번만 파싱하고 필드마다 미리 컴파일한 선택자로 값을 뽑는 단일 경로로 추출한다.
+
+명세 구조 (src/crawlers/site_specs/*.toml 참고):
+    channel, base_url, boards, list_url("{base}", "{board}", "{page}" 자리표시자), fetch(browser|http), max_pages,
+    sorted_by_date, settle_ms, retries, retry_delay_ms, post_id(URL 정규식 목록),
+    date_formats, max_age_days, require_date
+    [list]            rows(행 선택자 후보), fields.<이름> = 필드 명세 (url/title/dateText는 필수)
+    [detail]          fields.<이름> = 필드 명세 (Post 필드: title, content, view_cnt, like_cnt, comment_cnt,
+                      created_at, category)
+    [detail.clean]    remove(본문에서 지울 선택자), drop_lines(지울 줄 정규식), stop_at(이후를 버릴 줄 정규식),
+                      min_length(이보다 짧은 본문은 수집 실패)
+
+필드 명세:
+    selectors  후보 선택자 목록 (앞에서부터 처음 찾은 요소 사용)
+    attr       text(기본) | html | 속성 이름 (예: href)
+    pattern    값에 적용할 정규식 (그룹 1 사용)
+    page_pattern  선택자로 찾지 못하면 페이지 전체 텍스트에 적용할 정규식 (그룹 1)
+    remove     값을 읽기 전에 요소 안에서 지울 선택자 (예: 제목 안의 말머리/댓글 수)
+    type       str(기본) | int | date
+"""
+import copy
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+
+from src.crawlers.html_parsers import inner_text
+from src.utils.brand_tagger import get_brand_tagger
+from src.utils.canonical_url import canonical_post_url, normalize_url
+
+try:
+    import tomllib
+except ImportError:  # Python 3.10
+    tomllib = None
+
+SPEC_DIR = os.path.join(os.path.dirname(__file__), 'site_specs')
+FETCH_MODES = ('browser', 'http')
+FIELD_TYPES = ('str', 'int', 'date')
+POST_FIELDS = ('title', 'content', 'view_cnt', 'like_cnt', 'comment_cnt', 'created_at', 'category')
+
+RELATIVE_DATE = re.compile(r'(\d+)\s*(초|분|시간|일)\s*전')
+RELATIVE_UNITS = {'초': 'seconds', '분': 'minutes', '시간': 'hours', '일': 'days'}
+
+
+class SpecError(ValueError):
+    """명세 형식 오류"""
+
+
+def resolve_spec_path(name_or_path: str) -> str:
+    """명세 이름(site_specs/<이름>.toml|.json) 또는 파일 경로 → 파일 경로"""
+    if os.path.exists(name_or_path):
+        return os.path.abspath(name_or_path)
+    for ext in ('.toml', '.json'):
+        path = os.path.join(SPEC_DIR, name_or_path + ext)
+        if os.path.exists(path):
+            return path
+    raise SpecError(f"사이트 명세를 찾을 수 없음: {name_or_path}")
+
+
+def available_specs() -> List[str]:
+    if not os.path.isdir(SPEC_DIR):
+        return []
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(SPEC_DIR) if f.endswith(('.toml', '.json')))
+
+
+def _read_spec(path: str) -> Dict:
+    if path.endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    if tomllib is None:
+        raise SpecError("TOML 명세는 Python 3.11 이상에서 읽을 수 있습니다 (JSON 명세 사용)")
+    with open(path, 'rb') as f:
+        return tomllib.load(f)
+
+
+class FieldSpec:
+    """필드 하나의 컴파일된 추출 규칙"""
+
+    def __init__(self, name: str, spec):
+        if isinstance(spec, (str, list)):
+            spec = {'selectors': spec}
+        selectors = spec.get('selectors', [])
+        if isinstance(selectors, str):
+            selectors = [selectors]
+        self.name = name
+        try:
+            self.selectors = [soupsieve.compile(sel) for sel in selectors]
+        except Exception as e:
+            raise SpecError(f"필드 {name}: 잘못된 선택자 ({e})")
+        self.attr = spec.get('attr', 'text')
+        remove = spec.get('remove', [])
+        try:
+            self.remove = soupsieve.compile(', '.join([remove] if isinstance(remove, str) else remove)) if remove else None
+        except Exception as e:
+            raise SpecError(f"필드 {name}: 잘못된 remove 선택자 ({e})")
+        self.pattern = re.compile(spec['pattern']) if spec.get('pattern') else None
+        self.page_pattern = re.compile(spec['page_pattern']) if spec.get('page_pattern') else None
+        self.type = spec.get('type', 'str')
+        if self.type not in FIELD_TYPES:
+            raise SpecError(f"필드 {name}: 알 수 없는 type {self.type}")
+
+    def element(self, root: Tag) -> Optional[Tag]:
+        for selector in self.selectors:
+            found = selector.select_one(root)
+            if found is not None:
+                return found
+        return None
+
+    def raw(self, root: Tag, page_text=None) -> str:
+        """요소 값 (attr/pattern 적용 전후), 없으면 페이지 텍스트 정규식, 그래도 없으면 빈 문자열"""
+        elem = self.element(root)
+        value = ''
+        if elem is not None:
+            if self.remove is not None:
+                # 원본 트리는 다른 필드가 다시 읽으므로 복사본에서 지움
+                elem = copy.copy(elem)
+                for child in self.remove.select(elem):
+                    child.decompose()
+            if self.attr == 'text':
+                value = inner_text(elem)
+            elif self.attr == 'html':
+                value = str(elem)
+            else:
+                value = elem.get(self.attr) or ''
+            if self.pattern:
+                match = self.pattern.search(value)
+                value = next((g for g in match.groups() if g), match.group(0)) if match else ''
+        if not value and self.page_pattern and page_text is not None:
+            match = self.page_pattern.search(page_text())
+            value = next((g for g in match.groups() if g), match.group(0)) if match else ''
+        return value.strip()
+
+
+class DateParser:
+    """명세의 날짜 형식 목록 (시각만 있으면 오늘, 연도가 없으면 올해 또는 작년)"""
+
+    def __init__(self, formats: List[str]):
+        self.formats = []
+        for fmt in formats:
+            has_date = any(code in fmt for code in ('%d', '%j'))
+            has_year = any(code in fmt for code in ('%Y', '%y'))
+            self.formats.append((fmt, has_date, has_year))
+
+    def __call__(self, text: str) -> Optional[datetime]:
+        text = (text or '').strip()
+        if not text:
+            return None
+        relative = RELATIVE_DATE.search(text)
+        if relative:
+            return datetime.now() - timedelta(**{RELATIVE_UNITS[relative.group(2)]: int(relative.group(1))})
+        now = datetime.now()
+        for fmt, has_date, has_year in self.formats:
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            if not has_date:
+                return now.replace(hour=parsed.hour, minute=parsed.minute, second=parsed.second, microsecond=0)
+            if not has_year:
+                parsed = parsed.replace(year=now.year)
+                if parsed > now + timedelta(days=1):
+                    parsed = parsed.replace(year=now.year - 1)
+            return parsed
+        return None
+
+
+class SiteSpec:
+    """컴파일된 사이트 명세"""
+
+    def __init__(self, data: Dict, path: str = ''):
+        self.path = path
+        self.channel = data.get('channel') or ''
+        if not self.channel:
+            raise SpecError(f"channel이 없습니다: {path}")
+        self.base_url = (data.get('base_url') or '').rstrip('/')
+        self.list_url_template = data.get('list_url', '')
+        if '{page}' not in self.list_url_template:
+            raise SpecError(f"list_url에 {{page}} 자리표시자가 필요합니다: {path}")
+        self.boards: List[str] = data.get('boards') or ['']
+        self.fetch = data.get('fetch', 'browser')
+        if self.fetch not in FETCH_MODES:
+            raise SpecError(f"fetch는 browser 또는 http: {self.fetch}")
+        self.max_pages = int(data.get('max_pages', 50))
+        self.sorted_by_date = bool(data.get('sorted_by_date', True))
+        self.settle_ms = int(data.get('settle_ms', 0))
+        self.retries = int(data.get('retries', 3))
+        self.retry_delay_ms = int(data.get('retry_delay_ms', 2000))
+        self.max_age_days = data.get('max_age_days', 7)
+        self.require_date = bool(data.get('require_date', False))
+        self.post_id_patterns = [re.compile(p) for p in data.get('post_id', [])]
+        self.parse_date = DateParser(data.get('date_formats', ['%Y-%m-%d %H:%M', '%Y.%m.%d %H:%M', '%Y-%m-%d', '%Y.%m.%d']))
+
+        list_spec = data.get('list', {})
+        self.row_selectors = [soupsieve.compile(sel) for sel in list_spec.get('rows', [])]
+        if not self.row_selectors:
+            raise SpecError(f"list.rows가 없습니다: {path}")
+        self.list_fields = {name: FieldSpec(name, spec) for name, spec in list_spec.get('fields', {}).items()}
+        for required in ('url', 'title'):
+            if required not in self.list_fields:
+                raise SpecError(f"list.fields.{required}가 없습니다: {path}")
+
+        detail_spec = data.get('detail', {})
+        self.detail_fields = {name: FieldSpec(name, spec) for name, spec in detail_spec.get('fields', {}).items()}
+        unknown = set(self.detail_fields) - set(POST_FIELDS)
+        if unknown:
+            raise SpecError(f"detail.fields에 Post 필드가 아닌 항목: {', '.join(sorted(unknown))}")
+        clean = detail_spec.get('clean', {})
+        self.remove_selectors = soupsieve.compile(', '.join(clean['remove'])) if clean.get('remove') else None
+        self.drop_lines = [re.compile(p) for p in clean.get('drop_lines', [])]
+        self.stop_at = [re.compile(p) for p in clean.get('stop_at', [])]
+        self.min_length = int(clean.get('min_length', 10))
+
+    def list_url(self, board: str, page: int, base_url: Optional[str] = None) -> str:
+        return self.list_url_template.format(base=(base_url or self.base_url).rstrip('/'), board=board, page=page)
+
+    def post_id(self, url: str) -> Optional[int]:
+        for pattern in self.post_id_patterns:
+            match = pattern.search(url or '')
+            if match:
+                digits = next((g for g in match.groups() if g), None)
+                if digits and digits.isdigit():
+                    return int(digits)
+        return None
+
+    def canonical_url(self, url: str) -> str:
+        """기존 채널이면 정식 URL, 아니면 추적 파라미터만 제거"""
+        canonical = canonical_post_url(self.channel, url)
+        return canonical if canonical else normalize_url(url, detect=False)
+
+    # -----------------------------------------------------------------------
+    # 추출 (HTML 한 번 파싱)
+    # -----------------------------------------------------------------------
+
+    def extract_list(self, html: str, page_url: str) -> List[Dict]:
+        """목록 HTML → 항목 목록 (url은 절대 주소, int 필드는 숫자)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        rows: List[Tag] = []
+        for selector in self.row_selectors:
+            rows = selector.select(soup)
+            if rows:
+                break
+        items = []
+        for row in rows:
+            item = {}
+            for name, field in self.list_fields.items():
+                value = field.raw(row)
+                item[name] = _parse_int(value) if field.type == 'int' else value
+            if not item.get('url') or not item.get('title'):
+                continue
+            item['url'] = urljoin(page_url, item['url'])
+            item.setdefault('dateText', '')
+            items.append(item)
+        return items
+
+    def clean_content(self, content_elem: Tag) -> str:
+        if self.remove_selectors is not None:
+            for elem in self.remove_selectors.select(content_elem):
+                elem.decompose()
+        lines = []
+        for line in inner_text(content_elem).split('\n'):
+            line = line.strip()
+            if any(p.search(line) for p in self.stop_at):
+                break
+            if not line or any(p.search(line) for p in self.drop_lines):
+                continue
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def extract_detail(self, html: str, item: Dict) -> Optional[Dict]:
+        """상세 HTML → Post 필드 dict (본문이 min_length보다 짧으면 None, 없는 필드는 목록 항목 값 사용)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        page_text_cache: List[str] = []
+
+        def page_text() -> str:
+            # 페이지 전체 텍스트는 필요할 때 한 번만 계산
+            if not page_text_cache:
+                page_text_cache.append(inner_text(soup.body or soup))
+            return page_text_cache[0]
+
+        values: Dict = {}
+        for name, field in self.detail_fields.items():
+            if name == 'content':
+                elem = field.element(soup)
+                values[name] = self.clean_content(elem) if elem is not None else ''
+                continue
+            raw = field.raw(soup, page_text)
+            if field.type == 'int':
+                values[name] = _parse_int(raw) if raw else None
+            elif field.type == 'date':
+                values[name] = self.parse_date(raw) if raw else None
+            else:
+                values[name] = raw
+
+        content = (values.get('content') or '').strip()
+        if len(content) < self.min_length:
+            return None
+        title = values.get('title') or item.get('title', '')
+        created_at = values.get('created_at') or self.parse_date(item.get('dateText', ''))
+        post_url = item.get('url', '')
+        return {
+            'id': self.post_id(post_url),
+            'category': values.get('category') or item.get('category', '') or '',
+            'title': title.split('\n')[0].strip(),
+            'content': content,
+            'view_cnt': _first_count(values.get('view_cnt'), item.get('view_cnt')),
+            'like_cnt': _first_count(values.get('like_cnt'), item.get('like_cnt')),
+            'comment_cnt': _first_count(values.get('comment_cnt'), item.get('comment_cnt')),
+            'created_at': created_at,
+            # own_company: 제목 또는 본문에 자사 브랜드(별칭 포함)가 있으면 1
+            'own_company': get_brand_tagger().own_company(title, content),
+            'url': self.canonical_url(post_url),
+        }
+
+
+def _parse_int(text) -> int:
+    if isinstance(text, int):
+        return text
+    match = re.search(r'([\d,]+)', text or '')
+    return int(match.group(1).replace(',', '')) if match else 0
+
+
+def _first_count(*values) -> int:
+    for value in values:
+        if value is not None and value != '':
+            return _parse_int(value)
+    return 0
+
+
+@lru_cache(maxsize=None)
+def load_spec(name_or_path: str) -> SiteSpec:
+    """명세 로드 + 컴파일 (프로세스마다 한 번)"""
+    path = resolve_spec_path(name_or_path)
+    return SiteSpec(_read_spec(path), path)
+
+
+def parse_spec_detail(spec_path: str, html: str, item: Dict) -> Optional[Dict]:
+    """프로세스 풀용 상세 파서 (functools.partial(parse_spec_detail, 경로)로 전달, 워커에서 명세를 한 번 컴파일)"""
+    return load_spec(spec_path).extract_detail(html, item)
+
@@ -0,0 +1,259 @@
+"""
+명세 기반 범용 크롤러
+
+사이트 명세(src/crawlers/site_specs/*.toml, site_spec 모듈 참고) 하나로 목록 → 상세 수집을 수행한다.
+목록/상세 모두 HTML을 받아 컴파일된 명세로 한 번에 추출하므로 fetch 방식과 관계없이 같은 추출 경로를 쓴다.
+    fetch = "browser"  Playwright 페이지에서 HTML을 받음 (봇 확인/스크립트 렌더링이 필요한 사이트)
+    fetch = "http"     httpx로 받음 (브라우저를 띄우지 않음, 상세는 프로세스 풀에서 파싱)
+
+환경변수:
+    SPEC_FETCH      명세의 fetch 방식 대신 사용할 방식
+    SPEC_BASE_URL   명세의 base_url 대신 사용할 주소 (목 서버 등)
+    SPEC_BOARDS     명세의 boards 대신 수집할 게시판 ("이름" 또는 "이름=URL"을 쉼표로 구분)
+"""
+import asyncio
+import os
+from functools import partial
+from typing import Dict, List, Optional
+
+import httpx
+
+from src.crawlers.base_crawler import BaseCrawler, USER_AGENT, PAGE_HEADERS, parse_boards
+from src.crawlers.site_spec import load_spec, parse_spec_detail, resolve_spec_path
+from src.models.post import Post
+from src.utils.circuit_breaker import BLOCKED_STATUSES, CircuitOpenError, describe_error, html_is_bot_check
+from src.utils.prefetch_filters import FilterRule, PrefetchFilter, load_rules
+from src.utils.proxy_pool import OUTCOME_BLOCKED, OUTCOME_ERROR, OUTCOME_OK, classify_response
+
+
+class SpecCrawler(BaseCrawler):
+    def __init__(self, spec: str, board: Optional[str] = None, list_url: Optional[str] = None):
+        super().__init__()
+        self.spec_path = resolve_spec_path(spec)
+        self.spec = load_spec(self.spec_path)
+        self.channel = self.spec.channel
+        self.fetch_mode = os.getenv('SPEC_FETCH', self.spec.fetch).strip().lower()
+        self.base_url = os.getenv('SPEC_BASE_URL', '') or self.spec.base_url
+        self.board = board if board is not None else self.spec.boards[0]
+        self.popular_url = list_url or self.spec.list_url(self.board, 1, self.base_url)
+        # 명세 템플릿으로 만든 목록 주소면 페이지 이동도 템플릿으로 (직접 지정한 URL은 page 파라미터만 교체)
+        self.templated = self.popular_url == self.spec.list_url(self.board, 1, self.base_url)
+        self.boards = parse_boards(os.getenv('SPEC_BOARDS', '') or ','.join(b for b in self.spec.boards if b),
+                                   self.popular_url, lambda name: self.spec.list_url(name, 1, self.base_url))
+        self.client: Optional[httpx.AsyncClient] = None
+        if self.fetch_mode == 'http':
+            self.detail_fetch = 'http'
+
+    async def __aenter__(self):
+        if self.fetch_mode == 'browser':
+            return await super().__aenter__()
+        self.client = self._new_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.client:
+            await self.client.aclose()
+            self.client = None
+        await super().__aexit__(exc_type, exc_val, exc_tb)
+
+    def _new_client(self) -> httpx.AsyncClient:
+        """HTTP 방식 클라이언트 (프록시 풀이 있으면 크롤러마다 프록시 하나 배정)"""
+        if self.proxy_pool and (self.proxy is None or self.proxy.evicted):
+            self.proxy = self.proxy_pool.choose(self.popular_url)
+            print(f"🫛 HTTP 프록시: {self.proxy.name}")
+        return self._new_http_client(self.proxy, headers={'User-Agent': USER_AGENT, **PAGE_HEADERS})
+
+    async def _rotate_client(self):
+        """HTTP 방식에서 현재 프록시가 풀에서 제외됐으면 다른 프록시로 클라이언트 교체"""
+        if self.fetch_mode == 'http' and self.proxy is not None and self.proxy.evicted:
+            await self.client.aclose()
+            self.client = self._new_client()
+
+    def _for_board(self, board: Dict[str, str]) -> 'SpecCrawler':
+        return SpecCrawler(self.spec_path, board=board['name'], list_url=board['url'])
+
+    async def _attach(self, parent: 'SpecCrawler', storage_state: Optional[Dict] = None):
+        if self.fetch_mode == 'browser':
+            return await super()._attach(parent, storage_state)
+        # HTTP 방식은 통계를 공유하고 클라이언트만 게시판마다 (프록시 풀이 있으면 게시판마다 다른 프록시)
+        self.memory = parent.memory
+        self.rate_limiter = parent.rate_limiter
+        self.circuit_breakers = parent.circuit_breakers
+        self.proxy_pool = parent.proxy_pool
+        self._prefetch_filter = parent.prefetch_filter
+        self.client = self._new_client()
+
+    async def _detach(self):
+        if self.fetch_mode == 'browser':
+            await super()._detach()
+        elif self.client:
+            await self.client.aclose()
+        self.client = None
+
+    @property
+    def prefetch_filter(self) -> PrefetchFilter:
+        """채널 규칙 + (채널에 날짜 규칙이 없으면) 명세의 max_age_days 날짜 규칙"""
+        if self._prefetch_filter is None:
+            rules = [rule for rule in load_rules() if rule.applies_to(self.channel)]
+            if self.spec.max_age_days and not any(rule.type == 'date_window' for rule in rules):
+                rules.append(FilterRule({
+                    'name': 'spec-window', 'channel': self.channel, 'type': 'date_window',
+                    'max_age_days': self.spec.max_age_days, 'require_date': self.spec.require_date,
+                }))
+            self._prefetch_filter = PrefetchFilter(self.channel, rules=rules, date_parser=self._parse_date)
+        return self._prefetch_filter
+
+    def _parse_date(self, date_text: str):
+        return self.spec.parse_date(date_text)
+
+    def _list_page_url(self, page: int) -> str:
+        if self.templated:
+            return self.spec.list_url(self.board, page, self.base_url)
+        return super()._list_page_url(page)
+
+    async def _open_list_tab(self):
+        return await super()._open_list_tab() if self.fetch_mode == 'browser' else None
+
+    async def _fetch_html(self, url: str, tab=None, settle_ms: int = 0) -> str:
+        """HTML 가져오기 (명세의 retries만큼 재시도, 속도 제한은 호출하는 쪽에서)"""
+        last_error: Optional[Exception] = None
+        for attempt in range(max(1, self.spec.retries)):
+            try:
+                if self.fetch_mode == 'http':
+                    response = await self.client.get(url)
+                    response.raise_for_status()
+                    return response.text
+                tab = tab or self.page
+                response = await tab.goto(url, wait_until="load")
+                if response and response.status >= 400:
+                    raise Exception(f"HTTP 상태 코드 오류: {response.status}")
+                if settle_ms:
+                    await tab.wait_for_timeout(settle_ms)
+                return await tab.content()
+            except Exception as e:
+                last_error = e
+                # 차단 응답은 재시도하지 않고 서킷 브레이커에 맡김
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in BLOCKED_STATUSES:
+                    break
+                if attempt + 1 < self.spec.retries:
+                    print(f"🫛 {url} 요청 실패, 재시도 {attempt + 1}/{self.spec.retries - 1}: {e}")
+                    await asyncio.sleep(self.spec.retry_delay_ms / 1000)
+        raise last_error
+
+    async def _load_list_page(self, tab, page_no: int, list_script: str = '', settle_ms: int = 0) -> List[Dict]:
+        url = self._list_page_url(page_no)
+        breaker = self.circuit_breakers.get(url)
+        breaker.before_request()
+        await self._rotate_client()
+        await self._throttle(url)
+        try:
+            html = await self._fetch_html(url, tab, settle_ms)
+        except Exception as e:
+            breaker.record_failure(describe_error(e))
+            status = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else 0
+            self._record_proxy(classify_response(status) if status else OUTCOME_ERROR)
+            raise
+        if html_is_bot_check(html):
+            breaker.record_failure('봇 확인 페이지')
+            self._record_proxy(OUTCOME_BLOCKED)
+            raise Exception("봇 확인 페이지")
+        breaker.record_success()
+        self._record_proxy(OUTCOME_OK)
+        return self.spec.extract_list(html, url)
+
+    async def crawl(self, max_posts: int = None) -> List[Post]:
+        posts: List[Post] = []
+        try:
+            post_items = await self.discover(max_posts)
+            posts, pending_items = self._pending_detail_items(post_items)
+            if self.detail_fetch == 'http':
+                # 워커 프로세스에서 명세를 한 번 컴파일하도록 경로만 넘김
+                posts += await self._crawl_details_http(pending_items, partial(parse_spec_detail, self.spec_path))
+            else:
+                for i, item in enumerate(pending_items):
+                    print(f"🫛 게시글 데이터 수집 시작: {item.get('url', '')} [{i+1}/{len(pending_items)}]")
+                    try:
+                        post = await self._guarded_fetch_post(item, settle_ms=self.spec.settle_ms)
+                    except CircuitOpenError:
+                        break
+                    except Exception as e:
+                        print(f"🫛 게시글 {item.get('url', '')} 처리 중 오류: {e}")
+                        continue
+                    self._checkpoint_post(item, post)
+                    if post:
+                        posts.append(post)
+                    await asyncio.sleep(self.delay / 1000)
+            self._checkpoint_complete()
+        except Exception as e:
+            print(f"🫛 {self.channel} 크롤링 오류: {e}")
+            import traceback
+            traceback.print_exc()
+
+        print(f"🫛 총 {len(posts)}개 게시글 수집 완료")
+        return posts
+
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        """목록 페이지에서 상세 수집 대상 항목 수집 (날짜순 목록이면 경계 탐색 후 동시 수집)"""
+        resumed = self._resumed_items()
+        if resumed is not None:
+            return resumed
+        post_items, current_page = self._resume_listing()
+        print(f"🫛 {self.channel} 목록 수집: {self._list_page_url(current_page)}")
+
+        if self.boundary_search and self.spec.sorted_by_date and current_page == 1 and not max_posts:
+            found = await self._collect_by_boundary('', self.spec.max_pages, settle_ms=self.spec.settle_ms)
+            if found is not None:
+                post_items, last_page = found
+                self._checkpoint_listing(last_page + 1, post_items, done=True)
+                self._record_items(post_items)
+                return post_items
+
+        seen = {item.get('url') for item in post_items}
+        window_start = self.prefetch_filter.window_start()
+        for page_no in range(current_page, self.spec.max_pages + 1):
+            try:
+                items = await self._load_list_page(self.page, page_no, settle_ms=self.spec.settle_ms)
+            except Exception as e:
+                print(f"🫛 목록 {page_no}페이지 수집 실패: {e}")
+                break
+            if not items:
+                break
+            for item in items:
+                if self._prefetch_rejected(item):
+                    continue
+                if item['url'] not in seen:
+                    seen.add(item['url'])
+                    post_items.append(item)
+            print(f"🫛 목록 {page_no}페이지: 누적 {len(post_items)}개")
+            done = bool(max_posts and len(post_items) >= max_posts)
+            # 날짜순 목록에서 페이지 전체가 기간 밖이면 이후 페이지도 기간 밖
+            dates = self._edge_dates(items)
+            if self.spec.sorted_by_date and window_start and dates and max(dates) < window_start:
+                done = True
+            self._checkpoint_listing(page_no + 1, post_items, done=done)
+            if done:
+                break
+
+        if max_posts:
+            post_items = post_items[:max_posts]
+        print(f"🫛 수집된 게시글 목록: {len(post_items)}개")
+        self._record_items(post_items)
+        return post_items
+
+    async def _before_navigation(self):
+        if self.fetch_mode == 'browser':
+            return await super()._before_navigation()
+        await self._rotate_client()
+        await self._throttle(self.popular_url)
+
+    async def _fetch_post(self, item: Dict, settle_ms: int = 1000) -> Optional[Post]:
+        await self._before_navigation()
+        html = await self._fetch_html(item['url'], settle_ms=settle_ms)
+        data = self.spec.extract_detail(html, item)
+        if not data and html_is_bot_check(html):
+            raise Exception("봇 확인 페이지")
+        if not data:
+            print(f"🫛 본문 추출 실패: {item.get('url', '')}")
+            return None
+        post = Post(channel=self.channel, **data)
+        return post if self._accept_post(post) else None
@@ -0,0 +1,574 @@
+import argparse
+import asyncio
+import bisect
+import csv
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.crawlers.fmkorea_crawler import FmkoreaCrawler
+from src.crawlers.ppomppu_crawler import PpomppuCrawler
+from src.crawlers.mamibebe_crawler import MamibebeCrawler
+from src.crawlers.base_crawler import USER_AGENT
+from src.utils.brand_tagger import get_brand_tagger, normalize
+from src.utils.browser_profiles import PROFILES, launch_options
+from src.utils.memory import current_rss_mb, descendants_rss_mb
+from src.utils.perf_gate import (
+    DEFAULT_BASELINE_PATH, DEFAULT_THRESHOLD, METRICS, ProtocolCallCounter,
+    compare, gate_problems, load_baseline, percentile, print_comparison, save_baseline,
+)
+from src.utils.fixtures import FixtureStore
+from playwright.async_api import async_playwright
+
+CRAWLERS = {
+    'fmkorea': FmkoreaCrawler,
+    'ppomppu': PpomppuCrawler,
+    'mam2bebe': MamibebeCrawler,
+}
+
+
+async def bench_extract(channel: str, fixtures_dir: str, repeat: int = 1) -> Optional[Dict]:
+    """기록된 픽스처를 재생하며 채널별 상세 추출 속도(posts/sec) 측정"""
+    items = FixtureStore(fixtures_dir, channel).load_items()
+    if not items:
+        print(f"⚠️ {channel}: 기록된 목록 항목이 없습니다 (FIXTURE_MODE=record로 먼저 크롤링)")
+        return None
+
+    # 재생 모드로 크롤러 초기화 (네트워크 접근 없음)
+    os.environ['FIXTURE_MODE'] = 'replay'
+    os.environ['FIXTURE_DIR'] = fixtures_dir
+
+    async with CRAWLERS[channel]() as crawler:
+        extracted = 0
+        failed = 0
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for item in items:
+                try:
+                    post = await crawler._fetch_post(item, settle_ms=0)
+                except Exception as e:
+                    print(f"🫛 {item.get('url', '')} 추출 오류: {e}")
+                    post = None
+                if post:
+                    extracted += 1
+                else:
+                    failed += 1
+        elapsed = time.perf_counter() - started
+
+    # 처리량은 추출에 성공한 게시글만 집계 (실패는 failed로 따로 보고)
+    return {
+        'channel': channel,
+        'posts': extracted + failed,
+        'extracted': extracted,
+        'failed': failed,
+        'seconds': round(elapsed, 3),
+        'posts_per_sec': round(extracted / elapsed, 2) if elapsed > 0 else 0.0,
+    }
+
+
+def print_results(results: List[Dict]) -> None:
+    print(f"\n{'='*60}")
+    print("📊 추출 벤치마크 결과")
+    print(f"{'='*60}")
+    for r in results:
+        print(f"  - {r['channel']:<10} {r['posts_per_sec']:>8} posts/sec "
+              f"(추출 {r['extracted']}/{r['posts']}, 실패 {r['failed']}, {r['seconds']}s)")
+    print(f"{'='*60}\n")
+
+
+def bench_brands(csv_path: str, repeat: int = 1) -> Optional[Dict]:
+    """CSV 전체에 대해 브랜드 태깅 처리량 측정 (별칭별 부분 문자열 검색 방식과 비교)"""
+    if not os.path.exists(csv_path):
+        print(f"⚠️ CSV 파일이 없습니다: {csv_path}")
+        return None
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        docs = [f"{row.get('title', '')}\n{row.get('content', '')}" for row in csv.DictReader(f)]
+    if not docs:
+        print(f"⚠️ CSV에 게시글이 없습니다: {csv_path}")
+        return None
+
+    tagger = get_brand_tagger()
+    aliases = [(key, normalize(alias)) for key, spec in tagger.brands.items() for alias in spec.get('aliases', [])]
+    chars = sum(len(doc) for doc in docs) * repeat
+
+    # 기준: 문서마다 별칭 수만큼 반복 탐색
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            text = normalize(doc)
+            counts: Dict[str, int] = {}
+            for key, alias in aliases:
+                hits = text.count(alias)
+                if hits:
+                    counts[key] = counts.get(key, 0) + hits
+    naive_seconds = time.perf_counter() - started
+
+    # Aho–Corasick: 문서당 한 번의 선형 탐색
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            tagger.count(doc)
+    ac_seconds = time.perf_counter() - started
+
+    total = len(docs) * repeat
+    return {
+        'docs': total,
+        'brands': len(tagger.brands),
+        'aliases': len(aliases),
+        'mchars': round(chars / 1e6, 2),
+        'naive_docs_per_sec': round(total / naive_seconds, 1) if naive_seconds > 0 else 0.0,
+        'ac_docs_per_sec': round(total / ac_seconds, 1) if ac_seconds > 0 else 0.0,
+        'ac_mchars_per_sec': round(chars / ac_seconds / 1e6, 2) if ac_seconds > 0 else 0.0,
+    }
+
+
+def print_brand_results(result: Dict) -> None:
+    print(f"\n{'='*60}")
+    print("📊 브랜드 태깅 벤치마크 결과")
+    print(f"{'='*60}")
+    print(f"  - 문서 {result['docs']}개 ({result['mchars']}M자), 브랜드 {result['brands']}개 / 별칭 {result['aliases']}개")
+    print(f"  - 별칭별 검색   {result['naive_docs_per_sec']:>10} docs/sec")
+    print(f"  - Aho–Corasick  {result['ac_docs_per_sec']:>10} docs/sec ({result['ac_mchars_per_sec']}M자/sec)")
+    print(f"{'='*60}\n")
+
+
+def _metrics_python(rows: List[Dict], as_of) -> Dict[int, Dict]:
+    """비교용 행 단위 구현 (dict 순회, 기존 후속 처리 방식)"""
+    from datetime import datetime
+    ratio_sum: Dict[str, float] = {}
+    ratio_count: Dict[str, int] = {}
+    groups: Dict[tuple, List[int]] = {}
+    result: Dict[int, Dict] = {}
+    for row in rows:
+        views, likes = int(row['view_cnt'] or 0), int(row['like_cnt'] or 0)
+        ratio = likes / views if views > 0 else 0.0
+        ratio_sum[row['channel']] = ratio_sum.get(row['channel'], 0.0) + ratio
+        ratio_count[row['channel']] = ratio_count.get(row['channel'], 0) + 1
+        created = datetime.fromisoformat(row['created_at']) if row['created_at'] else None
+        velocity = None
+        if created:
+            age_hours = max((as_of - created).total_seconds() / 3600, 1.0)
+            velocity = int(row['comment_cnt'] or 0) / age_hours
+            groups.setdefault((row['channel'], created.date()), []).append(views)
+        result[row['id']] = {'like_view_ratio': ratio, 'comment_velocity': velocity, 'created': created}
+    sorted_groups = {key: sorted(values) for key, values in groups.items()}
+    for row in rows:
+        metrics = result[row['id']]
+        mean = ratio_sum[row['channel']] / ratio_count[row['channel']]
+        metrics['channel_norm'] = metrics['like_view_ratio'] / mean if mean > 0 else 0.0
+        created = metrics.pop('created')
+        if created is None:
+            metrics['channel_day_pct'] = None
+            continue
+        values = sorted_groups[(row['channel'], created.date())]
+        below = bisect.bisect_left(values, int(row['view_cnt'] or 0))
+        metrics['channel_day_pct'] = below / (len(values) - 1) if len(values) > 1 else 1.0
+    return result
+
+
+def bench_metrics(rows: int = 1000000, python_rows: Optional[int] = None, seed: int = 7) -> Dict:
+    """합성 게시글 rows개로 벡터 지표 계산과 행 단위 구현의 처리 시간 비교 (결과 일치 여부 확인)"""
+    import numpy as np
+    from datetime import datetime, timedelta
+    from src.utils.engagement_metrics import columns_from_rows, compute_metrics
+
+    rng = np.random.default_rng(seed)
+    as_of = datetime(2025, 11, 8, 12, 0, 0)
+    channels = np.array(list(CRAWLERS))[rng.integers(0, len(CRAWLERS), rows)]
+    minutes = rng.integers(0, 60 * 24 * 30, rows)
+    views = rng.integers(0, 50000, rows)
+    likes = rng.integers(0, 300, rows)
+    comments = rng.integers(0, 200, rows)
+    created = [(as_of - timedelta(minutes=int(m))).strftime('%Y-%m-%d %H:%M:%S') for m in minutes]
+    dict_rows = [
+        {'id': i + 1, 'channel': channels[i], 'view_cnt': int(views[i]), 'like_cnt': int(likes[i]),
+         'comment_cnt': int(comments[i]), 'created_at': created[i] if i % 50 else ''}
+        for i in range(rows)
+    ]
+
+    started = time.perf_counter()
+    columns = columns_from_rows(dict_rows)
+    loaded = time.perf_counter()
+    vectorized = compute_metrics(columns, as_of=as_of)
+    computed = time.perf_counter()
+
+    python_rows = min(python_rows or rows, rows)
+    sample = dict_rows[:python_rows]
+    py_started = time.perf_counter()
+    reference = _metrics_python(sample, as_of)
+    py_seconds = time.perf_counter() - py_started
+
+    # 표본 구간만 다시 벡터 계산해서 행 단위 구현과 비교 (그룹 구성이 같아야 하므로)
+    check = compute_metrics(columns_from_rows(sample), as_of=as_of)
+    max_diff = 0.0
+    for name in ('like_view_ratio', 'channel_norm', 'comment_velocity', 'channel_day_pct'):
+        expected = np.array([np.nan if reference.get(i) is None or reference[i][name] is None else reference[i][name]
+                             for i in check['id'].tolist()], dtype=np.float64)
+        diff = np.nanmax(np.abs(expected - check[name])) if len(expected) else 0.0
+        max_diff = max(max_diff, float(diff))
+
+    return {
+        'rows': rows,
+        'columnar_load_s': round(loaded - started, 3),
+        'vector_s': round(computed - loaded, 3),
+        'vector_rows_per_sec': round(rows / (computed - loaded)) if computed > loaded else 0,
+        'python_rows': python_rows,
+        'python_s': round(py_seconds, 3),
+        'python_rows_per_sec': round(python_rows / py_seconds) if py_seconds > 0 else 0,
+        'max_abs_diff': max_diff,
+    }
+
+
+def print_metrics_results(result: Dict) -> None:
+    print(f"\n{'='*60}")
+    print("📊 반응 지표 계산 벤치마크 결과")
+    print(f"{'='*60}")
+    print(f"  - 게시글 {result['rows']}개 (열 배열 변환 {result['columnar_load_s']}s)")
+    print(f"  - NumPy 벡터 계산  {result['vector_s']:>8}s ({result['vector_rows_per_sec']} rows/sec)")
+    print(f"  - 행 단위 Python   {result['python_s']:>8}s ({result['python_rows_per_sec']} rows/sec, {result['python_rows']}개)")
+    print(f"  - 결과 최대 오차   {result['max_abs_diff']:.2e}")
+    print(f"{'='*60}\n")
+
+
+BLANK_PAGE = "data:text/html,<title>startup</title>"
+
+
+async def bench_startup(profile: str, url: str, repeat: int = 3, headless: bool = True) -> Optional[Dict]:
+    """프로필별 브라우저 실행 → 첫 페이지 로드 시간과 기본 메모리(RSS) 측정 (실행마다 새 브라우저)"""
+    launch_times: List[float] = []
+    first_page_times: List[float] = []
+    rss_samples: List[float] = []
+    status = None
+    webdriver = None
+    for _ in range(repeat):
+        async with async_playwright() as playwright:
+            started = time.perf_counter()
+            try:
+                browser = await playwright.chromium.launch(**launch_options(profile, headless))
+            except Exception as e:
+                print(f"⚠️ {profile}: 브라우저 실행 실패 - {e}")
+                return None
+            launched = time.perf_counter()
+            context = await browser.new_context(user_agent=USER_AGENT, locale='ko-KR', timezone_id='Asia/Seoul')
+            page = await context.new_page()
+            try:
+                response = await page.goto(url, wait_until="load")
+            except Exception as e:
+                print(f"⚠️ {profile}: 페이지 로드 실패 - {e}")
+                await browser.close()
+                return None
+            loaded = time.perf_counter()
+            # 봇 확인 참고값: 응답 상태와 navigator.webdriver 노출 여부
+            status = response.status if response else None
+            webdriver = await page.evaluate("navigator.webdriver === true")
+            rss = descendants_rss_mb()
+            await browser.close()
+        launch_times.append(launched - started)
+        first_page_times.append(loaded - started)
+        if rss is not None:
+            rss_samples.append(rss)
+
+    return {
+        'profile': profile,
+        'runs': repeat,
+        'launch_ms': round(sum(launch_times) / len(launch_times) * 1000, 1),
+        'first_page_ms': round(sum(first_page_times) / len(first_page_times) * 1000, 1),
+        'rss_mb': round(sum(rss_samples) / len(rss_samples), 1) if rss_samples else None,
+        'status': status,
+        'webdriver': webdriver,
+    }
+
+
+def print_startup_results(results: List[Dict], url: str) -> None:
+    print(f"\n{'='*60}")
+    print(f"📊 브라우저 시작 벤치마크 결과 ({url[:40]})")
+    print(f"{'='*60}")
+    for r in results:
+        rss = f"{r['rss_mb']}MB" if r['rss_mb'] is not None else "측정 불가"
+        print(f"  - {r['profile']:<9} 실행 {r['launch_ms']:>7}ms, 첫 페이지 {r['first_page_ms']:>7}ms, "
+              f"메모리 {rss} (응답 {r['status']}, webdriver 노출 {r['webdriver']}, {r['runs']}회 평균)")
+    print(f"{'='*60}\n")
+
+
+async def bench_e2e(channel: str, source: str = 'mock', fixtures_dir: str = 'fixtures',
+                    max_posts: Optional[int] = None) -> Optional[Dict]:
+    """목 서버 또는 픽스처 재생으로 크롤링 전체(목록 → 상세)를 실행하며 성능 지표 측정
+    
+    source 설정(환경변수)은 호출 전에 적용되어 있어야 한다 (prepare_e2e_source).
+    """
+    samples: List[float] = []
+    python_peak = current_rss_mb()
+    counter = ProtocolCallCounter()
+    
+    async with CRAWLERS[channel]() as crawler:
+        counter.attach(crawler.playwright)
+        fetch_post = crawler._fetch_post
+        
+        async def timed_fetch_post(item: Dict, *args, **kwargs):
+            nonlocal python_peak
+            started = time.perf_counter()
+            try:
+                return await fetch_post(item, *args, **kwargs)
+            finally:
+                samples.append((time.perf_counter() - started) * 1000)
+                # 메모리 측정은 지연 시간에 포함하지 않음
+                crawler.memory.sample()
+                rss = current_rss_mb()
+                if rss is not None:
+                    python_peak = max(python_peak or 0.0, rss)
+        
+        # 상세 수집 1건 단위 지연 측정 (DETAIL_FETCH=http는 _fetch_post를 거치지 않아 측정되지 않음)
+        crawler._fetch_post = timed_fetch_post
+        started = time.perf_counter()
+        posts = await crawler.crawl(max_posts=max_posts)
+        elapsed = time.perf_counter() - started
+        crawler.memory.sample()
+        counter.detach()
+        browser_peak = crawler.memory.browser_peak_mb
+    
+    if not posts:
+        print(f"⚠️ {channel}: 수집된 게시글이 없습니다 ({source})")
+        return None
+    p50, p95 = percentile(samples, 50), percentile(samples, 95)
+    return {
+        'channel': channel,
+        'posts': len(posts),
+        'seconds': round(elapsed, 3),
+        'posts_per_sec': round(len(posts) / elapsed, 3) if elapsed > 0 else 0.0,
+        'p50_ms': round(p50, 1) if p50 is not None else None,
+        'p95_ms': round(p95, 1) if p95 is not None else None,
+        'python_peak_mb': round(python_peak, 1) if python_peak is not None else None,
+        'browser_peak_mb': round(browser_peak, 1) if browser_peak is not None else None,
+        'protocol_calls': counter.total,
+    }
+
+
+def prepare_e2e_source(source: str, fixtures_dir: str, mock_posts: int, mock_latency_ms: int):
+    """측정 대상 설정: mock이면 목 서버를 띄워 반환, fixtures면 재생 모드 환경변수 설정 (None 반환)"""
+    if source == 'fixtures':
+        os.environ['FIXTURE_MODE'] = 'replay'
+        os.environ['FIXTURE_DIR'] = fixtures_dir
+        return None
+    from tests.mock_community_server import MockBoardConfig, MockCommunityServer
+    # 목 서버는 고정 시드로 같은 게시판을 만들고, 체크포인트/픽스처 없이 실행
+    server = MockCommunityServer(MockBoardConfig(posts=mock_posts, latency_ms=mock_latency_ms)).start()
+    os.environ.update(server.crawler_env())
+    os.environ.pop('FIXTURE_MODE', None)
+    print(f"🫛 목 커뮤니티 서버 실행: {server.base_url} (게시판당 {mock_posts}개, 지연 {mock_latency_ms}ms)")
+    return server
+
+
+def print_e2e_results(results: List[Dict]) -> None:
+    print(f"\n{'='*60}")
+    print("📊 크롤링 E2E 벤치마크 결과")
+    print(f"{'='*60}")
+    for r in results:
+        metrics = ', '.join(f"{name} {r[name]}" for name in METRICS if r.get(name) is not None)
+        print(f"  - {r['channel']:<10} 게시글 {r['posts']}개 / {r['seconds']}s: {metrics}")
+    print(f"{'='*60}\n")
+
+
+def _metric_thresholds(values: Optional[List[str]]) -> Dict[str, float]:
+    """--metric-threshold name=0.2 목록 → dict"""
+    thresholds = {}
+    for value in values or []:
+        name, _, limit = value.partition('=')
+        if name not in METRICS or not limit:
+            raise SystemExit(f"--metric-threshold 형식: <{'|'.join(METRICS)}>=<비율> ({value})")
+        thresholds[name] = float(limit)
+    return thresholds
+
+
+async def main() -> None:
+    """픽스처 기반 오프라인 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    extract_parser = subparsers.add_parser("extract", help="픽스처 재생으로 상세 추출 posts/sec 측정")
+    extract_parser.add_argument(
+        "--channel",
+        choices=sorted(CRAWLERS),
+        action="append",
+        help="측정할 채널 (여러 번 지정 가능, 기본값: 전체)"
+    )
+    extract_parser.add_argument(
+        "--fixtures-dir",
+        type=str,
+        default=os.getenv("FIXTURE_DIR", "fixtures"),
+        help="픽스처 디렉토리 경로 (기본값: ./fixtures)"
+    )
+    extract_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="항목 목록 반복 횟수 (기본값: 1)"
+    )
+
+    brands_parser = subparsers.add_parser("brands", help="CSV 전체 브랜드 태깅 docs/sec 측정")
+    brands_parser.add_argument(
+        "--csv-path",
+        type=str,
+        default=os.path.join(os.getcwd(), "community_data.csv"),
+        help="대상 CSV 파일 경로 (기본값: ./community_data.csv)"
+    )
+    brands_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="CSV 반복 횟수 (기본값: 1)"
+    )
+
+    startup_parser = subparsers.add_parser("startup", help="브라우저 프로필별 시작 시간/기본 메모리 측정")
+    startup_parser.add_argument(
+        "--profile",
+        choices=PROFILES,
+        action="append",
+        help="측정할 프로필 (여러 번 지정 가능, 기본값: 전체)"
+    )
+    startup_parser.add_argument(
+        "--url",
+        type=str,
+        default=BLANK_PAGE,
+        help="첫 페이지 URL (사이트 봇 확인 통과 여부를 보려면 인기글 URL 지정, 기본값: 빈 data: 페이지)"
+    )
+    startup_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="프로필별 실행 횟수 (기본값: 3)"
+    )
+    startup_parser.add_argument(
+        "--headful",
+        action="store_true",
+        help="headless 대신 창을 띄워 측정"
+    )
+
+    metrics_parser = subparsers.add_parser("metrics", help="반응 지표 벡터 계산 vs 행 단위 계산 시간 측정")
+    metrics_parser.add_argument(
+        "--rows",
+        type=int,
+        default=1000000,
+        help="합성 게시글 수 (기본값: 1000000)"
+    )
+    metrics_parser.add_argument(
+        "--python-rows",
+        type=int,
+        default=None,
+        help="행 단위 구현으로 계산할 게시글 수 (기본값: --rows와 같음)"
+    )
+
+    e2e_parser = subparsers.add_parser("e2e", help="목 서버/픽스처로 크롤링 전체 성능 측정, 기준값 저장/비교")
+    e2e_parser.add_argument(
+        "--channel",
+        choices=sorted(CRAWLERS),
+        action="append",
+        help="측정할 채널 (여러 번 지정 가능, 기본값: 전체)"
+    )
+    e2e_parser.add_argument(
+        "--source",
+        choices=("mock", "fixtures"),
+        default="mock",
+        help="측정 대상 (mock: tests.mock_community_server, fixtures: 기록된 픽스처 재생, 기본값: mock)"
+    )
+    e2e_parser.add_argument(
+        "--fixtures-dir",
+        type=str,
+        default=os.getenv("FIXTURE_DIR", "fixtures"),
+        help="픽스처 디렉토리 경로 (기본값: ./fixtures)"
+    )
+    e2e_parser.add_argument("--mock-posts", type=int, default=100, help="목 서버 게시판당 게시글 수 (기본값: 100)")
+    e2e_parser.add_argument("--mock-latency-ms", type=int, default=0, help="목 서버 응답 지연(ms) (기본값: 0)")
+    e2e_parser.add_argument("--max-posts", type=int, default=None, help="채널별 최대 수집 게시글 수")
+    e2e_parser.add_argument(
+        "--baseline",
+        type=str,
+        default=DEFAULT_BASELINE_PATH,
+        help=f"기준값 JSON 경로 (기본값: {DEFAULT_BASELINE_PATH})"
+    )
+    e2e_parser.add_argument("--save-baseline", action="store_true", help="측정 결과를 기준값으로 저장")
+    e2e_parser.add_argument("--compare", action="store_true", help="기준값과 비교해 회귀가 있으면 종료 코드 1")
+    e2e_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"허용 악화 비율 (기본값: {DEFAULT_THRESHOLD})"
+    )
+    e2e_parser.add_argument(
+        "--metric-threshold",
+        action="append",
+        help="지표별 허용 비율 (예: p95_ms=0.3, 여러 번 지정 가능)"
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "e2e":
+        metric_thresholds = _metric_thresholds(args.metric_threshold)
+        channels = args.channel or sorted(CRAWLERS)
+        server = prepare_e2e_source(args.source, args.fixtures_dir, args.mock_posts, args.mock_latency_ms)
+        results = []
+        try:
+            for channel in channels:
+                result = await bench_e2e(channel, args.source, args.fixtures_dir, args.max_posts)
+                if result:
+                    results.append(result)
+        finally:
+            if server:
+                server.stop()
+        if not results:
+            raise SystemExit(1)
+        print_e2e_results(results)
+        # 측정 조건이 같은 기준값끼리만 비교
+        settings = {
+            'source': args.source,
+            'mock_posts': args.mock_posts if args.source == 'mock' else None,
+            'mock_latency_ms': args.mock_latency_ms if args.source == 'mock' else None,
+            'max_posts': args.max_posts,
+            'detail_fetch': os.getenv('DETAIL_FETCH', 'browser'),
+            'browser_profile': os.getenv('BROWSER_PROFILE', ''),
+        }
+        if args.compare:
+            baseline = load_baseline(args.baseline)
+            # 비교할 기준이 없으면 통과가 아니라 실패 (기준값 없이 회귀 검사가 항상 통과하는 것 방지)
+            problems = gate_problems(results, baseline, settings, channels)
+            if problems:
+                print(f"⚠️ 기준값과 비교할 수 없습니다 ({args.baseline}):")
+                for problem in problems:
+                    print(f"  - {problem}")
+                raise SystemExit(1)
+            if print_comparison(compare(results, baseline, args.threshold, metric_thresholds)):
+                print("⚠️ 성능 회귀 발견")
+                sys.exit(1)
+            print("✅ 성능 회귀 없음")
+        if args.save_baseline:
+            save_baseline(results, settings, args.baseline)
+            print(f"📈 기준값 저장: {args.baseline}")
+    elif args.command == "metrics":
+        print_metrics_results(bench_metrics(args.rows, args.python_rows))
+    elif args.command == "startup":
+        results = []
+        for profile in args.profile or PROFILES:
+            result = await bench_startup(profile, args.url, args.repeat, headless=not args.headful)
+            if result:
+                results.append(result)
+        if results:
+            print_startup_results(results, args.url)
+    elif args.command == "brands":
+        result = bench_brands(args.csv_path, args.repeat)
+        if result:
+            print_brand_results(result)
+    elif args.command == "extract":
+        results = []
+        for channel in args.channel or sorted(CRAWLERS):
+            result = await bench_extract(channel, args.fixtures_dir, args.repeat)
+            if result:
+                results.append(result)
+        if results:
+            print_results(results)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+from datetime import datetime
+from typing import Dict, List
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.crawlers.fmkorea_crawler import FmkoreaCrawler
+from src.crawlers.ppomppu_crawler import PpomppuCrawler
+from src.crawlers.mamibebe_crawler import MamibebeCrawler
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.work_queue import WorkQueue
+
+CRAWLERS = {
+    'fmkorea': FmkoreaCrawler,
+    'ppomppu': PpomppuCrawler,
+    'mam2bebe': MamibebeCrawler,
+}
+
+
+async def coordinate(channel: str, queue_path: str = None, max_posts: int = None) -> None:
+    """목록 페이지에서 게시글을 찾아 작업 큐에 등록"""
+    async with CRAWLERS[channel]() as crawler:
+        items = await crawler.discover(max_posts)
+    with WorkQueue(queue_path) as queue:
+        added = queue.enqueue(channel, items)
+    print(f"🫛 [{channel}] 작업 등록: 신규 {added}개 / 발견 {len(items)}개")
+
+
+async def work(channel: str, worker_id: str, queue_path: str = None, batch: int = 10,
+               lease_seconds: float = 300, poll_seconds: float = 5, exit_when_idle: bool = True) -> Dict[str, int]:
+    """작업 큐에서 배치를 임대해 상세 추출 후 결과 커밋 (큐가 비면 종료)"""
+    stats = {'done': 0, 'failed': 0, 'skipped': 0}
+    with WorkQueue(queue_path) as queue:
+        async with CRAWLERS[channel]() as crawler:
+            await crawler.prepare_details()
+            while True:
+                jobs = queue.claim(worker_id, channel, batch=batch, lease_seconds=lease_seconds)
+                if not jobs:
+                    # 다른 워커가 임대 중인 작업은 기한이 지나면 다시 가져갈 수 있으므로 모두 끝날 때까지 대기
+                    if exit_when_idle and queue.outstanding(channel) == 0:
+                        break
+                    await asyncio.sleep(poll_seconds)
+                    continue
+
+                remaining = [job['id'] for job in jobs]
+                stopped = False
+                for job in jobs:
+                    remaining.remove(job['id'])
+                    try:
+                        post = await crawler._guarded_fetch_post(job['item'])
+                    except CircuitOpenError:
+                        # 사이트 서킷이 최대 횟수만큼 열림: 이 작업과 배치의 남은 작업을 바로 대기 상태로 돌려
+                        # 임대 기한을 기다리지 않고 다른 워커가 가져가게 함
+                        released = queue.release(worker_id, [job['id']] + remaining)
+                        print(f"🫛 [{worker_id}] 서킷 열림으로 중단, 작업 {released}개 반환")
+                        stopped = True
+                        break
+                    except Exception as e:
+                        print(f"🫛 [{worker_id}] {job['url']} 처리 중 오류: {e}")
+                        queue.fail(worker_id, job['id'], str(e))
+                        stats['failed'] += 1
+                        continue
+
+                    if post is None:
+                        queue.fail(worker_id, job['id'], 'extract failed')
+                        stats['failed'] += 1
+                    elif not crawler._accept_post(post):
+                        # 제외 대상도 다시 처리하지 않도록 결과 없이 완료 처리
+                        queue.ack(worker_id, job['id'], None)
+                        stats['skipped'] += 1
+                    else:
+                        queue.ack(worker_id, job['id'], post.model_dump(mode='json'))
+                        stats['done'] += 1
+                    # 남은 작업 임대 연장 (heartbeat)
+                    queue.extend(worker_id, remaining, lease_seconds)
+                    await asyncio.sleep(crawler.delay / 1000)
+                if stopped:
+                    break
+
+    print(f"🫛 [{worker_id}] 워커 종료: 완료 {stats['done']}, 실패 {stats['failed']}, 제외 {stats['skipped']}")
+    return stats
+
+
+def _worker_process(channel: str, worker_id: str, queue_path: str, batch: int, lease_seconds: float) -> None:
+    """multiprocessing 진입점 (프로세스마다 브라우저 하나)"""
+    asyncio.run(work(channel, worker_id, queue_path, batch=batch, lease_seconds=lease_seconds))
+
+
+def run_workers(channel: str, processes: int, queue_path: str = None, batch: int = 10, lease_seconds: float = 300) -> None:
+    """워커 프로세스 여러 개 실행 (머신 간에는 같은 큐 파일을 공유해서 각각 실행)"""
+    host = socket.gethostname()
+    procs: List[multiprocessing.Process] = []
+    for index in range(processes):
+        worker_id = f"{host}-{os.getpid()}-{index}"
+        proc = multiprocessing.Process(
+            target=_worker_process,
+            args=(channel, worker_id, queue_path, batch, lease_seconds),
+            name=worker_id,
+        )
+        proc.start()
+        procs.append(proc)
+    for proc in procs:
+        proc.join()
+
+
+def _to_payload(item: Dict) -> Dict:
+    """워커 결과(Post.model_dump)를 run_* 스크립트와 같은 저장 형식으로 변환"""
+    if item.get("created_at") and isinstance(item["created_at"], str):
+        try:
+            dt = datetime.fromisoformat(item["created_at"].replace('Z', '+00:00'))
+            item["created_at"] = dt.strftime('%Y-%m-%d %H:%M')
+        except:
+            pass
+    if item.get("category") is None:
+        item["category"] = ""
+    if item.get("content") is None:
+        item["content"] = ""
+    for key in ("views", "comments", "likes", "timestamp", "community"):
+        item.pop(key, None)
+    return item
+
+
+def export(queue_path: str = None, channel: str = None) -> None:
+    """완료된 결과를 지표 스냅샷과 CSV에 저장 (한 번 내보낸 결과는 다시 내보내지 않음)"""
+    with WorkQueue(queue_path) as queue:
+        payload = [_to_payload(item) for item in queue.take_results(channel)]
+    print(f"🫛 내보낼 결과: {len(payload)}개")
+    if payload:
+        from src.utils.engagement_store import record_post_snapshots
+        from src.utils.json_to_csv import append_posts_to_csv
+        record_post_snapshots(payload)
+        append_posts_to_csv(payload)
+
+
+def status(queue_path: str = None) -> None:
+    with WorkQueue(queue_path) as queue:
+        stats = queue.stats()
+    if not stats:
+        print("🫛 작업 큐가 비어 있습니다")
+    for channel, counts in sorted(stats.items()):
+        summary = ", ".join(f"{key} {value}" for key, value in sorted(counts.items()))
+        print(f"🫛 [{channel}] {summary}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="작업 큐 기반 분산 크롤링")
+    parser.add_argument("--queue", default=None, help="작업 큐 SQLite 경로 (기본값: WORK_QUEUE_PATH 또는 ./work_queue.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    coord = sub.add_parser("coordinator", help="목록 페이지 탐색 후 상세 URL 등록")
+    coord.add_argument("--channel", choices=sorted(CRAWLERS), action="append", required=True)
+    coord.add_argument("--max-posts", type=int, default=None)
+
+    worker = sub.add_parser("worker", help="작업 임대 → 상세 추출 → 결과 커밋")
+    worker.add_argument("--channel", choices=sorted(CRAWLERS), required=True)
+    worker.add_argument("--processes", type=int, default=1, help="이 머신에서 실행할 워커 프로세스 수")
+    worker.add_argument("--batch", type=int, default=10, help="한 번에 임대할 작업 수")
+    worker.add_argument("--lease", type=float, default=300, help="임대 기한(초), 지나면 다른 워커가 가져감")
+
+    export_parser = sub.add_parser("export", help="완료 결과를 CSV/지표 스냅샷으로 저장")
+    export_parser.add_argument("--channel", choices=sorted(CRAWLERS), default=None)
+
+    sub.add_parser("status", help="채널별 작업 상태 출력")
+
+    args = parser.parse_args()
+    if args.command == "coordinator":
+        for channel in args.channel:
+            asyncio.run(coordinate(channel, args.queue, args.max_posts))
+    elif args.command == "worker":
+        run_workers(args.channel, args.processes, args.queue, args.batch, args.lease)
+    elif args.command == "export":
+        export(args.queue, args.channel)
+    elif args.command == "status":
+        status(args.queue)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.crawlers.ppomppu_crawler import PpomppuCrawler
+from src.utils.engagement_store import EngagementStore
+
+# 목록 행에 지표가 표시되어 목록만으로 갱신 가능한 채널
+REFRESH_CRAWLERS = {
+    'ppomppu': PpomppuCrawler,
+}
+
+
+async def refresh(channel: str, db_path: str = None, fetch_missing: bool = None) -> None:
+    """추적 중인 게시글 지표 갱신 (목록 행 우선, 필요 시 상세 페이지)"""
+    with EngagementStore(db_path) as store:
+        async with REFRESH_CRAWLERS[channel]() as crawler:
+            await crawler.refresh_counters(store, fetch_missing=fetch_missing)
+
+
+def show_series(channel: str, post_id: int, db_path: str = None) -> None:
+    """게시글 지표 시계열 출력"""
+    with EngagementStore(db_path) as store:
+        rows = store.series(channel, post_id)
+    if not rows:
+        print(f"⚠️ {channel}/{post_id}: 저장된 스냅샷이 없습니다")
+        return
+    print(f"📈 {channel}/{post_id} 지표 변화 ({len(rows)}건)")
+    print(f"{'시각':<20} {'조회':>8} {'추천':>6} {'댓글':>6}  출처")
+    for row in rows:
+        view, like, comment = ('-' if row[k] is None else str(row[k]) for k in ('view_cnt', 'like_cnt', 'comment_cnt'))
+        print(f"{row['ts']:<20} {view:>8} {like:>6} {comment:>6}  {row['source']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="게시글 반응 지표 시계열 추적")
+    parser.add_argument("--db", default=None, help="SQLite 파일 경로 (기본값: ENGAGEMENT_DB_PATH 또는 ./engagement.db)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = sub.add_parser("refresh", help="목록 페이지에서 추적 게시글 지표 갱신")
+    refresh_parser.add_argument("--channel", choices=sorted(REFRESH_CRAWLERS), default="ppomppu")
+    refresh_parser.add_argument("--no-detail", action="store_true", help="목록에 없는 게시글의 상세 페이지 확인 생략")
+
+    series_parser = sub.add_parser("series", help="게시글 지표 시계열 출력")
+    series_parser.add_argument("--channel", required=True)
+    series_parser.add_argument("post_id", type=int)
+
+    args = parser.parse_args()
+    if args.command == "refresh":
+        asyncio.run(refresh(args.channel, args.db, fetch_missing=False if args.no_detail else None))
+    elif args.command == "series":
+        show_series(args.channel, args.post_id, args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import asyncio
 import os
 from datetime import datetime
@@ -6,9 +7,10 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.crawlers.ppomppu_crawler import PpomppuCrawler
+from src.utils.checkpoint import build_checkpoint
 
 
-async def main() -> None:
+async def main(resume: bool = False, comments: bool = False) -> None:
     """뽐뿌 크롤링 실행"""
     # MAX_POSTS 기본값: None (기간 내 모든 데이터 수집)
     max_posts_env = os.getenv("MAX_POSTS", "")
@@ -22,7 +24,10 @@ async def main() -> None:
             max_posts = None  # 파싱 실패 시 None (전체 수집)
 
     async with PpomppuCrawler() as crawler:
-        results = await crawler.crawl(max_posts=max_posts)
+        # 중간 상태 체크포인트 (--resume이면 중단된 위치부터)
+        crawler.checkpoint = build_checkpoint(crawler.channel, resume)
+        # <채널>_BOARDS / MAMIBEBE_CAFES에 여러 게시판이 있으면 같은 브라우저에서 동시에 수집
+        results = await crawler.crawl_boards(max_posts=max_posts)
         
         # Post 객체를 딕셔너리로 변환
         payload = []
@@ -71,12 +76,31 @@ async def main() -> None:
                 print(f"  - 조회수 범위: {min(view_counts)} ~ {max(view_counts)}")
             print(f"  - 롯데온 게시글: {sum(1 for p in payload if p.get('own_company') == 1)}개")
         
+        # 지표 스냅샷 저장 (CSV는 URL 중복 제거로 재발견 게시글을 건너뛰므로 별도 저장)
+        if payload:
+            from src.utils.engagement_store import record_post_snapshots
+            record_post_snapshots(payload)
+        
         # CSV에 바로 저장
         if payload:
             from src.utils.json_to_csv import append_posts_to_csv
             append_posts_to_csv(payload)
+        
+        # 댓글 수집 (선택 단계, 게시글 id 기준 별도 파일)
+        if comments and results:
+            await crawler.collect_comments(results)
+        
+        # 정상 완료 후 저장까지 끝나면 체크포인트 삭제
+        if crawler.checkpoint.state['completed']:
+            crawler.checkpoint.clear()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resume", action="store_true", help="중단된 크롤링을 체크포인트부터 이어서 진행")
+    parser.add_argument("--comments", action="store_true",
+                        help="게시글 댓글도 수집 (COMMENTS_DIR/<채널>_comments.jsonl, 환경변수 COMMENT_COLLECTION=true와 동일)")
+    args = parser.parse_args()
+    comments = args.comments or os.getenv("COMMENT_COLLECTION", "false").lower() == "true"
+    asyncio.run(main(resume=args.resume, comments=comments))
 
@@ -0,0 +1,76 @@
+import argparse
+import asyncio
+import os
+from datetime import datetime
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from src.crawlers.site_spec import available_specs
+from src.crawlers.spec_crawler import SpecCrawler
+from src.utils.checkpoint import build_checkpoint
+
+
+async def main(spec: str, resume: bool = False) -> None:
+    """사이트 명세 기반 크롤링 실행"""
+    # MAX_POSTS 기본값: None (기간 내 모든 데이터 수집, 0도 전체 수집)
+    max_posts_env = os.getenv("MAX_POSTS", "")
+    max_posts = None
+    if max_posts_env.strip():
+        try:
+            max_posts = int(max_posts_env) or None
+        except Exception:
+            max_posts = None
+
+    async with SpecCrawler(spec) as crawler:
+        # 중간 상태 체크포인트 (--resume이면 중단된 위치부터)
+        crawler.checkpoint = build_checkpoint(crawler.channel, resume)
+        # 명세의 boards(또는 SPEC_BOARDS)에 여러 게시판이 있으면 동시에 수집
+        results = await crawler.crawl_boards(max_posts=max_posts)
+
+        payload = []
+        for p in results:
+            item = p.model_dump()
+            # created_at을 "2025-11-02 12:39" 형식으로 변환
+            if isinstance(item.get("created_at"), datetime):
+                item["created_at"] = item["created_at"].strftime('%Y-%m-%d %H:%M')
+            if item.get("category") is None:
+                item["category"] = ""
+            if item.get("content") is None:
+                item["content"] = ""
+            # 하위 호환 필드 제거
+            for key in ("views", "comments", "likes", "timestamp", "community"):
+                item.pop(key, None)
+            payload.append(item)
+
+        print(f"\n{'='*60}")
+        print(f"✅ 크롤링 완료! ({crawler.channel}, 명세 {os.path.basename(crawler.spec_path)})")
+        print(f"📊 수집된 게시글 수: {len(payload)}개")
+        print(f"{'='*60}\n")
+
+        if payload:
+            print("📋 수집 요약:")
+            print(f"  - 제목 예시: {payload[0].get('title', 'N/A')[:50]}...")
+            view_counts = [p.get('view_cnt', 0) for p in payload if p.get('view_cnt')]
+            if view_counts:
+                print(f"  - 조회수 범위: {min(view_counts)} ~ {max(view_counts)}")
+            print(f"  - 롯데온 게시글: {sum(1 for p in payload if p.get('own_company') == 1)}개")
+
+            # 지표 스냅샷 저장 후 CSV에 바로 저장
+            from src.utils.engagement_store import record_post_snapshots
+            record_post_snapshots(payload)
+            from src.utils.json_to_csv import append_posts_to_csv
+            append_posts_to_csv(payload)
+
+        # 정상 완료 후 저장까지 끝나면 체크포인트 삭제
+        if crawler.checkpoint.state['completed']:
+            crawler.checkpoint.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--spec", required=True,
+                        help=f"사이트 명세 이름 또는 파일 경로 (기본 제공: {', '.join(available_specs())})")
+    parser.add_argument("--resume", action="store_true", help="중단된 크롤링을 체크포인트부터 이어서 진행")
+    args = parser.parse_args()
+    asyncio.run(main(args.spec, resume=args.resume))
@@ -0,0 +1,219 @@
+"""
+브랜드 키워드 태깅 (Aho–Corasick)
+
+자사 브랜드와 별칭, 띄어쓰기 변형, 영문 표기, 경쟁사 브랜드를 사전으로 관리하고
+모든 별칭을 하나의 Aho–Corasick 오토마톤으로 컴파일해서 문서당 한 번의 선형 탐색으로 브랜드별 언급 수를 센다.
+
+사전은 BRAND_DICT_PATH(JSON)로 바꿀 수 있다:
+    {"brands": {"lotteon": {"label": "롯데온", "own": true, "aliases": ["롯데온", "롯데 온", "lotteon"]}}}
+"""
+import csv
+import json
+import os
+import re
+import time
+import unicodedata
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_BRANDS: Dict[str, Dict] = {
+    'lotteon': {'label': '롯데온', 'own': True, 'aliases': ['롯데온', '롯데 온', '롯데ON', '롯데 ON', 'lotteon', 'lotte on']},
+    'coupang': {'label': '쿠팡', 'aliases': ['쿠팡', 'coupang', '로켓배송', '로켓와우']},
+    '11st': {'label': '11번가', 'aliases': ['11번가', '11 번가', '십일번가', '11st']},
+    'gmarket': {'label': 'G마켓', 'aliases': ['G마켓', '지마켓', 'gmarket']},
+    'auction': {'label': '옥션', 'aliases': ['옥션', 'auction']},
+    'ssg': {'label': 'SSG닷컴', 'aliases': ['SSG닷컴', 'SSG.COM', '쓱닷컴', 'ssg']},
+    'naver_shopping': {'label': '네이버쇼핑', 'aliases': ['네이버쇼핑', '네이버 쇼핑', '네이버페이', '스마트스토어']},
+    'wemakeprice': {'label': '위메프', 'aliases': ['위메프', 'wemakeprice']},
+    'tmon': {'label': '티몬', 'aliases': ['티몬', 'tmon']},
+    'kurly': {'label': '컬리', 'aliases': ['마켓컬리', '컬리', 'kurly']},
+}
+
+_SPACES_RE = re.compile(r'\s+')
+
+
+def normalize(text: str) -> str:
+    """NFKC 정규화 + 소문자화 + 연속 공백을 공백 하나로"""
+    return _SPACES_RE.sub(' ', unicodedata.normalize('NFKC', text or '').lower())
+
+
+def _is_ascii_word(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 탐색 오토마톤 (패턴 id 목록 반환)"""
+
+    def __init__(self, patterns: List[str]):
+        self.patterns = patterns
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.output: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(patterns):
+            self._add(pattern, pattern_id)
+        self._build()
+
+    def _add(self, pattern: str, pattern_id: int):
+        node = 0
+        for ch in pattern:
+            nxt = self.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[node][ch] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+            node = nxt
+        self.output[node].append(pattern_id)
+
+    def _build(self):
+        """BFS로 실패 링크를 계산해 전이표를 완성 (탐색 시 실패 링크를 따라갈 필요 없는 DFA)"""
+        # 실패 링크 쪽 출력도 합쳐 두어 매 위치에서 출력 목록 하나만 확인
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+
+        # delta[node][ch]: 패턴 알파벳 문자에 대한 완전한 전이 (알파벳 밖 문자는 루트로)
+        self.delta: List[Dict[str, int]] = [dict(self.goto[0])]
+        self.delta.extend({} for _ in range(len(self.goto) - 1))
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            transitions = dict(self.delta[self.fail[node]])
+            transitions.update(self.goto[node])
+            self.delta[node] = transitions
+            queue.extend(self.goto[node].values())
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(끝 위치(포함), 패턴 id) 순회 — 문자당 사전 조회 한 번, 문서 길이에 선형"""
+        delta, output = self.delta, self.output
+        node = 0
+        for i, ch in enumerate(text):
+            node = delta[node].get(ch, 0)
+            if output[node]:
+                for pattern_id in output[node]:
+                    yield i, pattern_id
+
+
+class BrandTagger:
+    """브랜드 사전을 컴파일한 태거"""
+
+    def __init__(self, brands: Optional[Dict[str, Dict]] = None):
+        self.brands = brands or DEFAULT_BRANDS
+        self.own_brands = [key for key, spec in self.brands.items() if spec.get('own')]
+        patterns: List[str] = []
+        self.pattern_brand: List[str] = []
+        # 영문 별칭은 단어 경계에서만 인정 (예: 'ssg'가 다른 영단어 일부로 잡히지 않도록)
+        self.pattern_bounded: List[bool] = []
+        seen = set()
+        for key, spec in self.brands.items():
+            for alias in spec.get('aliases', []):
+                alias = normalize(alias)
+                # 띄어쓰기 변형: 공백 있는 별칭은 붙여 쓴 형태도 등록
+                for variant in {alias, alias.replace(' ', '')}:
+                    if not variant or (key, variant) in seen:
+                        continue
+                    seen.add((key, variant))
+                    patterns.append(variant)
+                    self.pattern_brand.append(key)
+                    self.pattern_bounded.append(_is_ascii_word(variant[0]) or _is_ascii_word(variant[-1]))
+        self.automaton = AhoCorasick(patterns)
+
+    @classmethod
+    def from_config(cls, path: Optional[str] = None) -> "BrandTagger":
+        """BRAND_DICT_PATH JSON 사전 로드 (없으면 기본 사전)"""
+        path = path or os.getenv('BRAND_DICT_PATH', '')
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f).get('brands'))
+        return cls()
+
+    def count(self, text: str) -> Dict[str, int]:
+        """브랜드별 언급 수 (같은 브랜드의 별칭이 겹쳐 잡히면 한 번만, 예: 'ssg' + 'ssg.com')"""
+        text = normalize(text)
+        counts: Dict[str, int] = {}
+        last_end: Dict[str, int] = {}
+        patterns = self.automaton.patterns
+        for end, pattern_id in self.automaton.iter_matches(text):
+            key = self.pattern_brand[pattern_id]
+            start = end - len(patterns[pattern_id]) + 1
+            if self.pattern_bounded[pattern_id]:
+                if (start > 0 and _is_ascii_word(text[start - 1])) or (end + 1 < len(text) and _is_ascii_word(text[end + 1])):
+                    continue
+            if key in last_end and start <= last_end[key]:
+                # 이전 일치와 겹치면 더 긴 쪽으로 범위만 확장
+                last_end[key] = max(last_end[key], end)
+                continue
+            last_end[key] = end
+            counts[key] = counts.get(key, 0) + 1
+        return counts
+
+    def tag_post(self, title: str, content: str) -> Dict[str, int]:
+        """브랜드별 언급 수 열 (brand_<키>), 제목과 본문을 함께 탐색"""
+        counts = self.count(f"{title or ''}\n{content or ''}")
+        return {f"brand_{key}": counts.get(key, 0) for key in self.brands}
+
+    def own_company(self, title: str, content: str = '') -> int:
+        """자사 브랜드(별칭 포함)가 제목 또는 본문에 있으면 1"""
+        counts = self.count(f"{title or ''}\n{content or ''}")
+        return 1 if any(counts.get(key) for key in self.own_brands) else 0
+
+
+_default_tagger: Optional[BrandTagger] = None
+
+
+def get_brand_tagger() -> BrandTagger:
+    """프로세스당 한 번만 컴파일한 기본 태거"""
+    global _default_tagger
+    if _default_tagger is None:
+        _default_tagger = BrandTagger.from_config()
+    return _default_tagger
+
+
+def tag_csv(csv_path: str, out_path: str, tagger: Optional[BrandTagger] = None) -> Dict[str, float]:
+    """CSV 전체를 스트리밍으로 태깅해서 id + 브랜드별 언급 수 열을 out_path에 저장, 처리량 반환"""
+    tagger = tagger or get_brand_tagger()
+    columns = [f"brand_{key}" for key in tagger.brands]
+    docs = 0
+    chars = 0
+    started = time.perf_counter()
+    with open(csv_path, 'r', encoding='utf-8', newline='') as src, \
+            open(out_path, 'w', encoding='utf-8', newline='') as dst:
+        writer = csv.DictWriter(dst, fieldnames=['id', 'own_company'] + columns)
+        writer.writeheader()
+        for row in csv.DictReader(src):
+            title, content = row.get('title', ''), row.get('content', '')
+            tags = tagger.tag_post(title, content)
+            own = 1 if any(tags[f"brand_{key}"] for key in tagger.own_brands) else 0
+            writer.writerow({'id': row.get('id'), 'own_company': own, **tags})
+            docs += 1
+            chars += len(title) + len(content)
+    elapsed = time.perf_counter() - started
+    return {
+        'docs': docs,
+        'chars': chars,
+        'seconds': round(elapsed, 3),
+        'docs_per_sec': round(docs / elapsed, 1) if elapsed > 0 else 0.0,
+        'mchars_per_sec': round(chars / elapsed / 1e6, 2) if elapsed > 0 else 0.0,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="브랜드 언급 태깅 (브랜드별 언급 수 열 생성)")
+    parser.add_argument("--csv-path", type=str, default=None, help="대상 CSV 파일 경로 (기본값: ./community_data.csv)")
+    parser.add_argument("--out", type=str, default="brand_tags.csv", help="결과 CSV 경로 (기본값: ./brand_tags.csv)")
+    parser.add_argument("--dict", type=str, default=None, help="브랜드 사전 JSON (기본값: BRAND_DICT_PATH 또는 내장 사전)")
+    args = parser.parse_args()
+
+    result = tag_csv(args.csv_path or os.path.join(os.getcwd(), "community_data.csv"), args.out,
+                     BrandTagger.from_config(args.dict))
+    print(f"✅ 브랜드 태깅 완료: {result['docs']}개 문서, {result['docs_per_sec']} docs/sec ({args.out})")
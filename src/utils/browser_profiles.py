@@ -0,0 +1,77 @@
+"""
+브라우저 실행 프로필 (launch 옵션 묶음)
+
+BROWSER_PROFILE 환경변수로 모든 크롤러의 프로필을 고른다 (없으면 크롤러별 기본값).
+    plain     추가 옵션 없음 (맘이베베 기존 방식)
+    standard  봇 탐지 우회 플래그 + headless일 때 /dev/shm, sandbox 비활성화 (BaseCrawler 기존 방식)
+    full      standard 플래그로 전체 Chromium 바이너리 사용 (channel='chromium', 새 headless 모드)
+    lean      headless shell + 확장/백그라운드 네트워크/동기화/GPU/컴포넌트 업데이트 비활성화,
+              공유 디스크 캐시(BROWSER_CACHE_DIR), 렌더러 프로세스 수 제한(BROWSER_RENDERER_LIMIT)
+
+Playwright의 launch()는 --user-data-dir을 받지 않으므로 (launch_persistent_context 전용)
+실행 간 공유 캐시는 --disk-cache-dir로 지정한다.
+"""
+import os
+from typing import Dict, List, Optional
+
+PROFILES = ('plain', 'standard', 'full', 'lean')
+
+STANDARD_ARGS = ['--disable-blink-features=AutomationControlled']
+HEADLESS_ARGS = ['--disable-dev-shm-usage', '--no-sandbox']
+LEAN_ARGS = [
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-sync',
+    '--disable-gpu',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--mute-audio',
+    '--metrics-recording-only',
+]
+
+
+def get_browser_profile(default: str = 'standard') -> str:
+    """BROWSER_PROFILE 환경변수 (알 수 없는 값이면 기본값)"""
+    profile = os.getenv('BROWSER_PROFILE', '').strip().lower() or default
+    if profile not in PROFILES:
+        print(f"⚠️ 알 수 없는 BROWSER_PROFILE: {profile} (사용 가능: {', '.join(PROFILES)}), {default} 사용")
+        return default
+    return profile
+
+
+def launch_options(profile: str, headless: bool) -> Dict:
+    """프로필의 chromium.launch 옵션"""
+    if profile == 'plain':
+        return {'headless': headless}
+
+    args: List[str] = list(STANDARD_ARGS)
+    if headless:
+        args.extend(HEADLESS_ARGS)
+    options: Dict = {'headless': headless, 'args': args}
+
+    if profile == 'full':
+        # 전체 Chromium 바이너리의 새 headless 모드 (headless shell보다 무겁지만 실제 브라우저와 동일)
+        options['channel'] = 'chromium'
+    elif profile == 'lean':
+        # headless=True 기본값이 chromium-headless-shell이므로 channel은 지정하지 않음
+        cache_dir = os.path.abspath(os.getenv('BROWSER_CACHE_DIR', '.browser_cache'))
+        os.makedirs(cache_dir, exist_ok=True)
+        renderer_limit = int(os.getenv('BROWSER_RENDERER_LIMIT', '2'))
+        args.extend(LEAN_ARGS)
+        args.append(f'--disk-cache-dir={cache_dir}')
+        if renderer_limit > 0:
+            args.append(f'--renderer-process-limit={renderer_limit}')
+    return options
+
+
+async def launch_browser(playwright, headless: bool, profile: Optional[str] = None, default: str = 'standard',
+                         proxy: Optional[Dict] = None):
+    """프로필 옵션으로 Chromium 실행 (proxy: 컨텍스트별 프록시를 쓸 때 넘기는 전역 프록시)"""
+    profile = profile or get_browser_profile(default)
+    options = launch_options(profile, headless)
+    if proxy:
+        options['proxy'] = proxy
+    return await playwright.chromium.launch(**options)
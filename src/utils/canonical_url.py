@@ -0,0 +1,108 @@
+"""
+게시글 정식(canonical) URL 생성 및 중복 제거용 URL 정규화
+
+복사 버튼 클릭 + 클립보드 읽기 대신, 목록 URL에 이미 들어있는 게시글 ID로 고유 주소를 만든다.
+- 에펨코리아: document_srl 또는 /<번호>            → https://www.fmkorea.com/<번호>
+- 뽐뿌: view.php?id=<게시판>&no=<번호>             → https://www.ppomppu.co.kr/zboard/view.php?id=<게시판>&no=<번호>
+- 네이버 카페: /<카페>/<번호>, /articles/<번호>, articleid=<번호> → https://cafe.naver.com/<카페>/<번호>
+"""
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_CAFE_SLUG = "skybluezw4rh"
+
+# 도메인 → 채널 (정규화 시 채널 자동 판별)
+CHANNEL_HOSTS = {
+    'fmkorea.com': 'fmkorea',
+    'ppomppu.co.kr': 'ppomppu',
+    'cafe.naver.com': 'mam2bebe',
+}
+
+# 게시글 식별과 무관한 추적/표시용 쿼리 파라미터
+TRACKING_PARAMS = {
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'fbclid', 'gclid', 'referrerAllArticles', 'fromList', 'boardType', 'menuId',
+    'page', 'sort_index', 'order_type', 'listStyle', 'search_keyword', 'search_target',
+}
+
+
+def detect_channel(url: str) -> Optional[str]:
+    """URL 도메인으로 채널 판별"""
+    host = urlsplit(url).netloc.lower()
+    for domain, channel in CHANNEL_HOSTS.items():
+        if host == domain or host.endswith('.' + domain):
+            return channel
+    return None
+
+
+def extract_post_id(channel: str, url: str) -> Optional[int]:
+    """URL에서 게시글 번호 추출"""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+
+    if channel == 'fmkorea':
+        if query.get('document_srl', '').isdigit():
+            return int(query['document_srl'])
+        match = re.search(r'/(\d+)/?$', parts.path)
+        return int(match.group(1)) if match else None
+
+    if channel == 'ppomppu':
+        return int(query['no']) if query.get('no', '').isdigit() else None
+
+    if channel == 'mam2bebe':
+        for key in ('articleid', 'articleId'):
+            if query.get(key, '').isdigit():
+                return int(query[key])
+        match = re.search(r'/articles/(\d+)', parts.path) or re.search(r'^/[^/]+/(\d+)/?$', parts.path)
+        return int(match.group(1)) if match else None
+
+    return None
+
+
+def canonical_post_url(channel: str, url: str, cafe_slug: str = DEFAULT_CAFE_SLUG) -> str:
+    """게시글 ID로 정식 URL 생성 (ID를 찾지 못하면 정규화된 원본 URL)"""
+    post_id = extract_post_id(channel, url)
+    if post_id is None:
+        return normalize_url(url, detect=False)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower() or 'https'
+    host = parts.netloc.lower()
+
+    if channel == 'fmkorea':
+        return f"{scheme}://{host}/{post_id}"
+    if channel == 'ppomppu':
+        board = dict(parse_qsl(parts.query)).get('id', 'ppomppu')
+        return f"{scheme}://{host}/zboard/view.php?id={board}&no={post_id}"
+    if channel == 'mam2bebe':
+        # URL에 카페 주소가 들어있으면 그대로 사용
+        slug_match = re.match(r'^/([^/]+)/\d+/?$', parts.path)
+        if slug_match:
+            cafe_slug = slug_match.group(1)
+        return f"{scheme}://{host}/{cafe_slug}/{post_id}"
+    return normalize_url(url, detect=False)
+
+
+def normalize_url(url: str, detect: bool = True) -> str:
+    """
+    중복 제거용 URL 정규화
+
+    알려진 커뮤니티 URL은 정식 URL로 변환하고, 그 외에는 scheme/host 소문자화,
+    fragment 및 추적 파라미터 제거, 쿼리 정렬, 끝 슬래시 제거를 적용한다.
+    """
+    url = (url or '').strip()
+    if not url:
+        return url
+
+    if detect:
+        channel = detect_channel(url)
+        if channel and extract_post_id(channel, url) is not None:
+            return canonical_post_url(channel, url)
+
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in TRACKING_PARAMS)
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urlencode(query), ''))
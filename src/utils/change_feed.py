@@ -0,0 +1,191 @@
+"""
+수집 게시글 변경분 내보내기 (소비자별 커서)
+
+후속 파이프라인(페르소나 등)이 community_data.csv 전체를 다시 읽지 않도록, 게시글 색인(post_index)의
+갱신 순번(seq) 또는 id를 기준으로 소비자 커서 이후에 추가/변경된 행만 묶음 단위로 내보낸다.
+소비자 커서는 색인 DB의 consumers 테이블에 저장되며, 묶음 하나를 처리한 뒤에만 앞으로 옮긴다
+(처리 중 종료되면 마지막 묶음부터 다시 받음).
+CSV가 제자리에서 다시 쓰이면(--new) 색인이 전체를 다시 확인하므로, 바뀐 행은 upsert, 사라진 행은 delete로 전달된다.
+
+    seq  추가/변경/삭제 모두 (행마다 op: upsert|delete)
+    id   새로 추가된 행만 (id 증가 순)
+"""
+import csv
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from src.utils.post_index import PostIndex, QUERY_COLUMNS
+
+# 묶음 하나의 기본 행 수
+DEFAULT_CHUNK_ROWS = 1000
+FEED_COLUMNS = ['seq', 'op'] + QUERY_COLUMNS
+CURSOR_MODES = ('seq', 'id')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS consumers (
+    name TEXT PRIMARY KEY,
+    mode TEXT NOT NULL,
+    cursor INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
+"""
+
+
+class ChangeFeed:
+    """게시글 색인 위의 소비자별 변경분 피드"""
+
+    def __init__(self, index: PostIndex):
+        self.index = index
+        self.conn = index.conn
+        self.conn.executescript(SCHEMA)
+
+    def consumer(self, name: str, mode: str = 'seq') -> Dict:
+        """소비자 커서 (없으면 0부터 새로 등록, 기존 소비자의 기준과 다르면 ValueError)"""
+        if mode not in CURSOR_MODES:
+            raise ValueError(f"커서 기준은 seq 또는 id: {mode}")
+        row = self.conn.execute("SELECT name, mode, cursor, updated_at FROM consumers WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            self.conn.execute("INSERT INTO consumers (name, mode, cursor) VALUES (?, ?, 0)", (name, mode))
+            self.conn.commit()
+            return {'name': name, 'mode': mode, 'cursor': 0, 'updated_at': None}
+        if row['mode'] != mode:
+            raise ValueError(f"소비자 {name}의 커서 기준은 {row['mode']}입니다 (요청: {mode})")
+        return dict(row)
+
+    def set_cursor(self, name: str, cursor: int):
+        self.conn.execute(
+            "UPDATE consumers SET cursor = ?, updated_at = ? WHERE name = ?",
+            (cursor, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), name),
+        )
+        self.conn.commit()
+
+    def reset(self, name: str):
+        """소비자 커서를 처음으로 (다음 읽기에서 전체를 다시 받음)"""
+        self.set_cursor(name, 0)
+
+    def consumers(self) -> List[Dict]:
+        """등록된 소비자와 남은 변경분 수"""
+        result = []
+        for row in self.conn.execute("SELECT name, mode, cursor, updated_at FROM consumers ORDER BY name").fetchall():
+            info = dict(row)
+            info['pending'] = self._pending(info['mode'], info['cursor'])
+            result.append(info)
+        return result
+
+    def _pending(self, mode: str, cursor: int) -> int:
+        if mode == 'id':
+            return self.conn.execute("SELECT COUNT(*) FROM posts WHERE id > ? AND deleted = 0", (cursor,)).fetchone()[0]
+        return self.conn.execute("SELECT COUNT(*) FROM posts WHERE seq > ?", (cursor,)).fetchone()[0]
+
+    def _fetch(self, mode: str, cursor: int, limit: int) -> List[Dict]:
+        columns = ', '.join(QUERY_COLUMNS)
+        if mode == 'id':
+            sql = (f"SELECT seq, 'upsert' AS op, {columns} FROM posts "
+                   "WHERE id > ? AND deleted = 0 ORDER BY id LIMIT ?")
+        else:
+            sql = (f"SELECT seq, CASE WHEN deleted THEN 'delete' ELSE 'upsert' END AS op, {columns} FROM posts "
+                   "WHERE seq > ? ORDER BY seq LIMIT ?")
+        return [dict(row) for row in self.conn.execute(sql, (cursor, limit))]
+
+    def iter_chunks(self, name: str, mode: str = 'seq', chunk_rows: int = DEFAULT_CHUNK_ROWS,
+                    max_rows: Optional[int] = None, commit: bool = True) -> Iterator[List[Dict]]:
+        """커서 이후 변경분을 묶음 단위로 반환 (다음 묶음을 요청하면 앞 묶음은 처리 완료로 보고 커서 이동)"""
+        cursor = self.consumer(name, mode)['cursor']
+        key = 'id' if mode == 'id' else 'seq'
+        sent = 0
+        while max_rows is None or sent < max_rows:
+            limit = chunk_rows if max_rows is None else min(chunk_rows, max_rows - sent)
+            rows = self._fetch(mode, cursor, limit)
+            if not rows:
+                break
+            yield rows
+            cursor = rows[-1][key]
+            sent += len(rows)
+            if commit:
+                self.set_cursor(name, cursor)
+            if len(rows) < limit:
+                break
+
+
+def export_changes(
+    consumer: str,
+    out,
+    fmt: str = 'jsonl',
+    mode: str = 'seq',
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    max_rows: Optional[int] = None,
+    csv_path: Optional[str] = None,
+    index_path: Optional[str] = None,
+    commit: bool = True,
+) -> Dict[str, int]:
+    """CSV와 색인을 동기화한 뒤 소비자 커서 이후 변경분을 out에 기록 (묶음마다 flush 후 커서 이동)"""
+    csv_path = csv_path or os.path.join(os.getcwd(), "community_data.csv")
+    stats = {'rows': 0, 'chunks': 0, 'deleted': 0}
+    with PostIndex(index_path) as index:
+        if os.path.exists(csv_path):
+            index.sync_csv(csv_path)
+        feed = ChangeFeed(index)
+        writer = csv.DictWriter(out, fieldnames=FEED_COLUMNS) if fmt == 'csv' else None
+        if writer:
+            writer.writeheader()
+        for rows in feed.iter_chunks(consumer, mode, chunk_rows, max_rows, commit):
+            for row in rows:
+                if writer:
+                    writer.writerow(row)
+                else:
+                    out.write(json.dumps(row, ensure_ascii=False) + '\n')
+                if row['op'] == 'delete':
+                    stats['deleted'] += 1
+            out.flush()
+            stats['rows'] += len(rows)
+            stats['chunks'] += 1
+        stats['cursor'] = feed.consumer(consumer, mode)['cursor']
+    return stats
+
+
+def add_export_arguments(parser) -> None:
+    """json_to_csv의 export 하위 명령 인자"""
+    parser.add_argument("--consumer", type=str, default=None, help="소비자 이름 (커서가 저장됨)")
+    parser.add_argument("--by", choices=CURSOR_MODES, default="seq", help="커서 기준 (seq: 추가/변경/삭제, id: 추가만)")
+    parser.add_argument("--csv-path", type=str, default=None, help="원본 CSV 경로 (기본값: ./community_data.csv)")
+    parser.add_argument("--index-path", type=str, default=None, help="색인 경로 (기본값: POST_INDEX_PATH 또는 ./.post_index.db)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help=f"묶음 행 수 (기본값: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument("--max-rows", type=int, default=None, help="이번 실행에서 내보낼 최대 행 수")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="출력 형식 (기본값: jsonl)")
+    parser.add_argument("--out", type=str, default=None, help="출력 파일 (기본값: 표준 출력)")
+    parser.add_argument("--peek", action="store_true", help="커서를 옮기지 않고 변경분만 확인")
+    parser.add_argument("--reset", action="store_true", help="소비자 커서를 처음으로 되돌린 뒤 내보내기")
+    parser.add_argument("--list", action="store_true", help="소비자 목록과 남은 변경분 수 출력")
+
+
+def run_export(args) -> None:
+    """export 하위 명령 실행 (진행 상황은 stderr로 출력)"""
+    if args.list:
+        with PostIndex(args.index_path) as index:
+            for info in ChangeFeed(index).consumers():
+                print(f"🫛 {info['name']} ({info['mode']}): 커서 {info['cursor']}, 남은 변경분 {info['pending']}개, "
+                      f"마지막 읽기 {info['updated_at'] or '-'}", file=sys.stderr)
+        return
+    if not args.consumer:
+        raise SystemExit("--consumer가 필요합니다")
+    if args.reset:
+        with PostIndex(args.index_path) as index:
+            feed = ChangeFeed(index)
+            feed.consumer(args.consumer, args.by)
+            feed.reset(args.consumer)
+
+    started = time.perf_counter()
+    options = dict(fmt=args.format, mode=args.by, chunk_rows=args.chunk_rows, max_rows=args.max_rows,
+                   csv_path=args.csv_path, index_path=args.index_path, commit=not args.peek)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8', newline='') as f:
+            stats = export_changes(args.consumer, f, **options)
+    else:
+        stats = export_changes(args.consumer, sys.stdout, **options)
+    elapsed = time.perf_counter() - started
+    print(f"🫛 {args.consumer}: 변경분 {stats['rows']}개 (삭제 {stats['deleted']}개, 묶음 {stats['chunks']}개), "
+          f"커서 {stats['cursor']} ({elapsed * 1000:.1f}ms)", file=sys.stderr)
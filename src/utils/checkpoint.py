@@ -0,0 +1,129 @@
+"""
+크롤링 중간 상태 체크포인트 (목록 커서, 대기 URL, 완료 게시글)
+
+프로세스가 중간에 종료되어도 --resume으로 목록 페이지 위치와 상세 수집 진행 상황을 이어서 진행한다.
+상태 파일은 CHECKPOINT_DIR/<채널>.json에 임시 파일 → os.replace로 원자적으로 저장한다.
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from src.models.post import Post
+
+
+class CrawlCheckpoint:
+    """채널별 크롤링 진행 상태"""
+
+    def __init__(self, channel: str, directory: Optional[str] = None, save_every: Optional[int] = None):
+        self.channel = channel
+        self.directory = directory or os.getenv('CHECKPOINT_DIR', '.checkpoints')
+        self.path = os.path.join(self.directory, f"{channel}.json")
+        # 상세 수집은 게시글 N개마다 저장 (목록은 페이지마다 저장)
+        self.save_every = save_every or int(os.getenv('CHECKPOINT_EVERY', '5'))
+        self.state: Dict = self._empty_state()
+        self._unsaved = 0
+
+    def _empty_state(self) -> Dict:
+        return {
+            'channel': self.channel,
+            'started_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'updated_at': None,
+            'listing': {'page': 1, 'done': False, 'items': []},
+            'posts': [],
+            'done_urls': [],
+            'completed': False,
+        }
+
+    def load(self) -> bool:
+        """저장된 상태 불러오기 (없거나 이미 완료된 상태면 False)"""
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except Exception as e:
+            print(f"⚠️ 체크포인트 읽기 오류: {e}")
+            return False
+        if state.get('completed'):
+            return False
+        self.state = state
+        listing = state['listing']
+        cursor = '완료' if listing['done'] else f"{listing['page']}페이지부터"
+        print(f"🫛 체크포인트 재개: 목록 {cursor}, "
+              f"목록 항목 {len(listing['items'])}개, 완료 게시글 {len(state['posts'])}개 ({self.path})")
+        return True
+
+    def reset(self):
+        """새 크롤링 시작 (기존 상태 파일 삭제)"""
+        self.state = self._empty_state()
+        self.clear()
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.state['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, self.path)
+        self._unsaved = 0
+
+    def clear(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    # 목록 커서
+    @property
+    def listing_done(self) -> bool:
+        return self.state['listing']['done']
+
+    @property
+    def listing_page(self) -> int:
+        return self.state['listing']['page']
+
+    @property
+    def listing_items(self) -> List[Dict]:
+        return self.state['listing']['items']
+
+    def save_listing(self, next_page: int, items: List[Dict], done: bool = False):
+        """목록 페이지 하나를 처리할 때마다 다음 페이지 번호와 누적 항목 저장"""
+        self.state['listing'] = {'page': next_page, 'done': done, 'items': list(items)}
+        self.save()
+
+    # 상세 수집
+    @property
+    def completed_urls(self) -> Set[str]:
+        return set(self.state.get('done_urls', []))
+
+    def restored_posts(self) -> List[Post]:
+        return [Post(**post) for post in self.state['posts']]
+
+    def pending_items(self) -> List[Dict]:
+        """목록 항목 중 아직 상세 수집하지 않은 항목"""
+        done = self.completed_urls
+        return [item for item in self.listing_items if item.get('url') not in done]
+
+    def add_post(self, item: Dict, post: Optional[Post]):
+        """상세 수집 완료 기록 (실패/제외된 항목도 다시 시도하지 않도록 URL 기록)"""
+        self.state.setdefault('done_urls', []).append(item.get('url', ''))
+        if post is not None:
+            self.state['posts'].append(post.model_dump(mode='json'))
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
+
+    def complete(self):
+        """크롤링 정상 종료 표시 (다음 실행은 처음부터)"""
+        self.state['completed'] = True
+        self.save()
+
+
+def build_checkpoint(channel: str, resume: bool) -> CrawlCheckpoint:
+    """run_* 스크립트용: --resume이면 저장된 상태를 불러오고, 아니면 새로 시작"""
+    checkpoint = CrawlCheckpoint(channel)
+    if resume:
+        if not checkpoint.load():
+            print(f"🫛 재개할 체크포인트가 없어 처음부터 시작합니다 ({checkpoint.path})")
+    else:
+        checkpoint.reset()
+    return checkpoint
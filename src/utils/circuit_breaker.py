@@ -0,0 +1,172 @@
+"""
+호스트별 서킷 브레이커 (차단/장애 사이트 빠른 중단)
+
+상세/목록 요청 실패(타임아웃, 네트워크 오류, 4xx/5xx 차단 응답)나 봇 확인 페이지가 연속으로 나오면
+해당 호스트의 서킷을 열어 이후 요청을 기다리지 않고 바로 실패시킨다. 열린 뒤 CIRCUIT_RESET_SEC가 지나면
+반열림(half-open) 상태로 시험 요청을 허용하고, 성공하면 닫고 실패하면 다시 연다.
+호스트 단위라서 여러 사이트를 함께 수집할 때 한 사이트가 막혀도 다른 사이트는 영향을 받지 않는다.
+    CIRCUIT_FAILURE_THRESHOLD  서킷을 여는 연속 실패 수 (기본값: 5)
+    CIRCUIT_RESET_SEC          열린 뒤 시험 요청까지 대기 시간 (기본값: 60)
+    CIRCUIT_HALF_OPEN_PROBES   반열림 상태에서 동시에 허용할 시험 요청 수 (기본값: 1)
+    CIRCUIT_MAX_TRIPS          이 횟수만큼 열리면 해당 사이트 수집 종료 (기본값: 3)
+"""
+import os
+import re
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+# 차단으로 보는 HTTP 상태 코드
+BLOCKED_STATUSES = (403, 429, 430, 503)
+
+# 봇 확인/차단 페이지 표식 (제목 또는 본문 앞부분)
+BOT_CHECK_MARKERS = (
+    'just a moment', 'cf-browser-verification', 'challenge-platform', 'captcha',
+    'access denied', 'attention required', '자동입력 방지', '보안문자', '비정상적인 접근', '접근이 차단',
+)
+
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+def looks_like_bot_check(text: str) -> bool:
+    """봇 확인/차단 페이지로 보이는지 (제목 또는 본문 앞부분으로 판단)"""
+    head = (text or '')[:5000].lower()
+    return any(marker in head for marker in BOT_CHECK_MARKERS)
+
+
+def html_is_bot_check(html: str) -> bool:
+    """원본 HTML의 <title>만으로 판단 (스크립트 안의 captcha 문자열 등 오탐 방지)"""
+    match = TITLE_PATTERN.search(html or '')
+    return bool(match) and looks_like_bot_check(match.group(1))
+
+
+def describe_error(error: Exception) -> str:
+    """실패 사유 한 줄 (예외 종류 + 메시지 첫 줄)"""
+    message = str(error).strip().split('\n', 1)[0][:80]
+    return f"{type(error).__name__}: {message}" if message else type(error).__name__
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 요청을 보내지 않음"""
+
+    def __init__(self, host: str, retry_in: float, reason: str = ''):
+        self.host = host
+        self.retry_in = retry_in
+        self.reason = reason
+        super().__init__(f"{host} 서킷 열림 ({reason or '연속 실패'}, {retry_in:.0f}s 후 시험 요청)")
+
+
+class CircuitBreaker:
+    """호스트 하나의 서킷 (closed → open → half_open → closed/open)"""
+
+    def __init__(self, host: str, failure_threshold: int, reset_seconds: float, half_open_probes: int):
+        self.host = host
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.half_open_probes = max(1, half_open_probes)
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+        self.trips = 0
+        self.last_reason = ''
+        self.rejected = 0
+
+    def retry_in(self) -> float:
+        return max(0.0, self.reset_seconds - (time.monotonic() - self.opened_at)) if self.state == OPEN else 0.0
+
+    def before_request(self):
+        """요청 허가 (열려 있으면 CircuitOpenError)"""
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                self.rejected += 1
+                raise CircuitOpenError(self.host, self.retry_in(), self.last_reason)
+            self.state = HALF_OPEN
+            self.probes = 0
+            print(f"🫛 {self.host} 서킷 반열림: 시험 요청 허용")
+        if self.state == HALF_OPEN:
+            if self.probes >= self.half_open_probes:
+                self.rejected += 1
+                raise CircuitOpenError(self.host, 0.0, self.last_reason)
+            self.probes += 1
+
+    def record_success(self):
+        if self.state == HALF_OPEN:
+            print(f"🫛 {self.host} 서킷 닫힘: 시험 요청 성공")
+        self.state = CLOSED
+        self.failures = 0
+
+    def record_failure(self, reason: str):
+        self.failures += 1
+        self.last_reason = reason
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            self.trip(reason)
+
+    def trip(self, reason: str):
+        """서킷 열기 (헬스 체크 실패 시 바로 호출)"""
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.last_reason = reason
+        self.trips += 1
+        print(f"⚠️ {self.host} 서킷 열림 ({reason}, 연속 실패 {self.failures}회, {self.trips}번째): "
+              f"{self.reset_seconds:.0f}s 동안 요청 중단")
+
+
+class HostCircuitBreakers:
+    """호스트별 서킷 모음"""
+
+    def __init__(self, failure_threshold: Optional[int] = None, reset_seconds: Optional[float] = None,
+                 half_open_probes: Optional[int] = None, max_trips: Optional[int] = None):
+        self.failure_threshold = failure_threshold or int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+        self.reset_seconds = reset_seconds if reset_seconds is not None else float(os.getenv('CIRCUIT_RESET_SEC', '60'))
+        self.half_open_probes = half_open_probes or int(os.getenv('CIRCUIT_HALF_OPEN_PROBES', '1'))
+        self.max_trips = max_trips or int(os.getenv('CIRCUIT_MAX_TRIPS', '3'))
+        self.breakers: Dict[str, CircuitBreaker] = {}
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        return urlsplit(url_or_host).netloc.lower() if '://' in url_or_host else url_or_host.lower()
+
+    def get(self, url_or_host: str) -> CircuitBreaker:
+        host = self.host_of(url_or_host)
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers[host] = CircuitBreaker(
+                host, self.failure_threshold, self.reset_seconds, self.half_open_probes
+            )
+        return breaker
+
+    def exhausted(self, url_or_host: str) -> bool:
+        """서킷이 max_trips번 열려 해당 사이트 수집을 끝내야 하는지"""
+        breaker = self.get(url_or_host)
+        return breaker.state != CLOSED and breaker.trips >= self.max_trips
+
+    def status(self, url_or_host: str) -> str:
+        breaker = self.get(url_or_host)
+        if breaker.state == CLOSED:
+            return 'ok'
+        return f"중단 ({breaker.last_reason})" if breaker.trips >= self.max_trips else f"서킷 {breaker.state}"
+
+    def report(self):
+        tripped = [b for b in self.breakers.values() if b.trips]
+        if not tripped:
+            return
+        print("⚠️ 서킷 브레이커:")
+        for breaker in tripped:
+            print(f"  - {breaker.host}: {breaker.state}, 열림 {breaker.trips}회, 차단한 요청 {breaker.rejected}개, "
+                  f"마지막 사유: {breaker.last_reason}")
+
+
+_shared_breakers: Optional[HostCircuitBreakers] = None
+
+
+def get_circuit_breakers() -> HostCircuitBreakers:
+    """프로세스에서 공유하는 서킷 모음"""
+    global _shared_breakers
+    if _shared_breakers is None:
+        _shared_breakers = HostCircuitBreakers()
+    return _shared_breakers
@@ -0,0 +1,238 @@
+"""
+게시글 반응 지표 파생값 계산 (NumPy 벡터 연산)
+
+조회/추천/댓글 수와 작성일만 열 단위로 읽어 NumPy 배열에 담고, 행 단위 Python 반복 없이 계산한다.
+    like_view_ratio    추천수 / 조회수 (조회수 0이면 0)
+    channel_norm       like_view_ratio / 같은 채널 평균 like_view_ratio (채널별 정규화)
+    comment_velocity   댓글수 / 게시 후 경과 시간(시간, 최소 1시간)
+    channel_day_pct    같은 채널·같은 작성일 안에서 조회수 백분위 (0~1, 동률은 같은 값, 작성일 없으면 NaN)
+
+결과는 id와 함께 사이드카 CSV(기본값: ./community_metrics.csv) 또는 게시글 색인 DB의
+post_metrics 테이블에 저장한다 (원본 CSV는 수정하지 않음).
+"""
+import csv
+import os
+import sqlite3
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+METRIC_COLUMNS = ['like_view_ratio', 'channel_norm', 'comment_velocity', 'channel_day_pct']
+COUNT_COLUMNS = ('view_cnt', 'like_cnt', 'comment_cnt')
+# 경과 시간 하한 (방금 올라온 게시글의 속도가 과도하게 커지지 않도록)
+MIN_AGE_HOURS = 1.0
+
+
+def _counts(values: List[str]) -> np.ndarray:
+    """숫자 문자열 열 → int64 배열 (빈 값/숫자가 아닌 값은 0)"""
+    array = np.array([v if v and v.lstrip('-').isdigit() else '0' for v in values])
+    return array.astype(np.int64) if len(array) else np.zeros(0, dtype=np.int64)
+
+
+def _ints(values: List[int]) -> np.ndarray:
+    return np.array(values, dtype=np.int64)
+
+
+def _timestamps(values: List[str]) -> np.ndarray:
+    """작성일 문자열 열 → datetime64[s] 배열 (빈 값/해석 불가 값은 NaT)"""
+    try:
+        return np.array([v or 'NaT' for v in values], dtype='datetime64[s]')
+    except ValueError:
+        # 시간대 등 NumPy가 읽지 못하는 형식이 섞여 있으면 행 단위로 정규화
+        from src.utils.post_index import normalize_created_at
+        return np.array([normalize_created_at(v) or 'NaT' for v in values], dtype='datetime64[s]')
+
+
+def columns_from_rows(rows: Iterable[Dict]) -> Dict[str, np.ndarray]:
+    """convert_to_csv_format 결과 같은 dict 목록 → 열 배열"""
+    ids, channels, views, likes, comments, created = [], [], [], [], [], []
+    for row in rows:
+        ids.append(int(row.get('id') or 0))
+        channels.append(row.get('channel') or '')
+        views.append(int(row.get('view_cnt') or 0))
+        likes.append(int(row.get('like_cnt') or 0))
+        comments.append(int(row.get('comment_cnt') or 0))
+        created.append(str(row.get('created_at') or ''))
+    return _build_columns(_ints(ids), channels, _ints(views), _ints(likes), _ints(comments), _timestamps(created))
+
+
+def load_csv_columns(csv_path: str) -> Dict[str, np.ndarray]:
+    """CSV에서 필요한 열만 골라 읽기 (제목/본문은 보관하지 않음)"""
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        index = {name: header.index(name) for name in ('id', 'channel', 'created_at') + COUNT_COLUMNS}
+        columns: Dict[str, List[str]] = {name: [] for name in index}
+        picks = list(index.items())
+        for row in reader:
+            if len(row) < len(header):
+                continue
+            for name, position in picks:
+                columns[name].append(row[position])
+    return _build_columns(_counts(columns['id']), columns['channel'], _counts(columns['view_cnt']),
+                          _counts(columns['like_cnt']), _counts(columns['comment_cnt']),
+                          _timestamps(columns['created_at']))
+
+
+def load_index_columns(index_path: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """게시글 색인 DB(post_index)에서 지표 열만 조회"""
+    path = index_path or os.getenv('POST_INDEX_PATH', '.post_index.db')
+    conn = sqlite3.connect(path)
+    try:
+        rows = conn.execute(
+            "SELECT id, channel, view_cnt, like_cnt, comment_cnt, created_at FROM posts WHERE deleted = 0"
+        ).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return columns_from_rows([])
+    ids, channels, views, likes, comments, created = zip(*rows)
+    return _build_columns(_ints(ids), channels, _ints([v or 0 for v in views]), _ints([v or 0 for v in likes]),
+                          _ints([v or 0 for v in comments]), _timestamps([v or '' for v in created]))
+
+
+def _build_columns(ids: np.ndarray, channels, views: np.ndarray, likes: np.ndarray,
+                   comments: np.ndarray, created: np.ndarray) -> Dict[str, np.ndarray]:
+    channel_names, channel_codes = np.unique(np.array(channels, dtype=str), return_inverse=True)
+    return {
+        'id': ids,
+        'channel_names': channel_names,
+        'channel': channel_codes.astype(np.int64),
+        'view_cnt': views,
+        'like_cnt': likes,
+        'comment_cnt': comments,
+        'created_at': created,
+    }
+
+
+def _group_percentile(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """그룹 안에서 값의 백분위 (자신보다 작은 값의 비율, 그룹 크기 1이면 1.0)"""
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n == 0:
+        return result
+    order = np.lexsort((values, groups))
+    sorted_groups = groups[order]
+    sorted_values = values[order]
+    positions = np.arange(n)
+
+    group_start_flags = np.r_[True, sorted_groups[1:] != sorted_groups[:-1]]
+    group_starts = np.maximum.accumulate(np.where(group_start_flags, positions, 0))
+    group_ids = np.cumsum(group_start_flags) - 1
+    group_sizes = np.bincount(group_ids)[group_ids]
+
+    # 동률은 첫 위치의 순위를 공유
+    run_start_flags = group_start_flags | np.r_[True, sorted_values[1:] != sorted_values[:-1]]
+    run_starts = np.maximum.accumulate(np.where(run_start_flags, positions, 0))
+    rank = run_starts - group_starts
+
+    pct = np.divide(rank, group_sizes - 1, out=np.ones(n), where=group_sizes > 1)
+    result[order] = pct
+    return result
+
+
+def compute_metrics(columns: Dict[str, np.ndarray], as_of: Optional[datetime] = None) -> Dict[str, np.ndarray]:
+    """열 배열에서 지표 계산 (as_of: 경과 시간 기준 시각, 기본값: 현재)"""
+    views = columns['view_cnt'].astype(np.float64)
+    likes = columns['like_cnt'].astype(np.float64)
+    comments = columns['comment_cnt'].astype(np.float64)
+    channel = columns['channel']
+    created = columns['created_at']
+    n = len(views)
+
+    like_view_ratio = np.divide(likes, views, out=np.zeros(n), where=views > 0)
+
+    # 채널별 평균 대비 비율
+    channel_count = np.bincount(channel, minlength=len(columns['channel_names'])) if n else np.zeros(0)
+    channel_sum = np.bincount(channel, weights=like_view_ratio, minlength=len(channel_count)) if n else np.zeros(0)
+    channel_mean = np.divide(channel_sum, channel_count, out=np.zeros(len(channel_count)), where=channel_count > 0)
+    mean_per_row = channel_mean[channel] if n else np.zeros(0)
+    channel_norm = np.divide(like_view_ratio, mean_per_row, out=np.zeros(n), where=mean_per_row > 0)
+
+    # 게시 후 경과 시간 (작성일 없으면 NaN)
+    now = np.datetime64(as_of or datetime.now(), 's')
+    has_date = ~np.isnat(created)
+    age_hours = np.full(n, np.nan)
+    age_hours[has_date] = (now - created[has_date]).astype(np.float64) / 3600.0
+    comment_velocity = comments / np.maximum(age_hours, MIN_AGE_HOURS)
+
+    # 채널·작성일 그룹 안에서 조회수 백분위
+    channel_day_pct = np.full(n, np.nan)
+    if has_date.any():
+        days = created[has_date].astype('datetime64[D]').astype(np.int64)
+        groups = channel[has_date] * (days.max() - days.min() + 1) + (days - days.min())
+        channel_day_pct[has_date] = _group_percentile(views[has_date], groups)
+
+    return {
+        'id': columns['id'],
+        'like_view_ratio': like_view_ratio,
+        'channel_norm': channel_norm,
+        'comment_velocity': comment_velocity,
+        'channel_day_pct': channel_day_pct,
+    }
+
+
+def write_sidecar_csv(metrics: Dict[str, np.ndarray], out_path: str) -> int:
+    """id + 지표 열을 사이드카 CSV로 저장 (NaN은 빈 칸)"""
+    table = np.column_stack([metrics[name] for name in METRIC_COLUMNS]) if len(metrics['id']) else np.zeros((0, 4))
+    formatted = np.char.mod('%.6g', table)
+    formatted[np.isnan(table)] = ''
+    with open(out_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(','.join(['id'] + METRIC_COLUMNS) + '\n')
+        ids = metrics['id'].astype(str)
+        for start in range(0, len(ids), 100000):
+            block = np.column_stack([ids[start:start + 100000], formatted[start:start + 100000]])
+            f.write('\n'.join(','.join(row) for row in block.tolist()))
+            f.write('\n')
+    return len(ids)
+
+
+def write_index_table(metrics: Dict[str, np.ndarray], index_path: Optional[str] = None) -> int:
+    """게시글 색인 DB의 post_metrics 테이블에 저장 (id로 posts와 조인)"""
+    path = index_path or os.getenv('POST_INDEX_PATH', '.post_index.db')
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("DROP TABLE IF EXISTS post_metrics")
+        conn.execute(
+            "CREATE TABLE post_metrics (id INTEGER PRIMARY KEY, like_view_ratio REAL, channel_norm REAL, "
+            "comment_velocity REAL, channel_day_pct REAL)"
+        )
+        columns = [metrics['id'].tolist()] + [
+            [None if np.isnan(v) else v for v in metrics[name].tolist()] for name in METRIC_COLUMNS
+        ]
+        conn.executemany("INSERT OR REPLACE INTO post_metrics VALUES (?, ?, ?, ?, ?)", zip(*columns))
+        conn.commit()
+    finally:
+        conn.close()
+    return len(metrics['id'])
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="게시글 반응 지표 파생값 계산 (채널·작성일 그룹)")
+    parser.add_argument("--csv-path", type=str, default=None, help="원본 CSV 경로 (기본값: ./community_data.csv)")
+    parser.add_argument("--from-index", action="store_true", help="CSV 대신 게시글 색인 DB(post_index)에서 읽기")
+    parser.add_argument("--index-path", type=str, default=None, help="색인 경로 (기본값: POST_INDEX_PATH 또는 ./.post_index.db)")
+    parser.add_argument("--out", type=str, default="community_metrics.csv", help="사이드카 CSV 경로 (기본값: ./community_metrics.csv)")
+    parser.add_argument("--to-index", action="store_true", help="사이드카 CSV 대신 색인 DB의 post_metrics 테이블에 저장")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.from_index:
+        data = load_index_columns(args.index_path)
+    else:
+        data = load_csv_columns(args.csv_path or os.path.join(os.getcwd(), "community_data.csv"))
+    loaded = time.perf_counter()
+    result = compute_metrics(data)
+    computed = time.perf_counter()
+    if args.to_index:
+        count = write_index_table(result, args.index_path)
+        target = "post_metrics 테이블"
+    else:
+        count = write_sidecar_csv(result, args.out)
+        target = args.out
+    print(f"📈 지표 {count}개 게시글 저장: {target} "
+          f"(읽기 {loaded - started:.2f}s, 계산 {computed - loaded:.3f}s, 쓰기 {time.perf_counter() - computed:.2f}s)")
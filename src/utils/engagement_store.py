@@ -0,0 +1,152 @@
+"""
+게시글 반응 지표(조회수/추천수/댓글수) 시계열 저장소 (SQLite)
+
+URL 중복 제거로 한 번만 저장되던 게시글의 지표 변화를 추적하기 위해,
+수집할 때마다 (채널, 게시글 ID, 시각, 지표) 스냅샷을 쌓는다.
+- detail: 상세 페이지 크롤링 결과
+- list: 목록 행에 표시된 지표만 읽은 값 (상세 페이지 미접속)
+"""
+import os
+import sqlite3
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.canonical_url import detect_channel, extract_post_id
+
+COUNTER_FIELDS = ('view_cnt', 'like_cnt', 'comment_cnt')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tracked_posts (
+    channel TEXT NOT NULL,
+    post_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT,
+    created_at TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    PRIMARY KEY (channel, post_id)
+);
+CREATE TABLE IF NOT EXISTS engagement_snapshots (
+    channel TEXT NOT NULL,
+    post_id INTEGER NOT NULL,
+    ts TEXT NOT NULL,
+    view_cnt INTEGER,
+    like_cnt INTEGER,
+    comment_cnt INTEGER,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_post ON engagement_snapshots (channel, post_id, ts);
+"""
+
+
+def is_tracking_enabled() -> bool:
+    """ENGAGEMENT_TRACKING 환경변수 (기본값: true)"""
+    return os.getenv('ENGAGEMENT_TRACKING', 'true').lower() == 'true'
+
+
+def _to_text(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return str(value)
+
+
+class EngagementStore:
+    """스냅샷 테이블 접근 (with 문 지원)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('ENGAGEMENT_DB_PATH', 'engagement.db')
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.conn:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def record(self, channel: str, post_id: int, url: str, counts: Dict, source: str,
+               title: Optional[str] = None, created_at=None, ts: Optional[datetime] = None):
+        """스냅샷 1건 저장 (지표가 모두 비어 있으면 게시글 정보만 갱신)"""
+        now = _to_text(ts or datetime.now())
+        self.conn.execute(
+            """
+            INSERT INTO tracked_posts (channel, post_id, url, title, created_at, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (channel, post_id) DO UPDATE SET
+                last_seen = excluded.last_seen,
+                title = COALESCE(excluded.title, tracked_posts.title),
+                created_at = COALESCE(excluded.created_at, tracked_posts.created_at)
+            """,
+            (channel, post_id, url, title, _to_text(created_at), now, now),
+        )
+        values = [counts.get(field) for field in COUNTER_FIELDS]
+        if all(v is None for v in values):
+            return
+        self.conn.execute(
+            "INSERT INTO engagement_snapshots (channel, post_id, ts, view_cnt, like_cnt, comment_cnt, source) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (channel, post_id, now, *values, source),
+        )
+
+    def record_posts(self, posts: Iterable[Dict], source: str = 'detail') -> int:
+        """크롤링 결과(dict)의 지표를 일괄 저장, 저장한 게시글 수 반환"""
+        count = 0
+        ts = datetime.now()
+        for post in posts:
+            url = post.get('url', '')
+            channel = post.get('channel') or detect_channel(url)
+            post_id = extract_post_id(channel, url) if channel else None
+            if post_id is None:
+                continue
+            self.record(channel, post_id, url, post, source,
+                        title=post.get('title'), created_at=post.get('created_at'), ts=ts)
+            count += 1
+        self.conn.commit()
+        return count
+
+    def tracked(self, channel: str, since: datetime) -> Dict[int, Dict]:
+        """since 이후 처음 발견된 추적 대상 게시글 (post_id → 게시글 정보)"""
+        rows = self.conn.execute(
+            "SELECT * FROM tracked_posts WHERE channel = ? AND first_seen >= ?",
+            (channel, _to_text(since)),
+        ).fetchall()
+        return {row['post_id']: dict(row) for row in rows}
+
+    def series(self, channel: str, post_id: int) -> List[Dict]:
+        """게시글 지표 시계열 (시각 오름차순)"""
+        rows = self.conn.execute(
+            "SELECT ts, view_cnt, like_cnt, comment_cnt, source FROM engagement_snapshots "
+            "WHERE channel = ? AND post_id = ? ORDER BY ts",
+            (channel, post_id),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def record_post_snapshots(posts: List[Dict], source: str = 'detail'):
+    """run_* 스크립트용: 크롤링 결과 지표를 스냅샷으로 저장 (URL 중복 제거 전)"""
+    if not posts or not is_tracking_enabled():
+        return
+    try:
+        with EngagementStore() as store:
+            count = store.record_posts(posts, source=source)
+        print(f"📈 지표 스냅샷 저장: {count}건 ({store.path})")
+    except Exception as e:
+        print(f"⚠️ 지표 스냅샷 저장 오류: {e}")
+
+
+def default_track_since() -> datetime:
+    """ENGAGEMENT_TRACK_DAYS 환경변수 기준 추적 시작 시각 (기본값: 7일)"""
+    try:
+        days = int(os.getenv('ENGAGEMENT_TRACK_DAYS', '7'))
+    except ValueError:
+        days = 7
+    return datetime.now() - timedelta(days=days)
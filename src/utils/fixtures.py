@@ -0,0 +1,154 @@
+"""
+크롤링 응답을 기록/재생하는 픽스처 하네스 (오프라인, 결정적 추출 벤치마크용)
+
+- record: 목록/상세 페이지 응답을 채널별 디렉토리에 gzip으로 저장
+- replay: 저장된 응답을 context.route 또는 httpx transport로 제공 (네트워크 없이 크롤링)
+"""
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# 기록할 리소스 타입 (이미지/폰트/미디어는 추출에 필요 없으므로 제외)
+RECORD_RESOURCE_TYPES = ('document', 'script', 'stylesheet', 'xhr', 'fetch')
+
+# 재생 시 응답 헤더에서 제외할 항목 (본문은 이미 압축 해제된 상태로 저장됨)
+DROP_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+
+def fixture_key(method: str, url: str) -> str:
+    """요청 메서드 + URL(fragment 제외)로 픽스처 파일 키 생성"""
+    url = url.split('#', 1)[0]
+    return hashlib.sha1(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+
+class FixtureStore:
+    """채널별 픽스처 디렉토리 (index.json + <key>.gz 응답 본문 + items.json 목록 항목)"""
+
+    def __init__(self, root: str, channel: str):
+        self.dir = Path(root) / channel
+        self.index_path = self.dir / 'index.json'
+        self.items_path = self.dir / 'items.json'
+        self.index: Dict[str, Dict] = {}
+        if self.index_path.exists():
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+
+    def save(self, method: str, url: str, status: int, headers: Dict[str, str], body: bytes, resource_type: str = 'document'):
+        """응답 하나를 저장 (같은 URL은 마지막 응답으로 덮어씀)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        key = fixture_key(method, url)
+        with gzip.open(self.dir / f"{key}.gz", 'wb') as f:
+            f.write(body)
+        self.index[key] = {
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in DROP_HEADERS},
+            'resource_type': resource_type,
+        }
+
+    def load(self, method: str, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """저장된 응답 (status, headers, body) 반환, 없으면 None"""
+        key = fixture_key(method, url)
+        entry = self.index.get(key)
+        if not entry:
+            return None
+        with gzip.open(self.dir / f"{key}.gz", 'rb') as f:
+            body = f.read()
+        return entry['status'], entry['headers'], body
+
+    def save_items(self, items: List[Dict]):
+        """목록 페이지에서 수집한 게시글 항목 저장 (벤치마크에서 상세 추출 입력으로 사용)"""
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.items_path, 'w', encoding='utf-8') as f:
+            json.dump(items, f, ensure_ascii=False, indent=2)
+
+    def load_items(self) -> List[Dict]:
+        if not self.items_path.exists():
+            return []
+        with open(self.items_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def flush(self):
+        """index.json 저장"""
+        if not self.index:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=2)
+
+
+class FixtureRecorder:
+    """페이지 응답 이벤트를 받아 FixtureStore에 기록"""
+
+    def __init__(self, store: FixtureStore, resource_types: Tuple[str, ...] = RECORD_RESOURCE_TYPES):
+        self.store = store
+        self.resource_types = resource_types
+        self.recorded = 0
+
+    def attach(self, page):
+        page.on('response', self._on_response)
+
+    async def _on_response(self, response):
+        request = response.request
+        if request.resource_type not in self.resource_types:
+            return
+        try:
+            body = await response.body()
+        except Exception:
+            # 리다이렉트 응답 등 본문이 없는 경우
+            return
+        self.store.save(
+            request.method,
+            response.url,
+            response.status,
+            await response.all_headers(),
+            body,
+            request.resource_type,
+        )
+        self.recorded += 1
+
+
+class FixtureReplayer:
+    """저장된 응답을 Playwright route / httpx transport로 재생"""
+
+    def __init__(self, store: FixtureStore):
+        self.store = store
+        self.hits = 0
+        self.misses: List[str] = []
+
+    async def handle_route(self, route):
+        """context.route('**/*', ...) 핸들러: 기록에 없는 요청은 네트워크로 보내지 않고 중단"""
+        request = route.request
+        found = self.store.load(request.method, request.url)
+        if not found:
+            self.misses.append(request.url)
+            await route.abort()
+            return
+        status, headers, body = found
+        self.hits += 1
+        await route.fulfill(status=status, headers=headers, body=body)
+
+    def _handle_httpx(self, request: httpx.Request) -> httpx.Response:
+        found = self.store.load(request.method, str(request.url))
+        if not found:
+            self.misses.append(str(request.url))
+            return httpx.Response(404, request=request)
+        status, headers, body = found
+        self.hits += 1
+        return httpx.Response(status, headers=headers, content=body, request=request)
+
+    def httpx_transport(self) -> httpx.MockTransport:
+        """httpx.AsyncClient(transport=...)에 넘길 재생용 transport"""
+        return httpx.MockTransport(self._handle_httpx)
+
+
+def get_fixture_mode() -> str:
+    """FIXTURE_MODE 환경변수 ('record' | 'replay' | '')"""
+    mode = os.getenv('FIXTURE_MODE', '').strip().lower()
+    return mode if mode in ('record', 'replay') else ''
@@ -1,13 +1,41 @@
 """
 JSON 파일들을 CSV 형식으로 변환하여 community_data.csv에 추가하는 유틸리티
 """
+import codecs
+import hashlib
 import json
 import os
 import csv
+import queue
+import threading
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
+from src.utils.canonical_url import normalize_url
+from src.utils.near_dup import NearDupIndex, is_near_dup_enabled
+
+
+CSV_FIELDNAMES = [
+    'id', 'channel', 'category', 'title', 'content',
+    'view_cnt', 'like_cnt', 'comment_cnt', 'created_at',
+    'own_company', 'url', 'dup_group'
+]
+
+
+@contextmanager
+def open_near_dup_index():
+    """유사 중복 인덱스 (NEAR_DUP_ENABLED=false면 None)"""
+    if not is_near_dup_enabled():
+        yield None
+        return
+    with NearDupIndex() as index:
+        yield index
+        if index.matched:
+            print(f"🔍 유사 중복 게시글 {index.matched}개를 기존 dup_group에 연결")
+
 
 def get_last_id_and_existing_urls(csv_path: str) -> Tuple[int, set]:
     """기존 CSV 파일에서 마지막 id와 기존 URL들을 가져옴"""
@@ -28,10 +56,10 @@ def get_last_id_and_existing_urls(csv_path: str) -> Tuple[int, set]:
                 except (ValueError, TypeError):
                     pass
                 
-                # 기존 URL 수집 (중복 체크용)
+                # 기존 URL 수집 (중복 체크용, 정규화된 URL 기준)
                 url = row.get('url', '').strip()
                 if url:
-                    existing_urls.add(url)
+                    existing_urls.add(normalize_url(url))
             
             return last_id, existing_urls
     except Exception as e:
@@ -39,27 +67,250 @@ def get_last_id_and_existing_urls(csv_path: str) -> Tuple[int, set]:
         return 0, set()
 
 
-def load_json_files(outputs_dir: str) -> List[Dict]:
-    """outputs 디렉토리에서 모든 JSON 파일을 읽어서 합침"""
-    all_posts = []
-    json_files = sorted(Path(outputs_dir).glob("*.json"))
-    
-    for json_file in json_files:
+# 스트리밍 읽기 단위 (byte) / 리더 → 변환 단계로 넘기는 묶음 크기 / CSV 쓰기 묶음 크기
+READ_CHUNK_BYTES = 1024 * 1024
+RECORD_BATCH_SIZE = 500
+WRITE_CHUNK_ROWS = 5000
+
+
+def _iter_array_items(chunks: Iterator[str]) -> Iterator[Dict]:
+    """최상위 JSON 배열을 원소 단위로 점진적으로 파싱 (파일 전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        # 공백/구분자 건너뛰기
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if not started and pos < len(buffer):
+            if buffer[pos] != '[':
+                raise ValueError("최상위가 JSON 배열이 아닙니다")
+            started = True
+            pos += 1
+            continue
+        if started and pos < len(buffer) and buffer[pos] == ']':
+            return
+        if pos < len(buffer):
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                yield item
+                pos = end
+                continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+        elif eof:
+            return
+        # 원소가 청크 경계에 걸친 경우 다음 청크를 이어 붙여 재시도
+        chunk = next(chunks, None)
+        if chunk is None:
+            eof = True
+        else:
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def _read_text_chunks(path: Path, digest) -> Iterator[str]:
+    """파일을 청크 단위로 읽어 UTF-8 텍스트로 반환하면서 sha256 갱신"""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        while True:
+            raw = f.read(READ_CHUNK_BYTES)
+            if not raw:
+                tail = decoder.decode(b'', final=True)
+                if tail:
+                    yield tail
+                return
+            digest.update(raw)
+            yield decoder.decode(raw)
+
+
+def iter_json_records(path: Path, digest=None) -> Iterator[Dict]:
+    """JSON 배열(.json) 또는 JSON Lines(.jsonl) 파일의 게시글을 하나씩 반환"""
+    digest = digest or hashlib.sha256()
+    chunks = _read_text_chunks(path, digest)
+    if path.suffix == '.jsonl':
+        pending = ''
+        for chunk in chunks:
+            pending += chunk
+            *lines, pending = pending.split('\n')
+            for line in lines:
+                if line.strip():
+                    yield json.loads(line)
+        if pending.strip():
+            yield json.loads(pending)
+    else:
+        for item in _iter_array_items(chunks):
+            if isinstance(item, dict):
+                yield item
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for raw in iter(lambda: f.read(READ_CHUNK_BYTES), b''):
+            digest.update(raw)
+    return digest.hexdigest()
+
+
+class MergeManifest:
+    """이미 병합한 JSON 파일 기록 (경로 + mtime + sha256), CSV 옆에 <csv>.manifest.json으로 저장"""
+
+    def __init__(self, csv_path: str):
+        self.path = csv_path + '.manifest.json'
+        self.files: Dict[str, Dict] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.files = json.load(f).get('files', {})
+            except Exception as e:
+                print(f"⚠️ 병합 기록 읽기 오류: {e}")
+
+    def is_merged(self, path: Path) -> bool:
+        """같은 경로/mtime이면 병합된 것으로 보고, mtime만 바뀐 경우 내용 해시로 확인"""
+        entry = self.files.get(str(path.resolve()))
+        if not entry:
+            return False
+        stat = path.stat()
+        if entry['mtime'] == stat.st_mtime and entry['size'] == stat.st_size:
+            return True
+        if entry['size'] == stat.st_size and entry['sha256'] == file_sha256(path):
+            entry['mtime'] = stat.st_mtime
+            return True
+        return False
+
+    def mark(self, path: Path, sha256: str, records: int):
+        stat = path.stat()
+        self.files[str(path.resolve())] = {
+            'mtime': stat.st_mtime, 'size': stat.st_size, 'sha256': sha256, 'records': records,
+        }
+        self.save()
+
+    def reset(self):
+        self.files = {}
+        self.save()
+
+    def save(self):
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+_END = object()
+
+# 리더 스레드가 큐 자리를 기다리며 취소 여부를 확인하는 간격(초)
+PUT_POLL_SEC = 0.1
+
+
+def _put(out: "queue.Queue", item, cancel: threading.Event) -> bool:
+    """큐에 넣되 자리가 날 때까지 취소 여부를 확인하며 대기 (취소되면 False)"""
+    while not cancel.is_set():
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if isinstance(data, list):
-                    all_posts.extend(data)
-                    print(f"📄 {json_file.name}: {len(data)}개 게시글 로드")
-        except Exception as e:
-            print(f"⚠️ {json_file.name} 읽기 오류: {e}")
+            out.put(item, timeout=PUT_POLL_SEC)
+            return True
+        except queue.Full:
             continue
-    
-    return all_posts
+    return False
 
 
-def convert_to_csv_format(posts: List[Dict], start_id: int, existing_urls: set[str] = None) -> List[Dict]:
-    """JSON 형식의 게시글을 CSV 형식으로 변환하고 id 할당 (중복 제거)"""
+def _read_file_to_queue(path: Path, out: "queue.Queue", cancel: threading.Event) -> None:
+    """리더 스레드: 파일을 스트리밍 파싱해서 묶음 단위로 큐에 넣음 (큐가 차면 대기, 소비가 중단되면 종료)"""
+    digest = hashlib.sha256()
+    count = 0
+    try:
+        batch = []
+        for record in iter_json_records(path, digest):
+            batch.append(record)
+            if len(batch) >= RECORD_BATCH_SIZE:
+                if not _put(out, batch, cancel):
+                    return
+                count += len(batch)
+                batch = []
+        if batch:
+            if not _put(out, batch, cancel):
+                return
+            count += len(batch)
+        _put(out, (_END, digest.hexdigest(), count, None), cancel)
+    except Exception as e:
+        _put(out, (_END, None, count, e), cancel)
+
+
+def stream_json_files(
+    files: List[Path],
+    workers: int = 4,
+    on_file_done: Optional[Callable[[Path, Optional[str], int, Optional[Exception]], None]] = None,
+) -> Iterator[Dict]:
+    """
+    여러 JSON 파일을 스레드 풀로 동시에 읽되, 게시글은 파일 순서대로 하나씩 반환
+
+    현재 파일을 소비하는 동안 다음 workers-1개 파일을 미리 읽으며, 파일별 큐 크기가 제한되어 있어
+    메모리 사용량은 (workers x 큐 크기 x RECORD_BATCH_SIZE) 게시글로 제한된다.
+    소비 쪽이 중간에 멈추거나 예외를 내면 (제너레이터 close) 리더 스레드를 취소하고 큐를 비운 뒤 종료한다.
+    """
+    workers = max(1, workers)
+    executor = ThreadPoolExecutor(max_workers=workers)
+    cancel = threading.Event()
+    queues: Dict[int, "queue.Queue"] = {}
+
+    def submit(index: int):
+        if index < len(files) and index not in queues:
+            queues[index] = queue.Queue(maxsize=4)
+            executor.submit(_read_file_to_queue, files[index], queues[index], cancel)
+
+    try:
+        for index in range(min(workers, len(files))):
+            submit(index)
+        for index, path in enumerate(files):
+            submit(index)
+            current = queues[index]
+            while True:
+                entry = current.get()
+                if isinstance(entry, tuple) and entry and entry[0] is _END:
+                    _, sha256, count, error = entry
+                    if on_file_done:
+                        on_file_done(path, sha256, count, error)
+                    break
+                yield from entry
+            del queues[index]
+            submit(index + workers)
+    finally:
+        cancel.set()
+        # put에서 대기 중인 리더가 바로 빠져나오도록 남은 묶음 버림
+        for pending in queues.values():
+            while True:
+                try:
+                    pending.get_nowait()
+                except queue.Empty:
+                    break
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def list_json_files(outputs_dir: str) -> List[Path]:
+    """outputs 디렉토리의 JSON(.json) / JSON Lines(.jsonl) 파일 목록 (이름순)"""
+    return sorted(list(Path(outputs_dir).glob("*.json")) + list(Path(outputs_dir).glob("*.jsonl")))
+
+
+def load_json_files(outputs_dir: str) -> List[Dict]:
+    """outputs 디렉토리에서 모든 JSON 파일을 읽어서 합침 (소량 데이터용, 대량은 stream_json_files 사용)"""
+    def report(path: Path, sha256: Optional[str], count: int, error: Optional[Exception]):
+        if error:
+            print(f"⚠️ {path.name} 읽기 오류: {error}")
+        else:
+            print(f"📄 {path.name}: {count}개 게시글 로드")
+
+    return list(stream_json_files(list_json_files(outputs_dir), on_file_done=report))
+
+
+def convert_to_csv_format(
+    posts: List[Dict],
+    start_id: int,
+    existing_urls: set[str] = None,
+    near_dup: Optional[NearDupIndex] = None,
+) -> List[Dict]:
+    """JSON 형식의 게시글을 CSV 형식으로 변환하고 id 할당 (중복 제거, near_dup이 있으면 dup_group 태깅)"""
     if existing_urls is None:
         existing_urls = set()
     
@@ -69,9 +320,10 @@ def convert_to_csv_format(posts: List[Dict], start_id: int, existing_urls: set[s
     
     for post in posts:
         url = post.get('url', '').strip()
+        url_key = normalize_url(url)
         
-        # 중복 체크: URL이 이미 CSV에 있으면 스킵
-        if url and url in existing_urls:
+        # 중복 체크: 정규화된 URL이 이미 CSV에 있으면 스킵
+        if url and url_key in existing_urls:
             skipped_count += 1
             continue
         
@@ -89,13 +341,19 @@ def convert_to_csv_format(posts: List[Dict], start_id: int, existing_urls: set[s
             'comment_cnt': post.get('comment_cnt', 0) or 0,
             'created_at': post.get('created_at', ''),
             'own_company': post.get('own_company', 0) or 0,
-            'url': url
+            'url': url,
+            'dup_group': current_id,
         }
+        # 다른 URL의 유사 게시글(채널 간 같은 핫딜 등)이면 같은 그룹으로 묶음
+        if near_dup is not None:
+            csv_row['dup_group'] = near_dup.assign(
+                url_key or f"id:{current_id}", csv_row['title'], csv_row['content'], current_id
+            )
         
         csv_rows.append(csv_row)
         # 기존 URL 목록에 추가 (같은 배치 내 중복 방지)
         if url:
-            existing_urls.add(url)
+            existing_urls.add(url_key)
     
     if skipped_count > 0:
         print(f"⏭️  중복 제거: {skipped_count}개 게시글 스킵")
@@ -105,19 +363,22 @@ def convert_to_csv_format(posts: List[Dict], start_id: int, existing_urls: set[s
 
 def append_to_csv(csv_path: str, rows: List[Dict], append_mode: bool = True):
     """CSV 파일에 데이터 추가 또는 새로 작성"""
-    fieldnames = [
-        'id', 'channel', 'category', 'title', 'content',
-        'view_cnt', 'like_cnt', 'comment_cnt', 'created_at',
-        'own_company', 'url'
-    ]
+    fieldnames = CSV_FIELDNAMES
     
     file_exists = os.path.exists(csv_path)
     
     mode = 'a' if append_mode and file_exists else 'w'
     newline = ''  # CSV writer는 newline='' 필요
     
+    # 기존 파일에 추가할 때는 기존 헤더를 따름 (dup_group 열이 없는 이전 CSV 호환)
+    if mode == 'a':
+        with open(csv_path, 'r', encoding='utf-8', newline=newline) as f:
+            header = next(csv.reader(f), None)
+        if header:
+            fieldnames = header
+    
     with open(csv_path, mode, encoding='utf-8', newline=newline) as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL)
+        writer = csv.DictWriter(f, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL, extrasaction='ignore')
         
         # 헤더는 파일이 없거나 새로 작성할 때만
         if mode == 'w' or not file_exists:
@@ -151,8 +412,9 @@ def append_posts_to_csv(posts: List[Dict], csv_path: Optional[str] = None):
     last_id, existing_urls = get_last_id_and_existing_urls(csv_path)
     print(f"📊 마지막 ID: {last_id}, 기존 게시글 수: {len(existing_urls)}개")
     
-    # 2. CSV 형식으로 변환 (중복 제거)
-    csv_rows = convert_to_csv_format(posts, last_id, existing_urls)
+    # 2. CSV 형식으로 변환 (중복 제거, 유사 중복 dup_group 태깅)
+    with open_near_dup_index() as near_dup:
+        csv_rows = convert_to_csv_format(posts, last_id, existing_urls, near_dup)
     
     if csv_rows:
         print(f"✅ {len(csv_rows)}개 게시글 변환 완료 (ID: {last_id + 1} ~ {last_id + len(csv_rows)})")
@@ -170,53 +432,98 @@ def append_posts_to_csv(posts: List[Dict], csv_path: Optional[str] = None):
 def merge_json_to_csv(
     outputs_dir: Optional[str] = None,
     csv_path: Optional[str] = None,
-    append: bool = True
+    append: bool = True,
+    workers: Optional[int] = None,
+    chunk_rows: int = WRITE_CHUNK_ROWS,
 ):
     """
-    JSON 파일들을 읽어서 CSV로 변환
+    JSON 파일들을 스트리밍으로 읽어서 CSV로 변환
     
     Args:
         outputs_dir: outputs 디렉토리 경로 (기본값: ./outputs)
         csv_path: 출력할 CSV 파일 경로 (기본값: ./community_data.csv)
-        append: 기존 CSV에 추가할지 여부 (False면 새로 작성)
+        append: 기존 CSV에 추가할지 여부 (False면 새로 작성, 병합 기록도 초기화)
+        workers: 동시에 읽을 파일 수 (기본값: MERGE_READ_WORKERS 또는 4)
+        chunk_rows: CSV에 한 번에 쓰는 최대 행 수
     """
     # 기본 경로 설정
     if outputs_dir is None:
         outputs_dir = os.path.join(os.getcwd(), "outputs")
     if csv_path is None:
         csv_path = os.path.join(os.getcwd(), "community_data.csv")
+    if workers is None:
+        workers = int(os.getenv('MERGE_READ_WORKERS', '4'))
     
     print(f"🔄 JSON → CSV 변환 시작")
     print(f"📁 JSON 디렉토리: {outputs_dir}")
     print(f"📁 CSV 파일: {csv_path}")
     
     # 1. 기존 CSV에서 마지막 id와 기존 URL 목록 확인
+    manifest = MergeManifest(csv_path)
     if append:
         last_id, existing_urls = get_last_id_and_existing_urls(csv_path)
         print(f"📊 마지막 ID: {last_id}, 기존 게시글 수: {len(existing_urls)}개")
     else:
         last_id = 0
         existing_urls = set()
+        manifest.reset()
         print(f"📊 새 파일 생성 (ID: 1부터 시작)")
     
-    # 2. JSON 파일들 로드
-    all_posts = load_json_files(outputs_dir)
-    print(f"📦 총 {len(all_posts)}개 게시글 로드 완료")
-    
-    if not all_posts:
+    # 2. 병합 대상 파일 선정 (경로 + mtime + 해시로 이미 병합한 파일 제외)
+    files = list_json_files(outputs_dir)
+    pending_files = [path for path in files if not manifest.is_merged(path)]
+    if len(pending_files) < len(files):
+        print(f"⏭️  이미 병합한 파일 {len(files) - len(pending_files)}개 건너뜀")
+    if not pending_files:
         print("⚠️ 변환할 데이터가 없습니다.")
+        manifest.save()
         return
     
-    # 3. CSV 형식으로 변환 (중복 제거)
-    csv_rows = convert_to_csv_format(all_posts, last_id, existing_urls)
+    # 3. 스트리밍 변환 + 묶음 단위 CSV 저장 (중복 제거)
+    state = {'next_id': last_id, 'loaded': 0, 'written': 0, 'append': append}
+    chunk: List[Dict] = []
+    near_dup_context = open_near_dup_index()
+    near_dup = near_dup_context.__enter__()
     
-    if csv_rows:
-        print(f"✅ {len(csv_rows)}개 게시글 변환 완료 (ID: {last_id + 1} ~ {last_id + len(csv_rows)})")
-        
-        # 4. CSV 파일에 저장
-        append_to_csv(csv_path, csv_rows, append)
+    def flush():
+        if not chunk:
+            return
+        rows = convert_to_csv_format(chunk, state['next_id'], existing_urls, near_dup)
+        if near_dup is not None:
+            near_dup.commit()
+        if rows:
+            append_to_csv(csv_path, rows, state['append'])
+            state['append'] = True
+            state['next_id'] += len(rows)
+            state['written'] += len(rows)
+        chunk.clear()
+    
+    def on_file_done(path: Path, sha256: Optional[str], count: int, error: Optional[Exception]):
+        if error:
+            print(f"⚠️ {path.name} 읽기 오류: {error}")
+            return
+        # 파일의 마지막 묶음까지 쓴 뒤에 병합 완료로 기록
+        flush()
+        manifest.mark(path, sha256, count)
+        print(f"📄 {path.name}: {count}개 게시글 처리")
+    
+    try:
+        # 변환/저장 오류로 중단되면 바로 close해서 리더 스레드 정리
+        with closing(stream_json_files(pending_files, workers=workers, on_file_done=on_file_done)) as posts:
+            for post in posts:
+                chunk.append(post)
+                state['loaded'] += 1
+                if len(chunk) >= chunk_rows:
+                    flush()
+        flush()
+    finally:
+        near_dup_context.__exit__(None, None, None)
+    
+    print(f"📦 총 {state['loaded']}개 게시글 로드 완료")
+    if state['written']:
+        print(f"✅ {state['written']}개 게시글 변환 완료 (ID: {last_id + 1} ~ {state['next_id']})")
         print(f"💾 CSV 파일 저장 완료: {csv_path}")
-        print(f"📊 총 {len(csv_rows)}개 게시글 추가됨")
+        print(f"📊 총 {state['written']}개 게시글 추가됨")
     else:
         print("⚠️ 추가할 새 게시글이 없습니다 (모두 중복)")
 
@@ -224,7 +531,10 @@ def merge_json_to_csv(
 if __name__ == "__main__":
     import argparse
     
-    parser = argparse.ArgumentParser(description="JSON 파일들을 CSV로 변환")
+    from src.utils.post_index import add_query_arguments, run_query
+    from src.utils.change_feed import add_export_arguments, run_export
+    
+    parser = argparse.ArgumentParser(description="JSON 파일들을 CSV로 변환 (query: 색인 조회, export: 소비자별 변경분 내보내기)")
     parser.add_argument(
         "--outputs-dir",
         type=str,
@@ -242,12 +552,32 @@ if __name__ == "__main__":
         action="store_true",
         help="기존 CSV를 덮어쓰고 새로 작성"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="동시에 읽을 JSON 파일 수 (기본값: MERGE_READ_WORKERS 또는 4)"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command")
+    query_parser = subparsers.add_parser("query", help="채널/작성일/자사 여부/최소 지표/키워드로 게시글 조회 (SQLite FTS5 색인)")
+    add_query_arguments(query_parser)
+    export_parser = subparsers.add_parser("export", help="소비자 커서 이후 추가/변경된 게시글만 묶음 단위로 내보내기")
+    add_export_arguments(export_parser)
     
     args = parser.parse_args()
     
+    if args.command == "query":
+        run_query(args)
+        raise SystemExit(0)
+    if args.command == "export":
+        run_export(args)
+        raise SystemExit(0)
+    
     merge_json_to_csv(
         outputs_dir=args.outputs_dir,
         csv_path=args.csv_path,
-        append=not args.new
+        append=not args.new,
+        workers=args.workers
     )
 
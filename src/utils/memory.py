@@ -0,0 +1,100 @@
+"""
+Python 프로세스와 브라우저 프로세스의 메모리(RSS) 측정
+
+브라우저 RSS는 현재 프로세스의 하위 프로세스(Playwright 드라이버 + Chromium) RSS 합계로,
+/proc를 읽을 수 있는 Linux에서만 측정된다 (그 외 플랫폼은 None).
+"""
+import os
+import sys
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def python_peak_rss_mb() -> Optional[float]:
+    """현재 Python 프로세스의 최대 RSS (MB)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _children_map() -> Dict[int, List[int]]:
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # comm에 공백/괄호가 있을 수 있으므로 마지막 ')' 이후부터 파싱
+        ppid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def _rss_kb(pid: int) -> int:
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def current_rss_mb(pid: Optional[int] = None) -> Optional[float]:
+    """프로세스(기본: 현재 프로세스)의 현재 RSS (MB)"""
+    if not os.path.isdir('/proc'):
+        return None
+    return _rss_kb(pid or os.getpid()) / 1024
+
+
+def descendants_rss_mb(root_pid: Optional[int] = None) -> Optional[float]:
+    """root_pid(기본: 현재 프로세스)의 모든 하위 프로세스 RSS 합계 (MB)"""
+    if not os.path.isdir('/proc'):
+        return None
+    root_pid = root_pid or os.getpid()
+    try:
+        children = _children_map()
+    except OSError:
+        return None
+    total = 0
+    stack = list(children.get(root_pid, []))
+    while stack:
+        pid = stack.pop()
+        total += _rss_kb(pid)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+class MemoryMonitor:
+    """실행 중 RSS를 주기적으로 측정하고 최대값 기록"""
+
+    def __init__(self):
+        self.browser_mb: Optional[float] = None
+        self.browser_peak_mb: Optional[float] = None
+        self.samples = 0
+
+    def sample(self) -> Optional[float]:
+        """브라우저 RSS 측정 (MB), 최대값 갱신"""
+        self.browser_mb = descendants_rss_mb()
+        self.samples += 1
+        if self.browser_mb is not None:
+            self.browser_peak_mb = max(self.browser_peak_mb or 0.0, self.browser_mb)
+        return self.browser_mb
+
+    def report(self, recycled: int = 0):
+        self.sample()
+        python_mb = python_peak_rss_mb()
+        python = f"{python_mb:.0f}MB" if python_mb is not None else "측정 불가"
+        browser = f"{self.browser_peak_mb:.0f}MB" if self.browser_peak_mb is not None else "측정 불가"
+        print(f"🫛 최대 메모리: Python {python}, 브라우저 {browser} "
+              f"(측정 {self.samples}회, 페이지 재생성 {recycled}회)")
@@ -0,0 +1,206 @@
+"""
+채널 간 유사 중복 게시글 탐지 (MinHash + LSH, SQLite에 인덱스 유지)
+
+같은 핫딜이 에펨코리아/뽐뿌/카페에 URL만 다르게 올라오므로, 정규화한 제목+본문의
+문자 n-gram MinHash 서명을 밴드로 나눠 버킷에 저장하고, 같은 버킷의 후보만 비교해서
+(전체 비교 없이) 추정 Jaccard 유사도가 임계값 이상이면 같은 dup_group으로 묶는다.
+dup_group은 묶음에서 처음 저장된 게시글의 CSV id이다.
+"""
+import csv
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import unicodedata
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+# MinHash 순열 수 = BANDS x ROWS_PER_BAND (추정 유사도 0.6에서 후보가 될 확률 약 89%)
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 5
+# 상용구가 많은 게시글로 버킷이 커져도 비교 비용이 제한되도록 버킷당 후보 수 제한
+MAX_BUCKET_CANDIDATES = 200
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_rng = random.Random(20240601)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME)) for _ in range(NUM_PERM)]
+
+_URL_RE = re.compile(r'https?://\S+')
+_NON_WORD_RE = re.compile(r'[\W_]+', re.UNICODE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS signatures (
+    post_key TEXT PRIMARY KEY,
+    dup_group INTEGER NOT NULL,
+    signature BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lsh_buckets (
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    post_key TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_lsh_buckets ON lsh_buckets (band, bucket);
+"""
+
+
+def normalize_text(title: str, content: str) -> str:
+    """NFKC 정규화, 소문자화, URL/기호/공백 제거"""
+    text = unicodedata.normalize('NFKC', f"{title or ''} {content or ''}").lower()
+    text = _URL_RE.sub(' ', text)
+    return _NON_WORD_RE.sub('', text)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _hash64(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def minhash(shingle_set: set) -> Optional[List[int]]:
+    """문자 n-gram 집합의 MinHash 서명 (비어 있으면 None)"""
+    if not shingle_set:
+        return None
+    hashes = [_hash64(s) for s in shingle_set]
+    return [
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def estimated_jaccard(sig_a: List[int], sig_b: List[int]) -> float:
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def _band_buckets(signature: List[int]) -> List[Tuple[int, int]]:
+    """(밴드 번호, 버킷 키) 목록 (버킷 키는 SQLite INTEGER에 맞는 부호 있는 64bit)"""
+    buckets = []
+    for band in range(BANDS):
+        rows = array('I', signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]).tobytes()
+        key = int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), 'little', signed=True)
+        buckets.append((band, key))
+    return buckets
+
+
+class NearDupIndex:
+    """MinHash LSH 인덱스 (SQLite 파일로 실행 간 유지)"""
+
+    def __init__(self, path: Optional[str] = None, threshold: Optional[float] = None):
+        self.path = path or os.getenv('NEAR_DUP_INDEX_PATH', '.near_dup.db')
+        self.threshold = threshold or float(os.getenv('NEAR_DUP_THRESHOLD', '0.6'))
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(SCHEMA)
+        self.matched = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.conn:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def commit(self):
+        self.conn.commit()
+
+    def assign(self, post_key: str, title: str, content: str, row_id: int) -> int:
+        """게시글의 dup_group 반환 (이미 인덱스에 있으면 저장된 그룹, 유사 게시글이 없으면 row_id)"""
+        row = self.conn.execute("SELECT dup_group FROM signatures WHERE post_key = ?", (post_key,)).fetchone()
+        if row:
+            return row[0]
+
+        signature = minhash(shingles(normalize_text(title, content)))
+        if signature is None:
+            return row_id
+
+        buckets = _band_buckets(signature)
+        group = self._find_group(signature, buckets)
+        if group is None:
+            group = row_id
+        else:
+            self.matched += 1
+
+        self.conn.execute(
+            "INSERT INTO signatures (post_key, dup_group, signature) VALUES (?, ?, ?)",
+            (post_key, group, array('I', signature).tobytes()),
+        )
+        self.conn.executemany(
+            "INSERT INTO lsh_buckets (band, bucket, post_key) VALUES (?, ?, ?)",
+            [(band, bucket, post_key) for band, bucket in buckets],
+        )
+        return group
+
+    def _find_group(self, signature: List[int], buckets: List[Tuple[int, int]]) -> Optional[int]:
+        """같은 버킷의 후보 중 추정 유사도가 가장 높은 게시글의 그룹"""
+        candidates = set()
+        for band, bucket in buckets:
+            for (key,) in self.conn.execute(
+                "SELECT post_key FROM lsh_buckets WHERE band = ? AND bucket = ? LIMIT ?", (band, bucket, MAX_BUCKET_CANDIDATES)
+            ):
+                candidates.add(key)
+        best_group, best_score = None, self.threshold
+        for key in candidates:
+            group, blob = self.conn.execute(
+                "SELECT dup_group, signature FROM signatures WHERE post_key = ?", (key,)
+            ).fetchone()
+            score = estimated_jaccard(signature, array('I', blob).tolist())
+            if score >= best_score:
+                best_group, best_score = group, score
+        return best_group
+
+    def stats(self) -> Dict[str, int]:
+        posts = self.conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        groups = self.conn.execute("SELECT COUNT(DISTINCT dup_group) FROM signatures").fetchone()[0]
+        return {'posts': posts, 'groups': groups}
+
+
+def is_near_dup_enabled() -> bool:
+    """NEAR_DUP_ENABLED 환경변수 (기본값: true)"""
+    return os.getenv('NEAR_DUP_ENABLED', 'true').lower() == 'true'
+
+
+def tag_csv(csv_path: str, index_path: Optional[str] = None, commit_every: int = 5000) -> None:
+    """기존 CSV 전체에 dup_group 열을 채워서 다시 작성 (행 단위 스트리밍)"""
+    from src.utils.canonical_url import normalize_url
+    from src.utils.json_to_csv import CSV_FIELDNAMES
+
+    tmp_path = csv_path + '.tmp'
+    with NearDupIndex(index_path) as index:
+        with open(csv_path, 'r', encoding='utf-8', newline='') as src, \
+                open(tmp_path, 'w', encoding='utf-8', newline='') as dst:
+            reader = csv.DictReader(src)
+            writer = csv.DictWriter(dst, fieldnames=CSV_FIELDNAMES, extrasaction='ignore')
+            writer.writeheader()
+            for count, row in enumerate(reader, 1):
+                row_id = int(row.get('id') or 0)
+                key = normalize_url(row.get('url', '')) or f"id:{row_id}"
+                row['dup_group'] = index.assign(key, row.get('title', ''), row.get('content', ''), row_id)
+                writer.writerow(row)
+                if count % commit_every == 0:
+                    index.commit()
+                    print(f"🔍 {count}개 처리 (유사 중복 {index.matched}개)")
+        stats = index.stats()
+    os.replace(tmp_path, csv_path)
+    print(f"✅ dup_group 태깅 완료: 게시글 {stats['posts']}개, 그룹 {stats['groups']}개 (이번 실행 유사 중복 {index.matched}개)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="유사 중복 게시글 dup_group 태깅")
+    parser.add_argument("--csv-path", type=str, default=None, help="대상 CSV 파일 경로 (기본값: ./community_data.csv)")
+    parser.add_argument("--index-path", type=str, default=None, help="LSH 인덱스 경로 (기본값: NEAR_DUP_INDEX_PATH 또는 ./.near_dup.db)")
+    args = parser.parse_args()
+
+    tag_csv(args.csv_path or os.path.join(os.getcwd(), "community_data.csv"), args.index_path)
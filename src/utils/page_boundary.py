@@ -0,0 +1,34 @@
+"""
+목록 게시판의 날짜 경계 페이지 탐색 (galloping + 이진 탐색)
+
+최신순 목록에서 "기간 밖" 여부는 페이지 번호에 대해 단조(앞쪽 False … 뒤쪽 True)라고 보고,
+1, 2, 4, 8… 페이지를 지수적으로 확인해 처음 기간 밖인 구간을 찾은 뒤 그 안에서 이진 탐색한다.
+페이지 1..N을 순서대로 여는 대신 O(log N)번만 열어서 경계를 찾는다.
+"""
+from typing import Awaitable, Callable, Tuple
+
+
+async def find_boundary_page(is_past: Callable[[int], Awaitable[bool]], max_pages: int) -> Tuple[int, int]:
+    """기간 밖인 첫 페이지 번호와 확인한 페이지 수 (max_pages까지 모두 기간 안이면 max_pages + 1)"""
+    probes = 0
+    inside = 0  # 기간 안으로 확인된 가장 뒤 페이지 (0: 없음)
+    page = 1
+    while True:
+        probes += 1
+        if await is_past(page):
+            outside = page
+            break
+        inside = page
+        if page >= max_pages:
+            return max_pages + 1, probes
+        page = min(page * 2, max_pages)
+
+    # inside < 경계 <= outside
+    while outside - inside > 1:
+        middle = (inside + outside) // 2
+        probes += 1
+        if await is_past(middle):
+            outside = middle
+        else:
+            inside = middle
+    return outside, probes
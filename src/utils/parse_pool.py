@@ -0,0 +1,112 @@
+"""
+HTTP 상세 페이지 fetch → 프로세스 풀 파싱 파이프라인
+
+BeautifulSoup 파싱과 정규식 정리는 CPU 작업이라 asyncio 루프를 막으므로 ProcessPoolExecutor로 보낸다.
+fetch 단계와 parse 단계 사이에는 크기가 제한된 큐를 두어, 파싱이 밀리면 fetch가 대기한다 (backpressure).
+"""
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.proxy_pool import NoHealthyProxyError
+
+
+def get_parse_workers() -> int:
+    """PARSE_WORKERS 환경변수 (기본값: CPU 코어 수)"""
+    value = os.getenv('PARSE_WORKERS', '').strip()
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            pass
+    return os.cpu_count() or 1
+
+
+class ParsePool:
+    """파싱 전용 프로세스 풀 (with 문 지원)"""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or get_parse_workers()
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.executor:
+            self.executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            self.executor = None
+
+    async def parse(self, parse_fn: Callable[[str, Dict], Optional[Dict]], html: str, item: Dict) -> Optional[Dict]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, parse_fn, html, item)
+
+
+async def run_fetch_parse_pipeline(
+    items: List[Dict],
+    fetch: Callable[[Dict], Awaitable[str]],
+    parse_fn: Callable[[str, Dict], Optional[Dict]],
+    pool: ParsePool,
+    fetch_concurrency: int = 4,
+    queue_size: Optional[int] = None,
+) -> List[Optional[Dict]]:
+    """
+    items를 fetch(item) → parse_fn(html, item) 순으로 처리하고 입력 순서대로 결과 반환
+
+    Args:
+        items: 목록 페이지에서 수집한 게시글 항목 (picklable dict)
+        fetch: 항목의 원본 HTML을 가져오는 코루틴 함수
+        parse_fn: 모듈 수준 파서 함수 (프로세스 풀에서 실행되므로 picklable 해야 함)
+        pool: 진입된 ParsePool
+        fetch_concurrency: 동시 fetch 수
+        queue_size: fetch → parse 사이 버퍼 크기 (기본값: 워커 수 x 2)
+    """
+    results: List[Optional[Dict]] = [None] * len(items)
+    pending: asyncio.Queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        pending.put_nowait((index, item))
+    fetched: asyncio.Queue = asyncio.Queue(maxsize=queue_size or pool.workers * 2)
+
+    async def fetcher():
+        while True:
+            try:
+                index, item = pending.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                html = await fetch(item)
+            except (CircuitOpenError, NoHealthyProxyError) as e:
+                # 호스트 서킷이 열렸거나 남은 프록시가 없어 수집 종료 (남은 항목은 결과 None)
+                print(f"🫛 fetch 중단: {e}")
+                return
+            except Exception as e:
+                print(f"🫛 게시글 {item.get('url', '')} fetch 오류: {e}")
+                continue
+            # 파싱이 밀려 버퍼가 가득 차면 여기서 대기
+            await fetched.put((index, item, html))
+
+    async def parser():
+        while True:
+            entry = await fetched.get()
+            if entry is None:
+                return
+            index, item, html = entry
+            try:
+                results[index] = await pool.parse(parse_fn, html, item)
+            except Exception as e:
+                print(f"🫛 게시글 {item.get('url', '')} 파싱 오류: {e}")
+
+    parsers = [asyncio.create_task(parser()) for _ in range(pool.workers)]
+    try:
+        await asyncio.gather(*(fetcher() for _ in range(max(1, fetch_concurrency))))
+        for _ in parsers:
+            await fetched.put(None)
+        await asyncio.gather(*parsers)
+    finally:
+        for task in parsers:
+            task.cancel()
+
+    return results
@@ -0,0 +1,168 @@
+"""
+크롤링 성능 기준값(baseline) 저장/비교
+
+run_benchmark의 e2e 측정 결과를 채널별 지표로 JSON 파일(기본값: benchmarks/perf_baseline.json)에 저장하고,
+비교 모드에서는 지표별 허용 범위(기본 15%)보다 나빠진 항목을 회귀로 보고한다.
+기준값 파일이나 채널 기준값이 없거나 측정 조건이 다르면 비교 없이 통과시키지 않고 실패로 처리한다.
+    posts_per_sec     높을수록 좋음
+    p50_ms, p95_ms    게시글 1개 상세 수집 지연 (낮을수록 좋음)
+    python_peak_mb    Python 프로세스 최대 RSS
+    browser_peak_mb   브라우저(Playwright 드라이버 + Chromium) 최대 RSS
+    protocol_calls    Playwright 프로토콜 호출 수 (드라이버를 거쳐 CDP 명령으로 이어지는 호출)
+"""
+import json
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+DEFAULT_BASELINE_PATH = os.path.join('benchmarks', 'perf_baseline.json')
+DEFAULT_THRESHOLD = 0.15
+
+# 지표 → 좋아지는 방향
+METRICS = {
+    'posts_per_sec': 'higher',
+    'p50_ms': 'lower',
+    'p95_ms': 'lower',
+    'python_peak_mb': 'lower',
+    'browser_peak_mb': 'lower',
+    'protocol_calls': 'lower',
+}
+
+
+def percentile(samples: List[float], pct: float) -> Optional[float]:
+    """최근접 순위 백분위 (표본이 없으면 None)"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+class ProtocolCallCounter:
+    """Playwright 연결에서 서버(드라이버)로 보내는 메시지 수 집계
+
+    Python 클라이언트는 CDP를 직접 호출하지 않으므로 드라이버로 가는 호출 수를 CDP 호출 수의 대용으로 센다.
+    Playwright 내부 API(_connection)가 바뀌어 연결할 수 없으면 None을 보고한다.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.by_method: Dict[str, int] = {}
+        self._connection = None
+        self._original = None
+
+    def attach(self, playwright) -> bool:
+        connection = getattr(playwright, '_connection', None)
+        original = getattr(connection, '_send_message_to_server', None)
+        if original is None:
+            return False
+
+        def counted(object, method, params, *args, **kwargs):
+            self.calls += 1
+            self.by_method[method] = self.by_method.get(method, 0) + 1
+            return original(object, method, params, *args, **kwargs)
+
+        connection._send_message_to_server = counted
+        self._connection, self._original = connection, original
+        return True
+
+    def detach(self):
+        if self._connection is not None:
+            # 인스턴스 속성을 지워 클래스 메서드로 되돌림
+            del self._connection._send_message_to_server
+            self._connection = None
+
+    @property
+    def total(self) -> Optional[int]:
+        return self.calls if self._original is not None else None
+
+
+def load_baseline(path: str = DEFAULT_BASELINE_PATH) -> Optional[Dict]:
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(results: List[Dict], settings: Dict, path: str = DEFAULT_BASELINE_PATH) -> Dict:
+    """채널별 지표를 기준값 파일로 저장 (기존 파일의 다른 채널 값은 유지)"""
+    baseline = load_baseline(path) or {'channels': {}}
+    if baseline.get('settings') not in (None, settings):
+        print(f"⚠️ 측정 조건이 기존 기준값과 다릅니다. 다른 채널의 기준값을 지우고 새로 저장합니다")
+        baseline['channels'] = {}
+    baseline['version'] = 1
+    baseline['updated_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    baseline['settings'] = settings
+    for result in results:
+        baseline['channels'][result['channel']] = {name: result.get(name) for name in METRICS}
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+    return baseline
+
+
+def gate_problems(results: List[Dict], baseline: Optional[Dict], settings: Dict, channels: List[str]) -> List[str]:
+    """비교 자체가 성립하지 않는 이유 목록 (하나라도 있으면 회귀 검사 실패로 처리)
+
+    기준값 파일/채널이 없거나, 측정 조건이 다르거나, 측정에 실패한 채널이 있으면 비교 없이 통과하지 않도록 한다.
+    """
+    if baseline is None:
+        return ["기준값 파일 없음 (--save-baseline으로 먼저 저장)"]
+    problems = []
+    if baseline.get('settings') != settings:
+        problems.append(f"측정 조건이 기준값과 다름: {baseline.get('settings')} vs {settings}")
+    measured = {result['channel'] for result in results}
+    for channel in channels:
+        if channel not in measured:
+            problems.append(f"{channel}: 측정 실패 (결과 없음)")
+        elif channel not in baseline.get('channels', {}):
+            problems.append(f"{channel}: 기준값 없음")
+    return problems
+
+
+def compare(results: List[Dict], baseline: Dict, threshold: float = DEFAULT_THRESHOLD,
+            metric_thresholds: Optional[Dict[str, float]] = None) -> List[Dict]:
+    """기준값 대비 변화율 계산 → 지표별 비교 행 목록 (regressed=True가 회귀)"""
+    metric_thresholds = metric_thresholds or {}
+    rows = []
+    for result in results:
+        base = baseline.get('channels', {}).get(result['channel'])
+        if not base:
+            print(f"⚠️ {result['channel']}: 기준값 없음")
+            continue
+        for name, direction in METRICS.items():
+            before, after = base.get(name), result.get(name)
+            if before is None or after is None:
+                continue
+            limit = metric_thresholds.get(name, threshold)
+            if before == 0:
+                change = 0.0 if after == 0 else float('inf')
+            else:
+                change = (after - before) / before
+            worse = -change if direction == 'higher' else change
+            rows.append({
+                'channel': result['channel'],
+                'metric': name,
+                'baseline': before,
+                'current': after,
+                'change': change,
+                'threshold': limit,
+                'regressed': worse > limit,
+            })
+    return rows
+
+
+def print_comparison(rows: List[Dict]) -> bool:
+    """비교 결과 출력, 회귀가 있으면 True"""
+    print(f"\n{'='*60}")
+    print("📈 성능 기준값 비교")
+    print(f"{'='*60}")
+    regressed = False
+    for row in rows:
+        mark = '⚠️' if row['regressed'] else '✅'
+        regressed = regressed or row['regressed']
+        print(f"  {mark} {row['channel']:<10} {row['metric']:<16} {row['baseline']:>10} → {row['current']:>10} "
+              f"({row['change'] * 100:+.1f}%, 허용 {row['threshold'] * 100:.0f}%)")
+    print(f"{'='*60}\n")
+    return regressed
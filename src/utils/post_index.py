@@ -0,0 +1,450 @@
+"""
+수집 게시글 조회용 색인 저장소 (SQLite + FTS5)
+
+community_data.csv를 SQLite로 옮겨 채널/작성일/자사 여부/조회·추천·댓글 수에 인덱스를 두고,
+제목·본문은 FTS5(trigram) 전문 색인으로 검색해서 본문 전체를 매번 훑지 않고 조회한다.
+
+CSV는 뒤에 행을 추가하는 방식으로만 늘어나므로 마지막으로 읽은 byte 위치와 그 앞부분의 지문
+(처음/마지막 FINGERPRINT_BYTES의 해시)을 기록해 두고 다음 동기화 때 그 뒤만 읽는다.
+파일이 교체(dup_group 재태깅 등)되거나 줄었거나, 같은 파일을 제자리에서 다시 썼으면(--new)
+지문이 달라지므로 전체를 다시 읽되, 행 해시를 비교해서 실제로 바뀐 행만 갱신한다.
+
+행이 추가/변경/삭제될 때마다 단조 증가하는 seq(갱신 순번)를 부여하므로, 변경분 내보내기
+(change_feed)는 seq 인덱스로 소비자 커서 이후의 행만 읽는다.
+"""
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# 동기화 시 한 번에 넣는 행 수
+INSERT_BATCH_ROWS = 5000
+# trigram 색인은 3글자 이상만 MATCH로 찾을 수 있음 (더 짧으면 LIKE로 비교)
+MIN_FTS_CHARS = 3
+# 채널/작성일(+조회수) 인덱스로 좁힌 후보가 이 수 이하면 FTS 대신 후보 행에서 LIKE로 비교
+# (흔한 키워드는 FTS 문서 목록 전체를 읽는 비용이 후보 행 비교보다 큼)
+LIKE_CANDIDATE_LIMIT = 20000
+# 이미 읽은 구간의 지문에 쓰는 앞/뒤 byte 수 (제자리 재작성 감지)
+FINGERPRINT_BYTES = 64 * 1024
+
+QUERY_COLUMNS = [
+    'id', 'channel', 'category', 'title', 'content',
+    'view_cnt', 'like_cnt', 'comment_cnt', 'created_at',
+    'own_company', 'url', 'dup_group'
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY,
+    channel TEXT,
+    category TEXT,
+    title TEXT,
+    content TEXT,
+    view_cnt INTEGER,
+    like_cnt INTEGER,
+    comment_cnt INTEGER,
+    created_at TEXT,
+    own_company INTEGER,
+    url TEXT,
+    dup_group INTEGER,
+    seq INTEGER,
+    row_hash TEXT,
+    generation INTEGER,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_posts_channel_created ON posts (channel, created_at, view_cnt);
+CREATE INDEX IF NOT EXISTS idx_posts_created ON posts (created_at);
+CREATE INDEX IF NOT EXISTS idx_posts_own_created ON posts (own_company, created_at);
+CREATE INDEX IF NOT EXISTS idx_posts_views ON posts (view_cnt);
+CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+    title, content, content='posts', content_rowid='id', tokenize='trigram'
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# seq 열이 없던 색인(이전 버전)에 추가할 열
+CHANGE_COLUMNS = {
+    'seq': 'INTEGER',
+    'row_hash': 'TEXT',
+    'generation': 'INTEGER',
+    'deleted': 'INTEGER NOT NULL DEFAULT 0',
+}
+
+UPSERT_SQL = """
+INSERT INTO posts (id, channel, category, title, content, view_cnt, like_cnt, comment_cnt,
+                   created_at, own_company, url, dup_group, row_hash, seq, generation, deleted)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+ON CONFLICT(id) DO UPDATE SET
+    channel = excluded.channel, category = excluded.category, title = excluded.title,
+    content = excluded.content, view_cnt = excluded.view_cnt, like_cnt = excluded.like_cnt,
+    comment_cnt = excluded.comment_cnt, created_at = excluded.created_at,
+    own_company = excluded.own_company, url = excluded.url, dup_group = excluded.dup_group,
+    seq = CASE WHEN posts.row_hash IS NOT excluded.row_hash OR posts.deleted THEN excluded.seq ELSE posts.seq END,
+    row_hash = excluded.row_hash, generation = excluded.generation, deleted = 0
+"""
+
+
+def _to_int(value) -> int:
+    try:
+        return int(float(value)) if value not in (None, '') else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def normalize_created_at(value: str) -> str:
+    """작성일을 'YYYY-MM-DD HH:MM:SS'로 통일 (문자열 비교로 범위 검색, 파싱 실패면 빈 문자열)"""
+    value = (value or '').strip()
+    if not value:
+        return ''
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return ''
+    return parsed.replace(tzinfo=None).strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _iter_csv_lines(path: str, offset: int, size: int) -> Iterator[str]:
+    """offset부터 size까지의 줄 (동기화 도중 추가되는 행은 다음 동기화에서 읽음)"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        position = offset
+        while position < size:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8')
+
+
+def _csv_fingerprint(path: str, end: int) -> str:
+    """파일 [0, end) 구간의 처음/마지막 FINGERPRINT_BYTES 해시 (뒤에 추가만 했다면 값이 그대로)"""
+    digest = hashlib.blake2b(str(end).encode('ascii'), digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(end, FINGERPRINT_BYTES)))
+        if end > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, end - FINGERPRINT_BYTES))
+            digest.update(f.read(end - f.tell()))
+    return digest.hexdigest()
+
+
+def _row_hash(values: Tuple) -> str:
+    return hashlib.blake2b('\x1f'.join(str(v) for v in values).encode('utf-8'), digest_size=12).hexdigest()
+
+
+def _fts_phrase(keyword: str) -> str:
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+class PostIndex:
+    """CSV와 동기화되는 게시글 색인 (POST_INDEX_PATH, 기본값: .post_index.db)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('POST_INDEX_PATH', '.post_index.db')
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_seq ON posts (seq)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.conn:
+            self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def _migrate(self):
+        """갱신 순번 열이 없는 이전 색인이면 열을 추가하고 다음 동기화에서 전체를 다시 읽도록 표시"""
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(posts)")}
+        missing = [name for name in CHANGE_COLUMNS if name not in columns]
+        for name in missing:
+            self.conn.execute(f"ALTER TABLE posts ADD COLUMN {name} {CHANGE_COLUMNS[name]}")
+        if missing:
+            self.conn.execute("DELETE FROM meta WHERE key = 'csv_inode'")
+            self.conn.commit()
+
+    @property
+    def last_seq(self) -> int:
+        return int(self._meta('seq') or 0)
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, values: Dict[str, str]):
+        self.conn.executemany(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            list(values.items()),
+        )
+
+    def sync_csv(self, csv_path: str) -> Dict[str, int]:
+        """CSV에 추가된 행만 색인에 반영 (파일이 교체/재작성되었거나 줄었으면 전체를 다시 읽어 변경분만 갱신)"""
+        stat = os.stat(csv_path)
+        source = os.path.abspath(csv_path)
+        offset = int(self._meta('csv_offset') or 0)
+        header = json.loads(self._meta('csv_header') or 'null')
+        rebuild = (
+            self._meta('csv_path') != source
+            or self._meta('csv_inode') != str(stat.st_ino)
+            or stat.st_size < offset
+            or header is None
+            # 같은 inode를 제자리에서 다시 쓴 경우 (merge_json_to_csv --new)
+            or self._meta('csv_fingerprint') != _csv_fingerprint(csv_path, offset)
+        )
+        if not rebuild and stat.st_size == offset:
+            return {'added': 0, 'changed': 0, 'deleted': 0, 'rebuild': 0}
+
+        started = time.perf_counter()
+        seq_before = self.last_seq
+        generation = int(self._meta('generation') or 0)
+        if rebuild:
+            generation += 1
+            with open(csv_path, 'rb') as f:
+                first_line = f.readline()
+            header = next(csv.reader([first_line.decode('utf-8')]), [])
+            offset = len(first_line)
+
+        read = 0
+        batch: List[Tuple] = []
+        for row in csv.DictReader(_iter_csv_lines(csv_path, offset, stat.st_size), fieldnames=header):
+            batch.append((
+                _to_int(row.get('id')), row.get('channel', ''), row.get('category', ''),
+                row.get('title', ''), row.get('content', ''),
+                _to_int(row.get('view_cnt')), _to_int(row.get('like_cnt')), _to_int(row.get('comment_cnt')),
+                normalize_created_at(row.get('created_at', '')), _to_int(row.get('own_company')),
+                row.get('url', ''), _to_int(row.get('dup_group')) or _to_int(row.get('id')),
+            ))
+            if len(batch) >= INSERT_BATCH_ROWS:
+                read += self._upsert(batch, generation, with_fts=not rebuild)
+                batch = []
+        if batch:
+            read += self._upsert(batch, generation, with_fts=not rebuild)
+        deleted = 0
+        if rebuild:
+            deleted = self._mark_deleted(generation)
+            # 대량 적재는 FTS를 한 번에 재구성하는 편이 행 단위 갱신보다 빠름
+            self.conn.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+        changed = self.conn.execute(
+            "SELECT COUNT(*) FROM posts WHERE seq > ? AND deleted = 0", (seq_before,)
+        ).fetchone()[0]
+        self._set_meta({
+            'csv_path': source,
+            'csv_inode': str(stat.st_ino),
+            'csv_offset': str(stat.st_size),
+            'csv_fingerprint': _csv_fingerprint(csv_path, stat.st_size),
+            'csv_header': json.dumps(header, ensure_ascii=False),
+            'generation': str(generation),
+        })
+        self.conn.commit()
+        elapsed = time.perf_counter() - started
+        print(f"🔍 색인 {'전체 재확인' if rebuild else '동기화'}: {read}개 행 읽음, 추가/변경 {changed}개, 삭제 {deleted}개 "
+              f"({elapsed:.1f}s, {self.path})", file=sys.stderr)
+        return {'added': read, 'changed': changed, 'deleted': deleted, 'rebuild': int(rebuild)}
+
+    def _next_seqs(self, count: int) -> int:
+        """갱신 순번 count개 예약, 첫 번호 반환"""
+        first = self.last_seq + 1
+        self._set_meta({'seq': str(first + count - 1)})
+        return first
+
+    def _upsert(self, batch: List[Tuple], generation: int, with_fts: bool) -> int:
+        """행 묶음 반영 (해시가 같은 기존 행은 seq 유지, 추가 행은 FTS에도 반영)"""
+        existing: Dict[int, Tuple] = {}
+        if with_fts:
+            ids = [row[0] for row in batch]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                for row in self.conn.execute(
+                    f"SELECT id, title, content FROM posts WHERE id IN ({', '.join('?' for _ in chunk)})", chunk
+                ):
+                    existing[row[0]] = (row[1], row[2])
+            # 외부 콘텐츠 FTS는 기존 값을 먼저 지워야 함
+            self.conn.executemany(
+                "INSERT INTO posts_fts (posts_fts, rowid, title, content) VALUES ('delete', ?, ?, ?)",
+                [(post_id, title, content) for post_id, (title, content) in existing.items()],
+            )
+        first_seq = self._next_seqs(len(batch))
+        self.conn.executemany(
+            UPSERT_SQL,
+            [row + (_row_hash(row), first_seq + i, generation) for i, row in enumerate(batch)],
+        )
+        if with_fts:
+            self.conn.executemany(
+                "INSERT INTO posts_fts (rowid, title, content) VALUES (?, ?, ?)",
+                [(row[0], row[3], row[4]) for row in batch],
+            )
+        return len(batch)
+
+    def _mark_deleted(self, generation: int) -> int:
+        """전체 재확인에서 보이지 않은 행을 삭제 표시 (변경분 내보내기에 delete로 전달)"""
+        stale = [row[0] for row in self.conn.execute(
+            "SELECT id FROM posts WHERE deleted = 0 AND generation IS NOT ?", (generation,)
+        )]
+        if stale:
+            first_seq = self._next_seqs(len(stale))
+            self.conn.executemany(
+                "UPDATE posts SET deleted = 1, seq = ? WHERE id = ?",
+                [(first_seq + i, post_id) for i, post_id in enumerate(stale)],
+            )
+        return len(stale)
+
+    def _candidate_count(self, channels: Optional[List[str]], since: Optional[datetime],
+                         until: Optional[datetime]) -> int:
+        """채널/작성일 조건만으로 좁힌 후보 수 (인덱스만 읽음, 조건이 없으면 전체 행 수)"""
+        where: List[str] = []
+        params: List = []
+        if channels:
+            where.append(f"channel IN ({', '.join('?' for _ in channels)})")
+            params.extend(channels)
+        if since:
+            where.append("created_at >= ?")
+            params.append(since.strftime('%Y-%m-%d %H:%M:%S'))
+        if until:
+            where.append("created_at < ?")
+            params.append(until.strftime('%Y-%m-%d %H:%M:%S'))
+        if not where:
+            return self.conn.execute("SELECT MAX(rowid) FROM posts").fetchone()[0] or 0
+        sql = "SELECT COUNT(*) FROM posts WHERE " + " AND ".join(where)
+        return self.conn.execute(sql, params).fetchone()[0]
+
+    def query(
+        self,
+        channels: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        own_company: Optional[int] = None,
+        min_views: Optional[int] = None,
+        min_likes: Optional[int] = None,
+        min_comments: Optional[int] = None,
+        keyword: Optional[str] = None,
+        text: Optional[str] = None,
+        order_by: str = 'created_at',
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """조건에 맞는 게시글 (keyword: 제목, text: 제목+본문)"""
+        where: List[str] = ["p.deleted = 0"]
+        params: List = []
+        if channels:
+            where.append(f"p.channel IN ({', '.join('?' for _ in channels)})")
+            params.extend(channels)
+        if since:
+            where.append("p.created_at >= ?")
+            params.append(since.strftime('%Y-%m-%d %H:%M:%S'))
+        if until:
+            where.append("p.created_at < ?")
+            params.append(until.strftime('%Y-%m-%d %H:%M:%S'))
+        if own_company is not None:
+            where.append("p.own_company = ?")
+            params.append(own_company)
+        for column, minimum in (('view_cnt', min_views), ('like_cnt', min_likes), ('comment_cnt', min_comments)):
+            if minimum is not None:
+                where.append(f"p.{column} >= ?")
+                params.append(minimum)
+        use_fts = (keyword or text) and self._candidate_count(channels, since, until) > LIKE_CANDIDATE_LIMIT
+        for columns, term in (('title', keyword), ('{title content}', text)):
+            if not term:
+                continue
+            if use_fts and len(term) >= MIN_FTS_CHARS:
+                where.append("p.id IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)")
+                params.append(f"{columns} : {_fts_phrase(term)}")
+            elif columns == 'title':
+                where.append("p.title LIKE ?")
+                params.append(f"%{term}%")
+            else:
+                where.append("(p.title LIKE ? OR p.content LIKE ?)")
+                params.extend([f"%{term}%", f"%{term}%"])
+
+        if order_by not in ('created_at', 'view_cnt', 'like_cnt', 'comment_cnt', 'id'):
+            raise ValueError(f"정렬 기준은 created_at/view_cnt/like_cnt/comment_cnt/id 중 하나: {order_by}")
+        sql = f"SELECT {', '.join('p.' + c for c in QUERY_COLUMNS)} FROM posts p WHERE " + " AND ".join(where)
+        sql += f" ORDER BY p.{order_by} DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self.conn.execute(sql, params):
+            yield dict(row)
+
+
+def write_results(rows: Iterator[Dict], fmt: str, out) -> int:
+    """조회 결과를 CSV 또는 JSONL로 쓰고 행 수 반환"""
+    count = 0
+    if fmt == 'jsonl':
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + '\n')
+            count += 1
+        return count
+    writer = csv.DictWriter(out, fieldnames=QUERY_COLUMNS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _parse_day(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def add_query_arguments(parser) -> None:
+    """json_to_csv의 query 하위 명령 인자"""
+    parser.add_argument("--csv-path", type=str, default=None, help="원본 CSV 경로 (기본값: ./community_data.csv)")
+    parser.add_argument("--index-path", type=str, default=None, help="색인 경로 (기본값: POST_INDEX_PATH 또는 ./.post_index.db)")
+    parser.add_argument("--channel", action="append", help="채널 (여러 번 지정 가능, 예: ppomppu)")
+    parser.add_argument("--days", type=int, default=None, help="최근 N일 게시글")
+    parser.add_argument("--since", type=_parse_day, default=None, help="작성일 시작 (예: 2025-11-01)")
+    parser.add_argument("--until", type=_parse_day, default=None, help="작성일 끝, 미포함 (예: 2025-11-08)")
+    parser.add_argument("--own-company", type=int, choices=(0, 1), default=None, help="자사 언급 여부")
+    parser.add_argument("--min-views", type=int, default=None, help="최소 조회수")
+    parser.add_argument("--min-likes", type=int, default=None, help="최소 추천수")
+    parser.add_argument("--min-comments", type=int, default=None, help="최소 댓글수")
+    parser.add_argument("--keyword", type=str, default=None, help="제목 키워드")
+    parser.add_argument("--text", type=str, default=None, help="제목+본문 키워드")
+    parser.add_argument("--order-by", type=str, default="created_at", help="정렬 기준 (내림차순, 기본값: created_at)")
+    parser.add_argument("--limit", type=int, default=None, help="최대 결과 수")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv", help="출력 형식 (기본값: csv)")
+    parser.add_argument("--out", type=str, default=None, help="출력 파일 (기본값: 표준 출력)")
+    parser.add_argument("--no-sync", action="store_true", help="CSV 변경 확인 없이 기존 색인만 조회")
+
+
+def run_query(args) -> int:
+    """query 하위 명령 실행 (필요하면 CSV와 동기화 후 조회, 소요 시간은 stderr로 출력)"""
+    csv_path = args.csv_path or os.path.join(os.getcwd(), "community_data.csv")
+    since = args.since
+    if args.days:
+        since = max(since or datetime.min, datetime.now() - timedelta(days=args.days))
+    with PostIndex(args.index_path) as index:
+        if not args.no_sync:
+            if os.path.exists(csv_path):
+                index.sync_csv(csv_path)
+            else:
+                print(f"⚠️ CSV 파일이 없어 기존 색인만 조회합니다: {csv_path}", file=sys.stderr)
+        started = time.perf_counter()
+        rows = index.query(
+            channels=args.channel, since=since, until=args.until, own_company=args.own_company,
+            min_views=args.min_views, min_likes=args.min_likes, min_comments=args.min_comments,
+            keyword=args.keyword, text=args.text, order_by=args.order_by, limit=args.limit,
+        )
+        if args.out:
+            with open(args.out, 'w', encoding='utf-8', newline='') as f:
+                count = write_results(rows, args.format, f)
+        else:
+            count = write_results(rows, args.format, sys.stdout)
+        elapsed = time.perf_counter() - started
+    print(f"🔍 {count}개 게시글 ({elapsed * 1000:.1f}ms)", file=sys.stderr)
+    return count
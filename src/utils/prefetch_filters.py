@@ -0,0 +1,168 @@
+"""
+목록 단계 사전 필터 규칙 (상세 페이지 이동 전에 평가)
+
+채널별 제외 규칙을 설정 파일(JSON)로 선언하고, 목록 항목(url, title, dateText, category 등)에
+적용해서 상세 페이지를 열 필요가 없는 항목을 미리 걸러낸다. 규칙마다 막은 상세 요청 수를 집계한다.
+
+PREFETCH_RULES_PATH로 규칙 파일을 지정하면 기본 규칙 대신 사용한다:
+    {"rules": [
+        {"name": "kakaopay-referral", "channel": "mam2bebe", "type": "title_keywords",
+         "all": ["카카오페이"], "any": ["증권 추천인", "피자만들기 추천인"]},
+        {"name": "week-window", "channel": "*", "type": "date_window", "max_age_days": 7, "require_date": true}
+    ]}
+
+규칙 종류:
+    title_regex    제목이 pattern(정규식)과 일치하면 제외
+    title_keywords 제목에 all의 키워드가 모두, any의 키워드가 하나 이상 있으면 제외
+    category       category가 exclude에 있거나, include가 있는데 포함되지 않으면 제외 (카테고리가 없는 항목은 통과)
+    field_regex    field 값이 pattern과 일치하면 제외 (negate=true면 일치하지 않을 때 제외)
+    date_window    dateText가 max_age_days일보다 오래되면 제외 (require_date=true면 날짜 없음/파싱 실패도 제외)
+"""
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 날짜 규칙 판정 결과
+REASON_MATCHED = 'matched'
+REASON_TOO_OLD = 'too_old'
+REASON_NO_DATE = 'no_date'
+REASON_UNPARSED = 'unparsed'
+
+DEFAULT_RULES: List[Dict] = [
+    # 맘이베베: 카카오페이 추천인 홍보글
+    {'name': 'kakaopay-referral', 'channel': 'mam2bebe', 'type': 'title_keywords',
+     'all': ['카카오페이'], 'any': ['증권 추천인', '피자만들기 추천인']},
+    # 뽐뿌: 번호 칸이 숫자가 아닌 행 (공지, '-' 등)
+    {'name': 'ppomppu-notice', 'channel': 'ppomppu', 'type': 'field_regex',
+     'field': 'no', 'pattern': r'^\d+$', 'negate': True},
+    # 최근 일주일 (에펨코리아/뽐뿌는 날짜가 확인되는 게시글만)
+    {'name': 'week-window', 'channel': 'fmkorea', 'type': 'date_window', 'max_age_days': 7, 'require_date': True},
+    {'name': 'week-window', 'channel': 'ppomppu', 'type': 'date_window', 'max_age_days': 7, 'require_date': True},
+    {'name': 'week-window', 'channel': 'mam2bebe', 'type': 'date_window', 'max_age_days': 7, 'require_date': False},
+]
+
+RULE_TYPES = ('title_regex', 'title_keywords', 'category', 'field_regex', 'date_window')
+
+
+class FilterRule:
+    """선언된 규칙 하나 (match가 판정 사유를 반환하면 제외)"""
+
+    def __init__(self, spec: Dict):
+        self.name = spec.get('name') or spec.get('type', 'rule')
+        self.channel = spec.get('channel', '*')
+        self.type = spec.get('type')
+        if self.type not in RULE_TYPES:
+            raise ValueError(f"알 수 없는 사전 필터 규칙 종류: {self.type} ({self.name})")
+        self.pattern = re.compile(spec['pattern']) if spec.get('pattern') else None
+        self.field = spec.get('field', '')
+        self.negate = bool(spec.get('negate', False))
+        self.all_keywords: List[str] = spec.get('all', [])
+        self.any_keywords: List[str] = spec.get('any', [])
+        self.include = set(spec.get('include', []))
+        self.exclude = set(spec.get('exclude', []))
+        self.max_age_days = spec.get('max_age_days', 7)
+        self.require_date = bool(spec.get('require_date', False))
+        # 상세 단계(제목/카테고리만 있는 Post)에서도 평가할 수 있는 규칙인지
+        self.applies_to_post = self.type in ('title_regex', 'title_keywords', 'category')
+
+    def applies_to(self, channel: str) -> bool:
+        return self.channel in ('*', channel)
+
+    def window_start(self, now: datetime) -> datetime:
+        return now - timedelta(days=self.max_age_days)
+
+    def match(self, item: Dict, date_parser: Optional[Callable[[str], Optional[datetime]]] = None,
+              since: Optional[datetime] = None, now: Optional[datetime] = None) -> Optional[str]:
+        """제외 대상이면 판정 사유, 아니면 None"""
+        title = (item.get('title') or '').strip()
+        if self.type == 'title_regex':
+            return REASON_MATCHED if self.pattern.search(title) else None
+        if self.type == 'title_keywords':
+            if not all(keyword in title for keyword in self.all_keywords):
+                return None
+            if self.any_keywords and not any(keyword in title for keyword in self.any_keywords):
+                return None
+            return REASON_MATCHED
+        if self.type == 'category':
+            category = (item.get('category') or '').strip()
+            if not category:
+                return None
+            if category in self.exclude or (self.include and category not in self.include):
+                return REASON_MATCHED
+            return None
+        if self.type == 'field_regex':
+            matched = bool(self.pattern.search(str(item.get(self.field) or '').strip()))
+            return REASON_MATCHED if matched != self.negate else None
+        # date_window
+        date_text = item.get('dateText', '')
+        if not date_text:
+            return REASON_NO_DATE if self.require_date else None
+        post_date = date_parser(date_text) if date_parser else None
+        if post_date is None:
+            return REASON_UNPARSED if self.require_date else None
+        if post_date < (since or self.window_start(now or datetime.now())):
+            return REASON_TOO_OLD
+        return None
+
+
+def load_rules(path: Optional[str] = None) -> List[FilterRule]:
+    """PREFETCH_RULES_PATH JSON 규칙 로드 (없으면 기본 규칙)"""
+    path = path or os.getenv('PREFETCH_RULES_PATH', '')
+    specs = DEFAULT_RULES
+    if path and os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            specs = json.load(f).get('rules', [])
+    return [FilterRule(spec) for spec in specs if spec.get('enabled', True)]
+
+
+class PrefetchFilter:
+    """채널 하나의 사전 필터 (규칙 순서대로 평가, 처음 일치한 규칙에 막은 요청 수 집계)"""
+
+    def __init__(self, channel: str, rules: Optional[List[FilterRule]] = None,
+                 date_parser: Optional[Callable[[str], Optional[datetime]]] = None):
+        self.channel = channel
+        self.rules = [rule for rule in (rules if rules is not None else load_rules()) if rule.applies_to(channel)]
+        self.date_parser = date_parser
+        self.prevented: Dict[str, int] = {}
+        self.post_rejected: Dict[str, int] = {}
+        self.passed = 0
+
+    def window_start(self, since: Optional[datetime] = None) -> Optional[datetime]:
+        """날짜 규칙의 기준 시각 (날짜 규칙이 없으면 None)"""
+        if since:
+            return since
+        now = datetime.now()
+        starts = [rule.window_start(now) for rule in self.rules if rule.type == 'date_window']
+        return max(starts) if starts else None
+
+    def check(self, item: Dict, since: Optional[datetime] = None) -> Optional[Tuple[FilterRule, str]]:
+        """목록 항목 평가: 제외면 (규칙, 사유), 통과면 None"""
+        now = datetime.now()
+        for rule in self.rules:
+            reason = rule.match(item, self.date_parser, since=since, now=now)
+            if reason:
+                self.prevented[rule.name] = self.prevented.get(rule.name, 0) + 1
+                return rule, reason
+        self.passed += 1
+        return None
+
+    def check_post(self, title: str, category: str = '') -> Optional[FilterRule]:
+        """상세 추출 결과 평가 (목록에서 제목을 얻지 못한 항목용, 제목/카테고리 규칙만)"""
+        item = {'title': title, 'category': category}
+        for rule in self.rules:
+            if rule.applies_to_post and rule.match(item):
+                self.post_rejected[rule.name] = self.post_rejected.get(rule.name, 0) + 1
+                return rule
+        return None
+
+    def report(self):
+        """규칙별로 막은 상세 요청 수 출력"""
+        if not self.prevented and not self.post_rejected:
+            return
+        print(f"🫛 사전 필터: 상세 요청 {sum(self.prevented.values())}개 생략 (통과 {self.passed}개)")
+        for name, count in sorted(self.prevented.items(), key=lambda kv: -kv[1]):
+            print(f"  - {name}: {count}개")
+        for name, count in sorted(self.post_rejected.items(), key=lambda kv: -kv[1]):
+            print(f"  - {name} (상세 추출 후 제외): {count}개")
@@ -0,0 +1,93 @@
+"""
+호스트별 요청 속도 제한 (asyncio 토큰 버킷)
+
+상세 페이지 HTTP 수집, 댓글 수집 등 같은 사이트로 요청을 보내는 모든 단계가 하나의 제한기를 공유해서
+동시 작업 수와 관계없이 호스트당 초당 요청 수를 지킨다.
+    RATE_LIMIT_PER_SEC  호스트당 초당 요청 수 (기본값: 2)
+    RATE_LIMIT_BURST    한 번에 몰아서 보낼 수 있는 요청 수 (기본값: 2)
+"""
+import asyncio
+import os
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """토큰 버킷 하나 (rate개/초 충전, 최대 burst개)"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """지금 요청하면 기다려야 할 시간(초) 추정 (토큰은 쓰지 않음)"""
+        tokens = min(self.burst, self.tokens + (time.monotonic() - self.updated) * self.rate)
+        return 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+    async def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기, 대기한 시간(초) 반환"""
+        waited = 0.0
+        # 대기 순서를 지키도록 잠금 안에서 충전될 때까지 잠듦
+        async with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens < 1:
+                waited = (1 - self.tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill(time.monotonic())
+            self.tokens -= 1
+        return waited
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음"""
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        self.rate = rate or float(os.getenv('RATE_LIMIT_PER_SEC', '2'))
+        self.burst = burst or int(os.getenv('RATE_LIMIT_BURST', '2'))
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.requests: Dict[str, int] = {}
+        self.waited: Dict[str, float] = {}
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        return urlsplit(url_or_host).netloc.lower() if '://' in url_or_host else url_or_host.lower()
+
+    def wait_time(self, url_or_host: str) -> float:
+        bucket = self.buckets.get(self.host_of(url_or_host))
+        return bucket.wait_time() if bucket else 0.0
+
+    async def acquire(self, url_or_host: str):
+        """URL(또는 호스트)의 버킷에서 요청 1회 허가 받기"""
+        host = self.host_of(url_or_host)
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = TokenBucket(self.rate, self.burst)
+        waited = await bucket.acquire()
+        self.requests[host] = self.requests.get(host, 0) + 1
+        self.waited[host] = self.waited.get(host, 0.0) + waited
+
+    def report(self):
+        if not self.requests:
+            return
+        print(f"🫛 요청 속도 제한 (호스트당 {self.rate:g}회/초, 최대 {self.burst}회 연속):")
+        for host, count in sorted(self.requests.items()):
+            print(f"  - {host}: {count}회 요청, 대기 {self.waited.get(host, 0.0):.1f}s")
+
+
+_shared_limiter: Optional[HostRateLimiter] = None
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """프로세스에서 공유하는 제한기"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        _shared_limiter = HostRateLimiter()
+    return _shared_limiter
@@ -0,0 +1,150 @@
+"""
+사이트/필드별 대체 선택자 통계 저장소
+
+_extract_post_data의 선택자 목록을 과거에 성공한 순서대로 시도해서 query_selector 왕복을 줄인다.
+선택자 목록은 정확한 선택자가 앞, 범용 선택자(부분 일치 속성, text=, 태그만)가 뒤에 오도록 작성되어 있으므로
+순서는 같은 정밀도의 선택자가 연속된 구간 안에서만 바꾼다 (범용 선택자가 몇 페이지에서 적중해도
+그보다 앞의 정확한 선택자를 앞지르지 않아 추출 값이 달라지지 않음).
+통계는 JSON 파일로 실행 간 유지되며, 최근 성공 선택자 분포가 평소와 달라지면 (레이아웃 변경) 경고한다.
+"""
+import json
+import os
+import re
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# 레이아웃 변경 감지에 사용하는 최근 시도 수
+RECENT_WINDOW = 50
+# 최근 적중률이 장기 적중률과 이 값 이상 차이나면 경고
+SHIFT_THRESHOLD = 0.3
+# 경고 판단에 필요한 최소 최근 시도 수
+MIN_RECENT = 10
+
+BARE_TAG = re.compile(r'^[a-zA-Z][a-zA-Z0-9]*$')
+
+
+def is_generic_selector(sel: str) -> bool:
+    """범용 선택자 여부 (클래스 부분 일치, Playwright text=, 태그 이름만)"""
+    sel = sel.strip()
+    return '*=' in sel or sel.startswith('text=') or bool(BARE_TAG.match(sel))
+
+
+def precision_groups(selectors: List[str]) -> List[List[str]]:
+    """원래 순서에서 정밀도(정확/범용)가 같은 선택자가 연속된 구간 목록"""
+    groups: List[List[str]] = []
+    for sel in selectors:
+        if groups and is_generic_selector(groups[-1][0]) == is_generic_selector(sel):
+            groups[-1].append(sel)
+        else:
+            groups.append([sel])
+    return groups
+
+
+class SelectorTrial:
+    """선택자 목록 1회 시도 (적응 순서로 순회, 성공/실패 기록)"""
+
+    def __init__(self, stats: "SelectorStats", site: str, field: str, selectors: List[str]):
+        self.stats = stats
+        self.site = site
+        self.field = field
+        self.selectors = selectors
+        self.order = stats.ordered(site, field, selectors)
+        self.tried = 0
+        self.winner: Optional[str] = None
+
+    def __iter__(self):
+        for sel in self.order:
+            self.tried += 1
+            yield sel
+        # 모든 선택자 실패
+        if self.winner is None:
+            self.stats.record(self.site, self.field, self.selectors, None, self.tried)
+
+    def hit(self, sel: str):
+        """sel로 값을 얻었음을 기록 (루프 break 직전에 호출)"""
+        self.winner = sel
+        self.stats.record(self.site, self.field, self.selectors, sel, self.tried)
+
+
+class SelectorStats:
+    """사이트/필드별 선택자 적중 통계 (JSON 파일로 유지)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.getenv('SELECTOR_STATS_PATH', '.selector_stats.json')
+        self.data: Dict[str, Dict[str, Dict]] = {}
+        self.recent: Dict[str, Deque[Optional[str]]] = {}
+        self.alerted: set = set()
+        # 이번 실행에서 절약한 왕복 수 (사이트/필드별)
+        self.run_saved: Dict[str, int] = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.data = json.load(f)
+            except Exception as e:
+                print(f"⚠️ 선택자 통계 읽기 오류: {e}")
+                self.data = {}
+
+    def _field(self, site: str, field: str) -> Dict:
+        entry = self.data.setdefault(site, {}).setdefault(field, {})
+        entry.setdefault('selectors', {})
+        entry.setdefault('total', 0)
+        entry.setdefault('saved', 0)
+        return entry
+
+    def trial(self, site: str, field: str, selectors: List[str]) -> SelectorTrial:
+        return SelectorTrial(self, site, field, selectors)
+
+    def ordered(self, site: str, field: str, selectors: List[str]) -> List[str]:
+        """정밀도 구간마다 과거 적중 수가 많은 선택자부터 (구간 순서와 동률은 원래 순서 유지)"""
+        counts = self.data.get(site, {}).get(field, {}).get('selectors', {})
+        order: List[str] = []
+        for group in precision_groups(selectors):
+            order.extend(sorted(group, key=lambda sel: -counts.get(sel, {}).get('hits', 0)))
+        return order
+
+    def record(self, site: str, field: str, selectors: List[str], winner: Optional[str], tried: int):
+        entry = self._field(site, field)
+        entry['total'] += 1
+        if winner is not None:
+            stat = entry['selectors'].setdefault(winner, {'hits': 0})
+            stat['hits'] += 1
+            # 원래 순서였다면 winner까지 필요했을 시도 수 - 실제 시도 수
+            saved = selectors.index(winner) + 1 - tried
+            entry['saved'] += saved
+            key = f"{site}.{field}"
+            self.run_saved[key] = self.run_saved.get(key, 0) + saved
+
+        window = self.recent.setdefault(f"{site}.{field}", deque(maxlen=RECENT_WINDOW))
+        window.append(winner)
+        self._check_shift(site, field, entry, window)
+
+    def _check_shift(self, site: str, field: str, entry: Dict, window: Deque[Optional[str]]):
+        """장기 1순위 선택자의 최근 적중률이 크게 달라지면 레이아웃 변경 경고"""
+        key = f"{site}.{field}"
+        if key in self.alerted or len(window) < MIN_RECENT or entry['total'] < len(window) * 2:
+            return
+        top = max(entry['selectors'].items(), key=lambda kv: kv[1]['hits'], default=None)
+        if not top:
+            return
+        top_sel, top_stat = top
+        long_rate = top_stat['hits'] / entry['total']
+        recent_rate = sum(1 for w in window if w == top_sel) / len(window)
+        if abs(long_rate - recent_rate) >= SHIFT_THRESHOLD:
+            self.alerted.add(key)
+            print(f"⚠️ 선택자 적중률 변화 감지 ({key}): '{top_sel}' {long_rate:.0%} → 최근 {recent_rate:.0%} (레이아웃 변경 의심)")
+
+    def report(self):
+        """이번 실행에서 절약한 query_selector 왕복 수 출력"""
+        if not self.run_saved:
+            return
+        total = sum(self.run_saved.values())
+        print(f"🫛 선택자 순서 최적화: 이번 실행 {total}회 왕복 절약")
+        for key, saved in sorted(self.run_saved.items()):
+            print(f"  - {key}: {saved}회")
+
+    def save(self):
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.data, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"⚠️ 선택자 통계 저장 오류: {e}")
@@ -0,0 +1,207 @@
+"""
+SQLite 기반 게시글 상세 URL 작업 큐 (lease/ack/timeout)
+
+코디네이터가 목록 페이지에서 찾은 게시글을 등록하면, 여러 워커 프로세스(공유 볼륨을 쓰는 다른 머신 포함)가
+배치 단위로 임대(lease)해서 추출하고 결과를 커밋(ack)한다.
+임대 기한 내에 ack 되지 않은 작업(워커 종료 등)은 다른 워커가 다시 가져가므로 작업이 유실되지 않는다.
+
+주의: NFS 등 네트워크 파일시스템에서는 WAL 모드가 동작하지 않으므로 WORK_QUEUE_WAL=false로 설정한다.
+"""
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.canonical_url import normalize_url
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL,
+    url TEXT NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    error TEXT,
+    exported INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (channel, url)
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (channel, status, lease_expires);
+"""
+
+# 작업 상태
+PENDING = 'pending'
+LEASED = 'leased'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class WorkQueue:
+    """게시글 상세 수집 작업 큐"""
+
+    def __init__(self, path: Optional[str] = None, max_attempts: Optional[int] = None):
+        self.path = path or os.getenv('WORK_QUEUE_PATH', 'work_queue.db')
+        self.max_attempts = max_attempts or int(os.getenv('WORK_QUEUE_MAX_ATTEMPTS', '3'))
+        # isolation_level=None: 트랜잭션을 직접 BEGIN IMMEDIATE로 관리
+        self.conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA busy_timeout = 30000')
+        if os.getenv('WORK_QUEUE_WAL', 'true').lower() == 'true':
+            self.conn.execute('PRAGMA journal_mode = WAL')
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 바로 잡는 트랜잭션 (여러 워커의 동시 임대 방지)"""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self.conn
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        self.conn.execute('COMMIT')
+
+    def enqueue(self, channel: str, items: Iterable[Dict]) -> int:
+        """목록 항목 등록 (같은 채널/정규화 URL은 한 번만), 신규 등록 수 반환"""
+        now = time.time()
+        added = 0
+        with self._transaction() as conn:
+            for item in items:
+                url = normalize_url(item.get('url', ''))
+                if not url:
+                    continue
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO jobs (channel, url, item, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (channel, url, json.dumps(item, ensure_ascii=False), now, now),
+                )
+                added += cursor.rowcount
+        return added
+
+    def claim(self, worker_id: str, channel: Optional[str] = None, batch: int = 10,
+              lease_seconds: float = 300) -> List[Dict]:
+        """대기 중이거나 임대 기한이 지난 작업을 batch개까지 임대"""
+        now = time.time()
+        channel_clause = "AND channel = ?" if channel else ""
+        channel_args = (channel,) if channel else ()
+        with self._transaction() as conn:
+            # 재시도 한도를 넘긴 만료 작업은 실패 처리
+            conn.execute(
+                f"UPDATE jobs SET status = ?, error = COALESCE(error, 'lease expired'), updated_at = ? "
+                f"WHERE status = ? AND lease_expires < ? AND attempts >= ? {channel_clause}",
+                (FAILED, now, LEASED, now, self.max_attempts, *channel_args),
+            )
+            rows = conn.execute(
+                f"SELECT id, channel, url, item, attempts FROM jobs "
+                f"WHERE (status = ? OR (status = ? AND lease_expires < ?)) {channel_clause} "
+                f"ORDER BY id LIMIT ?",
+                (PENDING, LEASED, now, *channel_args, batch),
+            ).fetchall()
+            if not rows:
+                return []
+            ids = [row['id'] for row in rows]
+            conn.execute(
+                f"UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ? "
+                f"WHERE id IN ({','.join('?' * len(ids))})",
+                (LEASED, worker_id, now + lease_seconds, now, *ids),
+            )
+        return [
+            {'id': row['id'], 'channel': row['channel'], 'url': row['url'],
+             'item': json.loads(row['item']), 'attempts': row['attempts'] + 1}
+            for row in rows
+        ]
+
+    def extend(self, worker_id: str, job_ids: List[int], lease_seconds: float = 300) -> int:
+        """아직 처리 중인 작업의 임대 기한 연장 (heartbeat)"""
+        if not job_ids:
+            return 0
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET lease_expires = ?, updated_at = ? "
+                f"WHERE status = ? AND lease_owner = ? AND id IN ({','.join('?' * len(job_ids))})",
+                (now + lease_seconds, now, LEASED, worker_id, *job_ids),
+            )
+            return cursor.rowcount
+
+    def ack(self, worker_id: str, job_id: int, result: Optional[Dict]):
+        """작업 완료 및 결과 커밋 (임대가 다른 워커로 넘어갔어도 먼저 끝낸 결과를 사용)"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, lease_owner = ?, lease_expires = NULL, error = NULL, updated_at = ? "
+                "WHERE id = ? AND status != ?",
+                (DONE, json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+                 worker_id, now, job_id, DONE),
+            )
+
+    def fail(self, worker_id: str, job_id: int, error: str):
+        """작업 실패 (재시도 한도 전이면 대기 상태로 되돌림)"""
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = CASE WHEN attempts >= ? THEN ? ELSE ? END, "
+                "lease_owner = NULL, lease_expires = NULL, error = ?, updated_at = ? "
+                "WHERE id = ? AND status = ? AND lease_owner = ?",
+                (self.max_attempts, FAILED, PENDING, error[:500], now, job_id, LEASED, worker_id),
+            )
+
+    def release(self, worker_id: str, job_ids: List[int]) -> int:
+        """처리하지 못한 임대 작업을 바로 대기 상태로 되돌림 (시도 횟수에 넣지 않음, 서킷 열림 등 작업과 무관한 중단)"""
+        if not job_ids:
+            return 0
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), lease_owner = NULL, lease_expires = NULL, "
+                f"updated_at = ? WHERE status = ? AND lease_owner = ? AND id IN ({','.join('?' * len(job_ids))})",
+                (PENDING, now, LEASED, worker_id, *job_ids),
+            )
+            return cursor.rowcount
+
+    def outstanding(self, channel: Optional[str] = None) -> int:
+        """아직 끝나지 않은 작업 수 (대기 + 임대 중)"""
+        channel_clause = "AND channel = ?" if channel else ""
+        row = self.conn.execute(
+            f"SELECT COUNT(*) FROM jobs WHERE status IN (?, ?) {channel_clause}",
+            (PENDING, LEASED, *((channel,) if channel else ())),
+        ).fetchone()
+        return row[0]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """채널별 상태 집계"""
+        result: Dict[str, Dict[str, int]] = {}
+        for row in self.conn.execute("SELECT channel, status, COUNT(*) AS cnt FROM jobs GROUP BY channel, status"):
+            result.setdefault(row['channel'], {})[row['status']] = row['cnt']
+        return result
+
+    def take_results(self, channel: Optional[str] = None) -> List[Dict]:
+        """아직 내보내지 않은 완료 결과를 꺼내고 내보냄 표시"""
+        channel_clause = "AND channel = ?" if channel else ""
+        channel_args = (channel,) if channel else ()
+        with self._transaction() as conn:
+            rows = conn.execute(
+                f"SELECT id, result FROM jobs WHERE status = ? AND exported = 0 AND result IS NOT NULL {channel_clause} ORDER BY id",
+                (DONE, *channel_args),
+            ).fetchall()
+            if rows:
+                ids = [row['id'] for row in rows]
+                conn.execute(f"UPDATE jobs SET exported = 1 WHERE id IN ({','.join('?' * len(ids))})", ids)
+        return [json.loads(row['result']) for row in rows]
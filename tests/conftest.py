@@ -0,0 +1,24 @@
+"""
+공용 pytest 픽스처 (목 커뮤니티 서버, Chromium 실행 가능 여부)
+"""
+import pytest
+
+from tests.mock_community_server import MockBoardConfig, MockCommunityServer
+
+
+@pytest.fixture(scope='session')
+def mock_server():
+    """테스트 세션 동안 실행되는 목 커뮤니티 서버 (모든 게시글이 최근 3일 안)"""
+    with MockCommunityServer(MockBoardConfig(posts=40, days=3)) as server:
+        yield server
+
+
+@pytest.fixture(scope='session')
+def chromium():
+    """브라우저 경로 테스트용: Chromium을 실행할 수 없으면 건너뜀"""
+    sync_api = pytest.importorskip('playwright.sync_api')
+    try:
+        with sync_api.sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+    except Exception as e:
+        pytest.skip(f"Chromium 실행 불가: {str(e).splitlines()[0]}")
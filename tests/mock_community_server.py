@@ -0,0 +1,417 @@
+"""
+로컬 목 커뮤니티 서버 (동시성/부하 테스트용)
+
+에펨코리아 핫딜, 뽐뿌 인기글, 네이버 카페(iframe#cafe_main) 구조를 흉내낸 합성 게시판을 제공한다.
+게시판 크기, 응답 지연, 429 에러 주입을 설정할 수 있고 크롤러는 환경변수로 이 서버를 바라보게 한다.
+
+실행:
+    python -m tests.mock_community_server --port 8765 --posts 500 --latency-ms 50 --error-rate 0.05
+"""
+import argparse
+import html
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+CAFE_SLUG = "skybluezw4rh"
+CLUB_ID = 29434212
+
+
+@dataclass
+class MockBoardConfig:
+    posts: int = 200              # 게시판당 게시글 수
+    page_size: int = 20           # 목록 한 페이지당 게시글 수
+    days: int = 14                # 게시글 작성일 분포 기간 (일주일 필터 경계 테스트용)
+    latency_ms: int = 0           # 모든 응답에 추가할 지연
+    jitter_ms: int = 0            # 지연에 더할 무작위 편차 (0 ~ jitter_ms)
+    error_rate: float = 0.0       # 에러 응답 비율 (0.0 ~ 1.0)
+    error_status: int = 429       # 주입할 에러 상태 코드
+    seed: int = 42
+
+
+@dataclass
+class MockPost:
+    id: int
+    title: str
+    content: str
+    created_at: datetime
+    view_cnt: int
+    like_cnt: int
+    comment_cnt: int
+    category: str
+
+
+@dataclass
+class MockStats:
+    requests: Dict[str, int] = field(default_factory=dict)
+    errors: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def hit(self, kind: str):
+        with self.lock:
+            self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    def to_dict(self) -> Dict:
+        with self.lock:
+            return {'requests': dict(self.requests), 'errors': self.errors}
+
+
+def generate_posts(config: MockBoardConfig, id_base: int) -> List[MockPost]:
+    """최신순으로 정렬된 합성 게시글 생성 (결정적 시드)"""
+    rng = random.Random(config.seed + id_base)
+    now = datetime.now().replace(second=0, microsecond=0)
+    step = timedelta(days=config.days) / max(config.posts, 1)
+    categories = ['가전/전자', '식품', '의류', '생활', '디지털']
+    brands = ['롯데온', '쿠팡', '11번가', 'G마켓', '네이버쇼핑']
+    posts = []
+    for i in range(config.posts):
+        brand = rng.choice(brands)
+        title = f"[{brand}] 합성 핫딜 게시글 {i + 1} - {rng.randint(1000, 99999)}원"
+        content = "\n".join(
+            f"{brand} 특가 상품 설명 {i + 1}-{line} 입니다. 배송비 포함 가격을 확인하세요."
+            for line in range(rng.randint(2, 6))
+        )
+        posts.append(MockPost(
+            id=id_base + config.posts - i,
+            title=title,
+            content=content,
+            created_at=now - step * i,
+            view_cnt=rng.randint(100, 50000),
+            like_cnt=rng.randint(0, 300),
+            comment_cnt=rng.randint(0, 150),
+            category=rng.choice(categories),
+        ))
+    return posts
+
+
+class MockCommunity:
+    """세 사이트의 합성 게시판 데이터"""
+
+    def __init__(self, config: MockBoardConfig):
+        self.config = config
+        self.boards = {
+            'fmkorea': generate_posts(config, 8_000_000_000),
+            'ppomppu': generate_posts(config, 600_000),
+            'cafe': generate_posts(config, 1_000),
+        }
+        self.by_id = {
+            site: {p.id: p for p in posts} for site, posts in self.boards.items()
+        }
+        self.stats = MockStats()
+        self.rng = random.Random(config.seed)
+        self.rng_lock = threading.Lock()
+
+    def page_of(self, site: str, page: int) -> List[MockPost]:
+        size = self.config.page_size
+        return self.boards[site][(page - 1) * size: page * size]
+
+    def page_count(self, site: str) -> int:
+        size = self.config.page_size
+        return max(1, (len(self.boards[site]) + size - 1) // size)
+
+    def should_fail(self) -> bool:
+        if self.config.error_rate <= 0:
+            return False
+        with self.rng_lock:
+            return self.rng.random() < self.config.error_rate
+
+    def delay(self) -> float:
+        jitter = 0
+        if self.config.jitter_ms:
+            with self.rng_lock:
+                jitter = self.rng.randint(0, self.config.jitter_ms)
+        return (self.config.latency_ms + jitter) / 1000
+
+
+def _page(title: str, body: str) -> str:
+    return f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>{html.escape(title)}</title></head><body>{body}</body></html>"
+
+
+def _is_today(dt: datetime) -> bool:
+    return dt.date() == datetime.now().date()
+
+
+def _pagination(page: int, total: int, href_fn, link_class: str = '') -> str:
+    """현재 페이지 기준 10개 단위 페이지 번호 + 다음 링크"""
+    start = ((page - 1) // 10) * 10 + 1
+    links = []
+    for n in range(start, min(start + 10, total + 1)):
+        if n == page:
+            links.append(f'<strong class="this">{n}</strong>')
+        else:
+            links.append(f'<a class="{link_class}" href="{href_fn(n)}">{n}</a>')
+    if start + 10 <= total:
+        links.append(f'<a class="direction next" href="{href_fn(start + 10)}">다음</a>')
+    return " ".join(links)
+
+
+# ---------------------------------------------------------------------------
+# 사이트별 렌더러
+# ---------------------------------------------------------------------------
+
+def render_fmkorea_list(community: MockCommunity, query: Dict[str, str]) -> str:
+    page = int(query.get('page', '1') or 1)
+    rows = []
+    for p in community.page_of('fmkorea', page):
+        date_text = p.created_at.strftime('%H:%M') if _is_today(p.created_at) else p.created_at.strftime('%Y.%m.%d')
+        rows.append(
+            f'<li class="li"><h3 class="title"><a href="/index.php?mid=hotdeal&amp;document_srl={p.id}">{html.escape(p.title)}</a></h3>'
+            f'<span class="date">{date_text}</span><span class="count">{p.view_cnt}</span></li>'
+        )
+    pages = _pagination(
+        page, community.page_count('fmkorea'),
+        lambda n: f"/index.php?mid=hotdeal&amp;sort_index=pop&amp;order_type=desc&amp;page={n}",
+    )
+    return _page("핫딜 - 에펨코리아", f'<ul class="bd_lst">{"".join(rows)}</ul><div class="bd_pg">{pages}</div>')
+
+
+def render_fmkorea_detail(community: MockCommunity, post: MockPost) -> str:
+    lines = "".join(f"<div>{html.escape(line)}</div>" for line in post.content.split("\n"))
+    return _page(post.title, (
+        f'<div class="top_area"><h1 class="np_18px"><span class="np_18px_span">{html.escape(post.title)}</span></h1>'
+        f'<span class="date m_no">{post.created_at.strftime("%Y.%m.%d %H:%M")}</span></div>'
+        f'<div class="side fr"><span>조회 수 <b>{post.view_cnt:,}</b></span>'
+        f'<span>추천 수 <b>{post.like_cnt}</b></span><span>댓글 <b>{post.comment_cnt}</b></span></div>'
+        f'<div class="document_address"><a href="/{post.id}">https://www.fmkorea.com/{post.id}</a></div>'
+        f'<article><div class="document_{post.id}_0 xe_content rd_body">{lines}</div></article>'
+    ))
+
+
+def render_ppomppu_list(community: MockCommunity, query: Dict[str, str]) -> str:
+    page = int(query.get('page', '1') or 1)
+    rows = ['<tr class="title_bg"><td>번호</td><td>제목</td><td>등록일</td></tr>']
+    for p in community.page_of('ppomppu', page):
+        date_text = p.created_at.strftime('%H:%M:%S') if _is_today(p.created_at) else p.created_at.strftime('%y/%m/%d')
+        rows.append(
+            f'<tr class="baseList"><td>{p.id}</td>'
+            f'<td class="title"><a href="view.php?id=ppomppu&amp;no={p.id}">[{p.category}] {html.escape(p.title)}</a>'
+            f'<span class="baseList-c">{p.comment_cnt}</span></td>'
+            f'<td class="baseList-space">{date_text}</td>'
+            f'<td class="baseList-space baseList-rec">{p.like_cnt} - 0</td>'
+            f'<td class="baseList-space baseList-views">{p.view_cnt}</td></tr>'
+        )
+    pages = _pagination(
+        page, community.page_count('ppomppu'),
+        lambda n: f"/zboard/zboard.php?id=ppomppu&amp;hotlist_flag=999&amp;page={n}",
+        link_class='num',
+    )
+    return _page("뽐뿌 - 인기글", f'<table class="list_table">{"".join(rows)}</table><div class="bottom-list">{pages}</div>')
+
+
+def render_ppomppu_detail(community: MockCommunity, post: MockPost) -> str:
+    lines = "<br>".join(html.escape(line) for line in post.content.split("\n"))
+    return _page(post.title, (
+        f'<h1><span class="subject_preface">[{post.category}]</span> {html.escape(post.title)}'
+        f'<span id="comment">{post.comment_cnt}</span></h1>'
+        f'<ul class="topTitle-mainbox"><li>등록일 {post.created_at.strftime("%Y-%m-%d %H:%M")}</li>'
+        f'<li>조회수 {post.view_cnt:,}</li></ul>'
+        f'<span class="topTitle-rec">추천 <em>{post.like_cnt}</em></span>'
+        f'<span class="topTitle-copy">주소복사</span>'
+        f'<table class="board-contents"><tr><td>{lines}</td></tr></table>'
+    ))
+
+
+def render_cafe_shell(iframe_src: str, title: str) -> str:
+    """네이버 카페 외곽 페이지 (본문은 iframe#cafe_main 안에 로드됨)"""
+    return _page(title, f'<div id="cafe-body"><iframe id="cafe_main" name="cafe_main" src="{iframe_src}" width="860" height="3000"></iframe></div>')
+
+
+def render_cafe_list(community: MockCommunity, query: Dict[str, str]) -> str:
+    page = int(query.get('page', '1') or 1)
+    rows = []
+    for p in community.page_of('cafe', page):
+        date_text = p.created_at.strftime('%H:%M') if _is_today(p.created_at) else p.created_at.strftime('%Y.%m.%d.')
+        rows.append(
+            f'<tr><td class="td_article"><a href="/{CAFE_SLUG}/{p.id}" target="_top">{html.escape(p.title)}</a></td>'
+            f'<td class="td_date">{date_text}</td></tr>'
+        )
+    pages = _pagination(
+        page, community.page_count('cafe'),
+        lambda n: f"/ca-fe/cafes/{CLUB_ID}/popular?page={n}",
+    )
+    return _page("인기글", f'<table class="article-board">{"".join(rows)}</table><div class="Pagination">{pages}</div>')
+
+
+def render_cafe_article(community: MockCommunity, post: MockPost) -> str:
+    paragraphs = "".join(f'<p class="se-text-paragraph">{html.escape(line)}</p>' for line in post.content.split("\n"))
+    return _page(post.title, (
+        f'<div class="ArticleContentBox"><div class="article_header">'
+        f'<div class="ArticleTitle"><h3 class="title_text">{html.escape(post.title)}</h3></div>'
+        f'<div class="article_info"><span class="date">{post.created_at.strftime("%Y.%m.%d. %H:%M")}</span>'
+        f'<span class="count">조회 {post.view_cnt:,}</span></div></div>'
+        f'<div class="article_container"><div class="se-main-container">{paragraphs}</div></div>'
+        f'<div class="ReplyBox"><a class="like_no u_likeit_list_btn">좋아요 {post.like_cnt}</a>'
+        f'<a class="button_comment">댓글 {post.comment_cnt}</a></div></div>'
+    ))
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    community: MockCommunity = None  # 서버 생성 시 주입
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 로그 과다 출력 방지
+        pass
+
+    def _send(self, status: int, body: str, content_type: str = "text/html; charset=utf-8", headers: Optional[Dict[str, str]] = None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        community = self.community
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        if path == "/__stats":
+            self._send(200, json.dumps(community.stats.to_dict()), "application/json")
+            return
+
+        kind, body = self._route(path, query)
+        community.stats.hit(kind)
+
+        delay = community.delay()
+        if delay:
+            time.sleep(delay)
+
+        if kind != 'not_found' and community.should_fail():
+            with community.stats.lock:
+                community.stats.errors += 1
+            status = community.config.error_status
+            self._send(status, _page("Too Many Requests", f"<h1>{status}</h1>"), headers={"Retry-After": "1"})
+            return
+
+        if body is None:
+            self._send(404, _page("Not Found", "<h1>404</h1>"))
+            return
+        self._send(200, body)
+
+    def _route(self, path: str, query: Dict[str, str]):
+        community = self.community
+
+        # 에펨코리아: /index.php?mid=hotdeal[&document_srl=N] 또는 /N
+        if path == "/index.php":
+            if 'document_srl' in query:
+                post = community.by_id['fmkorea'].get(int(query['document_srl']))
+                return 'fmkorea_detail', render_fmkorea_detail(community, post) if post else None
+            return 'fmkorea_list', render_fmkorea_list(community, query)
+        if path.strip('/').isdigit() and int(path.strip('/')) in community.by_id['fmkorea']:
+            post = community.by_id['fmkorea'][int(path.strip('/'))]
+            return 'fmkorea_detail', render_fmkorea_detail(community, post)
+
+        # 뽐뿌: /zboard/zboard.php (목록), /zboard/view.php?no=N (상세)
+        if path == "/zboard/zboard.php":
+            return 'ppomppu_list', render_ppomppu_list(community, query)
+        if path == "/zboard/view.php":
+            post = community.by_id['ppomppu'].get(int(query.get('no', '0') or 0))
+            return 'ppomppu_detail', render_ppomppu_detail(community, post) if post else None
+
+        # 네이버 카페: 외곽 셸 + iframe 문서
+        if path == f"/{CAFE_SLUG}":
+            return 'cafe_shell', render_cafe_shell(f"/ca-fe/cafes/{CLUB_ID}/popular", "맘이베베")
+        if path == f"/f-e/cafes/{CLUB_ID}/popular":
+            return 'cafe_shell', render_cafe_shell(f"/ca-fe/cafes/{CLUB_ID}/popular", "인기글")
+        if path == f"/ca-fe/cafes/{CLUB_ID}/popular":
+            return 'cafe_list', render_cafe_list(community, query)
+        if path.startswith(f"/{CAFE_SLUG}/"):
+            article_id = path.rsplit('/', 1)[-1]
+            if article_id.isdigit() and int(article_id) in community.by_id['cafe']:
+                return 'cafe_shell', render_cafe_shell(f"/ca-fe/cafes/{CLUB_ID}/articles/{article_id}", "게시글")
+        if path.startswith(f"/ca-fe/cafes/{CLUB_ID}/articles/"):
+            article_id = path.rsplit('/', 1)[-1]
+            post = community.by_id['cafe'].get(int(article_id)) if article_id.isdigit() else None
+            return 'cafe_article', render_cafe_article(community, post) if post else None
+
+        return 'not_found', None
+
+
+class MockCommunityServer:
+    """백그라운드 스레드에서 실행되는 목 서버 (with 문 지원)"""
+
+    def __init__(self, config: Optional[MockBoardConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockBoardConfig()
+        self.community = MockCommunity(self.config)
+        handler = type("BoundMockRequestHandler", (MockRequestHandler,), {"community": self.community})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def crawler_env(self) -> Dict[str, str]:
+        """크롤러를 이 서버로 향하게 하는 환경변수"""
+        base = self.base_url
+        return {
+            'FMKOREA_POPULAR_URL': f"{base}/index.php?mid=hotdeal&sort_index=pop&order_type=desc",
+            'PPOMPPU_POPULAR_URL': f"{base}/zboard/zboard.php?id=ppomppu&hotlist_flag=999",
+            'MAMIBEBE_CAFE_MAIN_URL': f"{base}/{CAFE_SLUG}",
+            'MAMIBEBE_POPULAR_URL': f"{base}/f-e/cafes/{CLUB_ID}/popular",
+            # 목 서버는 로그인 검사를 하지 않으므로 더미 쿠키로 로그인 우회
+            'NAVER_COOKIE': 'NID_AUT=mock; NID_SES=mock',
+        }
+
+    def start(self) -> "MockCommunityServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 목 커뮤니티 서버")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--posts", type=int, default=200, help="게시판당 게시글 수")
+    parser.add_argument("--page-size", type=int, default=20, help="목록 페이지당 게시글 수")
+    parser.add_argument("--days", type=int, default=14, help="게시글 작성일 분포 기간(일)")
+    parser.add_argument("--latency-ms", type=int, default=0, help="응답 지연(ms)")
+    parser.add_argument("--jitter-ms", type=int, default=0, help="응답 지연 편차(ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="에러 응답 비율 (0.0 ~ 1.0)")
+    parser.add_argument("--error-status", type=int, default=429, help="주입할 에러 상태 코드")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    server = MockCommunityServer(
+        MockBoardConfig(
+            posts=args.posts,
+            page_size=args.page_size,
+            days=args.days,
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"🫛 목 커뮤니티 서버 실행: {server.base_url}")
+    for name, value in server.crawler_env().items():
+        print(f"  export {name}='{value}'")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
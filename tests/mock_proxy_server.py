@@ -0,0 +1,224 @@
+"""
+로컬 목 HTTP 프록시 (프록시 풀 테스트용)
+
+절대 URI GET 요청을 대상 서버로 전달하고, HTTPS는 CONNECT 터널로 그대로 잇는다.
+일정 요청 수 이후 403 또는 캡차 페이지로 차단하도록 설정할 수 있어 프록시 제외(evict) 동작을 확인할 수 있다.
+
+실행:
+    python -m tests.mock_proxy_server --port 8899 --block-after 20 --block-mode captcha
+    export PROXY_POOL='http://127.0.0.1:8899,http://127.0.0.1:8900'
+"""
+import argparse
+import base64
+import select
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+CAPTCHA_PAGE = "<html><head><title>보안문자 입력 - captcha</title></head><body>자동입력 방지</body></html>"
+
+# 대상 서버로 넘기지 않는 홉 단위 헤더
+HOP_HEADERS = {'connection', 'proxy-connection', 'keep-alive', 'proxy-authorization', 'te', 'trailer',
+               'transfer-encoding', 'upgrade'}
+
+
+@dataclass
+class MockProxyConfig:
+    block_after: int = -1         # 이 요청 수 이후 차단 (-1: 차단 안 함, 0: 처음부터 차단)
+    block_mode: str = '403'       # 차단 방식: 403 또는 captcha (200 응답에 캡차 페이지)
+    latency_ms: int = 0           # 전달 전 추가할 지연
+    username: str = ''            # 설정하면 Proxy-Authorization 검사 (Basic)
+    password: str = ''
+
+
+@dataclass
+class MockProxyStats:
+    requests: int = 0
+    forwarded: int = 0
+    blocked: int = 0
+    tunnels: int = 0
+    hosts: Dict[str, int] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def hit(self, host: str) -> int:
+        with self.lock:
+            self.requests += 1
+            self.hosts[host] = self.hosts.get(host, 0) + 1
+            return self.requests
+
+    def to_dict(self) -> Dict:
+        with self.lock:
+            return {'requests': self.requests, 'forwarded': self.forwarded, 'blocked': self.blocked,
+                    'tunnels': self.tunnels, 'hosts': dict(self.hosts)}
+
+
+class MockProxyHandler(BaseHTTPRequestHandler):
+    config: MockProxyConfig = None  # 서버 생성 시 주입
+    stats: MockProxyStats = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: str, headers: Optional[Dict[str, str]] = None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _authorized(self) -> bool:
+        if not self.config.username:
+            return True
+        expected = base64.b64encode(f"{self.config.username}:{self.config.password}".encode()).decode()
+        if self.headers.get('Proxy-Authorization', '') == f"Basic {expected}":
+            return True
+        self._send(407, "<h1>407</h1>", headers={'Proxy-Authenticate': 'Basic realm="mock"'})
+        return False
+
+    def _should_block(self, count: int) -> bool:
+        block_after = self.config.block_after
+        if block_after < 0 or count <= block_after:
+            return False
+        with self.stats.lock:
+            self.stats.blocked += 1
+        return True
+
+    def do_GET(self):
+        if not self._authorized():
+            return
+        target = urlsplit(self.path)
+        if not target.scheme:
+            self._send(400, "<h1>absolute URI required</h1>")
+            return
+        count = self.stats.hit(target.netloc)
+        if self.config.latency_ms:
+            time.sleep(self.config.latency_ms / 1000)
+        if self._should_block(count):
+            if self.config.block_mode == 'captcha':
+                self._send(200, CAPTCHA_PAGE)
+            else:
+                self._send(403, "<html><head><title>Access Denied</title></head><body>403</body></html>")
+            return
+
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in HOP_HEADERS}
+        request = urllib.request.Request(self.path, headers=headers, method='GET')
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                status, body, response_headers = response.status, response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            status, body, response_headers = e.code, e.read(), e.headers
+        except OSError as e:
+            self._send(502, f"<h1>502 {e}</h1>")
+            return
+        with self.stats.lock:
+            self.stats.forwarded += 1
+        self.send_response(status)
+        for name, value in response_headers.items():
+            if name.lower() not in HOP_HEADERS and name.lower() != 'content-length':
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self):
+        if not self._authorized():
+            return
+        host, _, port = self.path.partition(':')
+        count = self.stats.hit(self.path)
+        if self._should_block(count):
+            self._send(403, "<h1>403</h1>")
+            return
+        try:
+            upstream = socket.create_connection((host, int(port or 443)), timeout=30)
+        except OSError as e:
+            self._send(502, f"<h1>502 {e}</h1>")
+            return
+        with self.stats.lock:
+            self.stats.tunnels += 1
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        sockets = [self.connection, upstream]
+        try:
+            while True:
+                readable, _, errored = select.select(sockets, [], sockets, 30)
+                if errored or not readable:
+                    break
+                for sock in readable:
+                    data = sock.recv(65536)
+                    if not data:
+                        return
+                    (upstream if sock is self.connection else self.connection).sendall(data)
+        finally:
+            upstream.close()
+
+
+class MockProxyServer:
+    """백그라운드 스레드에서 실행되는 목 프록시 (with 문 지원)"""
+
+    def __init__(self, config: Optional[MockProxyConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockProxyConfig()
+        self.stats = MockProxyStats()
+        handler = type("BoundMockProxyHandler", (MockProxyHandler,), {"config": self.config, "stats": self.stats})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """PROXY_POOL에 넣을 프록시 URL"""
+        host, port = self.httpd.server_address[:2]
+        auth = f"{self.config.username}:{self.config.password}@" if self.config.username else ''
+        return f"http://{auth}{host}:{port}"
+
+    def start(self) -> "MockProxyServer":
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 목 HTTP 프록시")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8899)
+    parser.add_argument("--block-after", type=int, default=-1, help="이 요청 수 이후 차단 (-1: 차단 안 함)")
+    parser.add_argument("--block-mode", choices=['403', 'captcha'], default='403', help="차단 응답 방식")
+    parser.add_argument("--latency-ms", type=int, default=0, help="전달 지연(ms)")
+    parser.add_argument("--username", type=str, default='')
+    parser.add_argument("--password", type=str, default='')
+    args = parser.parse_args()
+
+    server = MockProxyServer(
+        MockProxyConfig(
+            block_after=args.block_after,
+            block_mode=args.block_mode,
+            latency_ms=args.latency_ms,
+            username=args.username,
+            password=args.password,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"🫛 목 프록시 실행: {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
@@ -0,0 +1,44 @@
+"""
+변경분 피드 테스트 (소비자 커서, CSV 제자리 재작성 후 upsert/delete)
+"""
+import io
+import json
+from typing import List
+
+from src.utils.change_feed import export_changes
+from src.utils.json_to_csv import append_to_csv
+from tests.test_post_index import make_rows
+
+
+def export(csv_path: str, index_path: str) -> List[dict]:
+    out = io.StringIO()
+    export_changes('persona', out, csv_path=csv_path, index_path=index_path)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_consumer_receives_only_new_rows(tmp_path):
+    csv_path, index_path = str(tmp_path / 'community_data.csv'), str(tmp_path / 'post_index.db')
+    append_to_csv(csv_path, make_rows(1, 5), append_mode=False)
+    assert [row['id'] for row in export(csv_path, index_path)] == [1, 2, 3, 4, 5]
+    assert export(csv_path, index_path) == []
+
+    append_to_csv(csv_path, make_rows(6, 7))
+    assert [(row['op'], row['id']) for row in export(csv_path, index_path)] == [('upsert', 6), ('upsert', 7)]
+
+
+def test_in_place_rewrite_emits_upserts_and_deletes(tmp_path):
+    csv_path, index_path = str(tmp_path / 'community_data.csv'), str(tmp_path / 'post_index.db')
+    append_to_csv(csv_path, make_rows(1, 5), append_mode=False)
+    export(csv_path, index_path)
+
+    # 같은 파일을 더 길게 다시 씀: 2번 변경, 5번 삭제, 6~12번 추가, 1/3/4번 그대로
+    rows = [row for row in make_rows(1, 12) if row['id'] != 5]
+    rows[1]['title'] = '변경된 게시글 2'
+    append_to_csv(csv_path, rows, append_mode=False)
+
+    changes = {row['id']: row for row in export(csv_path, index_path)}
+    assert set(changes) == {2, 5, *range(6, 13)}
+    assert changes[2]['op'] == 'upsert' and changes[2]['title'] == '변경된 게시글 2'
+    assert changes[5]['op'] == 'delete'
+    assert all(changes[i]['op'] == 'upsert' for i in range(6, 13))
+    assert export(csv_path, index_path) == []
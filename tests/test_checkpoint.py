@@ -0,0 +1,72 @@
+"""
+크롤링 체크포인트 저장/재개/완료 테스트
+"""
+import json
+import os
+
+import pytest
+
+from src.models.post import Post
+from src.utils.checkpoint import CrawlCheckpoint, build_checkpoint
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    path = str(tmp_path / 'checkpoints')
+    monkeypatch.setenv('CHECKPOINT_DIR', path)
+    return path
+
+
+def item(i: int):
+    return {'url': f"https://www.ppomppu.co.kr/{i}", 'title': f"게시글 {i}"}
+
+
+def test_resume_restores_listing_and_posts(directory):
+    checkpoint = build_checkpoint('ppomppu', resume=False)
+    checkpoint.save_listing(3, [item(1), item(2), item(3)])
+    checkpoint.save_listing(4, [item(1), item(2), item(3)], done=True)
+    checkpoint.add_post(item(1), Post(channel='ppomppu', title='게시글 1', url=item(1)['url']))
+    checkpoint.add_post(item(2), None)  # 실패/제외 항목도 다시 시도하지 않음
+    checkpoint.save()
+
+    resumed = build_checkpoint('ppomppu', resume=True)
+    assert resumed.listing_done and resumed.listing_page == 4
+    assert resumed.completed_urls == {item(1)['url'], item(2)['url']}
+    assert [post.title for post in resumed.restored_posts()] == ['게시글 1']
+    assert resumed.pending_items() == [item(3)]
+
+
+def test_posts_saved_every_n(directory):
+    checkpoint = CrawlCheckpoint('ppomppu', save_every=2)
+    checkpoint.add_post(item(1), None)
+    assert not os.path.exists(checkpoint.path)
+    checkpoint.add_post(item(2), None)
+    with open(checkpoint.path, encoding='utf-8') as f:
+        assert len(json.load(f)['done_urls']) == 2
+
+
+def test_completed_checkpoint_is_not_resumed(directory):
+    checkpoint = build_checkpoint('ppomppu', resume=False)
+    checkpoint.save_listing(2, [item(1)])
+    checkpoint.complete()
+    assert os.path.exists(checkpoint.path)
+
+    resumed = build_checkpoint('ppomppu', resume=True)
+    assert not resumed.state['completed']
+    assert resumed.listing_page == 1 and resumed.listing_items == []
+
+
+def test_new_run_discards_saved_state(directory):
+    checkpoint = build_checkpoint('ppomppu', resume=False)
+    checkpoint.save_listing(5, [item(1)])
+
+    fresh = build_checkpoint('ppomppu', resume=False)
+    assert not os.path.exists(fresh.path)
+    assert fresh.listing_page == 1
+
+
+def test_corrupt_file_starts_over(directory):
+    os.makedirs(directory)
+    with open(os.path.join(directory, 'ppomppu.json'), 'w', encoding='utf-8') as f:
+        f.write('{broken')
+    assert not CrawlCheckpoint('ppomppu').load()
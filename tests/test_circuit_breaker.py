@@ -0,0 +1,81 @@
+"""
+호스트별 서킷 브레이커 상태 전이 테스트 (closed → open → half_open → closed/open)
+"""
+import pytest
+
+from src.utils import circuit_breaker
+from src.utils.circuit_breaker import (
+    CLOSED, HALF_OPEN, OPEN, CircuitOpenError, HostCircuitBreakers, html_is_bot_check,
+)
+
+URL = 'https://www.fmkorea.com/index.php?mid=hotdeal'
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """circuit_breaker 모듈의 time.monotonic 대체 (now[0]을 바꿔 시간 이동)"""
+    now = [1000.0]
+    monkeypatch.setattr(circuit_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def breakers():
+    return HostCircuitBreakers(failure_threshold=3, reset_seconds=60, half_open_probes=1, max_trips=2)
+
+
+def test_opens_after_consecutive_failures(breakers, clock):
+    breaker = breakers.get(URL)
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure('HTTP 503')
+    assert breaker.state == CLOSED
+    breaker.record_success()
+    assert breaker.failures == 0
+
+    for _ in range(3):
+        breaker.record_failure('HTTP 503')
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.retry_in == 60 and breaker.rejected == 1
+    # 같은 호스트는 경로가 달라도 같은 서킷
+    assert breakers.get('https://WWW.fmkorea.com/other') is breaker
+
+
+def test_half_open_probe_success_closes(breakers, clock):
+    breaker = breakers.get(URL)
+    breaker.trip('헬스 체크 실패')
+    clock[0] += 59
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    clock[0] += 1
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+    # 시험 요청이 끝나기 전 추가 요청은 거절
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+
+
+def test_half_open_probe_failure_reopens_and_exhausts(breakers, clock):
+    breaker = breakers.get(URL)
+    breaker.trip('봇 확인 페이지')
+    assert not breakers.exhausted(URL)
+    assert breakers.status(URL) == f"서킷 {OPEN}"
+
+    clock[0] += 60
+    breaker.before_request()
+    breaker.record_failure('봇 확인 페이지')
+    assert breaker.state == OPEN and breaker.trips == 2
+    assert breaker.retry_in() == 60
+    assert breakers.exhausted(URL)
+    assert breakers.status(URL) == '중단 (봇 확인 페이지)'
+
+
+def test_bot_check_uses_title_only():
+    assert html_is_bot_check('<html><head><title>보안문자 입력 - captcha</title></head></html>')
+    assert not html_is_bot_check('<html><head><title>핫딜</title><script>var captcha = 1;</script></head></html>')
@@ -0,0 +1,73 @@
+"""
+여러 게시판 수집 테스트 (브라우저 없이 게시판 크롤러를 가짜로 대체)
+"""
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+import pytest
+
+from src.crawlers.base_crawler import BaseCrawler
+from src.models.post import Post
+from src.utils import circuit_breaker, proxy_pool
+from src.utils.checkpoint import build_checkpoint
+
+BOARDS = [{'name': 'hotdeal', 'url': 'https://example.com/hotdeal'},
+          {'name': 'best', 'url': 'https://example.com/best'}]
+
+
+class FakeBoardCrawler(BaseCrawler):
+    """게시판마다 게시글 2개를 돌려주는 크롤러 (페이지를 열지 않음)"""
+
+    def __init__(self, popular_url: Optional[str] = None):
+        super().__init__()
+        self.popular_url = popular_url or BOARDS[0]['url']
+        self.channel = 'fake'
+        self.boards = list(BOARDS)
+
+    async def crawl(self, max_posts: int = None) -> List[Post]:
+        return [Post(channel=self.channel, title=f"게시글 {i}", url=f"{self.popular_url}/{i}") for i in range(2)]
+
+    async def discover(self, max_posts: int = None) -> List[Dict]:
+        return []
+
+    async def _fetch_post(self, item: Dict, settle_ms: int = 1000) -> Optional[Post]:
+        return None
+
+    async def _attach(self, parent: BaseCrawler, storage_state: Optional[Dict] = None):
+        pass
+
+    async def _detach(self):
+        pass
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    monkeypatch.setenv('HEALTH_CHECK', 'false')
+    monkeypatch.setenv('CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+    monkeypatch.setenv('SELECTOR_STATS_PATH', str(tmp_path / 'selector_stats.json'))
+    monkeypatch.delenv('PROXY_POOL', raising=False)
+    monkeypatch.setattr(proxy_pool, '_shared_pool', None)
+    monkeypatch.setattr(circuit_breaker, '_shared_breakers', None)
+    crawler = FakeBoardCrawler()
+    crawler.checkpoint = build_checkpoint(crawler.channel, resume=False)
+    return crawler
+
+
+def test_multi_board_run_completes_parent_checkpoint(crawler):
+    posts = asyncio.run(crawler.crawl_boards())
+
+    assert len(posts) == 4
+    assert {post.category for post in posts} == {'hotdeal', 'best'}
+    # run_* 스크립트는 completed일 때만 체크포인트를 삭제
+    assert crawler.checkpoint.state['completed']
+    crawler._on_close()
+    crawler.checkpoint.clear()
+    assert not os.path.exists(crawler.checkpoint.path)
+
+
+def test_interrupted_multi_board_run_leaves_no_checkpoint(crawler, capsys):
+    # 게시판 수집 중 종료되어도 부모 체크포인트는 재개 대상이 아니므로 저장하지 않음
+    crawler._on_close()
+    assert not os.path.exists(crawler.checkpoint.path)
+    assert '--resume으로 재개 가능' not in capsys.readouterr().out
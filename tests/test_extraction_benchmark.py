@@ -0,0 +1,123 @@
+"""
+기록된 픽스처 재생으로 채널별 상세 추출 벤치마크 (pytest-benchmark)
+
+목 커뮤니티 서버의 목록/상세 응답을 FixtureStore에 한 번 기록한 뒤, 네트워크 없이 재생하며
+각 크롤러의 추출 경로를 측정하고 추출한 필드를 목 서버의 원본 게시글과 비교한다.
+    HTTP 경로       DETAIL_FETCH=http / 명세 크롤러가 프로세스 풀에서 호출하는 HTML 파서
+    브라우저 경로   run_benchmark extract와 같은 _fetch_post 재생 (Chromium이 없으면 건너뜀)
+
+실행:
+    python -m pytest tests/test_extraction_benchmark.py --benchmark-columns=mean,ops
+"""
+import asyncio
+from functools import partial
+from typing import Dict, List, Tuple
+
+import httpx
+import pytest
+
+from src.crawlers.html_parsers import parse_fmkorea_detail, parse_ppomppu_detail
+from src.crawlers.site_spec import load_spec, parse_spec_detail, resolve_spec_path
+from src.utils.canonical_url import canonical_post_url, extract_post_id
+from src.utils.fixtures import FixtureReplayer, FixtureStore
+
+# 목 서버 목록 URL 환경변수 (크롤러 설정과 같은 이름)
+LIST_URL_ENV = {
+    'fmkorea': 'FMKOREA_POPULAR_URL',
+    'ppomppu': 'PPOMPPU_POPULAR_URL',
+}
+
+# 이름 → (사이트, 상세 HTML 추출 함수)
+EXTRACTORS = {
+    'fmkorea': ('fmkorea', parse_fmkorea_detail),
+    'ppomppu': ('ppomppu', parse_ppomppu_detail),
+    'spec-fmkorea': ('fmkorea', partial(parse_spec_detail, resolve_spec_path('fmkorea'))),
+    'spec-ppomppu': ('ppomppu', partial(parse_spec_detail, resolve_spec_path('ppomppu'))),
+}
+
+BROWSER_POSTS = 5
+
+
+@pytest.fixture(scope='module')
+def recorded(mock_server, tmp_path_factory) -> str:
+    """목 서버 목록 1페이지와 그 상세 페이지를 사이트별 픽스처로 기록 → 픽스처 루트 경로"""
+    root = str(tmp_path_factory.mktemp('fixtures'))
+    env = mock_server.crawler_env()
+    with httpx.Client() as client:
+        for site, name in LIST_URL_ENV.items():
+            store = FixtureStore(root, site)
+            list_url = env[name]
+            response = client.get(list_url)
+            store.save('GET', list_url, response.status_code, dict(response.headers), response.content)
+            items = load_spec(site).extract_list(response.text, list_url)
+            for item in items:
+                detail = client.get(item['url'])
+                store.save('GET', item['url'], detail.status_code, dict(detail.headers), detail.content)
+            store.save_items(items)
+            store.flush()
+    return root
+
+
+def replay_pages(root: str, site: str) -> List[Tuple[Dict, str]]:
+    """기록된 목록 항목과 상세 HTML을 재생 transport로 읽기 (기록에 없는 요청이 있으면 실패)"""
+    store = FixtureStore(root, site)
+    replayer = FixtureReplayer(store)
+    with httpx.Client(transport=replayer.httpx_transport()) as client:
+        pages = [(item, client.get(item['url']).text) for item in store.load_items()]
+    assert not replayer.misses
+    return pages
+
+
+def assert_matches_source(mock_server, site: str, item: Dict, data: Dict):
+    """추출 결과가 목 서버 원본 게시글과 같은지 (작성일은 분 단위)"""
+    assert data is not None, item['url']
+    source = mock_server.community.by_id[site][extract_post_id(site, item['url'])]
+    assert data['title'] == source.title
+    assert data['content'] == source.content
+    assert (data['view_cnt'], data['like_cnt'], data['comment_cnt']) == \
+        (source.view_cnt, source.like_cnt, source.comment_cnt)
+    assert data['created_at'] == source.created_at.replace(second=0, microsecond=0)
+    assert data['url'] == canonical_post_url(site, item['url'])
+
+
+@pytest.mark.parametrize('name', sorted(EXTRACTORS))
+def test_http_extraction(name, recorded, mock_server, benchmark):
+    site, extract = EXTRACTORS[name]
+    pages = replay_pages(recorded, site)
+    assert pages
+    benchmark.extra_info['posts_per_round'] = len(pages)
+
+    results = benchmark(lambda: [extract(html, item) for item, html in pages])
+
+    for (item, _), data in zip(pages, results):
+        assert_matches_source(mock_server, site, item, data)
+
+
+@pytest.mark.parametrize('channel', ['fmkorea', 'ppomppu', 'mam2bebe'])
+def test_browser_extraction(channel, chromium, mock_server, tmp_path, monkeypatch, benchmark):
+    from src.run_benchmark import CRAWLERS, bench_extract
+
+    for name, value in mock_server.crawler_env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv('FIXTURE_MODE', 'record')
+    monkeypatch.setenv('FIXTURE_DIR', str(tmp_path / 'fixtures'))
+    monkeypatch.setenv('SELECTOR_STATS_PATH', str(tmp_path / 'selector_stats.json'))
+    monkeypatch.setenv('CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+
+    async def record() -> List[Dict]:
+        # 목록 → 상세를 브라우저로 한 번 실행해 응답 기록
+        async with CRAWLERS[channel]() as crawler:
+            items = await crawler.discover(BROWSER_POSTS)
+            for item in items:
+                await crawler._fetch_post(item, settle_ms=0)
+        return items
+
+    items = asyncio.run(record())
+    assert items
+
+    # bench_extract가 재생 모드로 전환 (monkeypatch가 테스트 후 환경변수 복원)
+    result = benchmark.pedantic(lambda: asyncio.run(bench_extract(channel, str(tmp_path / 'fixtures'))),
+                                rounds=1, iterations=1)
+    benchmark.extra_info.update(result)
+    assert result['failed'] == 0
+    assert result['extracted'] == len(items)
@@ -0,0 +1,90 @@
+"""
+JSON → CSV 스트리밍 병합 테스트 (소비 중단 시 리더 스레드 정리)
+"""
+import json
+import threading
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from src.utils import json_to_csv
+from src.utils.json_to_csv import merge_json_to_csv, stream_json_files
+
+RECORDS_PER_FILE = 20000
+
+
+@pytest.fixture
+def json_files(tmp_path) -> List[Path]:
+    """큐 크기보다 훨씬 큰 JSON 파일 3개 (리더 스레드가 put에서 대기하게 됨)"""
+    files = []
+    for n in range(3):
+        path = tmp_path / 'outputs' / f"posts_{n}.json"
+        path.parent.mkdir(exist_ok=True)
+        posts = [{'title': f"게시글 {n}-{i}", 'content': '본문', 'url': f"https://example.com/{n}/{i}",
+                  'channel': 'fmkorea', 'created_at': '2024-01-01T00:00:00'} for i in range(RECORDS_PER_FILE)]
+        path.write_text(json.dumps(posts, ensure_ascii=False), encoding='utf-8')
+        files.append(path)
+    return files
+
+
+def run_bounded(target: Callable[[], None], timeout: float = 20) -> None:
+    """target을 별도 스레드에서 실행하고 timeout 안에 끝나지 않으면 실패 (멈춤을 테스트 실패로 표시)"""
+    errors = []
+
+    def run():
+        try:
+            target()
+        except BaseException as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "스트리밍 병합이 멈춤 (리더 스레드 정리 안 됨)"
+    if errors:
+        raise errors[0]
+
+
+def reader_threads() -> List[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name.startswith('ThreadPoolExecutor')]
+
+
+def test_stream_reads_files_in_order(json_files):
+    titles = [post['title'] for post in stream_json_files(json_files, workers=2)]
+    assert len(titles) == 3 * RECORDS_PER_FILE
+    assert titles[0] == '게시글 0-0' and titles[-1] == f"게시글 2-{RECORDS_PER_FILE - 1}"
+
+
+def test_consumer_breaks_early(json_files):
+    before = set(reader_threads())
+
+    def consume():
+        for i, _ in enumerate(stream_json_files(json_files, workers=3)):
+            if i == 10:
+                break
+
+    run_bounded(consume)
+    assert set(reader_threads()) <= before
+
+
+def test_consumer_raises(json_files):
+    def consume():
+        for i, _ in enumerate(stream_json_files(json_files, workers=3)):
+            if i == 10:
+                raise ValueError('소비 오류')
+
+    with pytest.raises(ValueError):
+        run_bounded(consume)
+
+
+def test_merge_write_error_does_not_hang(json_files, tmp_path, monkeypatch):
+    monkeypatch.setenv('NEAR_DUP_ENABLED', 'false')
+
+    def failing_append(csv_path, rows, append_mode=True):
+        raise OSError('디스크 가득 참')
+
+    monkeypatch.setattr(json_to_csv, 'append_to_csv', failing_append)
+    with pytest.raises(OSError):
+        run_bounded(lambda: merge_json_to_csv(str(json_files[0].parent), str(tmp_path / 'out.csv'),
+                                              workers=3, chunk_rows=10))
@@ -0,0 +1,46 @@
+"""
+날짜 경계 페이지 탐색 테스트 (단조 증가하는 가짜 게시판)
+"""
+import asyncio
+from typing import List
+
+import pytest
+
+from src.utils.page_boundary import find_boundary_page
+
+
+def search(boundary: int, max_pages: int):
+    """boundary 페이지부터 기간 밖인 게시판에서 탐색 → (경계, 확인 수, 연 페이지 목록)"""
+    opened: List[int] = []
+
+    async def is_past(page: int) -> bool:
+        assert 1 <= page <= max_pages
+        opened.append(page)
+        return page >= boundary
+
+    found, probes = asyncio.run(find_boundary_page(is_past, max_pages))
+    return found, probes, opened
+
+
+@pytest.mark.parametrize('boundary', range(1, 42))
+def test_finds_first_page_past_boundary(boundary):
+    found, probes, opened = search(boundary, max_pages=40)
+    assert found == min(boundary, 41)
+    assert probes == len(opened) == len(set(opened))
+
+
+def test_page_one_already_past():
+    assert search(1, max_pages=40) == (1, 1, [1])
+
+
+def test_all_pages_inside():
+    found, _, opened = search(100, max_pages=10)
+    assert found == 11
+    assert opened == [1, 2, 4, 8, 10]
+
+
+def test_probe_count_is_logarithmic():
+    found, probes, _ = search(700, max_pages=1000)
+    assert found == 700
+    # 1, 2, 4, …, 1024 대신 1000까지 10번 + 이진 탐색 9번 이하
+    assert probes <= 20
@@ -0,0 +1,74 @@
+"""
+게시글 색인 CSV 동기화 테스트 (추가분만 읽기, 제자리 재작성 감지)
+"""
+import os
+from typing import Dict, List
+
+import pytest
+
+from src.utils import post_index
+from src.utils.json_to_csv import append_to_csv
+from src.utils.post_index import PostIndex
+
+
+def make_rows(start: int, end: int, label: str = '원본') -> List[Dict]:
+    return [{'id': i, 'channel': 'ppomppu', 'category': '', 'title': f"{label} 게시글 {i}", 'content': '본문',
+             'view_cnt': i, 'like_cnt': 0, 'comment_cnt': 0, 'created_at': '2025-11-01T10:00:00',
+             'own_company': 0, 'url': f"https://example.com/{i}", 'dup_group': i} for i in range(start, end + 1)]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / 'community_data.csv'), str(tmp_path / 'post_index.db')
+
+
+def titles(index: PostIndex) -> Dict[int, str]:
+    return {row['id']: row['title'] for row in index.query(order_by='id')}
+
+
+def test_append_reads_only_new_rows(paths):
+    csv_path, index_path = paths
+    append_to_csv(csv_path, make_rows(1, 5), append_mode=False)
+    with PostIndex(index_path) as index:
+        assert index.sync_csv(csv_path)['rebuild'] == 1
+        append_to_csv(csv_path, make_rows(6, 8))
+        result = index.sync_csv(csv_path)
+        assert (result['rebuild'], result['added'], result['changed']) == (0, 3, 3)
+        assert index.sync_csv(csv_path) == {'added': 0, 'changed': 0, 'deleted': 0, 'rebuild': 0}
+        assert len(titles(index)) == 8
+
+
+def test_in_place_rewrite_rebuilds(paths):
+    csv_path, index_path = paths
+    append_to_csv(csv_path, make_rows(1, 5), append_mode=False)
+    with PostIndex(index_path) as index:
+        index.sync_csv(csv_path)
+        inode = os.stat(csv_path).st_ino
+        # merge_json_to_csv --new처럼 같은 파일을 더 길게 다시 씀 (inode 유지)
+        append_to_csv(csv_path, make_rows(1, 12, label='새'), append_mode=False)
+        assert os.stat(csv_path).st_ino == inode
+
+        result = index.sync_csv(csv_path)
+        assert result['rebuild'] == 1
+        assert result['changed'] == 12
+        assert titles(index) == {i: f"새 게시글 {i}" for i in range(1, 13)}
+
+
+def test_rewrite_detected_beyond_fingerprint_head(paths, monkeypatch):
+    # 지문 앞부분보다 뒤쪽만 바뀐 재작성도 마지막 구간 해시로 감지
+    monkeypatch.setattr(post_index, 'FINGERPRINT_BYTES', 256)
+    csv_path, index_path = paths
+    rows = make_rows(1, 20)
+    append_to_csv(csv_path, rows, append_mode=False)
+    with PostIndex(index_path) as index:
+        index.sync_csv(csv_path)
+        append_to_csv(csv_path, make_rows(21, 25))
+        assert index.sync_csv(csv_path)['rebuild'] == 0
+
+        rows = make_rows(1, 25)
+        rows[23]['title'] = '수정된 게시글 24'
+        append_to_csv(csv_path, rows + make_rows(26, 30), append_mode=False)
+        result = index.sync_csv(csv_path)
+        assert result['rebuild'] == 1
+        assert (result['changed'], result['deleted']) == (6, 0)
+        assert titles(index)[24] == '수정된 게시글 24'
@@ -0,0 +1,138 @@
+"""
+프록시 풀 테스트 (ProxyPool 배정/속도 제한, 목 프록시를 거친 HTTP 상세 수집)
+
+목 커뮤니티 서버 앞에 목 프록시(tests/mock_proxy_server.py)를 두고 _crawl_details_http를 직접 실행한다.
+차단 프록시는 처음부터 403 또는 캡차 페이지로 응답한다.
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional
+
+import httpx
+import pytest
+
+from src.crawlers.fmkorea_crawler import FmkoreaCrawler
+from src.crawlers.html_parsers import parse_fmkorea_detail
+from src.crawlers.site_spec import load_spec
+from src.utils import circuit_breaker, proxy_pool, rate_limiter
+from src.utils.canonical_url import extract_post_id
+from src.utils.proxy_pool import NoHealthyProxyError, ProxyPool
+from tests.mock_proxy_server import MockProxyConfig, MockProxyServer
+
+DETAIL_POSTS = 8
+
+
+@pytest.fixture
+def crawler_env(mock_server, tmp_path, monkeypatch):
+    """목 서버 대상 설정 + 프로세스 공유 객체(프록시 풀/서킷/속도 제한) 초기화"""
+    for name, value in mock_server.crawler_env().items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.delenv('PROXY_POOL', raising=False)
+    monkeypatch.setenv('SELECTOR_STATS_PATH', str(tmp_path / 'selector_stats.json'))
+    monkeypatch.setenv('CHECKPOINT_DIR', str(tmp_path / 'checkpoints'))
+    monkeypatch.setenv('HEALTH_CHECK', 'false')
+    monkeypatch.setenv('BROWSER_DELAY', '0')
+    monkeypatch.setenv('PARSE_WORKERS', '1')
+    # 차단 응답으로 목 서버 서킷이 열리지 않도록 (프록시 제외 동작만 확인)
+    monkeypatch.setenv('CIRCUIT_FAILURE_THRESHOLD', '1000')
+    monkeypatch.setattr(proxy_pool, '_shared_pool', None)
+    monkeypatch.setattr(circuit_breaker, '_shared_breakers', None)
+    monkeypatch.setattr(rate_limiter, '_shared_limiter', None)
+    return monkeypatch
+
+
+@pytest.fixture(scope='module')
+def detail_items(mock_server) -> List[Dict]:
+    """목 서버 fmkorea 목록 1페이지의 앞쪽 항목"""
+    list_url = mock_server.crawler_env()['FMKOREA_POPULAR_URL']
+    html = httpx.get(list_url).text
+    return load_spec('fmkorea').extract_list(html, list_url)[:DETAIL_POSTS]
+
+
+def crawl_details(pool: ProxyPool, items: List[Dict], proxy_key: Optional[str] = None) -> List:
+    crawler = FmkoreaCrawler()
+    crawler.proxy_pool = pool
+    crawler.proxy_key = proxy_key
+    return asyncio.run(crawler._crawl_details_http(items, parse_fmkorea_detail))
+
+
+def test_rate_limit_is_per_proxy_and_host():
+    pool = ProxyPool(['http://10.0.0.1:3128', 'http://10.0.0.2:3128'], rate=10, burst=1)
+    url = 'https://www.fmkorea.com/1'
+
+    async def acquire_all():
+        start = time.monotonic()
+        first = await pool.acquire(url)
+        second = await pool.acquire(url)
+        other_host = await pool.acquire('https://www.ppomppu.co.kr/1')
+        immediate = time.monotonic() - start
+        await pool.acquire(url)
+        return first, second, other_host, immediate, time.monotonic() - start
+
+    first, second, other_host, immediate, total = asyncio.run(acquire_all())
+    # 같은 호스트 두 번째 요청은 버킷이 빈 첫 프록시 대신 다른 프록시로 바로 나감
+    assert first is not second
+    assert immediate < 0.05
+    # 다른 호스트는 버킷이 따로라 첫 프록시를 다시 사용
+    assert other_host is first
+    # 두 프록시 모두 버킷이 비면 프록시·호스트당 초당 10회로 대기
+    assert total >= 0.08
+    assert [p.requests for p in pool.proxies] in ([2, 2], [3, 1], [1, 3])
+
+
+def test_http_details_spread_over_proxies(crawler_env, mock_server, detail_items):
+    with MockProxyServer() as a, MockProxyServer() as b:
+        pool = ProxyPool([a.url, b.url], rate=20, burst=1)
+        posts = crawl_details(pool, detail_items)
+
+    assert len(posts) == len(detail_items)
+    for post in posts:
+        assert post.title == mock_server.community.by_id['fmkorea'][extract_post_id('fmkorea', post.url)].title
+    assert a.stats.forwarded > 0 and b.stats.forwarded > 0
+    assert a.stats.forwarded + b.stats.forwarded == len(detail_items)
+    assert not pool.proxies[0].evicted and not pool.proxies[1].evicted
+
+
+@pytest.mark.parametrize('block_mode', ['403', 'captcha'])
+def test_blocked_proxy_evicted_and_sticky_reassigned(crawler_env, detail_items, capsys, block_mode):
+    crawler_env.setenv('DETAIL_FETCH_CONCURRENCY', '1')
+    with MockProxyServer(MockProxyConfig(block_after=0, block_mode=block_mode)) as bad, MockProxyServer() as good:
+        # 점수 기준은 끄고 연속 차단 횟수(PROXY_MAX_BLOCKS)로만 제외
+        pool = ProxyPool([bad.url, good.url], rate=50, burst=5, min_score=0, max_blocks=3)
+        posts = crawl_details(pool, detail_items, proxy_key='naver')
+
+    bad_proxy, good_proxy = pool.proxies
+    assert bad_proxy.evicted == '연속 차단 3회'
+    assert bad.stats.blocked == 3 and bad.stats.forwarded == 0
+    # sticky 세션은 제외된 프록시 대신 남은 프록시로 다시 배정되고 이후 요청은 모두 그 프록시로
+    assert pool.sticky['naver'] is good_proxy
+    assert '세션 프록시 변경' in capsys.readouterr().out
+    assert good.stats.forwarded == len(detail_items) - 1
+    # 첫 게시글은 재시도(프록시 수만큼)까지 sticky 프록시에서 차단되어 실패
+    assert len(posts) == len(detail_items) - 1
+
+
+def test_all_proxies_evicted_stops_fetch(crawler_env, detail_items, capsys):
+    crawler_env.setenv('DETAIL_FETCH_CONCURRENCY', '1')
+    with MockProxyServer(MockProxyConfig(block_after=0)) as bad:
+        pool = ProxyPool([bad.url], rate=50, burst=5, min_score=0, max_blocks=3)
+        posts = crawl_details(pool, detail_items)
+
+    assert posts == []
+    assert pool.proxies[0].evicted
+    # 제외된 뒤에는 더 요청하지 않고 fetch 워커 종료
+    assert bad.stats.requests == 3
+    assert '사용 가능한 프록시 없음' in capsys.readouterr().out
+    with pytest.raises(NoHealthyProxyError):
+        pool.choose(detail_items[0]['url'])
+
+
+def test_no_healthy_proxy_at_start(crawler_env, detail_items, capsys):
+    with MockProxyServer() as proxy:
+        pool = ProxyPool([proxy.url])
+        pool.evict(pool.proxies[0], '테스트')
+        posts = crawl_details(pool, detail_items)
+
+    assert posts == []
+    assert proxy.stats.requests == 0
+    assert 'fetch 중단: 사용 가능한 프록시 없음' in capsys.readouterr().out
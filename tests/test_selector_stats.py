@@ -0,0 +1,53 @@
+"""
+선택자 적응 순서 (SelectorStats) 테스트
+"""
+from typing import Dict, Optional
+
+from src.utils.selector_stats import SelectorStats, precision_groups
+
+# mamibebe 제목 선택자와 같은 구성: 정확한 선택자 → 범용 선택자
+TITLE_SELECTORS = ['h3.title_text', '.title_text', 'h3[class*="title"]', '.ArticleTitle', 'h3']
+
+
+def extract(stats: SelectorStats, page: Dict[str, str]) -> Optional[str]:
+    """_extract_post_data처럼 적응 순서로 선택자를 시도해서 처음 찾은 값"""
+    trial = stats.trial('mam2bebe', 'title', TITLE_SELECTORS)
+    for sel in trial:
+        if sel in page:
+            trial.hit(sel)
+            return page[sel]
+    return None
+
+
+def test_precision_groups_keep_original_runs():
+    assert precision_groups(TITLE_SELECTORS) == [
+        ['h3.title_text', '.title_text'], ['h3[class*="title"]'], ['.ArticleTitle'], ['h3']]
+    assert precision_groups(['[class*="like"]', '.LikeButton', 'text=/좋아요\\s*\\d+/']) == [
+        ['[class*="like"]'], ['.LikeButton'], ['text=/좋아요\\s*\\d+/']]
+
+
+def test_generic_selector_cannot_overtake_matching_specific(tmp_path):
+    stats = SelectorStats(str(tmp_path / 'stats.json'))
+    # 제목 블록이 없는 이상한 페이지가 많아 범용 'h3'만 계속 적중
+    for _ in range(50):
+        assert extract(stats, {'h3': '댓글 3'}) == '댓글 3'
+    assert stats.data['mam2bebe']['title']['selectors']['h3']['hits'] == 50
+
+    # 정확한 선택자가 다시 맞는 페이지에서는 여전히 정확한 선택자의 값
+    page = {'h3.title_text': '실제 제목', '.title_text': '실제 제목', 'h3': '댓글 3'}
+    assert extract(stats, page) == '실제 제목'
+    assert stats.ordered('mam2bebe', 'title', TITLE_SELECTORS)[-1] == 'h3'
+
+
+def test_reorders_within_equivalent_group(tmp_path):
+    path = str(tmp_path / 'stats.json')
+    stats = SelectorStats(path)
+    for _ in range(5):
+        extract(stats, {'.title_text': '제목', '.ArticleTitle': '제목'})
+    stats.save()
+
+    # 같은 구간의 '.title_text'만 앞으로, 범용/뒤 구간 순서는 그대로 (파일에서 다시 읽어도 같음)
+    expected = ['.title_text', 'h3.title_text', 'h3[class*="title"]', '.ArticleTitle', 'h3']
+    assert stats.ordered('mam2bebe', 'title', TITLE_SELECTORS) == expected
+    assert SelectorStats(path).ordered('mam2bebe', 'title', TITLE_SELECTORS) == expected
+    assert stats.run_saved['mam2bebe.title'] == 4
@@ -0,0 +1,141 @@
+"""
+작업 큐 임대/완료/실패 테스트 (SQLite 파일은 tmp_path)
+"""
+import asyncio
+from typing import Dict, Optional
+
+import pytest
+
+from src import run_distributed
+from src.models.post import Post
+from src.utils.circuit_breaker import CircuitOpenError
+from src.utils.work_queue import DONE, FAILED, LEASED, PENDING, WorkQueue
+
+# 음수 임대 기한: 다음 claim에서 바로 만료된 것으로 보임
+EXPIRED = -1
+
+
+def items(count: int):
+    return [{'url': f"https://www.fmkorea.com/{i}", 'title': f"게시글 {i}"} for i in range(1, count + 1)]
+
+
+@pytest.fixture
+def queue(tmp_path):
+    with WorkQueue(str(tmp_path / 'work_queue.db'), max_attempts=2) as queue:
+        queue.enqueue('fmkorea', items(3))
+        yield queue
+
+
+def job_row(queue: WorkQueue, job_id: int) -> Dict:
+    return dict(queue.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone())
+
+
+def test_enqueue_skips_duplicate_urls(queue):
+    assert queue.enqueue('fmkorea', items(4)) == 1
+    assert queue.outstanding('fmkorea') == 4
+
+
+def test_expired_lease_is_reclaimed(queue):
+    first = queue.claim('w1', 'fmkorea', batch=2, lease_seconds=EXPIRED)
+    assert [job['attempts'] for job in first] == [1, 1]
+
+    second = queue.claim('w2', 'fmkorea', batch=3)
+    assert [job['id'] for job in second] == [1, 2, 3]
+    assert [job['attempts'] for job in second] == [2, 2, 1]
+    # 임대가 넘어간 뒤 이전 워커의 실패 보고는 무시
+    queue.fail('w1', 1, 'timeout')
+    assert job_row(queue, 1)['status'] == LEASED and job_row(queue, 1)['lease_owner'] == 'w2'
+
+
+def test_active_lease_is_not_reclaimed(queue):
+    queue.claim('w1', 'fmkorea', batch=3)
+    assert queue.claim('w2', 'fmkorea') == []
+
+
+def test_fail_moves_to_failed_at_max_attempts(queue):
+    job = queue.claim('w1', 'fmkorea', batch=1)[0]
+    queue.fail('w1', job['id'], 'extract failed')
+    assert job_row(queue, job['id'])['status'] == PENDING
+
+    job = queue.claim('w1', 'fmkorea', batch=1)[0]
+    assert job['attempts'] == 2
+    queue.fail('w1', job['id'], 'extract failed')
+    row = job_row(queue, job['id'])
+    assert (row['status'], row['error']) == (FAILED, 'extract failed')
+    assert [j['id'] for j in queue.claim('w1', 'fmkorea', batch=3)] == [2, 3]
+
+
+def test_expired_lease_fails_at_max_attempts(queue):
+    for _ in range(2):
+        queue.claim('w1', 'fmkorea', batch=3, lease_seconds=EXPIRED)
+    assert queue.claim('w2', 'fmkorea', batch=3) == []
+    assert queue.stats() == {'fmkorea': {FAILED: 3}}
+    assert job_row(queue, 1)['error'] == 'lease expired'
+
+
+def test_extend_ignores_lease_taken_by_another_worker(queue):
+    queue.claim('w1', 'fmkorea', batch=2, lease_seconds=EXPIRED)
+    queue.claim('w2', 'fmkorea', batch=1)
+    # 1번은 w2로 넘어감, 2번은 아직 w1 소유 (만료됐지만 다시 임대되지 않음)
+    assert queue.extend('w1', [1, 2], lease_seconds=300) == 1
+    assert job_row(queue, 1)['lease_owner'] == 'w2'
+    assert queue.extend('w2', [1], lease_seconds=300) == 1
+
+
+def test_take_results_marks_exported(queue):
+    jobs = queue.claim('w1', 'fmkorea', batch=3)
+    queue.ack('w1', jobs[0]['id'], {'title': '게시글 1'})
+    queue.ack('w1', jobs[1]['id'], None)  # 제외 대상: 결과 없이 완료
+    assert job_row(queue, jobs[1]['id'])['status'] == DONE
+
+    assert queue.take_results('fmkorea') == [{'title': '게시글 1'}]
+    assert job_row(queue, jobs[0]['id'])['exported'] == 1
+    assert queue.take_results('fmkorea') == []
+
+    queue.ack('w1', jobs[2]['id'], {'title': '게시글 3'})
+    assert queue.take_results() == [{'title': '게시글 3'}]
+
+
+def test_release_returns_jobs_without_counting_attempt(queue):
+    jobs = queue.claim('w1', 'fmkorea', batch=3)
+    assert queue.release('w2', [job['id'] for job in jobs]) == 0
+    assert queue.release('w1', [job['id'] for job in jobs]) == 3
+    reclaimed = queue.claim('w2', 'fmkorea', batch=3)
+    assert [job['attempts'] for job in reclaimed] == [1, 1, 1]
+
+
+class FakeCrawler:
+    """브라우저 없이 두 번째 게시글에서 서킷이 열리는 크롤러"""
+
+    delay = 0
+
+    def __init__(self):
+        self.fetched = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def prepare_details(self):
+        pass
+
+    async def _guarded_fetch_post(self, item: Dict) -> Optional[Post]:
+        if self.fetched:
+            raise CircuitOpenError('www.fmkorea.com', 60, '봇 확인 페이지')
+        self.fetched.append(item['url'])
+        return Post(channel='fmkorea', title=item['title'], url=item['url'])
+
+    def _accept_post(self, post: Post) -> bool:
+        return True
+
+
+def test_worker_releases_batch_when_circuit_opens(queue, monkeypatch):
+    monkeypatch.setitem(run_distributed.CRAWLERS, 'fmkorea', FakeCrawler)
+    stats = asyncio.run(run_distributed.work('fmkorea', 'w1', queue.path, batch=3))
+
+    assert stats == {'done': 1, 'failed': 0, 'skipped': 0}
+    assert queue.stats() == {'fmkorea': {DONE: 1, PENDING: 2}}
+    # 임대 기한을 기다리지 않고 다른 워커가 바로 가져감
+    assert [job['id'] for job in queue.claim('w2', 'fmkorea', batch=3)] == [2, 3]